@@ -16,7 +16,7 @@ from rich.table import Table
 from watercrawl.core import config
 from watercrawl.domain import relationships
 
-_DEFAULT_THROTTLE = 0.2
+_DEFAULT_THROTTLE = 0.0
 
 
 def _load_snapshot() -> relationships.RelationshipGraphSnapshot:
@@ -25,6 +25,7 @@ def _load_snapshot() -> relationships.RelationshipGraphSnapshot:
             graphml_path=config.RELATIONSHIPS_GRAPHML,
             node_csv_path=config.RELATIONSHIPS_CSV,
             edge_csv_path=config.RELATIONSHIPS_EDGES_CSV,
+            betweenness_samples=config.GRAPH_SEMANTICS.betweenness_samples,
         )
     except FileNotFoundError as exc:  # pragma: no cover - defensive guard
         raise click.ClickException(str(exc)) from exc
@@ -33,10 +34,6 @@ def _load_snapshot() -> relationships.RelationshipGraphSnapshot:
     return snapshot
 
 
-def _string_to_list(value: str) -> list[str]:
-    return [item for item in (value or "").split(";") if item]
-
-
 def _organisation_names(graph: nx.MultiDiGraph, node: str) -> list[str]:
     names: list[str] = []
     for neighbour in graph.neighbors(node):
@@ -46,23 +43,23 @@ def _organisation_names(graph: nx.MultiDiGraph, node: str) -> list[str]:
     return names
 
 
-def _person_nodes_for_source(graph: nx.MultiDiGraph, source_node: str) -> list[str]:
+def _person_nodes_for_source(
+    graph: nx.MultiDiGraph,
+    indexes: relationships.GraphIndexes,
+    source_node: str,
+) -> list[str]:
     people: list[str] = []
-    for predecessor, _, edge_key in cast(Any, graph).in_edges(source_node, keys=True):
-        data = graph.nodes[predecessor]
-        if data.get("type") == "person":
+    organisations: list[str] = []
+    for predecessor, _, _ in cast(Any, graph).in_edges(source_node, keys=True):
+        node_type = graph.nodes[predecessor].get("type")
+        if node_type == "person":
             people.append(predecessor)
+        elif node_type == "organisation":
+            organisations.append(predecessor)
     if people:
         return people
-    organisations = [
-        predecessor
-        for predecessor, _, _ in cast(Any, graph).in_edges(source_node, keys=True)
-        if graph.nodes[predecessor].get("type") == "organisation"
-    ]
     for organisation in organisations:
-        for _, neighbour, _ in graph.out_edges(organisation, keys=True):
-            if graph.nodes[neighbour].get("type") == "person":
-                people.append(neighbour)
+        people.extend(indexes.people_for_organisation(organisation))
     return list(dict.fromkeys(people))
 
 
@@ -87,18 +84,13 @@ def contacts_by_regulator(regulator: str, throttle: float) -> None:
     if snapshot.graph is None:  # pragma: no cover - defensive guard
         raise click.ClickException("Relationship graph has not been materialised yet.")
     graph = snapshot.graph
+    indexes = snapshot.indexes or relationships.build_graph_indexes(graph)
     console = Console()
-    regulator_key = regulator.casefold()
     rows: list[tuple[str, str, str]] = []
 
-    for node, data in graph.nodes(data=True):
-        if data.get("type") != "source":
-            continue
-        publisher = str(data.get("publisher", "")).casefold()
-        connector = str(data.get("connector", "")).casefold()
-        if regulator_key not in publisher and regulator_key not in connector:
-            continue
-        for person_node in _person_nodes_for_source(graph, node):
+    for node in indexes.sources_matching(regulator):
+        data = graph.nodes[node]
+        for person_node in _person_nodes_for_source(graph, indexes, node):
             person_data = graph.nodes[person_node]
             contact_name = person_data.get("name", person_node)
             organisations = _organisation_names(graph, person_node)
@@ -140,15 +132,11 @@ def sources_for_phone(phone: str, throttle: float) -> None:
         raise click.ClickException("Relationship graph has not been materialised yet.")
     graph = snapshot.graph
     console = Console()
-    normalized = phone.strip()
     matches: list[tuple[str, list[tuple[str, str]]]] = []
 
-    for node, data in graph.nodes(data=True):
-        if data.get("type") != "person":
-            continue
-        phones = {item.strip() for item in _string_to_list(str(data.get("phones", "")))}
-        if normalized not in phones:
-            continue
+    indexes = snapshot.indexes or relationships.build_graph_indexes(graph)
+    for node in indexes.people_with_phone(phone):
+        data = graph.nodes[node]
         sources: list[tuple[str, str]] = []
         for _, target, _ in graph.out_edges(node, keys=True):
             target_data = graph.nodes[target]
@@ -195,6 +183,7 @@ def export_telemetry(output: Path) -> None:
         "centrality": snapshot.centrality,
         "betweenness": snapshot.betweenness,
         "community_assignments": snapshot.community_assignments,
+        "betweenness_samples": snapshot.betweenness_samples,
         "anomalies": [asdict(anomaly) for anomaly in snapshot.anomalies],
     }
     output.parent.mkdir(parents=True, exist_ok=True)
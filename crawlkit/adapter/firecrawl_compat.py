@@ -2,22 +2,18 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any, Mapping
 
 from ..distill.distill import distill
 from ..extract.entities import extract_entities
+from ..fetch.client_pool import shared_pool
 from ..fetch.polite_fetch import fetch, fetch_many
 from ..types import FetchPolicy, serialize_for_celery
 
 
 def _run(coro):
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        return asyncio.run(coro)
-    else:  # pragma: no cover - defensive fallback when called inside an event loop
-        return loop.run_until_complete(coro)
+    # The pool's background loop keeps connections alive between calls.
+    return shared_pool().run(coro)
 
 
 def fetch_markdown(
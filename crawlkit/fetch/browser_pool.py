@@ -0,0 +1,254 @@
+"""Persistent Playwright browser pool for JavaScript rendering.
+
+:class:`BrowserPool` keeps one Chromium process running and renders each page
+in its own browser context, so pages stay isolated (cookies, storage, cache)
+without paying for a browser launch per render. A semaphore caps concurrent
+contexts. After ``recycle_after`` pages, or as soon as the browser disconnects
+(a crash), the next render launches a fresh browser; the old one is closed once
+its in-flight renders finish.
+
+Playwright objects are bound to the event loop that created them, so
+:func:`shared_browser_pool` keeps one pool per running loop. Like the HTTP
+client pool, only loops that outlive a call (the client pool's background loop
+and loops that opted in) keep a browser; :func:`browser_session` gives any other
+loop a pool that is closed on exit, so ``asyncio.run`` never orphans Chromium.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import os
+import threading
+import weakref
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from .client_pool import shared_pool
+
+__all__ = [
+    "BrowserPool",
+    "aclose_browser_pool",
+    "browser_session",
+    "close_browser_pools",
+    "configure_browser_pool",
+    "shared_browser_pool",
+]
+
+logger = logging.getLogger(__name__)
+
+Launcher = Callable[[], Awaitable[Any]]
+
+# Upper bound on how long exit-time cleanup waits for each pool.
+_CLOSE_TIMEOUT = 5.0
+
+
+class BrowserPool:
+    """Hand out isolated pages from one long-lived browser.
+
+    ``launcher`` returns a connected browser; the default starts Playwright
+    once and launches headless Chromium. Tests pass a fake.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_contexts: int = 4,
+        recycle_after: int = 100,
+        navigation_timeout_ms: int = 15000,
+        launcher: Launcher | None = None,
+    ) -> None:
+        if max_contexts <= 0 or recycle_after <= 0:
+            raise ValueError("max_contexts and recycle_after must be positive")
+        self.max_contexts = max_contexts
+        self.recycle_after = recycle_after
+        self.navigation_timeout_ms = navigation_timeout_ms
+        self._launcher = launcher or self._launch_chromium
+        self._slots = asyncio.Semaphore(max_contexts)
+        self._lock = asyncio.Lock()
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._served = 0
+        self._active: dict[int, int] = {}
+        self._retired: dict[int, Any] = {}
+        self.launches = 0
+        self.rendered = 0
+
+    async def render(self, url: str) -> str:
+        """Navigate to ``url`` in a fresh context and return the page HTML."""
+
+        async with self._slots:
+            browser = await self._acquire()
+            try:
+                context = await browser.new_context()
+                try:
+                    page = await context.new_page()
+                    await page.goto(
+                        url,
+                        wait_until="domcontentloaded",
+                        timeout=self.navigation_timeout_ms,
+                    )
+                    content = await page.content()
+                finally:
+                    await _quietly(context.close())
+                self.rendered += 1
+                return content
+            finally:
+                await self._release(browser)
+
+    async def aclose(self) -> None:
+        """Close the current and retired browsers and stop Playwright."""
+
+        async with self._lock:
+            browsers = list(self._retired.values())
+            if self._browser is not None:
+                browsers.append(self._browser)
+            self._browser = None
+            self._retired.clear()
+            self._active.clear()
+            playwright, self._playwright = self._playwright, None
+        for browser in browsers:
+            await _quietly(browser.close())
+        if playwright is not None:
+            await _quietly(playwright.stop())
+
+    async def _acquire(self) -> Any:
+        async with self._lock:
+            browser = self._browser
+            if (
+                browser is None
+                or not browser.is_connected()
+                or self._served >= self.recycle_after
+            ):
+                if browser is not None:
+                    reason = "recycle" if browser.is_connected() else "disconnected"
+                    logger.info("Replacing Playwright browser (%s)", reason)
+                    await self._retire(browser)
+                browser = self._browser = await self._launcher()
+                self._served = 0
+                self.launches += 1
+            self._served += 1
+            self._active[id(browser)] = self._active.get(id(browser), 0) + 1
+            return browser
+
+    async def _release(self, browser: Any) -> None:
+        async with self._lock:
+            key = id(browser)
+            remaining = self._active.get(key, 0) - 1
+            if remaining > 0:
+                self._active[key] = remaining
+                return
+            self._active.pop(key, None)
+            retired = self._retired.pop(key, None)
+        if retired is not None:
+            await _quietly(retired.close())
+
+    async def _retire(self, browser: Any) -> None:
+        # Caller holds the lock. Busy browsers close when their last render ends.
+        if self._active.get(id(browser)):
+            self._retired[id(browser)] = browser
+        else:
+            await _quietly(browser.close())
+
+    async def _launch_chromium(self) -> Any:
+        if self._playwright is None:
+            try:
+                from playwright.async_api import async_playwright
+            except ImportError as exc:  # pragma: no cover - optional dependency
+                raise RuntimeError("Playwright is not installed") from exc
+            self._playwright = await async_playwright().start()
+        return await self._playwright.chromium.launch(headless=True)
+
+
+async def _quietly(closing: Awaitable[Any]) -> None:
+    try:
+        await closing
+    except Exception as exc:  # pragma: no cover - crashed browsers fail to close
+        logger.debug("Ignoring error while closing Playwright object: %s", exc)
+
+
+_POOLS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BrowserPool] = (
+    weakref.WeakKeyDictionary()
+)
+_POOLS_LOCK = threading.Lock()
+_OPTIONS: dict[str, Any] = {}
+_EXIT_HOOK_REGISTERED = False
+
+
+def shared_browser_pool() -> BrowserPool:
+    """Return the browser pool for the running event loop."""
+
+    global _EXIT_HOOK_REGISTERED
+    loop = asyncio.get_running_loop()
+    with _POOLS_LOCK:
+        pool = _POOLS.get(loop)
+        if pool is None:
+            pool = _POOLS[loop] = BrowserPool(**_OPTIONS)
+            if not _EXIT_HOOK_REGISTERED:
+                # Registered on first use so it runs before the client pool's
+                # exit hook stops the background loop these browsers live on.
+                atexit.register(close_browser_pools)
+                _EXIT_HOOK_REGISTERED = True
+        return pool
+
+
+@asynccontextmanager
+async def browser_session() -> AsyncIterator[BrowserPool]:
+    """Yield the shared pool on pooled loops, else a pool closed on exit."""
+
+    if shared_pool().is_pooled():
+        yield shared_browser_pool()
+        return
+    with _POOLS_LOCK:
+        options = dict(_OPTIONS)
+    pool = BrowserPool(**options)
+    try:
+        yield pool
+    finally:
+        await pool.aclose()
+
+
+def configure_browser_pool(**options: Any) -> None:
+    """Set ``BrowserPool`` options for pools created from now on."""
+
+    with _POOLS_LOCK:
+        _OPTIONS.clear()
+        _OPTIONS.update(options)
+
+
+async def aclose_browser_pool() -> None:
+    """Async shutdown hook: close the running loop's browser pool."""
+
+    loop = asyncio.get_running_loop()
+    with _POOLS_LOCK:
+        pool = _POOLS.pop(loop, None)
+    if pool is not None:
+        await pool.aclose()
+
+
+def close_browser_pools() -> None:
+    """Sync shutdown hook for pools living on other threads' running loops."""
+
+    with _POOLS_LOCK:
+        pools = list(_POOLS.items())
+        _POOLS.clear()
+    for loop, pool in pools:
+        if loop.is_closed() or not loop.is_running():
+            continue
+        try:
+            asyncio.run_coroutine_threadsafe(pool.aclose(), loop).result(_CLOSE_TIMEOUT)
+        except Exception:  # pragma: no cover - best effort during shutdown
+            pass
+
+
+def _after_fork() -> None:
+    # A forked child must not drive the parent's browser processes.
+    global _POOLS, _POOLS_LOCK
+    _POOLS = weakref.WeakKeyDictionary()
+    _POOLS_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch - POSIX only
+    os.register_at_fork(after_in_child=_after_fork)
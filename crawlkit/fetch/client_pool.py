@@ -0,0 +1,309 @@
+"""Process-wide pool of long-lived httpx clients for Crawlkit fetches.
+
+An ``httpx.AsyncClient`` is bound to the event loop that first uses it, so
+:class:`ClientPool` keeps one client per pooled loop. Every client reuses
+keep-alive connections, negotiates HTTP/2 when ``h2`` is installed and caps
+in-flight requests per host. Synchronous callers (the Firecrawl adapter and the
+Celery tasks) go through :meth:`ClientPool.run`, which executes coroutines on a
+single background loop, so their connections survive between calls instead of
+being torn down with a per-call ``asyncio.run`` loop.
+
+Only the background loop and loops that opt in via :meth:`ClientPool.client`
+(such as a server's lifespan) are pooled. :meth:`ClientPool.session` hands any
+other loop a client that is closed on exit, so a script's ``asyncio.run`` does
+not leave keep-alive sockets behind when its loop ends.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import os
+import threading
+import weakref
+from collections.abc import AsyncIterator, Callable, Coroutine
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import httpx
+
+try:  # pragma: no cover - optional dependency for HTTP/2
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - httpx falls back to HTTP/1.1
+    _HTTP2_AVAILABLE = False
+
+__all__ = [
+    "ClientPool",
+    "PoolLimits",
+    "aclose_shared_pool",
+    "close_shared_pool",
+    "configure_shared_pool",
+    "shared_pool",
+]
+
+T = TypeVar("T")
+
+# Upper bound on how long close() waits for the background loop to drain.
+_CLOSE_TIMEOUT = 5.0
+
+
+@dataclass(frozen=True, slots=True)
+class PoolLimits:
+    """Connection limits applied to every client the pool creates."""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    max_connections_per_host: int = 6
+    http2: bool = True
+    timeout: float = 15.0
+    user_agent: str = "Watercrawl-Crawlkit/1.0"
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response stream that frees its host slot once the body is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                release, self._release = self._release, None
+                release()
+
+
+class _HostLimitedTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper allowing at most ``per_host`` open responses per origin.
+
+    The slot is held until the response body is closed, which ``client.get``
+    does after reading it, so streamed responses count against the limit too.
+    With HTTP/2 several of those responses may share one multiplexed
+    connection; the cap still bounds the load placed on each origin.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, per_host: int) -> None:
+        self._transport = transport
+        self._per_host = max(1, per_host)
+        self._slots: dict[tuple[str, str, int | None], asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = (request.url.scheme, request.url.host, request.url.port)
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = asyncio.Semaphore(self._per_host)
+        await slot.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            slot.release()
+            raise
+        if isinstance(response.stream, httpx.ByteStream):
+            # Already-buffered bodies (mock transports) hold no connection and
+            # are never closed by httpx, so free the slot straight away.
+            slot.release()
+            return response
+        response.stream = _ReleasingStream(response.stream, slot.release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class ClientPool:
+    """Hand out one shared ``httpx.AsyncClient`` per event loop.
+
+    ``transport`` replaces the network transport (tests pass an
+    ``httpx.MockTransport``); the per-host limit still wraps it.
+    """
+
+    def __init__(
+        self,
+        limits: PoolLimits | None = None,
+        *,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.limits = limits or PoolLimits()
+        self._transport = transport
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def http2(self) -> bool:
+        return self.limits.http2 and _HTTP2_AVAILABLE
+
+    def client(self) -> httpx.AsyncClient:
+        """Return the pooled client for the running loop, creating it on first use.
+
+        Calling this opts the loop into pooling: the client stays open until
+        :meth:`aclose` runs on that loop, which the caller must arrange.
+        """
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                client = self._clients[loop] = self._create_client()
+        return client
+
+    def is_pooled(self, loop: asyncio.AbstractEventLoop | None = None) -> bool:
+        """Whether ``loop`` (default: the running loop) keeps a pooled client."""
+
+        loop = loop or asyncio.get_running_loop()
+        with self._lock:
+            if loop is self._loop:
+                return True
+            client = self._clients.get(loop)
+            return client is not None and not client.is_closed
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the pooled client on pooled loops, else one closed on exit."""
+
+        if self.is_pooled():
+            yield self.client()
+            return
+        async with self._create_client() as client:
+            yield client
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run ``coro`` on the pool's background loop and wait for the result."""
+
+        loop = self._background_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            coro.close()
+            raise RuntimeError("ClientPool.run cannot block its own event loop")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def aclose(self) -> None:
+        """Close the client bound to the running loop (e.g. on app shutdown)."""
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    def close(self, timeout: float | None = _CLOSE_TIMEOUT) -> None:
+        """Close the background loop's client and stop its thread."""
+
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+        if thread.is_alive():
+            try:
+                asyncio.run_coroutine_threadsafe(self.aclose(), loop).result(timeout)
+            except Exception:  # pragma: no cover - best effort during shutdown
+                pass
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+
+    def _create_client(self) -> httpx.AsyncClient:
+        limits = self.limits
+        transport = self._transport or httpx.AsyncHTTPTransport(
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=limits.max_connections,
+                max_keepalive_connections=limits.max_keepalive_connections,
+                keepalive_expiry=limits.keepalive_expiry,
+            ),
+        )
+        return httpx.AsyncClient(
+            headers={"User-Agent": limits.user_agent},
+            timeout=limits.timeout,
+            transport=_HostLimitedTransport(transport, limits.max_connections_per_host),
+        )
+
+    def _background_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="crawlkit-client-pool", daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def _forget(self) -> None:
+        # Called in a forked child: the parent's loop thread does not exist here
+        # and its sockets must not be shared, so start from scratch.
+        self._clients = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._loop = self._thread = None
+
+
+_SHARED: ClientPool | None = None
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_pool() -> ClientPool:
+    """Return the process-wide pool used by ``fetch`` and ``fetch_many``."""
+
+    global _SHARED
+    with _SHARED_LOCK:
+        if _SHARED is None:
+            _SHARED = ClientPool()
+        return _SHARED
+
+
+def configure_shared_pool(
+    limits: PoolLimits | None = None,
+    *,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> ClientPool:
+    """Replace the shared pool, closing the previous one's background loop."""
+
+    global _SHARED
+    with _SHARED_LOCK:
+        previous, _SHARED = _SHARED, ClientPool(limits, transport=transport)
+        pool = _SHARED
+    if previous is not None:
+        previous.close()
+    return pool
+
+
+async def aclose_shared_pool() -> None:
+    """Async shutdown hook: close the shared client for the running loop."""
+
+    if _SHARED is not None:
+        await _SHARED.aclose()
+
+
+def close_shared_pool() -> None:
+    """Sync shutdown hook: close the shared pool's background loop."""
+
+    if _SHARED is not None:
+        _SHARED.close()
+
+
+def _after_fork() -> None:
+    if _SHARED is not None:
+        _SHARED._forget()
+
+
+atexit.register(close_shared_pool)
+if hasattr(os, "register_at_fork"):  # pragma: no branch - POSIX only
+    os.register_at_fork(after_in_child=_after_fork)
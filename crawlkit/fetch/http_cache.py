@@ -0,0 +1,298 @@
+"""On-disk conditional-GET cache for fetched pages.
+
+:class:`HttpCache` stores successful page responses under
+``<directory>/<hh>/<sha256(url)>.{json,body}`` together with their ``ETag`` and
+``Last-Modified`` validators. Entries that are still fresh per
+``Cache-Control: max-age`` (minus ``Age``) or ``Expires`` are served without
+touching the network. Stale entries are revalidated with ``If-None-Match`` /
+``If-Modified-Since``, so an unchanged page costs a bodiless 304. ``no-store``
+responses are never written, ``no-cache`` entries are always revalidated, and
+responses without validators or a freshness lifetime are not kept. ``Vary`` is
+not interpreted: Crawlkit sends the same headers for every request to a URL.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+import httpx
+
+__all__ = [
+    "CachedResponse",
+    "HttpCache",
+    "HttpCacheStats",
+    "configure_http_cache",
+    "ensure_http_cache",
+    "shared_http_cache",
+]
+
+logger = logging.getLogger(__name__)
+
+_ENTRY_VERSION = 1
+# httpx hands back decoded bodies, so transfer framing must not be replayed.
+_DROPPED_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding", "connection"}
+)
+
+
+@dataclass(frozen=True)
+class HttpCacheStats:
+    """Counters describing cache effectiveness."""
+
+    hits: int
+    revalidated: int
+    misses: int
+    stored: int
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "stored": self.stored,
+        }
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """Stored page body plus the headers needed to reuse or revalidate it."""
+
+    url: str
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    stored_at: float
+    expires_at: float | None
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        if self.expires_at is None:
+            return False
+        return (time.time() if now is None else now) < self.expires_at
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+
+        headers: dict[str, str] = {}
+        if etag := self.headers.get("etag"):
+            headers["If-None-Match"] = etag
+        if last_modified := self.headers.get("last-modified"):
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def to_response(self) -> httpx.Response:
+        return httpx.Response(
+            self.status,
+            headers=self.headers,
+            content=self.body,
+            request=httpx.Request("GET", self.url),
+        )
+
+
+class HttpCache:
+    """Directory-backed page cache with freshness and revalidation bookkeeping."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "revalidated": 0, "misses": 0, "stored": 0}
+
+    def lookup(self, url: str) -> CachedResponse | None:
+        """Return the stored entry for ``url`` (fresh or stale), if any."""
+
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable HTTP cache entry for %s: %s", url, exc)
+            return None
+        if meta.get("version") != _ENTRY_VERSION or meta.get("url") != url:
+            return None
+        return CachedResponse(
+            url=url,
+            status=int(meta["status"]),
+            headers=dict(meta["headers"]),
+            body=body,
+            stored_at=float(meta["stored_at"]),
+            expires_at=meta.get("expires_at"),
+        )
+
+    def hit(self, entry: CachedResponse) -> httpx.Response:
+        """Serve a fresh entry without contacting the origin."""
+
+        self._count("hits")
+        return entry.to_response()
+
+    def revalidated(
+        self, entry: CachedResponse, not_modified: httpx.Response
+    ) -> httpx.Response:
+        """Fold a 304's headers into ``entry``, persist it and return the page."""
+
+        headers = dict(entry.headers)
+        headers.update(_storable_headers(not_modified.headers))
+        refreshed = self._entry(entry.url, entry.status, headers, entry.body)
+        if refreshed is not None:
+            self._write(refreshed, body=False)
+        self._count("revalidated")
+        return (refreshed or entry).to_response()
+
+    def store(self, url: str, response: httpx.Response) -> bool:
+        """Record a full response (a miss); return whether it was cached."""
+
+        self._count("misses")
+        if response.status_code != 200:
+            return False
+        entry = self._entry(
+            url,
+            response.status_code,
+            _storable_headers(response.headers),
+            response.content,
+        )
+        if entry is None:
+            return False
+        self._write(entry, body=True)
+        self._count("stored")
+        return True
+
+    def stats(self) -> HttpCacheStats:
+        with self._lock:
+            return HttpCacheStats(**self._counters)
+
+    def _entry(
+        self, url: str, status: int, headers: dict[str, str], body: bytes
+    ) -> CachedResponse | None:
+        directives = _cache_directives(headers.get("cache-control", ""))
+        if "no-store" in directives:
+            return None
+        now = time.time()
+        expires_at = _expires_at(headers, directives, now)
+        has_validators = "etag" in headers or "last-modified" in headers
+        if not has_validators and (expires_at is None or expires_at <= now):
+            return None
+        return CachedResponse(
+            url=url,
+            status=status,
+            headers=headers,
+            body=body,
+            stored_at=now,
+            expires_at=expires_at,
+        )
+
+    def _write(self, entry: CachedResponse, *, body: bool) -> None:
+        meta_path, body_path = self._paths(entry.url)
+        meta = {
+            "version": _ENTRY_VERSION,
+            "url": entry.url,
+            "status": entry.status,
+            "headers": entry.headers,
+            "stored_at": entry.stored_at,
+            "expires_at": entry.expires_at,
+        }
+        try:
+            meta_path.parent.mkdir(parents=True, exist_ok=True)
+            # Body first: a reader never sees metadata pointing at a missing body.
+            if body:
+                _replace(body_path, entry.body)
+            _replace(meta_path, json.dumps(meta, sort_keys=True).encode("utf-8"))
+        except OSError as exc:
+            logger.warning(
+                "Failed to write HTTP cache entry for %s: %s", entry.url, exc
+            )
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = self.directory / digest[:2] / digest
+        return base.with_suffix(".json"), base.with_suffix(".body")
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+
+def _storable_headers(headers: httpx.Headers) -> dict[str, str]:
+    return {
+        key.lower(): value
+        for key, value in headers.items()
+        if key.lower() not in _DROPPED_HEADERS
+    }
+
+
+def _cache_directives(value: str) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for part in value.split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+def _expires_at(
+    headers: dict[str, str], directives: dict[str, str | None], now: float
+) -> float | None:
+    """Absolute expiry time, ``now`` for ``no-cache``, or ``None`` if unknown."""
+
+    if "no-cache" in directives:
+        return now
+    max_age = directives.get("max-age")
+    if max_age is not None:
+        try:
+            age = float(headers.get("age", 0) or 0)
+            return now + max(0.0, float(max_age) - age)
+        except ValueError:
+            return now
+    expires = headers.get("expires")
+    if expires:
+        try:
+            expires_ts = parsedate_to_datetime(expires).timestamp()
+            date = headers.get("date")
+            # Measure the lifetime against the origin's clock, not ours.
+            origin_now = parsedate_to_datetime(date).timestamp() if date else now
+        except (TypeError, ValueError):
+            return now  # An invalid Expires means "already expired".
+        return now + max(0.0, expires_ts - origin_now)
+    return None
+
+
+def _replace(path: Path, payload: bytes) -> None:
+    staging = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}")
+    staging.write_bytes(payload)
+    os.replace(staging, path)
+
+
+_SHARED: HttpCache | None = None
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_http_cache() -> HttpCache | None:
+    """Return the process-wide page cache, or ``None`` while it is disabled."""
+
+    return _SHARED
+
+
+def configure_http_cache(directory: Path | None) -> HttpCache | None:
+    """Enable the shared page cache under ``directory`` (``None`` disables it)."""
+
+    global _SHARED
+    with _SHARED_LOCK:
+        _SHARED = HttpCache(directory) if directory is not None else None
+        return _SHARED
+
+
+def ensure_http_cache(directory: Path) -> HttpCache:
+    """Enable the shared cache for ``directory`` unless it already points there."""
+
+    global _SHARED
+    with _SHARED_LOCK:
+        if _SHARED is None or _SHARED.directory != Path(directory):
+            _SHARED = HttpCache(directory)
+        return _SHARED
@@ -6,12 +6,16 @@ import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import Awaitable, Callable, Literal, Optional
-from urllib.parse import urljoin, urlparse
 from urllib.robotparser import RobotFileParser
 
 import httpx
 
 from ..types import FetchedPage, FetchPolicy, RobotsDecision
+from .browser_pool import BrowserPool, browser_session
+from .client_pool import shared_pool
+from .http_cache import CachedResponse, HttpCache, shared_http_cache
+from .robots_cache import shared_robots_cache
+from .scheduler import PolitenessScheduler
 
 __all__ = ["FetchPolicy", "FetchedPage", "fetch"]
 
@@ -23,19 +27,7 @@ async def _load_robots(
 ) -> RobotFileParser | None:
     if not policy.obey_robots:
         return None
-    parsed = urlparse(url)
-    robots_url = urljoin(f"{parsed.scheme}://{parsed.netloc}", "/robots.txt")
-    parser = RobotFileParser()
-    try:
-        response = await client.get(
-            robots_url, headers={"User-Agent": policy.user_agent}, timeout=5
-        )
-        if response.status_code >= 400:
-            return None
-        parser.parse(response.text.splitlines())
-        return parser
-    except httpx.HTTPError:
-        return None
+    return await shared_robots_cache().parser(url, client, user_agent=policy.user_agent)
 
 
 async def _evaluate_robots(
@@ -51,6 +43,16 @@ async def _evaluate_robots(
     return RobotsDecision(allowed=allowed, user_agent=policy.user_agent, rule=rule)
 
 
+def _robots_delay(parser: RobotFileParser | None, user_agent: str) -> float:
+    if parser is None:
+        return 0.0
+    delay = float(parser.crawl_delay(user_agent) or 0.0)
+    rate = parser.request_rate(user_agent)
+    if rate is not None and rate.requests:
+        delay = max(delay, rate.seconds / rate.requests)
+    return delay
+
+
 def _should_render(html: str, response: httpx.Response, policy: FetchPolicy) -> bool:
     if policy.render_js == "always":
         return True
@@ -70,29 +72,59 @@ def _should_render(html: str, response: httpx.Response, policy: FetchPolicy) ->
 
 
 async def _render_with_playwright(url: str) -> str:
-    try:
-        from playwright.async_api import async_playwright
-    except ImportError as exc:  # pragma: no cover - optional dependency
-        raise RuntimeError("Playwright is not installed") from exc
-
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        try:
-            page = await browser.new_page()
-            await page.goto(url, wait_until="domcontentloaded", timeout=15000)
-            content = await page.content()
-            return content
-        finally:
-            await browser.close()
+    # Pooled loops share one browser; each render gets its own context.
+    async with browser_session() as pool:
+        return await pool.render(url)
 
 
 @asynccontextmanager
 async def _build_client(policy: FetchPolicy, client: httpx.AsyncClient | None = None):
+    # Requests carry the policy's User-Agent, so the pooled client can be shared
+    # across policies. Loops the pool does not own get a client closed on exit.
     if client is not None:
         yield client
         return
-    async with httpx.AsyncClient(headers={"User-Agent": policy.user_agent}) as created:
-        yield created
+    async with shared_pool().session() as pooled:
+        yield pooled
+
+
+@asynccontextmanager
+async def _paced(scheduler: PolitenessScheduler | None, url: str):
+    if scheduler is None:
+        yield
+        return
+    async with scheduler.slot(url):
+        try:
+            yield
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == 429 or exc.response.status_code >= 500:
+                scheduler.record_error(url)
+            raise
+        except httpx.TransportError:
+            scheduler.record_error(url)
+            raise
+    scheduler.record_success(url)
+
+
+async def _get_page(
+    url: str,
+    policy: FetchPolicy,
+    client: httpx.AsyncClient,
+    cache: HttpCache | None,
+    cached: CachedResponse | None,
+) -> tuple[httpx.Response, str | None]:
+    headers = {"User-Agent": policy.user_agent}
+    if cached is not None:
+        headers.update(cached.validators())
+    response = await client.get(url, headers=headers, timeout=15)
+    if cache is None:
+        response.raise_for_status()
+        return response, None
+    if cached is not None and response.status_code == 304:
+        return cache.revalidated(cached, response), "revalidated"
+    response.raise_for_status()
+    cache.store(url, response)
+    return response, "miss"
 
 
 async def fetch(
@@ -101,13 +133,28 @@ async def fetch(
     *,
     client: httpx.AsyncClient | None = None,
     renderer: Optional[RenderCallable] = None,
+    scheduler: PolitenessScheduler | None = None,
+    http_cache: HttpCache | None = None,
+    browser_pool: BrowserPool | None = None,
 ) -> FetchedPage:
-    """Fetch a page politely, returning a :class:`FetchedPage`."""
+    """Fetch a page politely, returning a :class:`FetchedPage`.
+
+    With a ``scheduler`` the request (and any render) waits for the host's
+    turn, honouring the robots.txt crawl-delay and backing off on 429/5xx.
+    With an HTTP cache (``http_cache`` or the shared one), fresh pages are
+    served from disk and stale ones revalidated; ``metadata["cache"]`` records
+    ``hit``, ``revalidated`` or ``miss``. Without a ``renderer``, pages that
+    need JavaScript render through ``browser_pool`` when one is given.
+    """
 
     policy = policy or FetchPolicy()
     async with _build_client(policy, client) as active_client:
         robots_parser = await _load_robots(url, policy, active_client)
         robots_decision = await _evaluate_robots(url, policy, robots_parser)
+        if scheduler is not None:
+            scheduler.set_crawl_delay(
+                url, _robots_delay(robots_parser, policy.user_agent)
+            )
         if not robots_decision.allowed:
             return FetchedPage(
                 url=url,
@@ -120,21 +167,33 @@ async def fetch(
                 robots=robots_decision,
             )
 
-        response = await active_client.get(
-            url, headers={"User-Agent": policy.user_agent}, timeout=15
-        )
-        response.raise_for_status()
-        html = response.text
-        via: Literal["http", "rendered"] = "http"  # type: ignore[name-defined]
-
-        should_render = _should_render(html, response, policy)
-        if should_render:
-            render_callable = renderer or _render_with_playwright
-            try:
-                html = await render_callable(url)
-                via = "rendered"
-            except Exception:  # pragma: no cover - fallback when renderer fails
-                via = "http"
+        cache = http_cache if http_cache is not None else shared_http_cache()
+        cached = cache.lookup(url) if cache is not None else None
+        hit = cache.hit(cached) if cache and cached and cached.is_fresh() else None
+        # A fresh hit needs no host slot unless it still has to be rendered.
+        offline = hit is not None and not _should_render(hit.text, hit, policy)
+        async with _paced(None if offline else scheduler, url):
+            if hit is not None:
+                response, cache_status = hit, "hit"
+            else:
+                response, cache_status = await _get_page(
+                    url, policy, active_client, cache, cached
+                )
+            html = response.text
+            via: Literal["http", "rendered"] = "http"  # type: ignore[name-defined]
+
+            should_render = _should_render(html, response, policy)
+            if should_render:
+                render_callable = renderer or (
+                    browser_pool.render
+                    if browser_pool is not None
+                    else _render_with_playwright
+                )
+                try:
+                    html = await render_callable(url)
+                    via = "rendered"
+                except Exception:  # pragma: no cover - fallback when renderer fails
+                    via = "http"
 
         return FetchedPage(
             url=url,
@@ -146,19 +205,43 @@ async def fetch(
             metadata={
                 "headers": dict(response.headers),
                 "encoding": response.encoding,
+                **({"cache": cache_status} if cache_status else {}),
             },
             robots=robots_decision,
         )
 
 
 async def fetch_many(
-    urls: list[str], policy: FetchPolicy | None = None
+    urls: list[str],
+    policy: FetchPolicy | None = None,
+    *,
+    client: httpx.AsyncClient | None = None,
+    scheduler: PolitenessScheduler | None = None,
+    http_cache: HttpCache | None = None,
 ) -> list[FetchedPage]:
-    """Convenience helper for fetching multiple URLs concurrently."""
+    """Fetch multiple URLs concurrently, paced per host by a scheduler.
+
+    The batch shares one browser session, so on loops without a pooled
+    browser Chromium launches at most once per call rather than per page.
+    """
 
     policy = policy or FetchPolicy()
-    async with httpx.AsyncClient(headers={"User-Agent": policy.user_agent}) as client:
-        tasks = [fetch(url, policy, client=client) for url in urls[: policy.max_pages]]
+    scheduler = scheduler or PolitenessScheduler.from_policy(policy)
+    async with (
+        _build_client(policy, client) as active_client,
+        browser_session() as browsers,
+    ):
+        tasks = [
+            fetch(
+                url,
+                policy,
+                client=active_client,
+                scheduler=scheduler,
+                http_cache=http_cache,
+                browser_pool=browsers,
+            )
+            for url in urls[: policy.max_pages]
+        ]
         return await asyncio.gather(*tasks)
 
 
@@ -0,0 +1,325 @@
+"""Per-origin robots.txt cache shared by Crawlkit and the crawl policy manager.
+
+Entries are keyed by ``scheme://host[:port]`` and expire after ``ttl`` seconds.
+Following RFC 9309, a 4xx response means "no restrictions"; it is cached as a
+negative entry for ``negative_ttl`` seconds so missing robots files are not
+re-requested for every page. A 5xx response or network error means the site
+is unreachable, so the origin is treated as fully disallowed for the shorter
+``error_ttl`` before the robots file is retried. Redirects are followed. The
+cache holds at most ``max_entries`` origins,
+evicting the least recently used, and can persist the raw robots bodies to a
+JSON file so restarts begin warm.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+import httpx
+
+__all__ = [
+    "RobotsCache",
+    "RobotsEntry",
+    "configure_robots_cache",
+    "robots_origin",
+    "shared_robots_cache",
+]
+
+logger = logging.getLogger(__name__)
+
+_CACHE_VERSION = 1
+_ROBOTS_TIMEOUT = 5.0
+# Status recorded for robots.txt downloads that failed before any response.
+_UNREACHABLE = 0
+_DISALLOW_ALL = "User-agent: *\nDisallow: /"
+
+
+def robots_origin(url: str) -> str:
+    """Return the ``scheme://netloc`` cache key for ``url``."""
+
+    parsed = urlparse(url)
+    return f"{parsed.scheme.lower()}://{parsed.netloc.lower()}"
+
+
+@dataclass(slots=True)
+class RobotsEntry:
+    """Cached robots.txt outcome for one origin.
+
+    ``body`` is ``None`` for negative (4xx) entries, which allow everything.
+    Unreachable (5xx or network error) entries carry a disallow-all body.
+    """
+
+    status: int
+    body: str | None
+    fetched_at: float
+    expires_at: float
+    parser: RobotFileParser | None = None
+
+    def __post_init__(self) -> None:
+        if self.parser is None and self.body is not None:
+            parser = RobotFileParser()
+            parser.parse(self.body.splitlines())
+            self.parser = parser
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "status": self.status,
+            "body": self.body,
+            "fetched_at": self.fetched_at,
+            "expires_at": self.expires_at,
+        }
+
+    @classmethod
+    def from_mapping(cls, data: dict[str, Any]) -> "RobotsEntry":
+        body = data.get("body")
+        return cls(
+            status=int(data["status"]),
+            body=None if body is None else str(body),
+            fetched_at=float(data["fetched_at"]),
+            expires_at=float(data["expires_at"]),
+        )
+
+
+class RobotsCache:
+    """TTL- and size-bounded robots.txt cache, safe to share across threads.
+
+    Concurrent async lookups for the same origin on one event loop share a
+    single download.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 24 * 3600.0,
+        negative_ttl: float = 3600.0,
+        error_ttl: float = 300.0,
+        max_entries: int = 1024,
+        path: Path | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.error_ttl = error_ttl
+        self.max_entries = max_entries
+        self.path = Path(path) if path is not None else None
+        self._clock = clock
+        self._entries: OrderedDict[str, RobotsEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, asyncio.Future[RobotsEntry | None]]
+        ] = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+        if self.path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, url: str, *, max_age: float | None = None) -> RobotsEntry | None:
+        """Return the fresh cached entry for ``url``'s origin, if any.
+
+        ``max_age`` lets callers with a stricter TTL treat older entries as
+        missing without evicting them for everyone else.
+        """
+
+        origin = robots_origin(url)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(origin)
+            if entry is not None and entry.expires_at <= now:
+                del self._entries[origin]
+                entry = None
+            if entry is not None and (
+                max_age is None or now - entry.fetched_at < max_age
+            ):
+                self._entries.move_to_end(origin)
+                self.hits += 1
+                return entry
+            self.misses += 1
+            return None
+
+    def store(self, url: str, status: int, body: str | None) -> RobotsEntry | None:
+        """Record a robots.txt response; return the entry, or ``None`` if uncacheable.
+
+        Pass ``status=0`` for downloads that failed without a response.
+        """
+
+        if 200 <= status < 300:
+            ttl = self.ttl
+        elif 400 <= status < 500:
+            ttl, body = self.negative_ttl, None
+        elif status == _UNREACHABLE or 500 <= status < 600:
+            ttl, body = self.error_ttl, _DISALLOW_ALL
+        else:
+            return None
+        now = self._clock()
+        entry = RobotsEntry(
+            status=status, body=body, fetched_at=now, expires_at=now + ttl
+        )
+        origin = robots_origin(url)
+        with self._lock:
+            self._entries[origin] = entry
+            self._entries.move_to_end(origin)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        self._persist()
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        self._persist()
+
+    async def parser(
+        self, url: str, client: httpx.AsyncClient, *, user_agent: str
+    ) -> RobotFileParser | None:
+        """Return the robots parser for ``url``, downloading it on a miss."""
+
+        entry = self.lookup(url)
+        if entry is None:
+            entry = await self._download(url, client, user_agent)
+        return entry.parser if entry is not None else None
+
+    def parser_sync(
+        self,
+        url: str,
+        *,
+        user_agent: str,
+        max_age: float | None = None,
+        client: httpx.Client | None = None,
+    ) -> RobotFileParser | None:
+        """Blocking variant of :meth:`parser` for synchronous callers."""
+
+        entry = self.lookup(url, max_age=max_age)
+        if entry is None:
+            try:
+                response = (client or httpx).get(
+                    _robots_url(url),
+                    headers={"User-Agent": user_agent},
+                    timeout=_ROBOTS_TIMEOUT,
+                    follow_redirects=True,
+                )
+            except httpx.HTTPError as exc:
+                logger.warning("Failed to fetch robots.txt for %s: %s", url, exc)
+                entry = self.store(url, _UNREACHABLE, None)
+            else:
+                logger.info("Fetched robots.txt for %s", robots_origin(url))
+                entry = self.store(url, response.status_code, response.text)
+        return entry.parser if entry is not None else None
+
+    async def _download(
+        self, url: str, client: httpx.AsyncClient, user_agent: str
+    ) -> RobotsEntry | None:
+        origin = robots_origin(url)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pending = self._pending.setdefault(loop, {})
+            future = pending.get(origin)
+            owner = future is None
+            if owner:
+                future = pending[origin] = loop.create_future()
+        assert future is not None
+        if not owner:
+            return await asyncio.shield(future)
+        entry: RobotsEntry | None = None
+        try:
+            response = await client.get(
+                _robots_url(url),
+                headers={"User-Agent": user_agent},
+                timeout=_ROBOTS_TIMEOUT,
+                follow_redirects=True,
+            )
+            entry = self.store(url, response.status_code, response.text)
+        except httpx.HTTPError as exc:
+            logger.warning("Failed to fetch robots.txt for %s: %s", url, exc)
+            entry = self.store(url, _UNREACHABLE, None)
+        finally:
+            with self._lock:
+                pending.pop(origin, None)
+            if not future.done():
+                future.set_result(entry)
+        return entry
+
+    def _load(self) -> None:
+        assert self.path is not None
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable robots cache %s: %s", self.path, exc)
+            return
+        if not isinstance(payload, dict) or payload.get("version") != _CACHE_VERSION:
+            return
+        now = self._clock()
+        entries = sorted(
+            (
+                (origin, RobotsEntry.from_mapping(data))
+                for origin, data in payload.get("entries", {}).items()
+            ),
+            key=lambda item: item[1].fetched_at,
+        )
+        for origin, entry in entries[-self.max_entries :]:
+            if entry.expires_at > now:
+                self._entries[origin] = entry
+
+    def _persist(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            payload = {
+                "version": _CACHE_VERSION,
+                "entries": {
+                    origin: entry.to_dict() for origin, entry in self._entries.items()
+                },
+            }
+        staging = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            staging.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+            os.replace(staging, self.path)
+        except OSError as exc:
+            logger.warning("Failed to persist robots cache %s: %s", self.path, exc)
+
+
+def _robots_url(url: str) -> str:
+    return f"{robots_origin(url)}/robots.txt"
+
+
+_SHARED: RobotsCache | None = None
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_robots_cache() -> RobotsCache:
+    """Return the process-wide cache used by ``fetch`` and ``CrawlPolicyManager``."""
+
+    global _SHARED
+    with _SHARED_LOCK:
+        if _SHARED is None:
+            _SHARED = RobotsCache()
+        return _SHARED
+
+
+def configure_robots_cache(**options: Any) -> RobotsCache:
+    """Replace the shared cache, e.g. ``configure_robots_cache(path=...)``."""
+
+    global _SHARED
+    with _SHARED_LOCK:
+        _SHARED = RobotsCache(**options)
+        return _SHARED
@@ -0,0 +1,137 @@
+"""Asyncio politeness scheduler with per-host token buckets.
+
+:class:`PolitenessScheduler` paces requests per ``scheme://host``: each host
+has a token bucket refilled at one token per interval, where the interval is
+the larger of ``min_interval`` and the host's robots.txt crawl-delay, stretched
+by exponential backoff after :meth:`~PolitenessScheduler.record_error`. Waiting
+happens with ``asyncio.sleep``, so slow hosts never block a thread and many
+hosts progress in parallel. A per-host semaphore and a global semaphore cap
+concurrent requests; the global slot is only taken once the host's token is
+available, so a host that is waiting out its delay does not hold it.
+
+Primitives bind to the event loop that first uses them, so use one scheduler
+per loop (``fetch_many`` creates one per call unless given one).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .robots_cache import robots_origin
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from ..types import FetchPolicy
+
+__all__ = ["PolitenessScheduler"]
+
+
+@dataclass(slots=True)
+class _HostBucket:
+    slots: asyncio.Semaphore
+    tokens: float
+    updated: float
+    crawl_delay: float = 0.0
+    errors: int = 0
+
+
+class PolitenessScheduler:
+    """Grant request slots per host without blocking the event loop."""
+
+    def __init__(
+        self,
+        *,
+        min_interval: float = 1.0,
+        per_host_concurrency: int = 2,
+        max_concurrency: int = 16,
+        burst: int = 1,
+        backoff_base: float = 1.0,
+        backoff_factor: float = 2.0,
+        max_interval: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[object]] = asyncio.sleep,
+    ) -> None:
+        if per_host_concurrency <= 0 or max_concurrency <= 0 or burst <= 0:
+            raise ValueError("concurrency limits and burst must be positive")
+        self.min_interval = max(0.0, min_interval)
+        self.per_host_concurrency = per_host_concurrency
+        self.burst = burst
+        self.backoff_base = backoff_base
+        self.backoff_factor = backoff_factor
+        self.max_interval = max_interval
+        self._clock = clock
+        self._sleep = sleep
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._hosts: dict[str, _HostBucket] = {}
+
+    @classmethod
+    def from_policy(cls, policy: FetchPolicy) -> "PolitenessScheduler":
+        return cls(
+            min_interval=policy.min_delay_seconds,
+            per_host_concurrency=policy.concurrent_per_domain,
+            max_concurrency=policy.max_concurrency,
+        )
+
+    def interval(self, url: str) -> float:
+        """Current seconds between requests to ``url``'s host."""
+
+        bucket = self._bucket(url)
+        interval = max(self.min_interval, bucket.crawl_delay)
+        if bucket.errors:
+            backoff = self.backoff_base * self.backoff_factor ** (bucket.errors - 1)
+            interval = max(interval, min(backoff, self.max_interval))
+        return interval
+
+    def set_crawl_delay(self, url: str, seconds: float | None) -> None:
+        """Apply a robots.txt ``Crawl-delay`` (or request-rate) to the host."""
+
+        self._bucket(url).crawl_delay = max(0.0, float(seconds or 0.0))
+
+    def record_error(self, url: str) -> None:
+        """Back the host off exponentially (429, 5xx or transport failure)."""
+
+        self._bucket(url).errors += 1
+
+    def record_success(self, url: str) -> None:
+        self._bucket(url).errors = 0
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """Wait for the host's turn, then hold a host and a global slot."""
+
+        bucket = self._bucket(url)
+        async with bucket.slots:
+            await self._take_token(url, bucket)
+            async with self._global:
+                yield
+
+    async def _take_token(self, url: str, bucket: _HostBucket) -> None:
+        interval = self.interval(url)
+        now = self._clock()
+        if interval <= 0:
+            bucket.tokens, bucket.updated = float(self.burst), now
+            return
+        bucket.tokens = min(
+            float(self.burst), bucket.tokens + (now - bucket.updated) / interval
+        )
+        bucket.updated = now
+        # Reserve the token up front (the balance may go negative) so waiters
+        # are served in arrival order without re-checking after they wake.
+        bucket.tokens -= 1
+        if bucket.tokens < 0:
+            await self._sleep(-bucket.tokens * interval)
+
+    def _bucket(self, url: str) -> _HostBucket:
+        origin = robots_origin(url)
+        bucket = self._hosts.get(origin)
+        if bucket is None:
+            bucket = self._hosts[origin] = _HostBucket(
+                slots=asyncio.Semaphore(self.per_host_concurrency),
+                tokens=float(self.burst),
+                updated=self._clock(),
+            )
+        return bucket
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Any, Mapping
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Mapping
 
 from pydantic import BaseModel, Field
 
 from ..distill.distill import distill
 from ..extract.entities import extract_entities
+from ..fetch.browser_pool import aclose_browser_pool
+from ..fetch.client_pool import aclose_shared_pool, shared_pool
 from ..fetch.polite_fetch import fetch
 from ..types import FetchPolicy, serialize_for_celery
 
@@ -61,12 +64,24 @@ def build_router() -> "APIRouter":
     return router
 
 
+@asynccontextmanager
+async def lifespan(_app: Any) -> AsyncIterator[None]:
+    """Pool the serving loop's HTTP client and close pooled resources on shutdown."""
+
+    shared_pool().client()
+    try:
+        yield
+    finally:
+        await aclose_browser_pool()
+        await aclose_shared_pool()
+
+
 def create_app() -> "FastAPI":
     if FastAPI is None:  # pragma: no cover - FastAPI missing
         raise RuntimeError("FastAPI is required to create the Crawlkit app")
-    app = FastAPI(title="Crawlkit")
+    app = FastAPI(title="Crawlkit", lifespan=lifespan)
     app.include_router(build_router(), prefix="/crawlkit")
     return app
 
 
-__all__ = ["build_router", "create_app"]
+__all__ = ["build_router", "create_app", "lifespan"]
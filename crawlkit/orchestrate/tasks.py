@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any, Mapping
 
 from ..distill.distill import distill
 from ..extract.entities import extract_entities
+from ..fetch.browser_pool import close_browser_pools
+from ..fetch.client_pool import close_shared_pool, shared_pool
 from ..fetch.polite_fetch import fetch
 from ..types import (
     DistilledDoc,
@@ -27,13 +28,25 @@ except Exception:  # pragma: no cover - optional dependency missing
         return decorator
 
 
+try:  # pragma: no cover - optional dependency
+    from celery.signals import worker_process_shutdown
+except Exception:  # pragma: no cover - optional dependency missing
+    worker_process_shutdown = None
+
+
+def _close_client_pool(**_kwargs: Any) -> None:
+    # Browsers live on the pool's background loop, so close them first.
+    close_browser_pools()
+    close_shared_pool()
+
+
+if worker_process_shutdown is not None:  # pragma: no branch
+    worker_process_shutdown.connect(_close_client_pool, weak=False)
+
+
 def _run(coro):
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        return asyncio.run(coro)
-    else:  # pragma: no cover - defensive fallback when loop exists
-        return asyncio.ensure_future(coro, loop=loop)
+    # Worker processes reuse one background loop, and with it the pooled client.
+    return shared_pool().run(coro)
 
 
 @shared_task(name="crawlkit.fetch_page")
@@ -42,8 +55,6 @@ def fetch_page_task(
 ) -> dict[str, Any]:
     policy_obj = FetchPolicy.from_mapping(policy)
     result = _run(fetch(url, policy_obj))
-    if asyncio.isfuture(result):
-        result = asyncio.get_event_loop().run_until_complete(result)  # pragma: no cover
     assert isinstance(result, FetchedPage)
     return serialize_for_celery(result)
 
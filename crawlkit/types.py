@@ -39,6 +39,8 @@ class FetchPolicy:
     max_depth: int = 2
     max_pages: int = 200
     concurrent_per_domain: int = 2
+    min_delay_seconds: float = 1.0
+    max_concurrency: int = 16
     render_js: Literal["auto", "never", "always"] = "auto"
     region: Literal["ZA", "EU", "UK", "US"] = "ZA"
     user_agent: str = "Watercrawl-Crawlkit/1.0"
@@ -49,6 +51,8 @@ class FetchPolicy:
             "max_depth": self.max_depth,
             "max_pages": self.max_pages,
             "concurrent_per_domain": self.concurrent_per_domain,
+            "min_delay_seconds": self.min_delay_seconds,
+            "max_concurrency": self.max_concurrency,
             "render_js": self.render_js,
             "region": self.region,
             "user_agent": self.user_agent,
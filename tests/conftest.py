@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _relationship_graph_in_tmp_path(tmp_path, monkeypatch):
+    """Keep pipeline runs from writing the relationship graph into the checkout."""
+
+    from watercrawl.core import config
+
+    graph_dir = tmp_path / "relationship-graph"
+    graph_dir.mkdir()
+    monkeypatch.setattr(config, "RELATIONSHIPS_CSV", graph_dir / "relationships.csv")
+    monkeypatch.setattr(
+        config, "RELATIONSHIPS_GRAPHML", graph_dir / "relationships.graphml"
+    )
+    monkeypatch.setattr(
+        config, "RELATIONSHIPS_EDGES_CSV", graph_dir / "relationships_edges.csv"
+    )
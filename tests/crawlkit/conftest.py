@@ -3,6 +3,15 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_robots_cache(monkeypatch):
+    from crawlkit.fetch.robots_cache import RobotsCache
+
+    monkeypatch.setattr("crawlkit.fetch.robots_cache._SHARED", RobotsCache())
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from crawlkit.fetch.browser_pool import BrowserPool, aclose_browser_pool
+from crawlkit.fetch.client_pool import ClientPool
+from crawlkit.fetch.polite_fetch import FetchPolicy, fetch, fetch_many
+
+
+class FakePage:
+    def __init__(self, browser: "FakeBrowser") -> None:
+        self.browser = browser
+        self.url = ""
+
+    async def goto(self, url, wait_until, timeout):
+        if self.browser.crash_on == url:
+            self.browser.connected = False
+            raise RuntimeError("Target closed")
+        self.browser.open_contexts += 1
+        self.browser.peak = max(self.browser.peak, self.browser.open_contexts)
+        await asyncio.sleep(0.01)
+        self.browser.open_contexts -= 1
+        self.url = url
+
+    async def content(self):
+        return f"<html><main>{self.url}</main></html>"
+
+
+class FakeContext:
+    def __init__(self, browser: "FakeBrowser") -> None:
+        self.browser = browser
+
+    async def new_page(self):
+        return FakePage(self.browser)
+
+    async def close(self):
+        self.browser.closed_contexts += 1
+
+
+class FakeBrowser:
+    def __init__(self, crash_on: str | None = None) -> None:
+        self.crash_on = crash_on
+        self.connected = True
+        self.closed = False
+        self.open_contexts = 0
+        self.closed_contexts = 0
+        self.peak = 0
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self):
+        return FakeContext(self)
+
+    async def close(self):
+        self.closed = True
+        self.connected = False
+
+
+def _launcher(browsers: list[FakeBrowser], crash_on: str | None = None):
+    async def launch():
+        browsers.append(FakeBrowser(crash_on=crash_on))
+        return browsers[-1]
+
+    return launch
+
+
+def test_pool_reuses_one_browser_with_capped_contexts():
+    browsers: list[FakeBrowser] = []
+    pool = BrowserPool(max_contexts=2, launcher=_launcher(browsers))
+
+    async def runner():
+        pages = await asyncio.gather(
+            *(pool.render(f"https://example.com/{index}") for index in range(6))
+        )
+        await pool.aclose()
+        return pages
+
+    pages = asyncio.run(runner())
+
+    assert pages[3] == "<html><main>https://example.com/3</main></html>"
+    assert len(browsers) == 1
+    assert browsers[0].peak == 2
+    assert browsers[0].closed_contexts == 6
+    assert browsers[0].closed
+
+
+def test_pool_recycles_after_n_pages_and_after_crash():
+    browsers: list[FakeBrowser] = []
+    pool = BrowserPool(
+        recycle_after=2,
+        launcher=_launcher(browsers, crash_on="https://example.com/crash"),
+    )
+
+    async def runner():
+        for index in range(3):
+            await pool.render(f"https://example.com/{index}")
+        with pytest.raises(RuntimeError):
+            await pool.render("https://example.com/crash")
+        await pool.render("https://example.com/after")
+
+    asyncio.run(runner())
+
+    # 0,1 -> first browser; 2 + crash -> second; "after" -> third.
+    assert len(browsers) == 3
+    assert browsers[0].closed
+    assert pool.launches == 3
+    assert pool.rendered == 4
+
+
+def _render_policy_site(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, text="<html><body></body></html>")
+
+
+def test_fetch_renders_through_shared_pool_on_pooled_loop(monkeypatch):
+    browsers: list[FakeBrowser] = []
+    monkeypatch.setattr(
+        "crawlkit.fetch.browser_pool._OPTIONS", {"launcher": _launcher(browsers)}
+    )
+    pool = ClientPool(transport=httpx.MockTransport(_render_policy_site))
+    monkeypatch.setattr("crawlkit.fetch.client_pool._SHARED", pool)
+    policy = FetchPolicy(obey_robots=False)
+
+    async def runner():
+        pages = [
+            await fetch(f"https://example.com/{index}", policy) for index in range(3)
+        ]
+        await aclose_browser_pool()
+        return pages
+
+    try:
+        pages = pool.run(runner())
+    finally:
+        pool.close()
+
+    assert [page.via for page in pages] == ["rendered"] * 3
+    assert len(browsers) == 1
+    assert browsers[0].closed
+
+
+def test_fetch_closes_browser_on_unpooled_loop(monkeypatch):
+    browsers: list[FakeBrowser] = []
+    monkeypatch.setattr(
+        "crawlkit.fetch.browser_pool._OPTIONS", {"launcher": _launcher(browsers)}
+    )
+    transport = httpx.MockTransport(_render_policy_site)
+
+    async def runner():
+        async with httpx.AsyncClient(transport=transport) as client:
+            policy = FetchPolicy(obey_robots=False)
+            return await fetch("https://example.com/", policy, client=client)
+
+    page = asyncio.run(runner())
+
+    assert page.via == "rendered"
+    assert len(browsers) == 1
+    assert browsers[0].closed
+
+
+def test_fetch_many_launches_one_browser_per_batch_on_unpooled_loop(monkeypatch):
+    browsers: list[FakeBrowser] = []
+    monkeypatch.setattr(
+        "crawlkit.fetch.browser_pool._OPTIONS", {"launcher": _launcher(browsers)}
+    )
+    monkeypatch.setattr(
+        "crawlkit.fetch.client_pool._SHARED",
+        ClientPool(transport=httpx.MockTransport(_render_policy_site)),
+    )
+    policy = FetchPolicy(obey_robots=False, min_delay_seconds=0.0)
+    urls = [f"https://example.com/{index}" for index in range(3)]
+
+    pages = asyncio.run(fetch_many(urls, policy))
+
+    assert [page.via for page in pages] == ["rendered"] * 3
+    assert len(browsers) == 1
+    assert browsers[0].closed
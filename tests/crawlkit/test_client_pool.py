@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from crawlkit.fetch.client_pool import ClientPool, PoolLimits
+from crawlkit.fetch.polite_fetch import fetch
+from crawlkit.types import FetchPolicy
+
+
+def _site(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/robots.txt":
+        return httpx.Response(200, text="User-agent: *\nAllow: /")
+    return httpx.Response(200, text="<html><main>ok</main></html>")
+
+
+def test_run_reuses_one_client_across_sync_calls(monkeypatch):
+    pool = ClientPool(transport=httpx.MockTransport(_site))
+    monkeypatch.setattr("crawlkit.fetch.client_pool._SHARED", pool)
+
+    async def fetch_with_client():
+        page = await fetch("https://example.com/")
+        return page, pool.client()
+
+    try:
+        first_page, first_client = pool.run(fetch_with_client())
+        second_page, second_client = pool.run(fetch_with_client())
+        assert first_page.status == second_page.status == 200
+        assert first_client is second_client
+        assert not first_client.is_closed
+    finally:
+        pool.close()
+    assert first_client.is_closed
+
+
+def test_clients_are_bound_to_their_event_loop():
+    pool = ClientPool(transport=httpx.MockTransport(_site))
+
+    async def current_client():
+        return pool.client()
+
+    first = asyncio.run(current_client())
+    second = asyncio.run(current_client())
+    assert first is not second
+
+
+def test_session_is_scoped_on_loops_the_pool_does_not_own():
+    pool = ClientPool(transport=httpx.MockTransport(_site))
+
+    async def scoped():
+        async with pool.session() as client:
+            assert not pool.is_pooled()
+        return client
+
+    async def pooled():
+        async with pool.session() as client:
+            pass
+        return client
+
+    try:
+        assert asyncio.run(scoped()).is_closed
+        first, second = pool.run(pooled()), pool.run(pooled())
+        assert first is second
+        assert not first.is_closed
+    finally:
+        pool.close()
+
+
+class _CountingServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _KeepAliveHandler)
+        self.open_connections = 0
+        self._count_lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        with self._count_lock:
+            self.open_connections += 1
+        super().process_request(request, client_address)
+
+    def shutdown_request(self, request):
+        with self._count_lock:
+            self.open_connections -= 1
+        super().shutdown_request(request)
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"<html><main>ok</main></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_repeated_asyncio_run_fetches_leave_no_connections(monkeypatch):
+    monkeypatch.setattr("crawlkit.fetch.client_pool._SHARED", ClientPool())
+    server = _CountingServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    policy = FetchPolicy(obey_robots=False, render_js="never")
+    try:
+        for _ in range(3):
+            page = asyncio.run(fetch(url, policy))
+            assert page.status == 200
+        deadline = time.monotonic() + 5
+        while server.open_connections and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert server.open_connections == 0
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_per_host_limit_caps_in_flight_requests():
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    class Body(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            yield b"ok"
+
+    class SlowTransport(httpx.AsyncBaseTransport):
+        async def handle_async_request(self, request):
+            host = request.url.host
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            return httpx.Response(200, stream=Body())
+
+    pool = ClientPool(PoolLimits(max_connections_per_host=2), transport=SlowTransport())
+
+    async def runner():
+        client = pool.client()
+        urls = [
+            f"https://{host}/{index}"
+            for host in ("a.test", "b.test")
+            for index in range(6)
+        ]
+        responses = await asyncio.gather(*(client.get(url) for url in urls))
+        await pool.aclose()
+        return responses
+
+    responses = asyncio.run(runner())
+    assert all(response.status_code == 200 for response in responses)
+    assert peak == {"a.test": 2, "b.test": 2}
@@ -4,6 +4,7 @@ import asyncio
 
 import httpx
 
+from crawlkit.fetch.client_pool import ClientPool
 from crawlkit.fetch.polite_fetch import FetchPolicy, fetch, fetch_many
 
 
@@ -53,12 +54,9 @@ def test_fetch_many_batches_requests(monkeypatch):
         return httpx.Response(200, text="<html><main>ok</main></html>")
 
     transport = httpx.MockTransport(handler)
-
-    class DummyClient(httpx.AsyncClient):
-        def __init__(self, *args, **kwargs):
-            super().__init__(transport=transport, *args, **kwargs)
-
-    monkeypatch.setattr("crawlkit.fetch.polite_fetch.httpx.AsyncClient", DummyClient)
+    monkeypatch.setattr(
+        "crawlkit.fetch.client_pool._SHARED", ClientPool(transport=transport)
+    )
     pages = asyncio.run(
         fetch_many(
             ["https://example.com/a", "https://example.com/b"], policy=FetchPolicy()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from crawlkit.fetch.http_cache import HttpCache
+from crawlkit.fetch.polite_fetch import FetchPolicy, fetch
+
+PAGE = "<html><main>" + "Flight school " * 100 + "</main></html>"
+POLICY = FetchPolicy(obey_robots=False, render_js="never")
+
+
+def _fetch_twice(cache: HttpCache, handler) -> list:
+    async def runner():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return [
+                await fetch(
+                    "https://example.com/", POLICY, client=client, http_cache=cache
+                )
+                for _ in range(2)
+            ]
+
+    return asyncio.run(runner())
+
+
+def test_fresh_entries_are_served_from_disk(tmp_path):
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, text=PAGE, headers={"Cache-Control": "max-age=600"})
+
+    cache = HttpCache(tmp_path)
+    first, second = _fetch_twice(cache, handler)
+
+    assert len(requests) == 1
+    assert (first.metadata["cache"], second.metadata["cache"]) == ("miss", "hit")
+    assert second.html == first.html == PAGE
+    assert cache.stats().to_dict() == {
+        "hits": 1,
+        "revalidated": 0,
+        "misses": 1,
+        "stored": 1,
+    }
+
+
+def test_stale_entries_are_revalidated_with_validators(tmp_path):
+    seen_conditions: list[tuple[str | None, str | None]] = []
+    last_modified = "Wed, 01 Oct 2026 10:00:00 GMT"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        etag = request.headers.get("If-None-Match")
+        seen_conditions.append((etag, request.headers.get("If-Modified-Since")))
+        headers = {
+            "ETag": '"v1"',
+            "Last-Modified": last_modified,
+            "Cache-Control": "no-cache",
+        }
+        if etag == '"v1"':
+            return httpx.Response(304, headers=headers)
+        return httpx.Response(200, text=PAGE, headers=headers)
+
+    cache = HttpCache(tmp_path)
+    first, second = _fetch_twice(cache, handler)
+
+    assert seen_conditions == [(None, None), ('"v1"', last_modified)]
+    assert second.metadata["cache"] == "revalidated"
+    assert second.status == 200
+    assert second.html == PAGE
+    assert cache.stats().revalidated == 1
+
+
+def test_no_store_responses_are_not_cached(tmp_path):
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(
+            200, text=PAGE, headers={"Cache-Control": "no-store", "ETag": '"v1"'}
+        )
+
+    cache = HttpCache(tmp_path)
+    pages = _fetch_twice(cache, handler)
+
+    assert calls == 2
+    assert [page.metadata["cache"] for page in pages] == ["miss", "miss"]
+    assert cache.lookup("https://example.com/") is None
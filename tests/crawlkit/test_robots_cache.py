@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from crawlkit.fetch.client_pool import ClientPool
+from crawlkit.fetch.polite_fetch import FetchPolicy, fetch, fetch_many
+from crawlkit.fetch.robots_cache import RobotsCache
+from watercrawl.integrations.crawl_policy import CrawlPolicyManager
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _counting_site(robots_status: int = 200):
+    hits: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/robots.txt":
+            hits.append(str(request.url))
+            return httpx.Response(
+                robots_status, text="User-agent: *\nDisallow: /private"
+            )
+        return httpx.Response(200, text="<html><main>ok</main></html>")
+
+    return hits, httpx.MockTransport(handler)
+
+
+def test_fetch_many_downloads_robots_once_per_host(monkeypatch):
+    hits, transport = _counting_site()
+    monkeypatch.setattr(
+        "crawlkit.fetch.client_pool._SHARED", ClientPool(transport=transport)
+    )
+    urls = [f"https://example.com/page-{index}" for index in range(5)]
+    urls.append("https://example.com/private/report")
+
+    policy = FetchPolicy(render_js="never", min_delay_seconds=0.0)
+    pages = asyncio.run(fetch_many(urls, policy))
+    asyncio.run(fetch("https://example.com/again", FetchPolicy(render_js="never")))
+
+    assert hits == ["https://example.com/robots.txt"]
+    assert [page.robots_allowed for page in pages] == [True] * 5 + [False]
+
+
+def test_missing_robots_is_cached_until_negative_ttl_expires():
+    hits, transport = _counting_site(robots_status=404)
+    clock = _Clock()
+    cache = RobotsCache(negative_ttl=60, clock=clock)
+
+    async def lookup():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await cache.parser("https://example.com/a", client, user_agent="t")
+
+    assert asyncio.run(lookup()) is None
+    assert asyncio.run(lookup()) is None
+    assert len(hits) == 1
+    clock.now += 61
+    asyncio.run(lookup())
+    assert len(hits) == 2
+
+
+def test_unreachable_robots_disallows_until_error_ttl_expires():
+    hits, transport = _counting_site(robots_status=503)
+    clock = _Clock()
+    cache = RobotsCache(error_ttl=60, clock=clock)
+
+    async def lookup():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await cache.parser("https://example.com/a", client, user_agent="t")
+
+    parser = asyncio.run(lookup())
+    assert parser is not None
+    assert not parser.can_fetch("t", "https://example.com/public")
+    asyncio.run(lookup())
+    assert len(hits) == 1
+    clock.now += 61
+    asyncio.run(lookup())
+    assert len(hits) == 2
+
+
+def test_robots_network_error_is_cached_as_disallow_all():
+    attempts: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(str(request.url))
+        raise httpx.ConnectError("refused", request=request)
+
+    cache = RobotsCache()
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        for _ in range(2):
+            parser = cache.parser_sync(
+                "https://example.com/a", user_agent="t", client=client
+            )
+            assert parser is not None
+            assert not parser.can_fetch("t", "https://example.com/a")
+
+    assert len(attempts) == 1
+    assert cache.lookup("https://example.com/").status == 0
+
+
+def test_cache_evicts_least_recently_used_origin():
+    cache = RobotsCache(max_entries=2)
+    for host in ("a.test", "b.test"):
+        cache.store(f"https://{host}/", 200, "User-agent: *\nAllow: /")
+    assert cache.lookup("https://a.test/x") is not None
+    cache.store("https://c.test/", 200, "User-agent: *\nAllow: /")
+
+    assert cache.lookup("https://b.test/") is None
+    assert cache.lookup("https://a.test/") is not None
+    assert cache.lookup("http://a.test/") is None  # keyed by scheme as well
+
+
+def test_cache_persists_robots_bodies(tmp_path):
+    path = tmp_path / "robots.json"
+    RobotsCache(path=path).store(
+        "https://example.com/", 200, "User-agent: *\nDisallow: /private"
+    )
+
+    entry = RobotsCache(path=path).lookup("https://example.com/private/a")
+    assert entry is not None and entry.parser is not None
+    assert not entry.parser.can_fetch("bot", "https://example.com/private/a")
+    assert entry.parser.can_fetch("bot", "https://example.com/public")
+
+
+def test_crawl_policy_manager_reads_shared_cache():
+    cache = RobotsCache()
+    cache.store("https://example.com/", 200, "User-agent: *\nDisallow: /private")
+    manager = CrawlPolicyManager(robots_cache=cache)
+
+    assert manager.can_fetch("https://example.com/public")
+    assert not manager.can_fetch("https://example.com/private/page")
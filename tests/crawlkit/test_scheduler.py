@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from crawlkit.fetch.polite_fetch import FetchPolicy, fetch
+from crawlkit.fetch.scheduler import PolitenessScheduler
+
+
+def test_requests_to_one_host_are_spaced_by_interval():
+    scheduler = PolitenessScheduler(min_interval=0.05, per_host_concurrency=4)
+    starts: dict[str, list[float]] = {}
+
+    async def request(url):
+        async with scheduler.slot(url):
+            starts.setdefault(url.split("/")[2], []).append(time.monotonic())
+
+    async def runner():
+        await asyncio.gather(
+            *(request(f"https://a.test/{index}") for index in range(3)),
+            request("https://b.test/"),
+        )
+
+    asyncio.run(runner())
+    a_starts, (b_start,) = starts["a.test"], starts["b.test"]
+    gaps = [later - earlier for earlier, later in zip(a_starts, a_starts[1:])]
+    assert all(gap >= 0.045 for gap in gaps)
+    # Other hosts do not queue behind a.test.
+    assert b_start - a_starts[0] < 0.04
+
+
+def test_crawl_delay_and_backoff_stretch_the_interval():
+    scheduler = PolitenessScheduler(
+        min_interval=0.5, backoff_base=1.0, backoff_factor=2.0, max_interval=5.0
+    )
+    url = "https://a.test/page"
+
+    scheduler.set_crawl_delay(url, 3)
+    assert scheduler.interval(url) == 3.0
+    scheduler.set_crawl_delay(url, None)
+    for _ in range(4):
+        scheduler.record_error(url)
+    assert scheduler.interval(url) == 5.0  # 1 * 2**3 capped at max_interval
+    scheduler.record_success(url)
+    assert scheduler.interval(url) == 0.5
+    assert scheduler.interval("https://b.test/") == 0.5
+
+
+def test_global_cap_bounds_parallel_hosts():
+    scheduler = PolitenessScheduler(min_interval=0.0, max_concurrency=2)
+    active = 0
+    peak = 0
+
+    async def request(url):
+        nonlocal active, peak
+        async with scheduler.slot(url):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    async def runner():
+        await asyncio.gather(
+            *(request(f"https://h{index}.test/") for index in range(6))
+        )
+
+    asyncio.run(runner())
+    assert peak == 2
+
+
+def test_fetch_backs_off_after_server_errors():
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(
+            404 if request.url.path == "/robots.txt" else 503
+        )
+    )
+    scheduler = PolitenessScheduler(min_interval=0.0)
+
+    async def runner():
+        async with httpx.AsyncClient(transport=transport) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await fetch(
+                    "https://a.test/",
+                    FetchPolicy(render_js="never"),
+                    client=client,
+                    scheduler=scheduler,
+                )
+
+    asyncio.run(runner())
+    assert scheduler.interval("https://a.test/") == 1.0
@@ -130,6 +130,33 @@ def test_cli_validate_reports_issues(tmp_path):
     assert metadata["schema_uri"].endswith("/validation-report")
 
 
+def test_cli_validate_reuses_validation_cache(tmp_path):
+    input_path = tmp_path / "input.csv"
+    cache_path = tmp_path / "cache" / "validation.json"
+    _write_sample_csv(input_path, include_email=True)
+    command = [
+        "validate",
+        str(input_path),
+        "--format",
+        "json",
+        "--validation-cache",
+        str(cache_path),
+    ]
+
+    runner = CliRunner()
+    first = json.loads(runner.invoke(cli_group, command).output)
+    second = json.loads(runner.invoke(cli_group, command).output)
+
+    assert cache_path.exists()
+    assert first["validation_cache"]["row_misses"] == 1
+    assert second["validation_cache"] == {
+        "row_hits": 1,
+        "row_misses": 0,
+        "organisations_reevaluated": 0,
+    }
+    assert second["issues"] == first["issues"]
+
+
 def test_cli_enrich_creates_output(tmp_path):
     input_path = tmp_path / "input.csv"
     output_path = tmp_path / "output.csv"
@@ -172,6 +199,94 @@ def test_cli_enrich_creates_output(tmp_path):
     assert pipeline_contract["schema_uri"].endswith("/pipeline-report")
 
 
+def test_cli_enrich_writes_requested_dataset_format(tmp_path):
+    pytest.importorskip("pyarrow")
+    input_path = tmp_path / "input.csv"
+    _write_sample_csv(input_path, include_email=True)
+    plan_path = _write_plan(tmp_path)
+    commit_path = _write_commit(tmp_path)
+
+    with cli.override_cli_dependencies(
+        LineageManager=lambda: None,
+        build_lakehouse_writer=lambda: None,
+    ):
+        result = CliRunner().invoke(
+            cli_group,
+            [
+                "enrich",
+                str(input_path),
+                "--dataset-format",
+                "parquet",
+                "--format",
+                "json",
+                "--plan",
+                str(plan_path),
+                "--commit",
+                str(commit_path),
+            ],
+        )
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.output)
+    target = tmp_path / "input_enriched.parquet"
+    assert payload["output_path"] == str(target)
+    assert len(pd.read_parquet(target)) == 1
+
+
+def test_cli_enrich_keeps_compressed_jsonl_suffix(tmp_path):
+    csv_path = tmp_path / "input.csv"
+    _write_sample_csv(csv_path, include_email=True)
+    input_path = tmp_path / "input.jsonl.gz"
+    pd.read_csv(csv_path).to_json(input_path, orient="records", lines=True)
+    plan_path = _write_plan(tmp_path)
+    commit_path = _write_commit(tmp_path)
+
+    with cli.override_cli_dependencies(
+        LineageManager=lambda: None,
+        build_lakehouse_writer=lambda: None,
+    ):
+        result = CliRunner().invoke(
+            cli_group,
+            [
+                "enrich",
+                str(input_path),
+                "--format",
+                "json",
+                "--plan",
+                str(plan_path),
+                "--commit",
+                str(commit_path),
+            ],
+        )
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.output)
+    target = tmp_path / "input_enriched.jsonl.gz"
+    assert payload["output_path"] == str(target)
+    assert len(pd.read_json(target, orient="records", lines=True)) == 1
+
+
+def test_cli_enrich_rejects_mismatched_dataset_format(tmp_path):
+    input_path = tmp_path / "input.csv"
+    _write_sample_csv(input_path, include_email=True)
+
+    result = CliRunner().invoke(
+        cli_group,
+        [
+            "enrich",
+            str(input_path),
+            "--output",
+            str(tmp_path / "output.csv"),
+            "--dataset-format",
+            "parquet",
+            "--plan",
+            str(_write_plan(tmp_path)),
+            "--commit",
+            str(_write_commit(tmp_path)),
+        ],
+    )
+    assert result.exit_code != 0
+    assert "--dataset-format" in result.output
+
+
 def test_cli_enrich_requires_plan(tmp_path):
     input_path = tmp_path / "input.csv"
     output_path = tmp_path / "output.csv"
@@ -222,7 +337,14 @@ def test_cli_enrich_logs_plan_audit(tmp_path, caplog):
     commit_path = _write_commit(tmp_path)
     _write_sample_csv(input_path, include_email=True)
 
-    with caplog.at_level("INFO", logger="watercrawl.plan_commit"):
+    original_manager = cli.LineageManager
+    with (
+        caplog.at_level("INFO", logger="watercrawl.plan_commit"),
+        cli.override_cli_dependencies(
+            LineageManager=lambda: original_manager(artifact_root=tmp_path),
+            build_lakehouse_writer=lambda: None,
+        ),
+    ):
         runner = CliRunner()
         result = runner.invoke(
             cli_group,
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from watercrawl.core.fingerprints import fingerprint_frame
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Name of Organisation": ["Alpha Aero", "Beta Aero", "Gamma Aero"],
+            "Province": ["Gauteng", "Western Cape", None],
+            "Fleet Size": [3, 5, 8],
+        }
+    )
+
+
+def test_fingerprint_ignores_column_order_and_index() -> None:
+    frame = _frame()
+    shuffled = frame[["Fleet Size", "Province", "Name of Organisation"]].set_axis(
+        [10, 20, 30]
+    )
+
+    assert fingerprint_frame(frame) == fingerprint_frame(shuffled)
+    assert len(fingerprint_frame(frame).root) == 64
+
+
+def test_fingerprint_tracks_changed_cells_per_row_and_column() -> None:
+    frame = _frame()
+    edited = frame.copy()
+    edited.loc[1, "Province"] = "Limpopo"
+
+    before = fingerprint_frame(frame)
+    after = fingerprint_frame(edited)
+
+    assert before.root != after.root
+    assert after.changed_columns(before) == ["Province"]
+    changed_rows = [
+        position
+        for position, (old, new) in enumerate(
+            zip(before.row_digests(), after.row_digests())
+        )
+        if old != new
+    ]
+    assert changed_rows == [1]
+    assert before.row_digests(["Name of Organisation"]) == after.row_digests(
+        ["Name of Organisation"]
+    )
+
+
+def test_fingerprint_row_hashes_depend_on_column_names() -> None:
+    left = pd.DataFrame({"a": ["x"], "b": ["y"]})
+    right = pd.DataFrame({"a": ["y"], "b": ["x"]})
+
+    assert (
+        left.pipe(fingerprint_frame).row_digests()
+        != right.pipe(fingerprint_frame).row_digests()
+    )
+
+
+def test_fingerprint_hashes_nested_json_cells() -> None:
+    frame = pd.DataFrame({"tags": [["x", "y"], {"a": 1}, None], "n": [1, 2, 3]})
+    changed = frame.copy()
+    changed.at[0, "tags"] = ["x", "z"]
+
+    fingerprint = fingerprint_frame(frame)
+
+    assert fingerprint_frame(frame.copy()).root == fingerprint.root
+    assert fingerprint_frame(changed).changed_columns(fingerprint) == ["tags"]
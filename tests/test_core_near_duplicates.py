@@ -0,0 +1,104 @@
+import pandas as pd
+import pytest
+
+from watercrawl.core.near_duplicates import (
+    NearDuplicateDetector,
+    merge_near_duplicate_records,
+    normalize_organisation_name,
+)
+from watercrawl.core.normalization import ColumnConflictResolver
+
+
+def _frame(rows: list[dict[str, str]]) -> pd.DataFrame:
+    return pd.DataFrame(
+        rows, columns=["Name of Organisation", "Province", "Website URL"]
+    )
+
+
+def test_normalize_organisation_name_strips_legal_suffixes() -> None:
+    assert normalize_organisation_name("Aero Academy (Pty) Ltd") == "aero academy"
+    assert normalize_organisation_name("  SKY-Flyers CC ") == "sky flyers"
+    assert normalize_organisation_name(None) == ""
+
+
+def test_detector_matches_suffix_variants_within_province() -> None:
+    frame = _frame(
+        [
+            {"Name of Organisation": "Aero Academy (Pty) Ltd", "Province": "Gauteng"},
+            {"Name of Organisation": "Sky Flyers", "Province": "Gauteng"},
+            {"Name of Organisation": "Aero Academy", "Province": "Gauteng"},
+            {"Name of Organisation": "Aero Academy", "Province": "Western Cape"},
+        ]
+    )
+
+    matches = NearDuplicateDetector().find_matches(frame)
+
+    assert [(m.left_index, m.right_index) for m in matches] == [(0, 2)]
+    assert matches[0].similarity == 1.0
+    assert matches[0].block == "province:gauteng"
+
+
+def test_detector_uses_domain_blocks_across_provinces() -> None:
+    frame = _frame(
+        [
+            {
+                "Name of Organisation": "Blue Sky Aviation",
+                "Province": "Gauteng",
+                "Website URL": "https://www.bluesky.example",
+            },
+            {
+                "Name of Organisation": "Blue Sky Aviation Pty",
+                "Province": "Limpopo",
+                "Website URL": "bluesky.example/contact",
+            },
+        ]
+    )
+
+    matches = NearDuplicateDetector().find_matches(frame)
+
+    assert len(matches) == 1
+    assert matches[0].block == "domain:bluesky.example"
+
+
+def test_detector_skips_exact_duplicates_and_dissimilar_names() -> None:
+    frame = _frame(
+        [
+            {"Name of Organisation": "Falcon Flight", "Province": "Gauteng"},
+            {"Name of Organisation": "falcon  flight", "Province": "Gauteng"},
+            {"Name of Organisation": "Eagle Wings", "Province": "Gauteng"},
+        ]
+    )
+
+    assert NearDuplicateDetector().find_matches(frame) == []
+
+
+def test_detector_rejects_invalid_band_configuration() -> None:
+    with pytest.raises(ValueError):
+        NearDuplicateDetector(num_perm=10, bands=3)
+
+
+def test_merge_near_duplicate_records_emits_traces() -> None:
+    frame = _frame(
+        [
+            {
+                "Name of Organisation": "Aero Academy (Pty) Ltd",
+                "Province": "Gauteng",
+                "Website URL": "",
+            },
+            {
+                "Name of Organisation": "Aero Academy",
+                "Province": "Gauteng",
+                "Website URL": "https://aero.example",
+            },
+            {"Name of Organisation": "Sky Flyers", "Province": "Gauteng"},
+        ]
+    )
+
+    result = merge_near_duplicate_records(
+        frame, detector=NearDuplicateDetector(), resolver=ColumnConflictResolver()
+    )
+
+    assert len(result.merged_frame) == 2
+    assert result.merged_frame.loc[0, "Website URL"] == "https://aero.example"
+    assert result.traces[0].key == "aero academy (pty) ltd"
+    assert result.traces[0].source_indices == (0, 1)
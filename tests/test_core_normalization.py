@@ -266,3 +266,100 @@ def test_merge_duplicate_records_collapses_conflicts() -> None:
     assert trace.key == "merge org"
     assert len(trace.source_indices) == 2
     assert any(conflict.column == "Status" for conflict in trace.conflicts)
+
+
+def _merge_duplicates_row_by_row(
+    frame: pd.DataFrame, key_column: str, resolver: ColumnConflictResolver
+) -> tuple[pd.DataFrame, list[RowMergeTrace]]:
+    keys = (
+        frame[key_column]
+        .fillna("")
+        .astype(str)
+        .map(lambda value: " ".join(value.casefold().split()))
+    )
+    merged_rows = []
+    traces = []
+    for key, indices in keys.groupby(keys, sort=False).groups.items():
+        group = frame.loc[list(indices)]
+        base = group.iloc[0].to_dict()
+        conflicts: list[ColumnConflict] = []
+        for _, row in group.iloc[1:].iterrows():
+            for column in frame.columns:
+                selected, conflict = resolver.resolve(
+                    column, base.get(column), row[column]
+                )
+                base[column] = selected
+                if conflict is not None and conflict not in conflicts:
+                    conflicts.append(conflict)
+        merged_rows.append(base)
+        traces.append(
+            RowMergeTrace(
+                key=str(key),
+                source_indices=tuple(int(idx) for idx in indices),
+                conflicts=tuple(conflicts),
+            )
+        )
+    return pd.DataFrame(merged_rows, columns=list(frame.columns)), traces
+
+
+def test_merge_duplicate_records_matches_row_by_row_merge() -> None:
+    names = ["Alpha Aero", "alpha  aero", "Beta Flight", "Gamma", "BETA flight"]
+    statuses = ["Candidate", "Verified", None, "Needs Review", ""]
+    websites = ["https://a.example", None, " https://a.example ", "https://b.example"]
+    rows = []
+    for index in range(60):
+        rows.append(
+            {
+                "Name of Organisation": names[index % len(names)],
+                "Status": statuses[(index * 7) % len(statuses)],
+                "Website URL": websites[(index * 3) % len(websites)],
+                "Fleet Size": float("nan") if index % 4 == 0 else index % 3,
+                "Notes": "note" if index % 5 else "   ",
+            }
+        )
+    frame = pd.DataFrame(rows, index=range(100, 160))
+    descriptors = (
+        ColumnDescriptor(
+            name="Status",
+            semantic_type="enum",
+            allowed_values=("Verified", "Candidate", "Needs Review"),
+        ),
+        ColumnDescriptor(
+            name="Website URL",
+            semantic_type="url",
+            format_hints={"merge_prefer": "incoming"},
+        ),
+        ColumnDescriptor(name="Fleet Size", semantic_type="numeric"),
+    )
+    resolver = ColumnConflictResolver(descriptors)
+
+    result = merge_duplicate_records(
+        frame, key_column="Name of Organisation", resolver=resolver
+    )
+    expected_frame, expected_traces = _merge_duplicates_row_by_row(
+        frame, "Name of Organisation", resolver
+    )
+
+    assert result.traces == expected_traces
+    pd.testing.assert_frame_equal(
+        result.merged_frame, expected_frame, check_dtype=False
+    )
+
+
+def test_merge_duplicate_records_fills_missing_without_conflicts() -> None:
+    frame = pd.DataFrame(
+        [
+            {"Name of Organisation": "Fill Org", "Province": None, "Phone": "011"},
+            {"Name of Organisation": "fill org", "Province": "Gauteng", "Phone": ""},
+            {"Name of Organisation": "Solo", "Province": "Free State", "Phone": None},
+        ]
+    )
+
+    result = merge_duplicate_records(
+        frame, key_column="Name of Organisation", resolver=ColumnConflictResolver()
+    )
+
+    assert list(result.merged_frame["Province"]) == ["Gauteng", "Free State"]
+    assert result.merged_frame.loc[0, "Phone"] == "011"
+    assert [trace.source_indices for trace in result.traces] == [(0, 1), (2,)]
+    assert all(not trace.conflicts for trace in result.traces)
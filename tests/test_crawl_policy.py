@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 
+from crawlkit.fetch.robots_cache import RobotsCache
 from watercrawl.integrations.crawl_policy import (
     CrawlConfig,
     CrawlPolicyManager,
@@ -147,6 +149,31 @@ class TestRateLimiting:
         second_duration = time.time() - start
         assert second_duration >= 0.08  # Allow some margin
 
+    def test_async_wait_queues_callers_without_blocking(self) -> None:
+        config = CrawlConfig(min_delay_seconds=0.05)
+        manager = CrawlPolicyManager(config)
+        host = "example.com"
+        manager.record_success(host)
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            for _ in range(5):
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        async def runner() -> float:
+            start = time.monotonic()
+            await asyncio.gather(
+                *(manager.wait_for_rate_limit_async(host) for _ in range(3)),
+                ticker(),
+            )
+            return time.monotonic() - start
+
+        elapsed = asyncio.run(runner())
+        assert elapsed >= 0.09  # third caller waits two delays
+        assert ticks == 5
+
     def test_exponential_backoff_on_errors(self) -> None:
         config = CrawlConfig(min_delay_seconds=1.0, backoff_factor=2.0)
         manager = CrawlPolicyManager(config)
@@ -214,7 +241,9 @@ class TestCanFetch:
     """Test integrated can_fetch checks."""
 
     def test_allows_valid_url(self) -> None:
-        manager = create_default_policy()
+        cache = RobotsCache()
+        cache.store("https://example.com/", 404, None)
+        manager = CrawlPolicyManager(robots_cache=cache)
 
         url = "https://example.com/about"
         assert manager.can_fetch(url)
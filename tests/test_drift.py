@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from watercrawl.integrations.telemetry.drift import (
@@ -15,6 +17,14 @@ from watercrawl.integrations.telemetry.drift import (
     log_whylogs_profile,
     save_baseline,
 )
+from watercrawl.integrations.telemetry.metrics_store import MetricsStore
+from watercrawl.integrations.telemetry.sketches import (
+    SketchProfile,
+    compare_profiles,
+    load_profile,
+    profile_frame,
+    save_profile,
+)
 
 
 def _sample_frame() -> pd.DataFrame:
@@ -88,3 +98,143 @@ def test_whylogs_profile_fallback_and_alerts(tmp_path: Path) -> None:
 
     assert all(isinstance(alert, WhylogsAlert) for alert in alerts)
     assert any(alert.column == "Status" for alert in alerts)
+
+
+def _numeric_frame(rows: int, *, shift: float = 0.0, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "Fleet Size": rng.normal(10 + shift, 2, size=rows),
+            "Province": rng.choice(["Gauteng", "Western Cape"], size=rows),
+            "Name of Organisation": [f"School {row}" for row in range(rows)],
+        }
+    )
+
+
+def test_sketch_profiles_merge_across_shards(tmp_path: Path) -> None:
+    frame = _numeric_frame(20_000)
+
+    whole = profile_frame(frame, chunk_size=1_000)
+    sharded = profile_frame(frame.iloc[:7_000]).merge(
+        profile_frame(frame.iloc[7_000:], chunk_size=3_000)
+    )
+
+    assert sharded.rows == whole.rows == 20_000
+    fleet = sharded.columns["Fleet Size"]
+    assert fleet.quantiles is not None
+    assert fleet.quantiles.retained() < 1_000
+    median = float(fleet.quantiles.quantiles([0.5])[0])
+    assert abs(median - float(frame["Fleet Size"].median())) < 0.1
+    names = sharded.columns["Name of Organisation"].distinct.estimate()
+    assert abs(names - 20_000) / 20_000 < 0.05
+    assert sharded.columns["Province"].frequent is not None
+    assert set(sharded.columns["Province"].frequent.counters) == {
+        "Gauteng",
+        "Western Cape",
+    }
+
+    path = save_profile(sharded, tmp_path / "profile.json")
+    restored = load_profile(path)
+    assert isinstance(restored, SketchProfile)
+    unchanged = compare_profiles(whole, restored)
+    assert not unchanged.exceeded_threshold
+    assert unchanged.columns["Fleet Size"].psi < 0.01
+
+
+def test_sketch_comparison_flags_shifted_columns() -> None:
+    baseline = profile_frame(_numeric_frame(5_000))
+    shifted = _numeric_frame(5_000, shift=3.0, seed=11)
+    shifted["Province"] = "Gauteng"
+
+    report = compare_profiles(baseline, profile_frame(shifted))
+
+    assert report.drifted_columns == ["Fleet Size", "Province"]
+    assert report.columns["Fleet Size"].psi > report.psi_threshold
+    assert 0 < report.columns["Province"].js_divergence <= 1
+
+
+def test_sketch_comparison_ignores_identifier_churn() -> None:
+    provinces = ["Gauteng", "Western Cape"] * 20
+    baseline = pd.DataFrame(
+        {
+            "Province": provinces,
+            "Name of Organisation": [f"Baseline School {row}" for row in range(40)],
+        }
+    )
+    observed = pd.DataFrame(
+        {
+            "Province": provinces,
+            "Name of Organisation": [f"Observed School {row}" for row in range(40)],
+        }
+    )
+
+    report = compare_profiles(profile_frame(baseline), profile_frame(observed))
+
+    assert report.drifted_columns == []
+    names = report.columns["Name of Organisation"]
+    assert names.high_cardinality
+    assert names.null_rate_delta == 0.0
+    assert not report.columns["Province"].high_cardinality
+
+    observed.loc[:19, "Name of Organisation"] = None
+    degraded = compare_profiles(profile_frame(baseline), profile_frame(observed))
+    assert degraded.drifted_columns == ["Name of Organisation"]
+    assert degraded.columns["Name of Organisation"].null_rate_delta == 0.5
+
+
+def test_sketch_profiles_accept_nested_json_cells() -> None:
+    frame = pd.DataFrame({"Tags": [["x", "y"], ["x", "y"], {"a": 1}, None]})
+
+    sketch = profile_frame(frame).columns["Tags"]
+
+    assert sketch.nulls == 1
+    assert round(sketch.distinct.estimate()) == 2
+
+
+def test_metrics_store_keeps_run_partitions_and_rolling_baselines(
+    tmp_path: Path,
+) -> None:
+    store = MetricsStore(tmp_path / "history", dataset="flight-schools")
+    started = datetime(2025, 1, 1, tzinfo=UTC)
+    frames = [_numeric_frame(2_000, seed=seed) for seed in range(3)]
+    frames[0]["Province"] = "Gauteng"
+    for offset, frame in enumerate(frames):
+        frame["Status"] = "Verified"
+        observed = profile_frame(frame)
+        report = compare_to_baseline(
+            frame,
+            DriftBaseline({"Verified": 1}, {"Gauteng": 1}, total_rows=1),
+            threshold=0.15,
+        )
+        report.sketch_drift = compare_profiles(observed, observed)
+        store.record_run(
+            f"run-{offset}",
+            profile=observed,
+            drift_report=report,
+            recorded_at=started + timedelta(days=offset),
+        )
+
+    runs = store.runs()
+    assert [run.run_id for run in runs] == ["run-0", "run-1", "run-2"]
+    assert [run.run_id for run in store.runs(last=2)] == ["run-1", "run-2"]
+
+    history = store.read_history(last=2, columns=["Fleet Size"], metrics=["psi"])
+    assert list(history["run_id"]) == ["run-1", "run-2"]
+    assert set(history["metric"]) == {"psi"}
+
+    rolling = store.rolling_profile(last=2)
+    assert rolling is not None
+    assert rolling.rows == 4_000
+    province = rolling.columns["Province"].frequent
+    assert province is not None
+    assert province.counters["Western Cape"] > 0
+
+    baseline = store.rolling_baseline(last=2)
+    assert baseline is not None
+    assert baseline.total_rows == 4_000
+    assert baseline.status_counts == {"Verified": 4_000}
+    assert "Western Cape" in baseline.province_counts
+
+    shifted = _numeric_frame(2_000, shift=3.0)
+    drift = compare_profiles(rolling, profile_frame(shifted))
+    assert "Fleet Size" in drift.drifted_columns
@@ -287,6 +287,71 @@ def test_write_dataset_rejects_unsupported_extension(tmp_path: Path) -> None:
         excel.write_dataset(frame, target)
 
 
+@pytest.mark.parametrize(
+    "filename",
+    ["dataset.parquet", "dataset.feather", "dataset.jsonl", "dataset.jsonl.gz"],
+)
+def test_write_dataset_round_trips_columnar_formats(
+    tmp_path: Path, filename: str
+) -> None:
+    if not filename.startswith("dataset.jsonl"):
+        pytest.importorskip("pyarrow")
+    frame = pd.DataFrame(
+        [
+            {
+                "Name of Organisation": "Alpha Aero",
+                "Province": "Gauteng",
+                "Status": "Verified",
+                "Contact Number": "+27115550100",
+            },
+            {
+                "Name of Organisation": "Beta Aero",
+                "Province": "Gauteng",
+                "Status": "Candidate",
+                "Contact Number": None,
+            },
+        ]
+    )
+    target = tmp_path / filename
+
+    excel.write_dataset(frame, target)
+    loaded = excel.read_dataset(target)
+
+    assert list(loaded["Name of Organisation"]) == ["Alpha Aero", "Beta Aero"]
+    assert list(loaded["Status"]) == ["Verified", "Candidate"]
+    assert loaded.loc[0, "Contact Number"] == "+27115550100"
+    assert loaded["Province"].dtype == object
+
+
+def test_write_dataset_dictionary_encodes_low_cardinality_columns(
+    tmp_path: Path,
+) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    frame = pd.DataFrame(
+        {
+            "Name of Organisation": [f"Org {index}" for index in range(6)],
+            "Province": ["Gauteng"] * 6,
+            "Status": ["Verified", "Candidate"] * 3,
+            "Fleet Size": [1, "2 aircraft", None, 4, 5, 6],
+        }
+    )
+    target = tmp_path / "export.bin"
+
+    excel.write_dataset(frame, target, file_format="parquet")
+
+    schema = pq.read_schema(target)
+    assert str(schema.field("Province").type).startswith("dictionary")
+    assert str(schema.field("Status").type).startswith("dictionary")
+    assert str(schema.field("Name of Organisation").type) == "string"
+    assert str(schema.field("Fleet Size").type) == "string"
+
+
+def test_dataset_format_detects_compressed_jsonl() -> None:
+    assert excel.dataset_format(Path("out.jsonl.gz")) == "jsonl"
+    assert excel.dataset_format(Path("out.PARQUET")) == "parquet"
+    assert excel.dataset_format(Path("out.csv.gz")) is None
+
+
 def test_load_school_records_requires_expected_columns(tmp_path: Path) -> None:
     dataset = tmp_path / "dataset.csv"
     pd.DataFrame([{"Name of Organisation": "Example"}]).to_csv(dataset, index=False)
@@ -135,3 +135,66 @@ def test_excel_exporter_links_evidence_rows(tmp_path: Path) -> None:
 
     issues_sheet = workbook[config.ISSUES_SHEET]
     assert "IssuesTable" in issues_sheet.tables
+
+
+def test_streaming_exporter_matches_reload_exporter(tmp_path: Path) -> None:
+    dataframe = _build_sample_dataframe()
+    streaming_path = tmp_path / "streaming.xlsx"
+    reload_path = tmp_path / "reload.xlsx"
+
+    excel.ExcelExporter(streaming_path, tmp_path / "streaming.csv").write(
+        dataframe, _sample_evidence(), issues=_sample_issues()
+    )
+    excel.ExcelExporter(reload_path, tmp_path / "reload.csv", streaming=False).write(
+        dataframe, _sample_evidence(), issues=_sample_issues()
+    )
+
+    streamed = load_workbook(streaming_path)
+    reloaded = load_workbook(reload_path)
+    assert streamed.sheetnames == reloaded.sheetnames
+    for name in streamed.sheetnames:
+        streamed_values = list(streamed[name].iter_rows(values_only=True))
+        reloaded_values = list(reloaded[name].iter_rows(values_only=True))
+        assert streamed_values == reloaded_values, name
+        assert set(streamed[name].tables) == set(reloaded[name].tables)
+
+
+def test_streaming_exporter_writes_nested_values_as_text(tmp_path: Path) -> None:
+    dataframe = _build_sample_dataframe()
+    dataframe["Tags"] = [["x", "y"]] + [{"a": 1}] * (len(dataframe) - 1)
+    streaming_path = tmp_path / "streaming.xlsx"
+    reload_path = tmp_path / "reload.xlsx"
+
+    excel.ExcelExporter(streaming_path, tmp_path / "streaming.csv").write(
+        dataframe, _sample_evidence(), issues=_sample_issues()
+    )
+    excel.ExcelExporter(reload_path, tmp_path / "reload.csv", streaming=False).write(
+        dataframe, _sample_evidence(), issues=_sample_issues()
+    )
+
+    data_sheet = config.CLEANED_SHEET
+    streamed = list(
+        load_workbook(streaming_path)[data_sheet].iter_rows(values_only=True)
+    )
+    reloaded = list(load_workbook(reload_path)[data_sheet].iter_rows(values_only=True))
+    assert streamed == reloaded
+    tags = streamed[0].index("Tags")
+    assert streamed[1][tags] == "['x', 'y']"
+
+
+def test_streaming_exporter_sizes_columns_from_sample(tmp_path: Path) -> None:
+    dataframe = _build_sample_dataframe()
+    dataframe.loc[1, "Contact Email Address"] = "x" * 200
+    exporter = excel.ExcelExporter(
+        tmp_path / "enriched.xlsx", tmp_path / "provenance.csv", width_sample_rows=1
+    )
+
+    exporter.write(dataframe, _sample_evidence(), issues=_sample_issues())
+
+    data_sheet = load_workbook(tmp_path / "enriched.xlsx")[config.CLEANED_SHEET]
+    email_column = list(dataframe.columns).index("Contact Email Address") + 1
+    letter = data_sheet.cell(row=1, column=email_column).column_letter
+    # The long value sits outside the one-row sample, so the header wins.
+    assert (
+        data_sheet.column_dimensions[letter].width == len("Contact Email Address") + 2
+    )
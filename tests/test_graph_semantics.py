@@ -20,6 +20,7 @@ from watercrawl.integrations.telemetry.graph_semantics import (
     build_r2rml_mapping,
     build_relationship_graph,
     generate_graph_semantics_report,
+    update_relationship_graph,
 )
 
 
@@ -119,6 +120,42 @@ def test_generate_graph_semantics_report_flags_low_average_degree() -> None:
     assert "AVG_DEGREE_UNDERFLOW" in issue_codes
 
 
+def test_graph_metrics_issue_order_and_degrees() -> None:
+    frame = pd.DataFrame(
+        {
+            "Name of Organisation": ["Aero", "  ", "Blue Sky", "Aero", "Lonely"],
+            "Province": ["Gauteng", "Gauteng", "", None, " "],
+            "Status": ["Verified", "", "", "Candidate", ""],
+        }
+    )
+
+    report = generate_graph_semantics_report(
+        frame=frame,
+        dataset_uri="file://flight-schools.csv",
+        evidence_log_uri=None,
+    )
+
+    # None renders as "None", so the fourth row still has a province edge.
+    assert report.metrics.edge_count == 4
+    assert report.metrics.min_degree == 0
+    assert report.metrics.max_degree == 4
+    assert report.metrics.average_degree == 4 / 3
+    graph_issues = [
+        (issue.code, (issue.details or {}).get("organisation"))
+        for issue in report.issues
+        if issue.code.startswith(("MISSING_", "ISOLATED_"))
+    ]
+    assert graph_issues == [
+        ("MISSING_ORGANISATION", None),
+        ("MISSING_PROVINCE", "Blue Sky"),
+        ("MISSING_STATUS", "Blue Sky"),
+        ("MISSING_PROVINCE", "Lonely"),
+        ("MISSING_STATUS", "Lonely"),
+        ("ISOLATED_ORGANISATION", "Blue Sky"),
+        ("ISOLATED_ORGANISATION", "Lonely"),
+    ]
+
+
 def test_build_relationship_graph_exports_and_flags_conflicts(tmp_path: Path) -> None:
     org = Organisation(
         identifier=canonical_id("organisation", "Aero Example"),
@@ -178,3 +215,177 @@ def test_build_relationship_graph_exports_and_flags_conflicts(tmp_path: Path) ->
     assert org.identifier in snapshot.centrality
     assert snapshot.anomalies
     assert snapshot.anomalies[0].code == "CONFLICTING_PROVINCE"
+
+
+def test_relationship_graph_analytics_persist_with_snapshot(
+    tmp_path: Path, monkeypatch
+) -> None:
+    import networkx as nx
+
+    from watercrawl.domain.relationships import (
+        graph_analytics_path,
+        load_graph_snapshot,
+    )
+
+    org = Organisation(
+        identifier=canonical_id("organisation", "Aero Example"),
+        name="Aero Example",
+        provenance={_prov("dataset")},
+    )
+    person = Person(
+        identifier=canonical_id("person", "Sam Analyst"),
+        name="Sam Analyst",
+        organisations={org.identifier},
+        provenance={_prov("dataset")},
+    )
+    graphml_path = tmp_path / "relationships.graphml"
+    built = build_relationship_graph(
+        organisations=[org],
+        people=[person],
+        sources=[],
+        evidence=[
+            EvidenceLink(
+                source=org.identifier, target=person.identifier, kind="has_contact"
+            )
+        ],
+        graphml_path=graphml_path,
+        nodes_csv_path=tmp_path / "relationships.csv",
+        edges_csv_path=tmp_path / "relationships_edges.csv",
+    )
+    assert graph_analytics_path(graphml_path).exists()
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("analytics should be read from the snapshot")
+
+    monkeypatch.setattr(nx, "betweenness_centrality", _fail)
+    loaded = load_graph_snapshot(graphml_path=graphml_path)
+
+    assert loaded.centrality == built.centrality
+    assert loaded.betweenness == built.betweenness
+    assert loaded.community_assignments == built.community_assignments
+
+
+def test_update_relationship_graph_merges_run_into_snapshot(tmp_path: Path) -> None:
+    org = Organisation(
+        identifier=canonical_id("organisation", "Aero Example"),
+        name="Aero Example",
+        provinces={"Gauteng"},
+        provenance={_prov("dataset")},
+    )
+    person = Person(
+        identifier=canonical_id("person", "Sam Analyst"),
+        name="Sam Analyst",
+        phones={"+27115550123"},
+        provenance={_prov("dataset")},
+    )
+    contact = EvidenceLink(
+        source=org.identifier,
+        target=person.identifier,
+        kind="has_contact",
+        weight=1.0,
+        provenance={_prov("dataset")},
+    )
+    paths = {
+        "graphml_path": tmp_path / "relationships.graphml",
+        "nodes_csv_path": tmp_path / "relationships.csv",
+        "edges_csv_path": tmp_path / "relationships_edges.csv",
+    }
+    update_relationship_graph(
+        organisations=[org], people=[person], sources=[], evidence=[contact], **paths
+    )
+
+    other = Organisation(
+        identifier=canonical_id("organisation", "Blue Sky"),
+        name="Blue Sky",
+        provinces={"Western Cape"},
+    )
+    snapshot = update_relationship_graph(
+        organisations=[
+            Organisation(
+                identifier=org.identifier,
+                name="Aero Example",
+                provinces={"Limpopo"},
+                provenance={_prov("regulator")},
+            ),
+            other,
+        ],
+        people=[],
+        sources=[],
+        evidence=[
+            contact,
+            EvidenceLink(
+                source=other.identifier, target=person.identifier, kind="has_contact"
+            ),
+        ],
+        **paths,
+    )
+
+    assert snapshot.graph is not None
+    assert snapshot.node_count == 3
+    assert snapshot.edge_count == 2
+    org_data = snapshot.graph.nodes[org.identifier]
+    assert org_data["provinces"] == "Gauteng;Limpopo"
+    assert '"regulator"' in org_data["provenance"]
+    edge = snapshot.graph.get_edge_data(
+        org.identifier, person.identifier, key="has_contact"
+    )
+    assert edge["weight"] == 1.0
+    assert [anomaly.code for anomaly in snapshot.anomalies] == ["CONFLICTING_PROVINCE"]
+    # Sam now bridges both organisations.
+    assert snapshot.betweenness[person.identifier] == 1.0
+    assert snapshot.indexes is not None
+    assert snapshot.indexes.people_for_organisation(other.identifier) == [
+        person.identifier
+    ]
+
+
+def test_update_relationship_graph_replay_is_idempotent(tmp_path: Path) -> None:
+    org = Organisation(
+        identifier=canonical_id("organisation", "Aero Example"),
+        name="Aero Example",
+        provenance={_prov("dataset")},
+    )
+    person = Person(
+        identifier=canonical_id("person", "Sam Analyst"),
+        name="Sam Analyst",
+        provenance={_prov("dataset")},
+    )
+    contact = EvidenceLink(
+        source=org.identifier,
+        target=person.identifier,
+        kind="has_contact",
+        weight=1.0,
+        provenance={_prov("dataset")},
+    )
+    paths = {
+        "graphml_path": tmp_path / "relationships.graphml",
+        "nodes_csv_path": tmp_path / "relationships.csv",
+        "edges_csv_path": tmp_path / "relationships_edges.csv",
+    }
+
+    def _run(link: EvidenceLink):
+        return update_relationship_graph(
+            organisations=[org], people=[person], sources=[], evidence=[link], **paths
+        )
+
+    _run(contact)
+    replayed = _run(contact)
+    corroborated = _run(
+        EvidenceLink(
+            source=org.identifier,
+            target=person.identifier,
+            kind="has_contact",
+            weight=1.0,
+            provenance={_prov("regulator")},
+        )
+    )
+
+    def _weight(snapshot) -> float:
+        assert snapshot.graph is not None
+        edge = snapshot.graph.get_edge_data(
+            org.identifier, person.identifier, key="has_contact"
+        )
+        return edge["weight"]
+
+    assert _weight(replayed) == 1.0
+    assert _weight(corroborated) == 2.0
@@ -10,7 +10,11 @@ from watercrawl.core.excel import EXPECTED_COLUMNS
 from watercrawl.integrations.storage.lakehouse import (
     LakehouseConfig,
     LocalLakehouseWriter,
+    compact_snapshot,
+    diff_snapshots,
     restore_snapshot,
+    restore_snapshot_to_path,
+    vacuum_snapshots,
 )
 
 
@@ -130,3 +134,351 @@ def test_restore_snapshot_returns_latest_snapshot(tmp_path: Path) -> None:
     pd.testing.assert_frame_equal(
         restored_specific[list(frame.columns)], frame, check_dtype=False
     )
+
+
+def _roster(count: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Name of Organisation": [f"School {index:05d}" for index in range(count)],
+            "Province": ["Gauteng", "Western Cape"] * (count // 2),
+            "Status": ["Verified"] * count,
+        }
+    )
+
+
+def _filesystem_writer(tmp_path: Path) -> LocalLakehouseWriter:
+    return LocalLakehouseWriter(
+        LakehouseConfig(
+            backend="filesystem", root_path=tmp_path, table_name="flight_schools"
+        )
+    )
+
+
+def test_diff_snapshots_reports_changed_added_and_removed_rows(
+    tmp_path: Path,
+) -> None:
+    writer = _filesystem_writer(tmp_path)
+    base_frame = _roster(20_000)
+    target_frame = base_frame.drop(index=[7]).reset_index(drop=True)
+    target_frame.loc[100, "Status"] = "Candidate"
+    target_frame = pd.concat(
+        [
+            target_frame,
+            pd.DataFrame(
+                [
+                    {
+                        "Name of Organisation": "New Flyers",
+                        "Province": "Limpopo",
+                        "Status": "Candidate",
+                    }
+                ]
+            ),
+        ],
+        ignore_index=True,
+    )
+    base = writer.write(run_id="run-a", dataframe=base_frame)
+    target = writer.write(run_id="run-b", dataframe=target_frame)
+
+    payload = json.loads(target.manifest_path.read_text())
+    assert target.merkle is not None
+    assert payload["merkle"]["root"] == target.merkle.root
+    assert (target.table_path / payload["artifacts"]["row_index"]).exists()
+
+    diff = diff_snapshots(
+        base_version=base.version,
+        target_version=target.version,
+        table_name="flight_schools",
+        root_path=tmp_path,
+        backend="filesystem",
+    )
+
+    assert diff.added["Name of Organisation"].tolist() == ["New Flyers"]
+    assert diff.removed["Name of Organisation"].tolist() == ["School 00007"]
+    assert diff.changed_before["Status"].tolist() == ["Verified"]
+    assert diff.changed_after["Status"].tolist() == ["Candidate"]
+    assert diff.changed_after["Name of Organisation"].tolist() == ["School 00101"]
+    # Only the row groups holding differing rows are materialised.
+    assert diff.rows_read < len(base_frame)
+    summary = diff.to_dict()
+    assert summary["changed"] == 1
+    assert summary["rows"]["changed"][0]["columns"] == ["Status"]
+
+
+def test_diff_snapshots_short_circuits_identical_snapshots(tmp_path: Path) -> None:
+    writer = _filesystem_writer(tmp_path)
+    frame = _roster(50)
+    base = writer.write(run_id="run-a", dataframe=frame)
+    writer.write(run_id="run-b", dataframe=frame.iloc[::-1])
+
+    diff = diff_snapshots(
+        base_version=base.version,
+        table_name="flight_schools",
+        root_path=tmp_path,
+        backend="filesystem",
+    )
+
+    assert diff.is_empty
+    assert diff.leaves_changed == 0
+    assert diff.rows_read == 0
+
+
+def test_diff_snapshots_hashes_snapshots_without_merkle_metadata(
+    tmp_path: Path,
+) -> None:
+    writer = _filesystem_writer(tmp_path)
+    frame = _roster(10)
+    base = writer.write(run_id="run-a", dataframe=frame)
+    edited = frame.copy()
+    edited.loc[3, "Province"] = "Limpopo"
+    target = writer.write(run_id="run-b", dataframe=edited)
+    for manifest in (base, target):
+        payload = json.loads(manifest.manifest_path.read_text())
+        payload.pop("merkle")
+        manifest.manifest_path.write_text(json.dumps(payload))
+        (manifest.table_path / "row_index.npy").unlink()
+
+    diff = diff_snapshots(
+        base_version=base.version,
+        target_version=target.version,
+        table_name="flight_schools",
+        root_path=tmp_path,
+        backend="filesystem",
+    )
+
+    assert diff.changed_after["Province"].tolist() == ["Limpopo"]
+    assert diff.added.empty and diff.removed.empty
+
+
+def test_partitioned_snapshots_only_write_changed_partitions(tmp_path: Path) -> None:
+    writer = _filesystem_writer(tmp_path)
+    frame = _roster(40)
+    first = writer.write(run_id="run-a", dataframe=frame)
+    edited = frame.copy()
+    edited.loc[2, "Status"] = "Candidate"
+    second = writer.write(run_id="run-b", dataframe=edited)
+
+    first_artifacts = json.loads(first.manifest_path.read_text())["artifacts"]
+    second_artifacts = json.loads(second.manifest_path.read_text())["artifacts"]
+    assert first_artifacts["layout"] == "partitioned"
+    assert first_artifacts["files_written"] == 2
+    # Gauteng/Verified shrank and Gauteng/Candidate appeared; Western Cape is reused.
+    assert second_artifacts["files_written"] == 2
+    assert second_artifacts["files_reused"] == 1
+    assert {partition["path"] for partition in second_artifacts["partitions"]} == {
+        "Province=Gauteng/Status=Candidate",
+        "Province=Gauteng/Status=Verified",
+        "Province=Western Cape/Status=Verified",
+    }
+
+    restored = restore_snapshot(
+        table_name="flight_schools",
+        version=second.version,
+        root_path=tmp_path,
+        backend="filesystem",
+    )
+    pd.testing.assert_frame_equal(restored, edited[sorted(edited.columns)])
+
+
+def test_appended_partitions_compact_and_vacuum(tmp_path: Path) -> None:
+    writer = _filesystem_writer(tmp_path)
+    frame = _roster(10)
+    first = writer.write(run_id="run-a", dataframe=frame)
+    appended = pd.concat([frame, _roster(14).iloc[10:]], ignore_index=True)
+    second = writer.write(run_id="run-b", dataframe=appended)
+
+    partitions = json.loads(second.manifest_path.read_text())["artifacts"]["partitions"]
+    assert [len(partition["files"]) for partition in partitions] == [2, 2]
+
+    report = compact_snapshot(
+        table_name="flight_schools", root_path=tmp_path, backend="filesystem"
+    )
+    assert report.partitions_compacted == 2
+    assert report.files_merged == 4
+
+    preview = vacuum_snapshots(
+        retain_versions=1,
+        table_name="flight_schools",
+        root_path=tmp_path,
+        backend="filesystem",
+        dry_run=True,
+    )
+    assert preview.removed_versions == [first.version]
+    assert len(preview.removed_files) == 4
+    assert first.table_path.exists()
+
+    vacuum_snapshots(
+        retain_versions=1,
+        table_name="flight_schools",
+        root_path=tmp_path,
+        backend="filesystem",
+    )
+    assert not first.table_path.exists()
+    restored = restore_snapshot(
+        table_name="flight_schools", root_path=tmp_path, backend="filesystem"
+    )
+    pd.testing.assert_frame_equal(restored, appended[sorted(appended.columns)])
+
+
+def test_scan_snapshots_prunes_partitions_and_stacks_versions(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from watercrawl.integrations.storage import query
+
+    writer = _filesystem_writer(tmp_path)
+    frame = _roster(20)
+    writer.write(run_id="run-a", dataframe=frame)
+    edited = frame.copy()
+    edited.loc[[0, 2], "Status"] = "Candidate"
+    latest = writer.write(run_id="run-b", dataframe=edited)
+
+    opened: list[Path] = []
+    read_schema = query.pq.read_schema
+    monkeypatch.setattr(
+        query.pq,
+        "read_schema",
+        lambda path: opened.append(Path(path)) or read_schema(path),
+    )
+    table = query.scan_snapshots(
+        columns=["Name of Organisation"],
+        filters=[("Province", "==", "Gauteng"), ("Status", "==", "Verified")],
+        versions=2,
+        table_name="flight_schools",
+        root_path=tmp_path,
+        backend="filesystem",
+    )
+
+    assert all("Province=Gauteng/Status=Verified" in path.as_posix() for path in opened)
+    counts = query.count_by(table, ["snapshot_version"]).to_pylist()
+    assert [row["count"] for row in counts] == [10, 8]
+    assert counts[-1]["snapshot_version"] == latest.version
+    assert table.column_names == ["Name of Organisation", "snapshot_version"]
+
+
+def test_lakehouse_query_command_counts_rows(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    from watercrawl.infrastructure.lakehouse import main
+
+    writer = _filesystem_writer(tmp_path)
+    writer.write(run_id="run-a", dataframe=_roster(6))
+
+    main(
+        [
+            "query",
+            "--table",
+            "flight_schools",
+            "--root",
+            str(tmp_path),
+            "--backend",
+            "filesystem",
+            "--where",
+            "Status in Verified,Candidate",
+            "--count-by",
+            "Province",
+        ]
+    )
+
+    lines = capsys.readouterr().out.strip().splitlines()
+    assert lines == ["Province,count", "Gauteng,3", "Western Cape,3"]
+
+
+def test_parse_filter_supports_membership_and_equality() -> None:
+    from watercrawl.integrations.storage.query import parse_filter
+
+    assert parse_filter("Province = Gauteng") == ("Province", "==", "Gauteng")
+    assert parse_filter("Status not in Verified, Candidate") == (
+        "Status",
+        "not in",
+        ["Verified", "Candidate"],
+    )
+    with pytest.raises(ValueError):
+        parse_filter("Province")
+
+
+def test_restore_snapshot_pushes_down_columns_and_filters(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = LocalLakehouseWriter(
+        LakehouseConfig(
+            backend="filesystem",
+            root_path=tmp_path,
+            table_name="flight_schools",
+            partition_columns=(),
+        )
+    )
+    frame = _roster(20_000)
+    writer.write(run_id="run-a", dataframe=frame)
+
+    row_groups_read: list[int] = []
+    read_row_group = pq.ParquetFile.read_row_group
+
+    def _spy(self: pq.ParquetFile, index: int, *args: object, **kwargs: object):
+        row_groups_read.append(index)
+        return read_row_group(self, index, *args, **kwargs)
+
+    monkeypatch.setattr(pq.ParquetFile, "read_row_group", _spy)
+    restored = restore_snapshot(
+        table_name="flight_schools",
+        root_path=tmp_path,
+        backend="filesystem",
+        columns=["Name of Organisation"],
+        filters=[("Name of Organisation", "in", ["School 00003", "School 19999"])],
+    )
+
+    assert restored.columns.tolist() == ["Name of Organisation"]
+    assert restored["Name of Organisation"].tolist() == [
+        "School 00003",
+        "School 19999",
+    ]
+    # Row-group statistics skip every group between the first and the last.
+    assert row_groups_read == [0, 4]
+
+    arrow_table = restore_snapshot(
+        table_name="flight_schools",
+        root_path=tmp_path,
+        backend="filesystem",
+        columns=["Province"],
+        as_arrow=True,
+    )
+    assert isinstance(arrow_table, pa.Table)
+    assert arrow_table.num_rows == len(frame)
+
+
+def test_filtered_restore_keeps_original_row_order_for_partitions(
+    tmp_path: Path,
+) -> None:
+    import pyarrow.feather as feather
+
+    writer = _filesystem_writer(tmp_path)
+    frame = _roster(12)
+    frame.loc[[1, 4], "Status"] = "Candidate"
+    writer.write(run_id="run-a", dataframe=frame)
+
+    restored = restore_snapshot(
+        table_name="flight_schools",
+        root_path=tmp_path,
+        backend="filesystem",
+        filters=[[("Status", "==", "Candidate")], [("Province", "==", "Gauteng")]],
+    )
+    expected = frame[
+        (frame["Status"] == "Candidate") | (frame["Province"] == "Gauteng")
+    ]
+    pd.testing.assert_frame_equal(
+        restored, expected[sorted(frame.columns)].reset_index(drop=True)
+    )
+
+    output = restore_snapshot_to_path(
+        output_path=tmp_path / "restored.arrow",
+        table_name="flight_schools",
+        root_path=tmp_path,
+        backend="filesystem",
+        columns=["Name of Organisation"],
+        filters=[("Province", "==", "Western Cape")],
+    )
+    mapped = feather.read_table(output, memory_map=True)
+    assert mapped.column("Name of Organisation").to_pylist() == (
+        frame.loc[frame["Province"] == "Western Cape", "Name of Organisation"].tolist()
+    )
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import gzip
 import json
+import threading
 from collections.abc import Sequence
 from dataclasses import replace
 from datetime import datetime
@@ -11,11 +13,14 @@ import pandas as pd
 
 from watercrawl.domain import models
 from watercrawl.integrations.telemetry.lineage import (
+    BackgroundLineageEmitter,
     LineageContext,
     LineageManager,
+    LineageSpool,
     build_catalog_entry,
     build_openlineage_events,
     build_prov_document,
+    write_prov_document,
 )
 
 
@@ -252,3 +257,182 @@ def test_lineage_manager_emits_via_configured_emitter(tmp_path: Path) -> None:
 
     assert emitter.emitted, "Emitter should receive OpenLineage payloads"
     assert emitter.emitted[0][0]["run"]["runId"] == "emit-001"
+
+
+def test_lineage_manager_queues_events_without_blocking(tmp_path: Path) -> None:
+    release = threading.Event()
+    delivered: list[list[dict[str, Any]]] = []
+
+    class SlowEmitter:
+        def emit(self, events: Sequence[dict[str, Any]]) -> None:
+            release.wait(5)
+            delivered.append(list(events))
+
+    manager = LineageManager(artifact_root=tmp_path, transport="logging")
+    assert isinstance(manager.emitter, BackgroundLineageEmitter)
+    manager.emitter.delegate = SlowEmitter()
+    context = LineageContext(
+        run_id="async-001",
+        namespace="aces-aerodynamics",
+        job_name="enrichment",
+        dataset_name="flight-schools",
+        input_uri="file://sample.csv",
+    )
+
+    artifacts = manager.capture(_sample_report(), context)
+
+    assert artifacts.openlineage_path.exists()
+    assert not delivered, "capture must return before the transport is called"
+    release.set()
+    assert manager.flush(timeout=5)
+    assert delivered[0][0]["run"]["runId"] == "async-001"
+    manager.close()
+
+
+def test_background_emitter_spools_and_replays(tmp_path: Path) -> None:
+    class FlakyEmitter:
+        def __init__(self) -> None:
+            self.available = False
+            self.received: list[dict[str, Any]] = []
+
+        def emit(self, events: Sequence[dict[str, Any]]) -> None:
+            if not self.available:
+                raise ConnectionError("transport down")
+            self.received.extend(events)
+
+    delegate = FlakyEmitter()
+    spool = LineageSpool(tmp_path / "spool")
+    emitter = BackgroundLineageEmitter(
+        delegate,
+        spool=spool,
+        batch_size=10,
+        flush_interval=0.01,
+        max_retries=2,
+        sleep=lambda _: None,
+    )
+    emitter.emit([{"eventType": "START", "n": 1}, {"eventType": "COMPLETE", "n": 2}])
+    assert emitter.flush(timeout=5)
+
+    stats = emitter.stats()
+    assert stats.retries == 2
+    assert stats.spooled == 2
+    assert len(spool.pending()) == 1
+    assert spool.read(spool.pending()[0])[1]["n"] == 2
+
+    delegate.available = True
+    emitter.emit([{"eventType": "START", "n": 3}])
+    assert emitter.flush(timeout=5)
+    emitter.close()
+
+    assert [event["n"] for event in delegate.received] == [3, 1, 2]
+    assert spool.pending() == []
+    assert emitter.stats().replayed == 2
+
+
+def test_background_emitter_resumes_partial_replay(tmp_path: Path) -> None:
+    class FailOnceEmitter:
+        def __init__(self) -> None:
+            self.calls = 0
+            self.received: list[dict[str, Any]] = []
+
+        def emit(self, events: Sequence[dict[str, Any]]) -> None:
+            self.calls += 1
+            if self.calls == 3:
+                raise ConnectionError("transport down")
+            self.received.extend(events)
+
+    spool = LineageSpool(tmp_path / "spool")
+    spool.append([{"eventType": "START", "n": n} for n in range(5)])
+    delegate = FailOnceEmitter()
+    emitter = BackgroundLineageEmitter(
+        delegate, spool=spool, batch_size=2, flush_interval=0.01, max_retries=0
+    )
+    emitter.emit([{"eventType": "COMPLETE", "n": 99}])
+    assert emitter.flush(timeout=5)
+    emitter.close()
+
+    assert [event["n"] for event in delegate.received] == [0, 1, 2, 3, 99, 4]
+    assert spool.pending() == []
+    assert emitter.stats().replayed == 5
+
+
+def test_prov_writer_streams_and_summarises_evidence(tmp_path: Path) -> None:
+    report = _sample_report()
+    template = report.evidence_log[0]
+    evidence = [
+        replace(template, row_id=row, organisation=f"School {row % 3}")
+        for row in range(5)
+    ]
+    report = replace(report, evidence_log=evidence)
+    context = LineageContext(
+        run_id="stream-001",
+        namespace="aces-aerodynamics",
+        job_name="enrichment",
+        dataset_name="flight-schools",
+        input_uri="file://sample.csv",
+        output_uri="file://output.csv",
+        execution_start=datetime(2025, 10, 17, 12, 0, 0),
+    )
+    completed = datetime(2025, 10, 17, 12, 30, 0)
+
+    pretty = write_prov_document(
+        tmp_path / "prov.jsonld",
+        report,
+        context,
+        completed_at=completed,
+        record_threshold=2,
+    )
+    document = build_prov_document(
+        report, context, completed_at=completed, record_threshold=2
+    )
+    assert pretty.read_text() == json.dumps(document, indent=2, sort_keys=True)
+
+    graph = document["@graph"]
+    evidence_nodes = [
+        node for node in graph if node["@id"].startswith("urn:aces:evidence:")
+    ]
+    assert len(evidence_nodes) == 3
+    assert evidence_nodes[0]["prov:wasDerivedFrom"] == template.sources
+    summary = _node_lookup(graph, "urn:aces:evidence:stream-001:summary")
+    assert summary["aces:recordCount"] == 3
+    assert summary["aces:organisationCount"] == 3
+
+    packed = write_prov_document(
+        tmp_path / "packed" / "prov.jsonld",
+        report,
+        context,
+        completed_at=completed,
+        record_threshold=2,
+        compact=True,
+        compress=True,
+    )
+    assert packed.name == "prov.jsonld.gz"
+    with gzip.open(packed, "rt", encoding="utf-8") as handle:
+        assert json.load(handle) == document
+
+
+def test_prov_document_omits_evidence_nodes_by_default(tmp_path: Path) -> None:
+    report = _sample_report()
+    context = LineageContext(
+        run_id="default-001",
+        namespace="aces-aerodynamics",
+        job_name="enrichment",
+        dataset_name="flight-schools",
+        input_uri="file://sample.csv",
+        output_uri="file://output.csv",
+        execution_start=datetime(2025, 10, 17, 12, 0, 0),
+    )
+    completed = datetime(2025, 10, 17, 12, 30, 0)
+
+    document = build_prov_document(report, context, completed_at=completed)
+
+    assert report.evidence_log
+    assert not [
+        node
+        for node in document["@graph"]
+        if node["@id"].startswith("urn:aces:evidence:")
+    ]
+    written = write_prov_document(
+        tmp_path / "prov.jsonld", report, context, completed_at=completed
+    )
+    assert written.read_text() == json.dumps(document, indent=2, sort_keys=True)
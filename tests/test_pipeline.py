@@ -51,11 +51,14 @@ from watercrawl.integrations.storage.versioning import (
     VersionInfo,
     VersioningManager,
 )
+from watercrawl.integrations.telemetry.drift import DriftBaseline, save_baseline
 from watercrawl.integrations.telemetry.lineage import (
     LineageArtifacts,
     LineageContext,
     LineageManager,
 )
+from watercrawl.integrations.telemetry.metrics_store import MetricsStore
+from watercrawl.integrations.telemetry.sketches import profile_frame, save_profile
 
 
 def _minimal_frame() -> pd.DataFrame:
@@ -686,6 +689,158 @@ def test_pipeline_sends_slack_alert_on_drift(tmp_path: Path, monkeypatch) -> Non
     config.configure()
 
 
+def test_pipeline_compares_sketch_profile_with_baseline(
+    tmp_path: Path, monkeypatch
+) -> None:
+    baseline_frame = _frame_with_rows(20)
+    baseline_frame["Province"] = "Western Cape"
+    baseline_path = save_profile(
+        profile_frame(baseline_frame), tmp_path / "sketch-baseline.json"
+    )
+    output_dir = tmp_path / "whylogs"
+    env_vars = {
+        "DRIFT_REQUIRE_BASELINE": "0",
+        "DRIFT_SKETCH_BASELINE": str(baseline_path),
+        "DRIFT_WHYLOGS_OUTPUT": str(output_dir),
+        "DRIFT_ALERT_OUTPUT": str(tmp_path / "alerts.json"),
+        "DRIFT_PROMETHEUS_OUTPUT": str(tmp_path / "metrics.prom"),
+    }
+    for key, value in env_vars.items():
+        monkeypatch.setenv(key, value)
+    config.configure()
+
+    pipe = Pipeline(
+        research_adapter=StaticResearchAdapter({}),
+        evidence_sink=_RecordingEvidenceSink(),
+        quality_gate=QualityGate(min_confidence=0, require_official_source=False),
+        lakehouse_writer=TrackingLakehouseWriter(tmp_path),
+        versioning_manager=TrackingVersioningManager(tmp_path),
+        lineage_manager=TrackingLineageManager(tmp_path),
+    )
+    context = LineageContext(
+        run_id="run-sketch-1",
+        namespace="ns",
+        job_name="enrichment",
+        dataset_name="flight-schools",
+        input_uri="file://input.csv",
+    )
+    try:
+        report = asyncio.run(
+            pipe.run_dataframe_async(_frame_with_rows(5), lineage_context=context)
+        )
+    finally:
+        for key in env_vars:
+            monkeypatch.delenv(key, raising=False)
+        config.configure()
+
+    assert report.drift_report is not None
+    sketch_drift = report.drift_report.sketch_drift
+    assert sketch_drift is not None
+    assert "Province" in sketch_drift.drifted_columns
+    assert report.drift_report.exceeded_threshold
+    assert report.metrics.get("drift_sketch_alerts", 0) >= 1
+    assert (output_dir / "run-sketch-1.sketches.json").exists()
+
+
+def test_pipeline_uses_rolling_history_baseline(tmp_path: Path, monkeypatch) -> None:
+    history_path = tmp_path / "history"
+    env_vars = {
+        "DRIFT_REQUIRE_BASELINE": "0",
+        "DRIFT_HISTORY_PATH": str(history_path),
+        "DRIFT_BASELINE_WINDOW": "3",
+        "DRIFT_WHYLOGS_OUTPUT": str(tmp_path / "whylogs"),
+        "DRIFT_ALERT_OUTPUT": str(tmp_path / "alerts.json"),
+        "DRIFT_PROMETHEUS_OUTPUT": str(tmp_path / "metrics.prom"),
+    }
+    for key, value in env_vars.items():
+        monkeypatch.setenv(key, value)
+    config.configure()
+
+    pipe = Pipeline(
+        research_adapter=StaticResearchAdapter({}),
+        evidence_sink=_RecordingEvidenceSink(),
+        quality_gate=QualityGate(min_confidence=0, require_official_source=False),
+        lakehouse_writer=TrackingLakehouseWriter(tmp_path),
+        versioning_manager=TrackingVersioningManager(tmp_path),
+        lineage_manager=TrackingLineageManager(tmp_path),
+    )
+    reports = []
+    try:
+        for run, province in enumerate(["Gauteng", "Western Cape"]):
+            frame = _frame_with_rows(5)
+            frame["Province"] = province
+            context = LineageContext(
+                run_id=f"run-history-{run}",
+                namespace="ns",
+                job_name="enrichment",
+                dataset_name="flight-schools",
+                input_uri="file://input.csv",
+            )
+            reports.append(
+                asyncio.run(pipe.run_dataframe_async(frame, lineage_context=context))
+            )
+    finally:
+        for key in env_vars:
+            monkeypatch.delenv(key, raising=False)
+        config.configure()
+
+    first, second = reports
+    assert first.drift_report is None
+    assert second.drift_report is not None
+    assert second.drift_report.province_drift["Western Cape"].baseline_count == 0
+    assert second.drift_report.sketch_drift is not None
+    assert "Province" in second.drift_report.sketch_drift.drifted_columns
+    store = MetricsStore(history_path, dataset=config.LINEAGE.dataset_name)
+    assert [run.run_id for run in store.runs()] == ["run-history-0", "run-history-1"]
+
+
+def test_pipeline_survives_corrupt_history_partition(
+    tmp_path: Path, monkeypatch, caplog
+) -> None:
+    pytest.importorskip("pyarrow")
+    history_path = tmp_path / "history"
+    baseline_path = tmp_path / "baseline.json"
+    save_baseline(
+        DriftBaseline({"Candidate": 1}, {"Gauteng": 1}, total_rows=1), baseline_path
+    )
+    env_vars = {
+        "DRIFT_BASELINE_PATH": str(baseline_path),
+        "DRIFT_REQUIRE_WHYLOGS_METADATA": "0",
+        "DRIFT_HISTORY_PATH": str(history_path),
+        "DRIFT_BASELINE_WINDOW": "3",
+        "DRIFT_WHYLOGS_OUTPUT": str(tmp_path / "whylogs"),
+        "DRIFT_ALERT_OUTPUT": str(tmp_path / "alerts.json"),
+        "DRIFT_PROMETHEUS_OUTPUT": str(tmp_path / "metrics.prom"),
+    }
+    for key, value in env_vars.items():
+        monkeypatch.setenv(key, value)
+    config.configure()
+    store = MetricsStore(history_path, dataset=config.LINEAGE.dataset_name)
+    partition = store.dataset_root / "run=20250101T000000000000-broken"
+    partition.mkdir(parents=True)
+    (partition / "summary.parquet").write_bytes(b"not parquet")
+
+    pipe = Pipeline(
+        research_adapter=StaticResearchAdapter({}),
+        evidence_sink=_RecordingEvidenceSink(),
+        quality_gate=QualityGate(min_confidence=0, require_official_source=False),
+        lakehouse_writer=TrackingLakehouseWriter(tmp_path),
+        versioning_manager=TrackingVersioningManager(tmp_path),
+        lineage_manager=TrackingLineageManager(tmp_path),
+    )
+    try:
+        with caplog.at_level("WARNING"):
+            report = asyncio.run(pipe.run_dataframe_async(_frame_with_rows(5)))
+    finally:
+        for key in env_vars:
+            monkeypatch.delenv(key, raising=False)
+        config.configure()
+
+    assert report.drift_report is not None
+    assert report.drift_report.province_drift["Gauteng"].baseline_count == 1
+    assert "drift.history_read_failed" in caplog.text
+
+
 def test_pipeline_records_email_issue_for_bare_domain() -> None:
     frame = _minimal_frame()
     frame.at[0, "Name of Organisation"] = "Bare Domain Flight"
@@ -908,3 +1063,34 @@ def test_update_relationship_state_uses_source_info() -> None:
     ]
     assert dataset_tags
     assert any("source_row:1" in (tag.notes or "") for tag in dataset_tags)
+
+
+def test_detect_duplicate_schools_reports_near_duplicates() -> None:
+    pipe = Pipeline()
+    frame = pd.DataFrame(
+        [
+            {"Name of Organisation": "Aero Academy (Pty) Ltd", "Province": "Gauteng"},
+            {"Name of Organisation": "Aero Academy", "Province": "Gauteng"},
+        ]
+    )
+
+    findings = pipe._detect_duplicate_schools(frame, {0: 2, 1: 3})
+
+    assert [finding.issue for finding in findings] == [
+        "near_duplicate_organisation",
+        "near_duplicate_organisation",
+    ]
+    assert {finding.row_id for finding in findings} == {2, 3}
+    assert "row 3" in findings[0].remediation
+
+
+def test_detect_duplicate_schools_skips_near_duplicates_without_detector() -> None:
+    pipe = Pipeline(near_duplicate_detector=None)
+    frame = pd.DataFrame(
+        [
+            {"Name of Organisation": "Aero Academy (Pty) Ltd", "Province": "Gauteng"},
+            {"Name of Organisation": "Aero Academy", "Province": "Gauteng"},
+        ]
+    )
+
+    assert pipe._detect_duplicate_schools(frame, {}) == []
@@ -131,3 +131,107 @@ def test_load_graph_snapshot_reads_metrics(tmp_path: Path) -> None:
     assert organisation_id in snapshot.centrality
     assert snapshot.anomalies
     assert snapshot.anomalies[0].code == "CONFLICTING_PROVINCE"
+
+
+def test_compute_graph_analytics_samples_betweenness() -> None:
+    graph = nx.MultiDiGraph(nx.path_graph(40))
+    exact = relationships.compute_graph_analytics(graph)
+    sampled = relationships.compute_graph_analytics(graph, betweenness_samples=10)
+
+    assert exact.betweenness_samples is None
+    assert sampled.betweenness_samples == 10
+    assert sampled == relationships.compute_graph_analytics(
+        graph, betweenness_samples=10
+    )
+    assert max(sampled.betweenness, key=sampled.betweenness.__getitem__) in {
+        str(node) for node in range(10, 30)
+    }
+    # Sample sizes covering the whole graph fall back to exact betweenness.
+    assert relationships.compute_graph_analytics(graph, betweenness_samples=40) == exact
+
+
+def test_graph_tables_round_trip_matches_graphml(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    graph = nx.MultiDiGraph()
+    graph.add_node("organisation:aero", type="organisation", name="Aero")
+    graph.add_node("person:sam", type="person", name="Sam", phones="+27110000000")
+    graph.add_edge(
+        "organisation:aero",
+        "person:sam",
+        key="has_contact",
+        kind="has_contact",
+        weight=0.5,
+    )
+    graph_path = tmp_path / "relationships.graphml"
+    nx.write_graphml(graph, graph_path)
+    relationships.write_graph_tables(graph, graph_path)
+
+    snapshot = relationships.load_graph_snapshot(graphml_path=graph_path)
+
+    assert snapshot.node_table_path == relationships.graph_table_paths(graph_path)[0]
+    assert snapshot.graph is not None
+    assert list(snapshot.graph.nodes(data=True)) == list(graph.nodes(data=True))
+    assert list(snapshot.graph.edges(keys=True, data=True)) == list(
+        graph.edges(keys=True, data=True)
+    )
+
+
+def test_graph_indexes_answer_lookups_and_persist(tmp_path: Path) -> None:
+    graph = nx.MultiDiGraph()
+    graph.add_node("organisation:aero", type="organisation", name="Aero")
+    graph.add_node(
+        "person:sam",
+        type="person",
+        name="Sam",
+        phones="+27110000000; +27115550123",
+        emails="Sam@Aero.example",
+    )
+    graph.add_node(
+        "source:sacaa",
+        type="source",
+        publisher="South African Civil Aviation Authority",
+        connector="regulator",
+    )
+    graph.add_edge("organisation:aero", "person:sam", key="has_contact")
+    graph.add_edge("organisation:aero", "source:sacaa", key="corroborated_by")
+    graph_path = tmp_path / "relationships.graphml"
+    nx.write_graphml(graph, graph_path)
+
+    indexes = relationships.build_graph_indexes(graph)
+
+    assert indexes.people_with_phone(" +27115550123 ") == ["person:sam"]
+    assert indexes.people_with_email("sam@aero.example") == ["person:sam"]
+    assert indexes.sources_matching("Aviation") == ["source:sacaa"]
+    assert indexes.sources_matching("REGULATOR") == ["source:sacaa"]
+    assert indexes.people_for_organisation("organisation:aero") == ["person:sam"]
+    assert indexes.people_with_phone("+27000000000") == []
+
+    relationships.write_graph_indexes(graph_path, indexes)
+    assert relationships.read_graph_indexes(graph_path) == indexes
+    nx.write_graphml(nx.MultiDiGraph(), graph_path)
+    assert relationships.read_graph_indexes(graph_path) is None
+
+
+def test_update_graph_analytics_matches_full_betweenness() -> None:
+    graph = nx.MultiDiGraph(nx.path_graph(6))
+    graph.add_edges_from([(10, 11), (11, 12)])
+    graph = nx.relabel_nodes(graph, str)
+    previous = relationships.compute_graph_analytics(graph)
+
+    graph.add_edge("5", "13")
+    graph.add_edge("13", "14")
+    updated = relationships.update_graph_analytics(
+        graph,
+        previous,
+        {"5", "13", "14"},
+        previous_node_count=9,
+    )
+    full = relationships.compute_graph_analytics(graph)
+
+    assert updated.centrality == full.centrality
+    assert updated.betweenness == pytest.approx(full.betweenness)
+    # The untouched component keeps one community of its own.
+    assert (
+        len({updated.community_assignments[node] for node in "10 11 12".split()}) == 1
+    )
+    assert set(updated.community_assignments) == set(graph.nodes)
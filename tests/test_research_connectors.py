@@ -4,6 +4,8 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from crawlkit.fetch.robots_cache import RobotsCache
+from watercrawl.integrations.adapters.research import connectors
 from watercrawl.integrations.adapters.research.connectors import (
     ConnectorRequest,
     ConnectorResult,
@@ -12,6 +14,15 @@ from watercrawl.integrations.adapters.research.connectors import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _offline_robots(monkeypatch) -> None:
+    # Unreachable robots.txt means disallow-all, so answer lookups locally.
+    cache = RobotsCache()
+    for origin in ("https://regulator.gov.za", "https://press.example"):
+        cache.store(origin, 404, None)
+    monkeypatch.setattr(connectors._POLITENESS_MANAGER, "robots_cache", cache)
+
+
 @pytest.fixture()
 def sample_request() -> ConnectorRequest:
     return ConnectorRequest(
@@ -3,7 +3,7 @@ import string
 import pytest
 
 from watercrawl.domain.models import validation_report_to_contract
-from watercrawl.domain.validation import DatasetValidator
+from watercrawl.domain.validation import DatasetValidator, ValidationCache
 
 try:
     from hypothesis import given
@@ -120,3 +120,133 @@ def test_email_domain_mismatch_property(labels):
     assert "email_domain_mismatch" in codes
     contract = validation_report_to_contract(report)
     assert "email_domain_mismatch" in {issue.code for issue in contract.issues}
+
+
+def test_columnar_contact_index_matches_record_path():
+    frame = build_frame(
+        BASE_ROW,
+        {
+            **BASE_ROW,
+            "Name of Organisation": "  aero-labs! ",
+            "Website URL": "WWW.AeroLabs.co.za/contact",
+            "Contact Person": "nomonde jacobs",
+            "Contact Number": "(011) 555-0101",
+            "Contact Email Address": "Nomonde.Jacobs@AeroLabs.co.za",
+        },
+        {
+            **BASE_ROW,
+            "Name of Organisation": "nan",
+            "Website URL": "",
+            "Contact Person": None,
+            "Contact Number": " ",
+            "Contact Email Address": None,
+        },
+        {**BASE_ROW, "Name of Organisation": "Sky Academy", "Contact Person": "!!"},
+    )
+    validator = DatasetValidator()
+
+    columnar = validator._build_contact_index(frame)
+    by_record = validator._build_contact_index(frame.to_dict("records"))
+
+    assert list(columnar) == list(by_record)
+    assert columnar == by_record
+    assert [entry.row_number for entry in columnar["organisation:aero-labs"]] == [2, 3]
+
+
+def test_province_and_status_checks_report_sheet_rows():
+    frame = build_frame(
+        BASE_ROW,
+        {**BASE_ROW, "Province": "Atlantis", "Status": ""},
+        {**BASE_ROW, "Province": " unknown ", "Status": "Archived"},
+    )
+    report = DatasetValidator().validate_dataframe(frame)
+    flagged = {
+        (issue.code, issue.row)
+        for issue in report.issues
+        if issue.column in {"Province", "Status"}
+    }
+    assert flagged == {
+        ("invalid_province", 3),
+        ("missing_status", 3),
+        ("invalid_status", 4),
+    }
+
+
+def _issue_tuples(report) -> list[tuple]:
+    return [(issue.code, issue.message, issue.row, issue.column) for issue in report]
+
+
+def test_validation_cache_matches_full_validation_across_edits(tmp_path):
+    frame = build_frame(
+        BASE_ROW,
+        {
+            **BASE_ROW,
+            "Contact Person": "Lerato Maseko",
+            "Contact Email Address": "lerato@aerolabs.co.za",
+        },
+        {
+            **BASE_ROW,
+            "Name of Organisation": "Sky Academy",
+            "Website URL": "https://sky.co.za",
+            "Contact Email Address": "ops@sky.co.za",
+        },
+        {**BASE_ROW, "Name of Organisation": "", "Province": "Atlantis"},
+    )
+    cache = ValidationCache()
+    cached = DatasetValidator(cache=cache)
+    full = DatasetValidator()
+
+    first = cached.validate_dataframe(frame)
+    assert _issue_tuples(first.issues) == _issue_tuples(
+        full.validate_dataframe(frame).issues
+    )
+    assert cache.row_misses == 4
+
+    edited = frame.drop(index=0).reset_index(drop=True)
+    edited.loc[1, "Contact Email Address"] = "lerato@aerolabs.co.za"
+    edited.loc[2, "Status"] = ""
+    path = cache.save(tmp_path / "validation-cache.json")
+    reloaded = ValidationCache.load(path)
+
+    second = DatasetValidator(cache=reloaded).validate_dataframe(edited)
+
+    assert _issue_tuples(second.issues) == _issue_tuples(
+        full.validate_dataframe(edited).issues
+    )
+    assert reloaded.row_hits == 1
+    assert reloaded.row_misses == 2
+    assert "email_reused_across_organisations" in extract_codes(second)
+
+
+def test_validation_cache_skips_unchanged_rows(monkeypatch):
+    frame = build_frame(
+        BASE_ROW,
+        {**BASE_ROW, "Name of Organisation": "Sky Academy", "Status": "Archived"},
+    )
+    cache = ValidationCache()
+    validator = DatasetValidator(cache=cache)
+    expected = _issue_tuples(validator.validate_dataframe(frame).issues)
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("unchanged rows should not be re-normalised")
+
+    monkeypatch.setattr(
+        "watercrawl.domain.validation._build_columnar_contact_index", _fail
+    )
+    assert _issue_tuples(validator.validate_dataframe(frame).issues) == expected
+    assert cache.stats() == {
+        "row_hits": 2,
+        "row_misses": 0,
+        "organisations_reevaluated": 0,
+    }
+
+
+def test_validation_cache_resets_when_profile_settings_change(tmp_path):
+    frame = build_frame(BASE_ROW)
+    cache = ValidationCache()
+    DatasetValidator(cache=cache).validate_dataframe(frame)
+    cache.profile_version = "stale"
+
+    DatasetValidator(cache=cache).validate_dataframe(frame)
+
+    assert cache.row_misses == 1
@@ -16,7 +16,9 @@ try:  # pragma: no cover - fallback for direct execution
     from watercrawl.integrations.telemetry.drift import (
         DriftBaseline,
         log_whylogs_profile,
+        profile_frame,
         save_baseline,
+        save_profile,
     )
 except ModuleNotFoundError:  # pragma: no cover - allows `python seed_drift_baseline.py`
     if str(REPO_ROOT) not in sys.path:
@@ -25,7 +27,9 @@ except ModuleNotFoundError:  # pragma: no cover - allows `python seed_drift_base
     from watercrawl.integrations.telemetry.drift import (
         DriftBaseline,
         log_whylogs_profile,
+        profile_frame,
         save_baseline,
+        save_profile,
     )
 
 
@@ -37,6 +41,10 @@ def _default_metadata_path() -> Path:
     return config.DATA_DIR / "observability" / "whylogs" / "baseline_profile.bin"
 
 
+def _default_sketch_path() -> Path:
+    return config.DATA_DIR / "observability" / "whylogs" / "baseline.sketches.json"
+
+
 def _build_baseline(frame: pd.DataFrame) -> DriftBaseline:
     status_counts = (
         frame["Status"].fillna("Unknown").value_counts(dropna=False).to_dict()
@@ -73,6 +81,12 @@ def main() -> None:
         default=_default_metadata_path(),
         help="Output path (without .json extension) for whylogs profile metadata (default: data/observability/whylogs/baseline_profile.bin).",
     )
+    parser.add_argument(
+        "--sketch-output",
+        type=Path,
+        default=_default_sketch_path(),
+        help="Output path for the mergeable sketch profile used by DRIFT_SKETCH_BASELINE (default: data/observability/whylogs/baseline.sketches.json).",
+    )
     args = parser.parse_args()
 
     frame = pd.read_csv(args.dataset)
@@ -91,8 +105,11 @@ def main() -> None:
         json.dumps(metadata_payload, indent=2, sort_keys=True)
     )
 
+    save_profile(profile_frame(frame), args.sketch_output)
+
     print(f"Baseline written to {args.baseline}")
     print(f"Whylogs metadata written to {profile_info.metadata_path}")
+    print(f"Sketch profile written to {args.sketch_output}")
 
 
 if __name__ == "__main__":
@@ -37,6 +37,11 @@ from watercrawl.application.row_processing import (
 )
 from watercrawl.core import cache as global_cache
 from watercrawl.core import config
+from watercrawl.core.fingerprints import fingerprint_frame
+from watercrawl.core.near_duplicates import (
+    NearDuplicateDetector,
+    merge_near_duplicate_records,
+)
 from watercrawl.core.normalization import (
     ColumnConflictResolver,
     MergeDuplicatesResult,
@@ -83,11 +88,9 @@ from watercrawl.integrations.integration_plugins import (
     instantiate_plugin,
 )
 from watercrawl.integrations.storage.lakehouse import LocalLakehouseWriter
-from watercrawl.integrations.storage.versioning import (
-    VersioningManager,
-    fingerprint_dataframe,
-)
+from watercrawl.integrations.storage.versioning import VersioningManager
 from watercrawl.integrations.telemetry.alerts import send_slack_alert
+from watercrawl.integrations.telemetry.drift import DriftReport
 from watercrawl.integrations.telemetry.drift_dashboard import (
     append_alert_report,
     write_prometheus_metrics,
@@ -96,6 +99,11 @@ from watercrawl.integrations.telemetry.graph_semantics import (
     GraphSemanticsReport,
 )
 from watercrawl.integrations.telemetry.lineage import LineageContext, LineageManager
+from watercrawl.integrations.telemetry.metrics_store import MetricsStore
+from watercrawl.integrations.telemetry.sketches import (
+    SketchDriftReport,
+    SketchProfile,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -167,6 +175,13 @@ def _resolve_path(path: Path | None) -> Path | None:
     return path if path.is_absolute() else (config.PROJECT_ROOT / path)
 
 
+def _drift_history_store() -> MetricsStore | None:
+    history_path = _resolve_path(config.DRIFT.history_path)
+    if history_path is None:
+        return None
+    return MetricsStore(history_path, dataset=config.LINEAGE.dataset_name)
+
+
 def _normalize_cache_key(name: str, province: str) -> tuple[str, str]:
     return (name.strip().casefold(), province)
 
@@ -469,6 +484,9 @@ class Pipeline(PipelineService):
     drift_tools: dict[str, Any] | None = field(
         default_factory=lambda: _load_drift_tools()
     )
+    near_duplicate_detector: NearDuplicateDetector | None = field(
+        default_factory=NearDuplicateDetector
+    )
     _last_report: PipelineReport | None = field(default=None, init=False, repr=False)
     _last_contract: PipelineReportContract | None = field(
         default=None, init=False, repr=False
@@ -757,7 +775,11 @@ class Pipeline(PipelineService):
         lineage_context: LineageContext | None = None,
     ) -> PipelineReport:
         """Asynchronously run the enrichment pipeline for a dataframe."""
-        validation = self.validator.validate_dataframe(frame)
+        # Hash the input once; validation caching and versioning share it.
+        input_fingerprint = fingerprint_frame(frame)
+        validation = self.validator.validate_dataframe(
+            frame, fingerprint=input_fingerprint
+        )
         missing_column_errors = [
             issue for issue in validation.issues if issue.code == "missing_column"
         ]
@@ -767,7 +789,6 @@ class Pipeline(PipelineService):
 
         working_frame = frame.copy(deep=True)
         working_frame_cast = cast(Any, working_frame)
-        input_fingerprint = fingerprint_dataframe(frame)
         evidence_records: list[EvidenceRecord] = []
         enriched_rows = 0
         adapter_failures = 0
@@ -1008,6 +1029,13 @@ class Pipeline(PipelineService):
                         getattr(graph_report, "issues", [])
                     )
             builder = self.graph_semantics_toolkit.get("build_relationship_graph")
+            if config.GRAPH_SEMANTICS.incremental:
+                # Merge this run into the existing snapshot instead of
+                # rebuilding it from this run's entities alone.
+                builder = (
+                    self.graph_semantics_toolkit.get("update_relationship_graph")
+                    or builder
+                )
             if callable(builder) and relationship_orgs:
                 try:
                     snapshot = builder(
@@ -1047,7 +1075,7 @@ class Pipeline(PipelineService):
                     version_info = self.versioning_manager.record_snapshot(
                         run_id=active_context.run_id,
                         manifest=manifest,
-                        input_fingerprint=input_fingerprint,
+                        input_fingerprint=input_fingerprint.root,
                         extras={
                             "source": "pipeline.run_dataframe_async",
                             "environment": config.DEPLOYMENT.profile,
@@ -1080,10 +1108,30 @@ class Pipeline(PipelineService):
             report.version_info = version_info
 
         if self.drift_tools and config.DRIFT.enabled:
+            run_identifier = (
+                active_context.run_id
+                if active_context and active_context.run_id
+                else datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+            )
+            history = _drift_history_store()
+            window = config.DRIFT.baseline_window if history is not None else 0
+            sketch_profile, sketch_drift = self._profile_drift(
+                report.refined_dataframe,
+                run_identifier,
+                metrics,
+                history=history,
+                window=window,
+            )
             comparator = self.drift_tools.get("compare_to_baseline")
             load_baseline_fn = self.drift_tools.get("load_baseline")
             baseline_path = _resolve_path(config.DRIFT.baseline_path)
-            baseline_missing = not (
+            rolling_baseline = None
+            if history is not None and window:
+                try:
+                    rolling_baseline = history.rolling_baseline(window)
+                except Exception as exc:
+                    logger.warning("drift.history_read_failed", exc_info=exc)
+            baseline_missing = rolling_baseline is None and not (
                 baseline_path is not None and baseline_path.exists()
             )
             if config.DRIFT.require_baseline and baseline_missing:
@@ -1108,11 +1156,12 @@ class Pipeline(PipelineService):
                 and callable(load_baseline_fn)
                 and not baseline_missing
             ):
-                try:
-                    baseline = load_baseline_fn(baseline_path)
-                except Exception as exc:  # pragma: no cover - defensive
-                    logger.warning("drift.baseline_load_failed", exc_info=exc)
-                    baseline = None
+                baseline = rolling_baseline
+                if baseline is None:
+                    try:
+                        baseline = load_baseline_fn(baseline_path)
+                    except Exception as exc:  # pragma: no cover - defensive
+                        logger.warning("drift.baseline_load_failed", exc_info=exc)
                 if baseline is not None:
                     drift_report = cast(
                         Any,
@@ -1122,15 +1171,14 @@ class Pipeline(PipelineService):
                             threshold=config.DRIFT.threshold,
                         ),
                     )
+                    if sketch_drift is not None:
+                        drift_report.sketch_drift = sketch_drift
+                        if sketch_drift.exceeded_threshold:
+                            drift_report.exceeded_threshold = True
                     log_profile_fn = self.drift_tools.get("log_whylogs_profile")
                     load_meta_fn = self.drift_tools.get("load_whylogs_metadata")
                     compare_meta_fn = self.drift_tools.get("compare_whylogs_metadata")
                     output_dir = _resolve_path(config.DRIFT.whylogs_output_dir)
-                    run_identifier = (
-                        active_context.run_id
-                        if active_context and active_context.run_id
-                        else datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
-                    )
                     if (
                         callable(log_profile_fn)
                         and callable(load_meta_fn)
@@ -1248,6 +1296,23 @@ class Pipeline(PipelineService):
                                     + 1
                                 )
                     report.drift_report = drift_report
+            if sketch_drift is not None and report.drift_report is None:
+                report.drift_report = DriftReport(
+                    status_drift={},
+                    province_drift={},
+                    exceeded_threshold=sketch_drift.exceeded_threshold,
+                    threshold=config.DRIFT.threshold,
+                    sketch_drift=sketch_drift,
+                )
+            if history is not None:
+                try:
+                    history.record_run(
+                        run_identifier,
+                        profile=sketch_profile,
+                        drift_report=report.drift_report,
+                    )
+                except Exception as exc:  # pragma: no cover - defensive
+                    logger.warning("drift.history_write_failed", exc_info=exc)
 
         self._last_report = report
         self._last_contract = pipeline_report_to_contract(report)
@@ -1345,6 +1410,78 @@ class Pipeline(PipelineService):
             return self._list_sanity_issues()
         raise KeyError(task)
 
+    def _profile_drift(
+        self,
+        frame: Any,
+        run_identifier: str,
+        metrics: dict[str, float | int],
+        *,
+        history: MetricsStore | None = None,
+        window: int = 0,
+    ) -> tuple[SketchProfile | None, SketchDriftReport | None]:
+        """Sketch every column and compare with the sketch baseline, if configured.
+
+        With a history store and ``window`` set, the baseline merges the
+        sketches of the last ``window`` recorded runs instead of reading
+        ``DRIFT_SKETCH_BASELINE``.
+        """
+
+        baseline_path = _resolve_path(config.DRIFT.sketch_baseline_path)
+        if not self.drift_tools or (baseline_path is None and history is None):
+            return None, None
+        profile_fn = self.drift_tools.get("profile_frame")
+        compare_fn = self.drift_tools.get("compare_profiles")
+        load_fn = self.drift_tools.get("load_profile")
+        save_fn = self.drift_tools.get("save_profile")
+        if not all(callable(fn) for fn in (profile_fn, compare_fn, load_fn, save_fn)):
+            return None, None
+        profile = cast(
+            SketchProfile,
+            cast(Any, profile_fn)(frame, chunk_size=config.DRIFT.sketch_chunk_size),
+        )
+        output_dir = _resolve_path(config.DRIFT.whylogs_output_dir)
+        if output_dir is not None and baseline_path is not None:
+            try:
+                cast(Any, save_fn)(
+                    profile, output_dir / f"{run_identifier}.sketches.json"
+                )
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.warning("drift.sketch_save_failed", exc_info=exc)
+        baseline: SketchProfile | None = None
+        if history is not None and window:
+            try:
+                baseline = history.rolling_profile(window)
+            except Exception as exc:
+                logger.warning("drift.history_read_failed", exc_info=exc)
+        if baseline is None and baseline_path is not None:
+            if not baseline_path.exists():
+                metrics["drift_missing_sketch_baseline"] = (
+                    metrics.get("drift_missing_sketch_baseline", 0) + 1
+                )
+                return profile, None
+            try:
+                baseline = cast(SketchProfile, cast(Any, load_fn)(baseline_path))
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.warning("drift.sketch_baseline_load_failed", exc_info=exc)
+                return profile, None
+        if baseline is None:
+            return profile, None
+        result = cast(
+            SketchDriftReport,
+            cast(Any, compare_fn)(
+                baseline,
+                profile,
+                psi_threshold=config.DRIFT.psi_threshold,
+                js_threshold=config.DRIFT.js_threshold,
+                cardinality_ratio=config.DRIFT.sketch_cardinality_ratio,
+            ),
+        )
+        if result.exceeded_threshold:
+            metrics["drift_sketch_alerts"] = metrics.get(
+                "drift_sketch_alerts", 0
+            ) + len(result.drifted_columns)
+        return profile, result
+
     def _frame_from_payload(self, payload: dict[str, object]) -> Any:
         if "path" in payload:
             return read_dataset(Path(str(payload["path"])))
@@ -1369,9 +1506,6 @@ class Pipeline(PipelineService):
         normalized = names.str.strip().str.lower()
         duplicate_mask = normalized.duplicated(keep=False)
         findings: list[SanityCheckFinding] = []
-        if not duplicate_mask.any():
-            return findings
-
         for idx in frame.index[duplicate_mask]:
             row_id = row_lookup.get(idx, 0)
             organisation = names.loc[idx].strip()
@@ -1383,6 +1517,42 @@ class Pipeline(PipelineService):
                     remediation="Deduplicate or merge duplicate organisation rows before publishing.",
                 )
             )
+        findings.extend(self._detect_near_duplicate_schools(frame, row_lookup))
+        return findings
+
+    def _detect_near_duplicate_schools(
+        self, frame: Any, row_lookup: dict[Hashable, int]
+    ) -> list[SanityCheckFinding]:
+        if self.near_duplicate_detector is None:
+            return []
+        counterparts: dict[Hashable, tuple[Hashable, str, float]] = {}
+        for match in self.near_duplicate_detector.find_matches(frame):
+            counterparts.setdefault(
+                match.left_index,
+                (match.right_index, match.right_name, match.similarity),
+            )
+            counterparts.setdefault(
+                match.right_index,
+                (match.left_index, match.left_name, match.similarity),
+            )
+        names = frame["Name of Organisation"].fillna("").astype(str)
+        findings: list[SanityCheckFinding] = []
+        for idx in frame.index:
+            if idx not in counterparts:
+                continue
+            other_idx, other_name, similarity = counterparts[idx]
+            findings.append(
+                SanityCheckFinding(
+                    row_id=row_lookup.get(idx, 0),
+                    organisation=names.loc[idx].strip(),
+                    issue="near_duplicate_organisation",
+                    remediation=(
+                        f"Name is {similarity:.0%} similar to row "
+                        f"{row_lookup.get(other_idx, 0)} ('{other_name}'); "
+                        "confirm and merge before researching both."
+                    ),
+                )
+            )
         return findings
 
     def _summarize_last_run(self) -> dict[str, object]:
@@ -1417,6 +1587,7 @@ class MultiSourcePipeline(Pipeline):
             getattr(config, "COLUMN_DESCRIPTORS", ())
         )
     )
+    merge_near_duplicates: bool = False
 
     def _prepare_multi_source_frame(
         self,
@@ -1427,9 +1598,18 @@ class MultiSourcePipeline(Pipeline):
         dataset = read_dataset(input_path, sheet_map=sheet_map)
         original_rows = dataset.attrs.get("source_rows", [])
         original_files = set(dataset.attrs.get("source_files", []))
-        merge_result = merge_duplicate_records(
-            dataset, key_column="Name of Organisation", resolver=self.conflict_resolver
-        )
+        if self.merge_near_duplicates and self.near_duplicate_detector is not None:
+            merge_result = merge_near_duplicate_records(
+                dataset,
+                detector=self.near_duplicate_detector,
+                resolver=self.conflict_resolver,
+            )
+        else:
+            merge_result = merge_duplicate_records(
+                dataset,
+                key_column="Name of Organisation",
+                resolver=self.conflict_resolver,
+            )
         metadata_by_index: dict[int, Mapping[str, Any]] = {}
         if isinstance(original_rows, list):
             for entry in original_rows:
@@ -14,6 +14,8 @@ if _PANDAS_AVAILABLE:
         config,
         excel,
         external_sources,
+        fingerprints,
+        near_duplicates,
         normalization,
         presets,
     )
@@ -24,6 +26,8 @@ if _PANDAS_AVAILABLE:
         "config",
         "excel",
         "external_sources",
+        "fingerprints",
+        "near_duplicates",
         "normalization",
         "presets",
     ]
@@ -447,6 +447,7 @@ class CrawlerInfrastructureSettings:
     trap_rules_path: Path | None = None
     user_agent: str = "ACESCrawler/1.0"
     robots_cache_hours: float = 6.0
+    http_cache_dir: Path | None = None
 
 
 @dataclass(frozen=True)
@@ -515,6 +516,14 @@ class LineageSettings:
     api_key: str | None = None
     kafka_topic: str | None = None
     kafka_bootstrap_servers: str | None = None
+    async_emit: bool = True
+    spool_dir: Path | None = None
+    queue_size: int = 1000
+    batch_size: int = 50
+    max_retries: int = 3
+    compact_output: bool = False
+    gzip_output: bool = False
+    record_threshold: int = 0
 
 
 @dataclass(frozen=True)
@@ -523,6 +532,8 @@ class LakehouseSettings:
     backend: str = "delta"
     root_path: Path = field(default_factory=lambda: DATA_DIR / "lakehouse")
     table_name: str = "flight_schools"
+    partition_columns: tuple[str, ...] = ("Province", "Status")
+    retain_versions: int = 10
 
 
 @dataclass(frozen=True)
@@ -564,6 +575,8 @@ class GraphSemanticsSettings:
     min_edge_count: int = 2
     min_average_degree: float = 1.5
     max_average_degree: float = 4.0
+    betweenness_samples: int | None = None
+    incremental: bool = False
 
 
 @dataclass(frozen=True)
@@ -585,6 +598,13 @@ class DriftSettings:
     )
     slack_webhook: str | None = None
     dashboard_url: str | None = None
+    sketch_baseline_path: Path | None = None
+    psi_threshold: float = 0.2
+    js_threshold: float = 0.1
+    sketch_cardinality_ratio: float = 0.5
+    sketch_chunk_size: int = 10_000
+    history_path: Path | None = None
+    baseline_window: int = 0
 
 
 DRIFT: DriftSettings = DriftSettings()
@@ -663,6 +683,15 @@ def _build_drift_settings(provider: SecretsProvider) -> DriftSettings:
         or (DATA_DIR / "observability" / "whylogs" / "metrics.prom"),
         slack_webhook=slack_webhook,
         dashboard_url=dashboard_url,
+        sketch_baseline_path=_env_path("DRIFT_SKETCH_BASELINE", provider),
+        psi_threshold=_env_float("DRIFT_PSI_THRESHOLD", 0.2, provider),
+        js_threshold=_env_float("DRIFT_JS_THRESHOLD", 0.1, provider),
+        sketch_cardinality_ratio=_env_float(
+            "DRIFT_SKETCH_CARDINALITY_RATIO", 0.5, provider
+        ),
+        sketch_chunk_size=max(1, _env_int("DRIFT_SKETCH_CHUNK_SIZE", 10_000, provider)),
+        history_path=_env_path("DRIFT_HISTORY_PATH", provider),
+        baseline_window=max(0, _env_int("DRIFT_BASELINE_WINDOW", 0, provider)),
     )
 
 
@@ -946,6 +975,7 @@ def configure(provider: SecretsProvider | None = None) -> None:
         robots_cache_hours=_env_float(
             "CRAWLER_ROBOTS_CACHE_HOURS", 6.0, SECRETS_PROVIDER
         ),
+        http_cache_dir=_env_path("CRAWLER_HTTP_CACHE_DIR", SECRETS_PROVIDER),
     )
 
     probes = HealthProbeSettings(
@@ -1053,6 +1083,10 @@ def configure(provider: SecretsProvider | None = None) -> None:
         min_edge_count=_env_int("GRAPH_MIN_EDGE_COUNT", 2, SECRETS_PROVIDER),
         min_average_degree=_env_float("GRAPH_MIN_AVG_DEGREE", 1.5, SECRETS_PROVIDER),
         max_average_degree=_env_float("GRAPH_MAX_AVG_DEGREE", 4.0, SECRETS_PROVIDER),
+        betweenness_samples=(
+            _env_int("GRAPH_BETWEENNESS_SAMPLES", 0, SECRETS_PROVIDER) or None
+        ),
+        incremental=_env_bool("GRAPH_INCREMENTAL", False, SECRETS_PROVIDER),
     )
 
     lineage_root = _env_path("LINEAGE_ARTIFACT_ROOT", SECRETS_PROVIDER) or (
@@ -1095,11 +1129,26 @@ def configure(provider: SecretsProvider | None = None) -> None:
         api_key=lineage_api_key,
         kafka_topic=lineage_kafka_topic,
         kafka_bootstrap_servers=lineage_kafka_bootstrap,
+        async_emit=_env_bool("LINEAGE_ASYNC_EMIT", True, SECRETS_PROVIDER),
+        spool_dir=_env_path("LINEAGE_SPOOL_DIR", SECRETS_PROVIDER),
+        queue_size=max(1, _env_int("LINEAGE_QUEUE_SIZE", 1000, SECRETS_PROVIDER)),
+        batch_size=max(1, _env_int("LINEAGE_BATCH_SIZE", 50, SECRETS_PROVIDER)),
+        max_retries=max(0, _env_int("LINEAGE_MAX_RETRIES", 3, SECRETS_PROVIDER)),
+        compact_output=_env_bool("LINEAGE_COMPACT", False, SECRETS_PROVIDER),
+        gzip_output=_env_bool("LINEAGE_GZIP", False, SECRETS_PROVIDER),
+        record_threshold=max(
+            0, _env_int("LINEAGE_RECORD_THRESHOLD", 0, SECRETS_PROVIDER)
+        ),
     )
 
     lakehouse_root = _env_path("LAKEHOUSE_ROOT", SECRETS_PROVIDER) or (
         DATA_DIR / "lakehouse"
     )
+    lakehouse_partitions: tuple[str, ...] = ("Province", "Status")
+    if _get_value("LAKEHOUSE_PARTITION_COLUMNS", None, SECRETS_PROVIDER) is not None:
+        lakehouse_partitions = tuple(
+            _env_list("LAKEHOUSE_PARTITION_COLUMNS", SECRETS_PROVIDER)
+        )
     LAKEHOUSE = LakehouseSettings(
         enabled=_env_bool("LAKEHOUSE_ENABLED", True, SECRETS_PROVIDER),
         backend=_get_value("LAKEHOUSE_BACKEND", "delta", SECRETS_PROVIDER) or "delta",
@@ -1108,6 +1157,10 @@ def configure(provider: SecretsProvider | None = None) -> None:
             "LAKEHOUSE_TABLE_NAME", "flight_schools", SECRETS_PROVIDER
         )
         or "flight_schools",
+        partition_columns=lakehouse_partitions,
+        retain_versions=max(
+            1, _env_int("LAKEHOUSE_RETAIN_VERSIONS", 10, SECRETS_PROVIDER)
+        ),
     )
 
     DEPLOYMENT = _build_deployment_settings(SECRETS_PROVIDER)
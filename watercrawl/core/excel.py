@@ -2,19 +2,31 @@
 
 from __future__ import annotations
 
+import datetime
+import importlib.util
 import json
+import warnings
 from collections import Counter
 from collections.abc import Iterable, Sequence
 from dataclasses import asdict, dataclass, is_dataclass
+from decimal import Decimal
 from pathlib import Path
 from typing import Any, Mapping
 
 import pandas as pd
-from openpyxl import load_workbook  # type: ignore[import]
+from openpyxl import Workbook, load_workbook  # type: ignore[import]
+from openpyxl.cell import WriteOnlyCell  # type: ignore[import]
 from openpyxl.formatting.rule import CellIsRule  # type: ignore[import]
 from openpyxl.styles import Alignment, Font, PatternFill  # type: ignore[import]
-from openpyxl.utils import get_column_letter  # type: ignore[import]
-from openpyxl.worksheet.table import Table, TableStyleInfo  # type: ignore[import]
+from openpyxl.utils import (  # type: ignore[import]
+    coordinate_to_tuple,
+    get_column_letter,
+)
+from openpyxl.worksheet.table import (  # type: ignore[import]
+    Table,
+    TableColumn,
+    TableStyleInfo,
+)
 
 from watercrawl.domain.models import EXPECTED_COLUMNS as DOMAIN_EXPECTED_COLUMNS
 from watercrawl.domain.models import (
@@ -30,7 +42,24 @@ from .normalization import ColumnNormalizationRegistry, normalize_numeric_value
 
 EXPECTED_COLUMNS = DOMAIN_EXPECTED_COLUMNS
 
-_SUPPORTED_SUFFIXES = {".csv", ".xlsx", ".xls"}
+_DATASET_FORMATS = {
+    ".csv": "csv",
+    ".xlsx": "xlsx",
+    ".xls": "xlsx",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".feather": "feather",
+    ".arrow": "feather",
+    ".ipc": "feather",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+_JSONL_COMPRESSION_SUFFIXES = {".gz", ".bz2", ".xz", ".zst"}
+DATASET_FORMATS = ("xlsx", "csv", "parquet", "feather", "jsonl")
+# Columns always stored dictionary-encoded in columnar outputs; other text
+# columns are encoded when their cardinality is low enough to benefit.
+DICTIONARY_COLUMNS = ("Province", "Status")
+_DICTIONARY_MAX_RATIO = 0.5
 EVIDENCE_SHEET = "Evidence"
 
 
@@ -329,7 +358,7 @@ def _expand_input(target: Path) -> list[Path]:
         return [
             child
             for child in sorted(target.iterdir(), key=lambda item: item.name.lower())
-            if child.is_file() and child.suffix.lower() in _SUPPORTED_SUFFIXES
+            if child.is_file() and dataset_format(child) is not None
         ]
     return [target]
 
@@ -429,13 +458,278 @@ def _align_columns(
     return aligned[ordered_columns + remaining], missing_columns, inference_result
 
 
+_ISSUE_COLUMN_RENAMES = {
+    "row_id": "Row ID",
+    "organisation": "Organisation",
+    "code": "Code",
+    "severity": "Severity",
+    "message": "Message",
+    "remediation": "Remediation",
+}
+_ISSUE_COLUMNS = list(_ISSUE_COLUMN_RENAMES.values())
+_EVIDENCE_COLUMNS = [
+    "RowID",
+    "Organisation",
+    "What changed",
+    "Sources",
+    "Notes",
+    "Timestamp",
+    "Confidence",
+]
+_WIDTH_SAMPLE_ROWS = 500
+
+
+def _build_issues_frame(issue_records: list[dict[str, Any]]) -> pd.DataFrame:
+    issues_frame = (
+        pd.DataFrame(issue_records)
+        if issue_records
+        else pd.DataFrame(columns=list(_ISSUE_COLUMN_RENAMES))
+    )
+    issues_frame = issues_frame.rename(columns=_ISSUE_COLUMN_RENAMES)
+    issue_remainder = [
+        column for column in issues_frame.columns if column not in _ISSUE_COLUMNS
+    ]
+    return issues_frame.reindex(columns=_ISSUE_COLUMNS + issue_remainder)
+
+
+def _build_evidence_frame(evidence_records: list[dict[str, Any]]) -> pd.DataFrame:
+    evidence_frame = (
+        pd.DataFrame(evidence_records)
+        if evidence_records
+        else pd.DataFrame(columns=_EVIDENCE_COLUMNS)
+    )
+    evidence_remainder = [
+        column for column in evidence_frame.columns if column not in _EVIDENCE_COLUMNS
+    ]
+    return evidence_frame.reindex(columns=_EVIDENCE_COLUMNS + evidence_remainder)
+
+
+def _find_column(columns: Sequence[Any], name: str) -> int | None:
+    """Return the 1-based position of ``name`` (case-insensitive) in ``columns``."""
+
+    for index, column in enumerate(columns, start=1):
+        if isinstance(column, str) and column.strip().lower() == name:
+            return index
+    return None
+
+
+def _sample_column_widths(
+    frame: pd.DataFrame, sample_rows: int = _WIDTH_SAMPLE_ROWS
+) -> dict[int, int]:
+    """Estimate column widths from the header and the first ``sample_rows`` rows."""
+
+    sample = frame.head(sample_rows)
+    widths: dict[int, int] = {}
+    for index in range(len(frame.columns)):
+        lengths = sample.iloc[:, index].dropna().astype(str).str.len()
+        longest = len(str(frame.columns[index]))
+        if not lengths.empty:
+            longest = max(longest, int(lengths.max()))
+        widths[index + 1] = min(longest + 2, 60)
+    return widths
+
+
+def _row_lookup_from_frame(frame: pd.DataFrame) -> dict[int, int]:
+    """Map dataset row identifiers to worksheet rows without reading the sheet."""
+
+    rowid_index = _find_column(list(frame.columns), "rowid")
+    if rowid_index is None:
+        return {position: position + 2 for position in range(len(frame))}
+    mapping: dict[int, int] = {}
+    for excel_row, value in enumerate(frame.iloc[:, rowid_index - 1], start=2):
+        if value is None or _is_missing_cell(value):
+            continue
+        try:
+            mapping[int(str(value))] = excel_row
+        except ValueError:
+            continue
+    return mapping
+
+
+# Values openpyxl can write natively; anything else is converted to ``str``.
+_EXCEL_NATIVE_TYPES = (
+    str,
+    bool,
+    int,
+    float,
+    Decimal,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+)
+
+
+def _is_missing_cell(value: Any) -> bool:
+    try:
+        return bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+
+def _excel_cell_value(value: Any) -> Any:
+    if value is None or _is_missing_cell(value):
+        return None
+    if hasattr(value, "item") and not isinstance(value, (str, bytes)):
+        try:
+            value = value.item()
+        except (TypeError, ValueError):
+            pass
+    if isinstance(value, _EXCEL_NATIVE_TYPES):
+        return value
+    # Lists, dicts and other objects are written as text, like pandas does.
+    return str(value)
+
+
+def _add_streaming_table(
+    worksheet,
+    name: str,
+    headers: Sequence[str],
+    row_count: int,
+    *,
+    style: str,
+    anchor: str = "A1",
+) -> None:
+    """Register a table on a write-only sheet; columns must be declared upfront."""
+
+    if row_count < 1 or not headers:
+        return
+    start_column, start_row = coordinate_to_tuple(anchor)[::-1]
+    end_column = get_column_letter(start_column + len(headers) - 1)
+    table = Table(
+        displayName=name,
+        ref=f"{anchor}:{end_column}{start_row + row_count}",
+    )
+    table.tableColumns = [
+        TableColumn(id=index, name=header)
+        for index, header in enumerate(headers, start=1)
+    ]
+    table.tableStyleInfo = TableStyleInfo(
+        name=style,
+        showRowStripes=True,
+        showColumnStripes=False,
+    )
+    with warnings.catch_warnings():
+        # openpyxl warns for every write-only table, even when the columns
+        # have already been declared as above.
+        warnings.simplefilter("ignore", UserWarning)
+        worksheet.add_table(table)
+
+
+def _add_equal_rules(
+    worksheet,
+    column_index: int | None,
+    row_count: int,
+    fills: Mapping[str, str],
+) -> None:
+    if column_index is None or row_count < 1:
+        return
+    column_letter = get_column_letter(column_index)
+    cell_range = f"{column_letter}2:{column_letter}{row_count + 1}"
+    for value, colour in fills.items():
+        fill = PatternFill(start_color=colour, end_color=colour, fill_type="solid")
+        worksheet.conditional_formatting.add(
+            cell_range,
+            CellIsRule(operator="equal", formula=[f'"{value}"'], fill=fill),
+        )
+
+
+def _stream_frame(
+    worksheet,
+    frame: pd.DataFrame,
+    *,
+    sample_rows: int,
+    transform_row: Any = None,
+) -> None:
+    """Apply widths then stream the header and rows of ``frame`` into ``worksheet``."""
+
+    for index, width in _sample_column_widths(frame, sample_rows).items():
+        worksheet.column_dimensions[get_column_letter(index)].width = width
+    worksheet.append([str(column) for column in frame.columns])
+    for values in frame.itertuples(index=False, name=None):
+        row = [_excel_cell_value(value) for value in values]
+        if transform_row is not None:
+            row = transform_row(row)
+        worksheet.append(row)
+
+
+def _stream_summary_sheet(
+    workbook,
+    dataframe: pd.DataFrame,
+    issues_count: int,
+    evidence_count: int,
+    theme: WorkbookTheme,
+) -> None:
+    sheet = workbook.create_sheet("Summary")
+    for column, width in (("A", 24), ("B", 14), ("D", 18), ("E", 10)):
+        sheet.column_dimensions[column].width = width
+    metrics = [
+        ("Total Rows", len(dataframe)),
+        ("Evidence Entries", evidence_count),
+        ("Issues Logged", issues_count),
+    ]
+    status_counts: Counter[str] = Counter()
+    if "Status" in dataframe.columns:
+        status_counts.update(dataframe["Status"].dropna().astype(str))
+    statuses = list(config.CANONICAL_STATUSES)
+    _add_streaming_table(
+        sheet,
+        "SummaryMetrics",
+        ["Metric", "Value"],
+        len(metrics),
+        style="TableStyleLight9",
+        anchor="A2",
+    )
+    _add_streaming_table(
+        sheet,
+        "SummaryStatuses",
+        ["Status", "Count"],
+        len(statuses),
+        style="TableStyleLight11",
+        anchor="D2",
+    )
+
+    title = WriteOnlyCell(
+        sheet, value=getattr(config.PROFILE, "name", "Enrichment Summary")
+    )
+    title.font = Font(size=14, bold=True)
+    title.fill = PatternFill(
+        start_color=theme.accent, end_color=theme.accent, fill_type="solid"
+    )
+    sheet.append([title])
+    sheet.append(["Metric", "Value", None, "Status", "Count"])
+    for offset in range(max(len(metrics), len(statuses))):
+        row: list[Any] = [None] * 5
+        if offset < len(metrics):
+            row[0], row[1] = metrics[offset]
+        if offset < len(statuses):
+            row[3] = statuses[offset]
+            row[4] = status_counts.get(statuses[offset], 0)
+        sheet.append(row)
+
+
 class ExcelExporter:
-    """Exports enriched dataframes to Excel and CSV artefacts."""
+    """Exports enriched dataframes to Excel and CSV artefacts.
+
+    By default the workbook is produced in a single pass with openpyxl
+    write-only worksheets: tables, conditional formatting, hyperlinks and
+    column widths (estimated from a sample of rows) are declared while rows
+    stream to disk. ``streaming=False`` keeps the legacy pandas write followed
+    by a workbook reload for formatting.
+    """
 
-    def __init__(self, workbook_path: Path, provenance_path: Path):
+    def __init__(
+        self,
+        workbook_path: Path,
+        provenance_path: Path,
+        *,
+        streaming: bool = True,
+        width_sample_rows: int = _WIDTH_SAMPLE_ROWS,
+    ):
         """Initialize the exporter with paths."""
         self.workbook_path = workbook_path
         self.provenance_path = provenance_path
+        self.streaming = streaming
+        self.width_sample_rows = max(1, width_sample_rows)
 
     def write(
         self,
@@ -455,89 +749,156 @@ class ExcelExporter:
             else enriched_df.attrs.get("quality_issues", [])
         )
         issue_records = _normalize_records(list(issue_source or []))
+        issues_frame = _build_issues_frame(issue_records)
+        evidence_frame = _build_evidence_frame(evidence_records)
+        theme = _resolve_theme()
 
-        issues_frame = (
-            pd.DataFrame(issue_records)
-            if issue_records
-            else pd.DataFrame(
-                columns=[
-                    "row_id",
-                    "organisation",
-                    "code",
-                    "severity",
-                    "message",
-                    "remediation",
-                ]
+        if self.streaming:
+            self._write_streaming(
+                enriched_df,
+                issues_frame,
+                evidence_frame,
+                theme,
+                issue_count=len(issue_records),
+                evidence_count=len(evidence_records),
+            )
+        else:
+            self._write_with_reload(
+                enriched_df,
+                issues_frame,
+                evidence_frame,
+                theme,
+                issue_count=len(issue_records),
+                evidence_count=len(evidence_records),
             )
+        evidence_frame.to_csv(self.provenance_path, index=False)
+
+    def _write_streaming(
+        self,
+        enriched_df: pd.DataFrame,
+        issues_frame: pd.DataFrame,
+        evidence_frame: pd.DataFrame,
+        theme: WorkbookTheme,
+        *,
+        issue_count: int,
+        evidence_count: int,
+    ) -> None:
+        workbook = Workbook(write_only=True)
+        _stream_summary_sheet(workbook, enriched_df, issue_count, evidence_count, theme)
+
+        data_sheet = workbook.create_sheet(config.CLEANED_SHEET)
+        data_sheet.freeze_panes = "A2"
+        data_headers = [str(column) for column in enriched_df.columns]
+        _add_streaming_table(
+            data_sheet,
+            "DataTable",
+            data_headers,
+            len(enriched_df),
+            style="TableStyleMedium9",
         )
-        issues_frame = issues_frame.rename(
-            columns={
-                "row_id": "Row ID",
-                "organisation": "Organisation",
-                "code": "Code",
-                "severity": "Severity",
-                "message": "Message",
-                "remediation": "Remediation",
-            }
+        _add_equal_rules(
+            data_sheet,
+            _find_column(data_headers, "status"),
+            len(enriched_df),
+            theme.status_colours,
         )
-        standard_issue_columns = [
-            "Row ID",
-            "Organisation",
-            "Code",
-            "Severity",
-            "Message",
-            "Remediation",
-        ]
-        issue_remainder = [
-            column
-            for column in issues_frame.columns
-            if column not in standard_issue_columns
-        ]
-        issues_frame = issues_frame.reindex(
-            columns=standard_issue_columns + issue_remainder,
+        _stream_frame(data_sheet, enriched_df, sample_rows=self.width_sample_rows)
+
+        issues_sheet = workbook.create_sheet(config.ISSUES_SHEET)
+        issue_headers = [str(column) for column in issues_frame.columns]
+        _add_streaming_table(
+            issues_sheet,
+            "IssuesTable",
+            issue_headers,
+            len(issues_frame),
+            style="TableStyleMedium6",
         )
-        evidence_frame = (
-            pd.DataFrame(evidence_records)
-            if evidence_records
-            else pd.DataFrame(
-                columns=[
-                    "RowID",
-                    "Organisation",
-                    "What changed",
-                    "Sources",
-                    "Notes",
-                    "Timestamp",
-                    "Confidence",
-                ]
-            )
+        _add_equal_rules(
+            issues_sheet,
+            _find_column(issue_headers, "severity"),
+            len(issues_frame),
+            {"warn": "FFF6B26B", "block": "FFF4CCCC"},
         )
-        evidence_columns = [
-            "RowID",
-            "Organisation",
-            "What changed",
-            "Sources",
-            "Notes",
-            "Timestamp",
-            "Confidence",
-        ]
-        evidence_remainder = [
-            column
-            for column in evidence_frame.columns
-            if column not in evidence_columns
-        ]
-        evidence_frame = evidence_frame.reindex(
-            columns=evidence_columns + evidence_remainder,
+        _stream_frame(issues_sheet, issues_frame, sample_rows=self.width_sample_rows)
+
+        evidence_sheet = workbook.create_sheet(EVIDENCE_SHEET)
+        evidence_sheet.freeze_panes = "A2"
+        evidence_headers = [str(column) for column in evidence_frame.columns]
+        _add_streaming_table(
+            evidence_sheet,
+            "EvidenceTable",
+            evidence_headers,
+            len(evidence_frame),
+            style="TableStyleMedium4",
         )
+        row_lookup = _row_lookup_from_frame(enriched_df)
+        rowid_index = _find_column(evidence_headers, "rowid")
+        sources_index = _find_column(evidence_headers, "sources")
+
+        def _link_evidence_row(row: list[Any]) -> list[Any]:
+            if rowid_index is None or row[rowid_index - 1] is None:
+                return row
+            try:
+                row_identifier = int(str(row[rowid_index - 1]))
+            except ValueError:
+                return row
+            target_row = row_lookup.get(row_identifier, row_identifier + 2)
+            row_cell = WriteOnlyCell(evidence_sheet, value=row[rowid_index - 1])
+            row_cell.hyperlink = f"#{config.CLEANED_SHEET}!A{target_row}"
+            row_cell.style = "Hyperlink"
+            row[rowid_index - 1] = row_cell
+            if sources_index is not None and row[sources_index - 1]:
+                urls = [
+                    part.strip()
+                    for part in str(row[sources_index - 1]).split(";")
+                    if part.strip()
+                ]
+                if urls:
+                    sources_cell = WriteOnlyCell(evidence_sheet, value="\n".join(urls))
+                    sources_cell.hyperlink = urls[0]
+                    sources_cell.style = "Hyperlink"
+                    sources_cell.alignment = Alignment(wrap_text=True, vertical="top")
+                    row[sources_index - 1] = sources_cell
+            return row
+
+        _stream_frame(
+            evidence_sheet,
+            evidence_frame,
+            sample_rows=self.width_sample_rows,
+            transform_row=_link_evidence_row,
+        )
+
+        lists_sheet = workbook.create_sheet(config.LISTS_SHEET)
+        lists_sheet.sheet_state = "hidden"
+        lists_sheet.append(["Statuses", "Provinces"])
+        statuses = list(config.CANONICAL_STATUSES)
+        provinces = list(config.PROVINCES)
+        for offset in range(max(len(statuses), len(provinces))):
+            lists_sheet.append(
+                [
+                    statuses[offset] if offset < len(statuses) else None,
+                    provinces[offset] if offset < len(provinces) else None,
+                ]
+            )
 
+        workbook.save(self.workbook_path)
+
+    def _write_with_reload(
+        self,
+        enriched_df: pd.DataFrame,
+        issues_frame: pd.DataFrame,
+        evidence_frame: pd.DataFrame,
+        theme: WorkbookTheme,
+        *,
+        issue_count: int,
+        evidence_count: int,
+    ) -> None:
         with pd.ExcelWriter(self.workbook_path, engine="openpyxl") as writer:
             enriched_df.to_excel(writer, sheet_name=config.CLEANED_SHEET, index=False)
             issues_frame.to_excel(writer, sheet_name=config.ISSUES_SHEET, index=False)
             evidence_frame.to_excel(writer, sheet_name=EVIDENCE_SHEET, index=False)
 
-        evidence_frame.to_csv(self.provenance_path, index=False)
-
         workbook = load_workbook(self.workbook_path)
-        theme = _resolve_theme()
 
         data_sheet = workbook[config.CLEANED_SHEET]
         data_sheet.freeze_panes = "A2"
@@ -555,8 +916,8 @@ class ExcelExporter:
         _populate_summary_sheet(
             workbook,
             enriched_df,
-            len(issue_records),
-            len(evidence_records),
+            issue_count,
+            evidence_count,
             theme,
         )
         if config.LISTS_SHEET not in workbook.sheetnames:
@@ -583,21 +944,21 @@ def read_dataset(
     missing_columns_global: set[str] = set()
     inference_results: list[ColumnInferenceResult] = []
     for input_path in input_paths:
-        suffix = input_path.suffix.lower()
-        if suffix in {".xlsx", ".xls"}:
+        file_format = dataset_format(input_path)
+        if file_format == "xlsx":
             sheet_names: tuple[str | None, ...] = _resolve_sheet_names(
                 input_path, sheet_map
             )
-        elif suffix == ".csv":
+        elif file_format is not None:
             sheet_names = (None,)
         else:
-            raise ValueError(f"Unsupported file format: {suffix}")
+            raise ValueError(f"Unsupported file format: {input_path.suffix.lower()}")
 
         for sheet_name in sheet_names:
-            if suffix in {".xlsx", ".xls"}:
+            if file_format == "xlsx":
                 frame = pd.read_excel(input_path, sheet_name=sheet_name)
             else:
-                frame = pd.read_csv(input_path)
+                frame = _read_flat_dataset(input_path, file_format)
             aligned, missing_columns, inference_result = _align_columns(
                 frame, descriptors
             )
@@ -678,18 +1039,135 @@ def read_dataset(
     return normalized
 
 
-def write_dataset(df: pd.DataFrame, path: Path) -> None:
-    """Write the dataframe to the given path."""
+def dataset_format(path: Path) -> str | None:
+    """Return the dataset format implied by ``path``'s suffix, if supported."""
+
+    suffixes = [suffix.lower() for suffix in path.suffixes]
+    if not suffixes:
+        return None
+    if (
+        len(suffixes) >= 2
+        and suffixes[-1] in _JSONL_COMPRESSION_SUFFIXES
+        and _DATASET_FORMATS.get(suffixes[-2]) == "jsonl"
+    ):
+        return "jsonl"
+    return _DATASET_FORMATS.get(suffixes[-1])
+
+
+def dataset_suffix(path: Path) -> str:
+    """Return the full suffix behind :func:`dataset_format` (``.jsonl.gz``)."""
+
+    if dataset_format(path) == "jsonl" and len(path.suffixes) >= 2:
+        compressed = "".join(path.suffixes[-2:])
+        if path.suffix.lower() in _JSONL_COMPRESSION_SUFFIXES:
+            return compressed
+    return path.suffix
+
+
+def _require_pyarrow(file_format: str) -> None:
+    if importlib.util.find_spec("pyarrow") is None:
+        raise RuntimeError(
+            f"pyarrow is required for {file_format} datasets. "
+            "Install the UI dependency group or add pyarrow to your environment."
+        )
+
+
+def _read_flat_dataset(path: Path, file_format: str) -> pd.DataFrame:
+    if file_format == "csv":
+        return pd.read_csv(path)
+    if file_format == "jsonl":
+        return pd.read_json(
+            path,
+            lines=True,
+            orient="records",
+            compression="infer",
+            dtype=False,
+            convert_dates=False,
+        )
+    _require_pyarrow(file_format)
+    if file_format == "parquet":
+        frame = pd.read_parquet(path)
+    else:
+        frame = pd.read_feather(path)
+    # Dictionary-encoded columns come back as categoricals; the enrichment
+    # pipeline assigns free-form values, so decode them to plain objects.
+    categorical = [
+        column
+        for column in frame.columns
+        if isinstance(frame[column].dtype, pd.CategoricalDtype)
+    ]
+    for column in categorical:
+        frame[column] = frame[column].astype(object)
+    return frame
+
+
+def _prepare_columnar_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Coerce object columns Arrow cannot type and dictionary-encode categoricals."""
+
+    prepared = df.reset_index(drop=True)
+    row_count = len(prepared)
+    for column in prepared.columns:
+        series = prepared[column]
+        if not pd.api.types.is_object_dtype(series.dtype):
+            continue
+        inferred = pd.api.types.infer_dtype(series, skipna=True)
+        if inferred not in {"string", "empty"}:
+            if inferred.startswith("mixed") or inferred in {"bytes", "decimal"}:
+                series = series.map(
+                    lambda value: value if _is_missing_cell(value) else str(value)
+                )
+            else:
+                continue
+        non_null = series.dropna()
+        if non_null.empty:
+            continue
+        ratio = non_null.nunique() / row_count
+        if column in DICTIONARY_COLUMNS or ratio <= _DICTIONARY_MAX_RATIO:
+            series = series.astype("category")
+        prepared[column] = series
+    prepared.columns = [str(column) for column in prepared.columns]
+    return prepared
+
+
+def write_dataset(
+    df: pd.DataFrame, path: Path, *, file_format: str | None = None
+) -> None:
+    """Write the dataframe to the given path.
+
+    The format follows the path suffix (``.xlsx``, ``.csv``, ``.parquet``,
+    ``.feather``/``.arrow``, ``.jsonl`` with optional ``.gz``/``.bz2``/``.xz``/
+    ``.zst`` compression) unless ``file_format`` is supplied explicitly.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    suffix = path.suffix.lower()
-    if suffix in {".xlsx", ".xls"}:
+    resolved = file_format.lower() if file_format else dataset_format(path)
+    if resolved == "xlsx":
         with pd.ExcelWriter(path, engine="openpyxl") as writer:
             df.to_excel(writer, sheet_name=config.CLEANED_SHEET, index=False)
         return
-    if suffix == ".csv":
+    if resolved == "csv":
         df.to_csv(path, index=False)
         return
-    raise ValueError(f"Unsupported file format: {suffix}")
+    if resolved == "jsonl":
+        df.to_json(
+            path,
+            orient="records",
+            lines=True,
+            compression="infer",
+            date_format="iso",
+            force_ascii=False,
+        )
+        return
+    if resolved == "parquet":
+        _require_pyarrow(resolved)
+        _prepare_columnar_frame(df).to_parquet(
+            path, engine="pyarrow", compression="zstd", index=False
+        )
+        return
+    if resolved == "feather":
+        _require_pyarrow(resolved)
+        _prepare_columnar_frame(df).to_feather(path, compression="zstd")
+        return
+    raise ValueError(f"Unsupported file format: {file_format or path.suffix.lower()}")
 
 
 def load_school_records(path: Path = config.SOURCE_XLSX) -> list[SchoolRecord]:
@@ -0,0 +1,118 @@
+"""Hash-based dataframe fingerprints shared by versioning, lakehouse and caches.
+
+Each column is hashed with :func:`pandas.util.hash_pandas_object`, giving one
+64-bit hash per cell without serialising the frame. Cell hashes fold into
+per-row hashes (over any subset of columns), per-column digests and a root
+digest. Compute a :class:`FrameFingerprint` once per frame and pass it to every
+consumer instead of re-hashing. Cells pandas cannot hash (lists and dicts read
+from JSON Lines) are hashed through a canonical JSON rendering.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["FrameFingerprint", "fingerprint_frame", "hash_cells"]
+
+# Odd 64-bit multiplier used to fold column hashes into row hashes.
+_ROW_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+@dataclass(frozen=True)
+class FrameFingerprint:
+    """Content digests for a dataframe.
+
+    ``root`` identifies the whole frame (column names, row order and values),
+    ``columns`` maps each column to its own digest, and :meth:`row_hashes`
+    returns one 64-bit hash per row. Column order and the index are ignored.
+    """
+
+    root: str
+    columns: Mapping[str, str]
+    row_count: int
+    cell_hashes: Mapping[str, np.ndarray] = field(repr=False, compare=False)
+
+    def row_hashes(self, columns: Iterable[str] | None = None) -> np.ndarray:
+        """Return per-row ``uint64`` hashes over ``columns`` (all when ``None``)."""
+
+        selected = sorted(self.cell_hashes) if columns is None else list(columns)
+        combined = np.zeros(self.row_count, dtype=np.uint64)
+        for column in selected:
+            salt = np.uint64(_name_hash(column))
+            combined = (combined ^ (self.cell_hashes[column] + salt)) * _ROW_MULTIPLIER
+        return combined
+
+    def row_digests(self, columns: Iterable[str] | None = None) -> list[str]:
+        """Return per-row hashes as 16-character hex strings."""
+
+        return [f"{value:016x}" for value in self.row_hashes(columns).tolist()]
+
+    def changed_columns(self, other: FrameFingerprint) -> list[str]:
+        """Return columns whose digest differs from ``other`` (including added/removed)."""
+
+        names = set(self.columns) | set(other.columns)
+        return sorted(
+            name for name in names if self.columns.get(name) != other.columns.get(name)
+        )
+
+
+def fingerprint_frame(frame: Any) -> FrameFingerprint:
+    """Fingerprint ``frame`` by hashing each column once."""
+
+    cell_hashes: dict[str, np.ndarray] = {}
+    column_digests: dict[str, str] = {}
+    for position, name in sorted(
+        enumerate(frame.columns), key=lambda item: str(item[1])
+    ):
+        label = str(name)
+        values = frame.iloc[:, position]
+        hashes = hash_cells(values)
+        cell_hashes[label] = hashes
+        digest = hashlib.blake2b(label.encode("utf-8"), digest_size=16)
+        digest.update(b"\0")
+        digest.update(hashes.tobytes())
+        column_digests[label] = digest.hexdigest()
+
+    root = hashlib.blake2b(digest_size=32)
+    root.update(str(len(frame)).encode("ascii"))
+    for label, digest_hex in column_digests.items():
+        root.update(b"\0" + label.encode("utf-8") + b"\0" + digest_hex.encode("ascii"))
+    return FrameFingerprint(
+        root=root.hexdigest(),
+        columns=column_digests,
+        row_count=len(frame),
+        cell_hashes=cell_hashes,
+    )
+
+
+def hash_cells(values: pd.Series) -> np.ndarray:
+    """Return one ``uint64`` hash per cell of ``values``, ignoring the index."""
+
+    try:
+        hashed = pd.util.hash_pandas_object(values, index=False)
+    except TypeError:
+        # Unhashable cells (lists, dicts) hash via their canonical JSON text.
+        hashed = pd.util.hash_pandas_object(
+            values.map(_hashable_cell, na_action="ignore"), index=False
+        )
+    return hashed.to_numpy(dtype=np.uint64)
+
+
+def _hashable_cell(value: Any) -> Any:
+    try:
+        hash(value)
+    except TypeError:
+        return json.dumps(value, sort_keys=True, default=str)
+    return value
+
+
+def _name_hash(name: str) -> int:
+    digest = hashlib.blake2b(name.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
@@ -0,0 +1,271 @@
+"""Near-duplicate organisation detection using blocking and MinHash-LSH."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import defaultdict
+from collections.abc import Hashable, Iterable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from watercrawl.domain.compliance import canonical_domain
+
+from .normalization import (
+    ColumnConflictResolver,
+    MergeDuplicatesResult,
+    merge_grouped_records,
+)
+
+__all__ = [
+    "NearDuplicateMatch",
+    "NearDuplicateDetector",
+    "normalize_organisation_name",
+    "merge_near_duplicate_records",
+]
+
+_LEGAL_SUFFIXES = (
+    "pty ltd",
+    "pty",
+    "ltd",
+    "limited",
+    "proprietary",
+    "cc",
+    "npc",
+    "inc",
+    "soc",
+)
+_SUFFIX_PATTERN = re.compile(
+    r"\b(?:" + "|".join(re.escape(suffix) for suffix in _LEGAL_SUFFIXES) + r")\b"
+)
+_NON_ALNUM_PATTERN = re.compile(r"[^0-9a-z]+")
+# Smallest prime above 2**32; with 31-bit coefficients and 32-bit shingle
+# hashes ``a * x + b`` stays within uint64, keeping the hash family exact.
+_HASH_PRIME = np.uint64((1 << 32) + 15)
+_COEFF_LIMIT = 1 << 31
+
+
+def normalize_organisation_name(value: object) -> str:
+    """Casefold a name and strip punctuation plus trailing legal-entity suffixes."""
+
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return ""
+    text = _NON_ALNUM_PATTERN.sub(" ", str(value).casefold())
+    text = _SUFFIX_PATTERN.sub(" ", text)
+    return " ".join(text.split())
+
+
+@dataclass(frozen=True)
+class NearDuplicateMatch:
+    """Pair of rows whose organisation names are near-duplicates."""
+
+    left_index: Hashable
+    right_index: Hashable
+    left_name: str
+    right_name: str
+    similarity: float
+    block: str
+
+
+class NearDuplicateDetector:
+    """Find near-duplicate organisation rows in sub-quadratic time.
+
+    Rows are blocked by province and by website domain. Within province
+    blocks, character-trigram MinHash signatures are bucketed with LSH bands
+    so only rows that collide in at least one band are compared. Rows that
+    share a website domain are compared directly. Candidate pairs are
+    confirmed with the exact trigram Jaccard similarity.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        bands: int = 16,
+        name_column: str = "Name of Organisation",
+        province_column: str = "Province",
+        website_column: str = "Website URL",
+        seed: int = 1729,
+    ) -> None:
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be within (0, 1]")
+        if bands <= 0 or num_perm % bands:
+            raise ValueError("num_perm must be a positive multiple of bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.name_column = name_column
+        self.province_column = province_column
+        self.website_column = website_column
+        rng = np.random.default_rng(seed)
+        self._coeff_a = rng.integers(1, _COEFF_LIMIT, size=num_perm, dtype=np.uint64)
+        self._coeff_b = rng.integers(0, _COEFF_LIMIT, size=num_perm, dtype=np.uint64)
+
+    def find_matches(self, frame: pd.DataFrame) -> list[NearDuplicateMatch]:
+        """Return near-duplicate pairs, excluding rows with identical names."""
+
+        if self.name_column not in frame.columns or frame.empty:
+            return []
+
+        raw_names = frame[self.name_column].fillna("").astype(str).str.strip()
+        normalized = [normalize_organisation_name(name) for name in raw_names]
+        exact_keys = [" ".join(name.casefold().split()) for name in raw_names]
+        shingles = [_trigrams(name) for name in normalized]
+        labels = list(frame.index)
+
+        candidates: dict[tuple[int, int], str] = {}
+        for block, members in self._province_blocks(frame).items():
+            for pair in self._lsh_candidates(members, shingles):
+                candidates.setdefault(pair, f"province:{block}")
+        for domain, members in self._domain_blocks(frame).items():
+            for offset, left in enumerate(members):
+                for right in members[offset + 1 :]:
+                    candidates.setdefault((left, right), f"domain:{domain}")
+
+        matches: list[NearDuplicateMatch] = []
+        for (left, right), block in sorted(candidates.items()):
+            if not normalized[left] or not normalized[right]:
+                continue
+            if exact_keys[left] == exact_keys[right]:
+                # Exact duplicates are reported by the exact-match check.
+                continue
+            similarity = _jaccard(shingles[left], shingles[right])
+            if similarity < self.threshold:
+                continue
+            matches.append(
+                NearDuplicateMatch(
+                    left_index=labels[left],
+                    right_index=labels[right],
+                    left_name=raw_names.iloc[left],
+                    right_name=raw_names.iloc[right],
+                    similarity=round(similarity, 4),
+                    block=block,
+                )
+            )
+        return matches
+
+    def group_keys(self, frame: pd.DataFrame) -> pd.Series:
+        """Return a merge key per row, shared by rows in the same near-duplicate cluster."""
+
+        if self.name_column not in frame.columns:
+            return pd.Series([""] * len(frame), index=frame.index, dtype=object)
+        names = frame[self.name_column].fillna("").astype(str)
+        keys = [" ".join(name.casefold().split()) for name in names]
+        position = {label: offset for offset, label in enumerate(frame.index)}
+        parents = list(range(len(frame)))
+        first_by_key: dict[str, int] = {}
+
+        def _find(item: int) -> int:
+            while parents[item] != item:
+                parents[item] = parents[parents[item]]
+                item = parents[item]
+            return item
+
+        for offset, key in enumerate(keys):
+            # Rows with identical canonical keys always share a cluster.
+            parents[offset] = first_by_key.setdefault(key, offset)
+        for match in self.find_matches(frame):
+            left = _find(position[match.left_index])
+            right = _find(position[match.right_index])
+            if left != right:
+                parents[max(left, right)] = min(left, right)
+        return pd.Series(
+            [keys[_find(offset)] for offset in range(len(frame))],
+            index=frame.index,
+            dtype=object,
+        )
+
+    def _province_blocks(self, frame: pd.DataFrame) -> dict[str, list[int]]:
+        if self.province_column in frame.columns:
+            provinces = frame[self.province_column].fillna("").astype(str)
+            values: Iterable[str] = provinces.str.strip().str.casefold()
+        else:
+            values = [""] * len(frame)
+        blocks: dict[str, list[int]] = defaultdict(list)
+        for offset, province in enumerate(values):
+            blocks[province or "unknown"].append(offset)
+        return blocks
+
+    def _domain_blocks(self, frame: pd.DataFrame) -> dict[str, list[int]]:
+        if self.website_column not in frame.columns:
+            return {}
+        blocks: dict[str, list[int]] = defaultdict(list)
+        websites = frame[self.website_column].fillna("").astype(str)
+        for offset, website in enumerate(websites):
+            domain = canonical_domain(website)
+            if domain:
+                blocks[domain].append(offset)
+        return {domain: rows for domain, rows in blocks.items() if len(rows) > 1}
+
+    def _lsh_candidates(
+        self, members: Sequence[int], shingles: Sequence[frozenset[str]]
+    ) -> set[tuple[int, int]]:
+        if len(members) < 2:
+            return set()
+        rows_per_band = self.num_perm // self.bands
+        buckets: dict[tuple[int, bytes], list[int]] = defaultdict(list)
+        for member in members:
+            if not shingles[member]:
+                continue
+            signature = self._signature(shingles[member])
+            for band in range(self.bands):
+                start = band * rows_per_band
+                chunk = signature[start : start + rows_per_band].tobytes()
+                buckets[(band, chunk)].append(member)
+        pairs: set[tuple[int, int]] = set()
+        for bucket in buckets.values():
+            if len(bucket) < 2:
+                continue
+            for offset, left in enumerate(bucket):
+                for right in bucket[offset + 1 :]:
+                    pairs.add((left, right) if left < right else (right, left))
+        return pairs
+
+    def _signature(self, shingles: frozenset[str]) -> np.ndarray:
+        hashes = np.fromiter(
+            (_stable_hash(shingle) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        permuted = (np.outer(self._coeff_a, hashes) + self._coeff_b[:, None]) % (
+            _HASH_PRIME
+        )
+        return permuted.min(axis=1)
+
+
+def merge_near_duplicate_records(
+    frame: pd.DataFrame,
+    *,
+    detector: NearDuplicateDetector,
+    resolver: ColumnConflictResolver,
+) -> MergeDuplicatesResult:
+    """Merge exact and near-duplicate organisation rows, returning merge traces."""
+
+    if detector.name_column not in frame.columns:
+        return MergeDuplicatesResult(frame.copy(), [])
+    return merge_grouped_records(
+        frame, keys=detector.group_keys(frame), resolver=resolver
+    )
+
+
+def _trigrams(name: str) -> frozenset[str]:
+    if not name:
+        return frozenset()
+    padded = f"  {name} "
+    return frozenset(padded[index : index + 3] for index in range(len(padded) - 2))
+
+
+def _jaccard(left: frozenset[str], right: frozenset[str]) -> float:
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+
+@lru_cache(maxsize=65536)
+def _stable_hash(shingle: str) -> int:
+    digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=4).digest()
+    return int.from_bytes(digest, "little")
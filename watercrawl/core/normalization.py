@@ -11,6 +11,7 @@ from numbers import Real
 from typing import Any, Callable, Iterable, Mapping, Protocol, Sequence
 from urllib.parse import urlparse, urlunparse
 
+import numpy as np
 import pandas as pd
 from pandas import Series
 from pint import UnitRegistry
@@ -39,6 +40,7 @@ __all__ = [
     "build_numeric_rule_lookup",
     "normalize_numeric_value",
     "merge_duplicate_records",
+    "merge_grouped_records",
 ]
 
 
@@ -250,44 +252,181 @@ def merge_duplicate_records(
     key_column: str,
     resolver: ColumnConflictResolver,
 ) -> MergeDuplicatesResult:
-    """Merge duplicate rows sharing the given key using conflict resolution rules."""
+    """Merge duplicate rows sharing the given key using conflict resolution rules.
+
+    Rows are grouped by canonical key in a single pass. Within each duplicate
+    group, columns holding at most one distinct non-missing value collapse to
+    that value via vectorised aggregation; the resolver only runs for the
+    (group, column) cells that genuinely conflict. Traces match the
+    row-by-row merge order.
+    """
 
     if key_column not in frame.columns:
         return MergeDuplicatesResult(frame.copy(), [])
 
+    keyed = frame[key_column].fillna("").astype(str)
+    return merge_grouped_records(
+        frame, keys=keyed.map(_canonical_key), resolver=resolver
+    )
+
+
+def merge_grouped_records(
+    frame: pd.DataFrame,
+    *,
+    keys: Series,
+    resolver: ColumnConflictResolver,
+) -> MergeDuplicatesResult:
+    """Merge rows that share a precomputed group key (aligned with ``frame``)."""
+
     columns = list(frame.columns)
-    merged_rows: list[dict[str, Any]] = []
-    traces: list[RowMergeTrace] = []
+    if frame.empty:
+        return MergeDuplicatesResult(frame.iloc[0:0].reset_index(drop=True), [])
+
+    codes, uniques = pd.factorize(keys, sort=False)
+    positions = np.arange(len(frame))
+    labels = frame.index.to_numpy()
+
+    # Stable sort keeps rows in original order inside each group.
+    order = np.argsort(codes, kind="stable")
+    boundaries = np.flatnonzero(np.diff(codes[order])) + 1
+    group_members = np.split(positions[order], boundaries)
+    first_positions = np.array([members[0] for members in group_members])
+
+    merged_frame = frame.iloc[first_positions].reset_index(drop=True)
+    conflicts_by_group: dict[int, list[tuple[int, int, ColumnConflict]]] = {}
+
+    group_sizes = np.bincount(codes, minlength=len(uniques))
+    duplicate_mask = group_sizes[codes] > 1
+    if duplicate_mask.any():
+        dup_codes = codes[duplicate_mask]
+        dup_frame = frame.iloc[positions[duplicate_mask]]
+        row_offsets = _offsets_within_groups(dup_codes)
+        for column_index, column in enumerate(columns):
+            updates = _merge_duplicate_column(
+                dup_frame.iloc[:, column_index],
+                dup_codes,
+                row_offsets,
+                column=column,
+                column_index=column_index,
+                resolver=resolver,
+                conflicts_by_group=conflicts_by_group,
+            )
+            if not updates:
+                continue
+            values = merged_frame.iloc[:, column_index].to_numpy(
+                dtype=object, copy=True
+            )
+            for group_code, value in updates.items():
+                values[group_code] = value
+            merged_frame[column] = pd.Series(values).infer_objects()
 
-    keyed = frame[key_column].fillna("").astype(str)
-    canonical_keys = keyed.map(_canonical_key)
-    grouped = canonical_keys.groupby(canonical_keys, sort=False)
-    for new_index, (key, indices) in enumerate(grouped.groups.items()):
-        group = frame.loc[list(indices)]
-        base = group.iloc[0].to_dict()
-        conflicts: list[ColumnConflict] = []
-        for _, row in group.iloc[1:].iterrows():
-            for column in columns:
-                selected, conflict = resolver.resolve(
-                    column, base.get(column), row[column]
-                )
-                base[column] = selected
-                if conflict is not None and conflict not in conflicts:
-                    conflicts.append(conflict)
-        merged_rows.append(base)
+    traces: list[RowMergeTrace] = []
+    for group_code, key in enumerate(uniques):
+        members = group_members[group_code]
+        recorded = sorted(
+            conflicts_by_group.get(group_code, []), key=lambda item: item[:2]
+        )
         traces.append(
             RowMergeTrace(
                 key=str(key),
-                source_indices=tuple(int(idx) for idx in indices),
-                conflicts=tuple(conflicts),
+                source_indices=tuple(int(labels[idx]) for idx in members),
+                conflicts=tuple(conflict for _, _, conflict in recorded),
             )
         )
 
-    merged_frame = pd.DataFrame(merged_rows, columns=columns)
     merged_frame.reset_index(drop=True, inplace=True)
     return MergeDuplicatesResult(merged_frame=merged_frame, traces=traces)
 
 
+def _offsets_within_groups(codes: np.ndarray) -> np.ndarray:
+    """Return each row's position within its group (0 for the first member)."""
+
+    return pd.Series(codes).groupby(codes, sort=False).cumcount().to_numpy()
+
+
+def _stripped_strings(series: Series) -> Series | None:
+    """Return stripped string values (NaN elsewhere) for object columns."""
+
+    if series.dtype != object:
+        return None
+    try:
+        return series.str.strip()
+    except AttributeError:
+        return None
+
+
+def _missing_mask(series: Series, stripped: Series | None) -> np.ndarray:
+    mask = series.isna().to_numpy(dtype=bool, copy=True)
+    if stripped is not None:
+        mask |= (stripped == "").fillna(False).to_numpy(dtype=bool)
+    return mask
+
+
+def _merge_duplicate_column(
+    series: Series,
+    codes: np.ndarray,
+    row_offsets: np.ndarray,
+    *,
+    column: str,
+    column_index: int,
+    resolver: ColumnConflictResolver,
+    conflicts_by_group: dict[int, list[tuple[int, int, ColumnConflict]]],
+) -> dict[int, Any]:
+    """Resolve one column across duplicate rows, returning per-group overrides."""
+
+    stripped = _stripped_strings(series)
+    present = ~_missing_mask(series, stripped)
+    if not present.any():
+        return {}
+
+    comparable = series
+    if stripped is not None:
+        comparable = stripped.where(stripped.notna(), series)
+    comparable = comparable.where(pd.Series(present, index=series.index))
+
+    try:
+        distinct = comparable.groupby(codes, sort=False).nunique(dropna=True)
+    except TypeError:
+        conflicting_groups = set(np.unique(codes[present]).tolist())
+    else:
+        conflicting_groups = set(distinct.index[distinct.to_numpy() > 1].tolist())
+
+    values = series.to_numpy(dtype=object)
+    updates: dict[int, Any] = {}
+
+    # Non-conflicting groups take their first non-missing value; when that is
+    # the group's first row the merged frame already holds it.
+    present_codes = codes[present]
+    present_offsets = row_offsets[present]
+    present_values = values[present]
+    unique_codes, first_index = np.unique(present_codes, return_index=True)
+    for group_code, index in zip(unique_codes.tolist(), first_index.tolist()):
+        if group_code in conflicting_groups or present_offsets[index] == 0:
+            continue
+        updates[group_code] = present_values[index]
+
+    if not conflicting_groups:
+        return updates
+
+    candidate_mask = np.isin(codes, list(conflicting_groups))
+    members_by_group: dict[int, list[int]] = {}
+    for position in np.flatnonzero(candidate_mask).tolist():
+        members_by_group.setdefault(int(codes[position]), []).append(position)
+    for group_code, members in members_by_group.items():
+        base = values[members[0]]
+        recorded: list[ColumnConflict] = []
+        entries = conflicts_by_group.setdefault(group_code, [])
+        for position in members[1:]:
+            selected, conflict = resolver.resolve(column, base, values[position])
+            base = selected
+            if conflict is not None and conflict not in recorded:
+                recorded.append(conflict)
+                entries.append((int(row_offsets[position]), column_index, conflict))
+        if base is not values[members[0]]:
+            updates[group_code] = base
+    return updates
+
+
 def _is_missing_value(value: Any) -> bool:
     if value is None:
         return True
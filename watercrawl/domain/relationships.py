@@ -2,19 +2,39 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import re
 from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Iterable, Mapping
+from typing import Any, Callable, Iterable, Mapping
 
 try:  # pragma: no cover - optional dependency during type checking
     import networkx as nx
 except Exception:  # pragma: no cover - fallback when networkx unavailable
     nx = None  # type: ignore
 
+try:  # pragma: no cover - optional dependency for columnar snapshots
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    _ARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover - pyarrow ships with the ui group
+    pa = None  # type: ignore
+    pq = None  # type: ignore
+    _ARROW_AVAILABLE = False
+
 
 _SLUG_PATTERN = re.compile(r"[^a-z0-9]+")
+_ANALYTICS_VERSION = 2
+_INDEXES_VERSION = 1
+_NODE_KEY_COLUMNS = ("id",)
+_EDGE_KEY_COLUMNS = ("source", "target", "key")
+_DIGEST_CHUNK = 1 << 20
+# Fixed seed so sampled betweenness is reproducible between builds.
+_BETWEENNESS_SEED = 0
 
 
 @dataclass(frozen=True)
@@ -118,6 +138,507 @@ class RelationshipGraphSnapshot:
     community_assignments: dict[str, int]
     anomalies: list[RelationshipAnomaly]
     graph: "nx.MultiDiGraph | None" = None
+    betweenness_samples: int | None = None
+    indexes: "GraphIndexes | None" = None
+    node_table_path: Path | None = None
+    edge_table_path: Path | None = None
+
+
+@dataclass(frozen=True)
+class GraphAnalytics:
+    """Centrality and community results computed once per graph build.
+
+    ``betweenness_samples`` is ``None`` for exact betweenness, otherwise the
+    number of pivot nodes used by the sampled approximation.
+    """
+
+    centrality: dict[str, float]
+    betweenness: dict[str, float]
+    community_assignments: dict[str, int]
+    betweenness_samples: int | None = None
+
+
+def compute_graph_analytics(
+    graph: "nx.MultiDiGraph", *, betweenness_samples: int | None = None
+) -> GraphAnalytics:
+    """Compute degree/betweenness centrality and modularity communities.
+
+    When ``betweenness_samples`` is set and smaller than the node count,
+    betweenness is estimated from that many sampled source nodes
+    (``O(k·m)`` instead of ``O(n·m)``).
+    """
+
+    if nx is None:  # pragma: no cover - optional dependency guard
+        raise RuntimeError("networkx is required to analyse the relationship graph")
+
+    simple_graph = nx.Graph(graph)
+    node_count = simple_graph.number_of_nodes()
+    samples = _sample_size(betweenness_samples, node_count)
+    if node_count:
+        centrality = nx.degree_centrality(simple_graph)
+        betweenness = _betweenness(simple_graph, samples)
+        communities = _communities(simple_graph)
+    else:
+        centrality = {}
+        betweenness = {}
+        communities = []
+
+    community_assignments: dict[str, int] = {}
+    for index, community in enumerate(communities):
+        for node in community:
+            community_assignments[str(node)] = index
+
+    return GraphAnalytics(
+        centrality={str(key): value for key, value in centrality.items()},
+        betweenness={str(key): value for key, value in betweenness.items()},
+        community_assignments=community_assignments,
+        betweenness_samples=samples,
+    )
+
+
+def update_graph_analytics(
+    graph: "nx.MultiDiGraph",
+    previous: GraphAnalytics,
+    affected: Iterable[str],
+    *,
+    previous_node_count: int,
+    betweenness_samples: int | None = None,
+) -> GraphAnalytics:
+    """Refresh ``previous`` analytics after nodes/edges touching ``affected``.
+
+    Shortest paths never leave a connected component, so betweenness is only
+    recomputed inside components containing an affected node; elsewhere the
+    stored values are rescaled to the new node count, which keeps exact
+    betweenness identical to a full recompute. Communities are re-detected
+    per affected component. Degree centrality is recomputed for every node
+    because it is cheap and its normalisation depends on the node count.
+    """
+
+    if nx is None:  # pragma: no cover - optional dependency guard
+        raise RuntimeError("networkx is required to analyse the relationship graph")
+
+    simple_graph = nx.Graph(graph)
+    node_count = simple_graph.number_of_nodes()
+    components: list[set[Any]] = []
+    seen: set[Any] = set()
+    for node in affected:
+        if node in seen or node not in simple_graph:
+            continue
+        component = nx.node_connected_component(simple_graph, node)
+        seen.update(component)
+        components.append(component)
+
+    rescale = _pair_count(previous_node_count) / _pair_count(node_count)
+    betweenness = {
+        key: value * rescale
+        for key, value in previous.betweenness.items()
+        if key not in seen
+    }
+    community_groups: dict[int, list[str]] = {}
+    for key, community in previous.community_assignments.items():
+        if key not in seen:
+            community_groups.setdefault(community, []).append(key)
+    communities: list[list[str]] = list(community_groups.values())
+
+    for component in components:
+        subgraph = simple_graph.subgraph(component)
+        size = subgraph.number_of_nodes()
+        local = _betweenness(subgraph, _sample_size(betweenness_samples, size))
+        scale = _pair_count(size) / _pair_count(node_count)
+        betweenness.update({str(key): value * scale for key, value in local.items()})
+        # Edgeless components leave every node in its own community.
+        communities.extend(
+            [str(node) for node in community]
+            for community in (_communities(subgraph) or [{node} for node in subgraph])
+        )
+
+    order = {str(node): position for position, node in enumerate(simple_graph)}
+    communities.sort(key=lambda members: (-len(members), min(map(order.get, members))))
+    community_assignments = {
+        node: index for index, members in enumerate(communities) for node in members
+    }
+    return GraphAnalytics(
+        centrality={
+            str(key): value for key, value in nx.degree_centrality(simple_graph).items()
+        },
+        betweenness={
+            str(node): betweenness.get(str(node), 0.0) for node in simple_graph
+        },
+        community_assignments=community_assignments,
+        betweenness_samples=_sample_size(betweenness_samples, node_count),
+    )
+
+
+def _sample_size(samples: int | None, node_count: int) -> int | None:
+    return samples if samples and 0 < samples < node_count else None
+
+
+def _pair_count(node_count: int) -> float:
+    # Normalisation denominator networkx applies to undirected betweenness.
+    return float((node_count - 1) * (node_count - 2)) if node_count > 2 else 1.0
+
+
+def _betweenness(graph: Any, samples: int | None) -> dict[Any, float]:
+    return nx.betweenness_centrality(
+        graph, k=samples, seed=_BETWEENNESS_SEED if samples else None
+    )
+
+
+def _communities(graph: Any) -> list[Any]:
+    try:
+        return list(nx.algorithms.community.greedy_modularity_communities(graph))
+    except Exception:  # pragma: no cover - community detection optional
+        return []
+
+
+def graph_analytics_path(graphml_path: Path) -> Path:
+    """Return the analytics sidecar stored next to a GraphML snapshot."""
+
+    return graphml_path.with_name(f"{graphml_path.stem}_analytics.json")
+
+
+def graph_table_paths(graphml_path: Path) -> tuple[Path, Path]:
+    """Return the Parquet node and edge tables stored next to a GraphML snapshot."""
+
+    stem = graphml_path.stem
+    return (
+        graphml_path.with_name(f"{stem}_nodes.parquet"),
+        graphml_path.with_name(f"{stem}_edges.parquet"),
+    )
+
+
+def write_graph_tables(
+    graph: "nx.MultiDiGraph", graphml_path: Path
+) -> tuple[Path, Path] | None:
+    """Write ``graph`` as typed Parquet node/edge tables next to ``graphml_path``.
+
+    Every node or edge attribute becomes its own column (null where a node
+    type does not carry it). Returns ``None`` when pyarrow is unavailable.
+    """
+
+    if not _ARROW_AVAILABLE:
+        return None
+    nodes_path, edges_path = graph_table_paths(graphml_path)
+    node_columns = _attribute_columns(
+        ((node,) for node in graph.nodes),
+        (data for _, data in graph.nodes(data=True)),
+        _NODE_KEY_COLUMNS,
+        graph.number_of_nodes(),
+    )
+    edge_columns = _attribute_columns(
+        graph.edges(keys=True),
+        (data for _, _, data in graph.edges(data=True)),
+        _EDGE_KEY_COLUMNS,
+        graph.number_of_edges(),
+    )
+    for path, columns in ((nodes_path, node_columns), (edges_path, edge_columns)):
+        table = pa.table(columns)
+        staging = path.with_name(f".{path.name}.tmp")
+        pq.write_table(table, staging, compression="zstd")
+        os.replace(staging, path)
+    return nodes_path, edges_path
+
+
+def read_graph_tables(graphml_path: Path) -> "nx.MultiDiGraph":
+    """Build a ``MultiDiGraph`` straight from the Parquet node/edge tables."""
+
+    if nx is None:  # pragma: no cover - optional dependency guard
+        raise RuntimeError("networkx is required to load the relationship graph")
+    if not _ARROW_AVAILABLE:  # pragma: no cover - optional dependency guard
+        raise RuntimeError(
+            "pyarrow is required to read columnar relationship graph snapshots"
+        )
+    nodes_path, edges_path = graph_table_paths(graphml_path)
+    graph = nx.MultiDiGraph()
+    nodes = _table_columns(pq.read_table(nodes_path))
+    node_ids = nodes.pop("id")
+    graph.add_nodes_from(zip(node_ids, _attribute_rows(nodes, len(node_ids))))
+    edges = _table_columns(pq.read_table(edges_path))
+    sources = edges.pop("source")
+    targets = edges.pop("target")
+    keys = edges.pop("key")
+    graph.add_edges_from(
+        zip(sources, targets, keys, _attribute_rows(edges, len(sources)))
+    )
+    return graph
+
+
+def _attribute_columns(
+    keys: Iterable[tuple[Any, ...]],
+    attributes: Iterable[Mapping[str, Any]],
+    key_columns: tuple[str, ...],
+    length: int,
+) -> dict[str, Any]:
+    columns: dict[str, list[Any]] = {name: [] for name in key_columns}
+    extra: dict[str, list[Any]] = {}
+    for index, (key, data) in enumerate(zip(keys, attributes)):
+        for name, value in zip(key_columns, key):
+            columns[name].append(str(value))
+        for name, value in data.items():
+            column = extra.get(name)
+            if column is None:
+                column = extra[name] = [None] * index
+            column.append(value)
+        for column in extra.values():
+            if len(column) <= index:
+                column.append(None)
+    arrays: dict[str, Any] = {
+        name: pa.array(values, pa.string()) for name, values in columns.items()
+    }
+    for name in sorted(extra):
+        array = pa.array(extra[name] + [None] * (length - len(extra[name])))
+        # Low-cardinality labels such as node type or edge kind compress
+        # far better dictionary-encoded.
+        if name in {"type", "kind"} and pa.types.is_string(array.type):
+            array = array.dictionary_encode()
+        arrays[name] = array
+    return arrays
+
+
+def _table_columns(table: Any) -> dict[str, list[Any]]:
+    columns: dict[str, list[Any]] = {}
+    for name in table.column_names:
+        column = table.column(name).combine_chunks()
+        if pa.types.is_dictionary(column.type):
+            column = column.cast(column.type.value_type)
+        if not pa.types.is_string(column.type):
+            columns[name] = column.to_pylist()
+            continue
+        # Decode through a dictionary so repeated values (node ids, JSON
+        # blobs) share one str object, which also reuses its cached hash.
+        encoded = column.dictionary_encode()
+        values = encoded.dictionary.to_pylist() + [None]
+        indices = encoded.indices.fill_null(len(values) - 1).to_pylist()
+        columns[name] = [values[index] for index in indices]
+    return columns
+
+
+def _attribute_rows(
+    columns: Mapping[str, list[Any]], length: int
+) -> Iterable[dict[str, Any]]:
+    names = list(columns)
+    values = [columns[name] for name in names]
+    if not names:
+        return ({} for _ in range(length))
+    if not any(None in column for column in values):
+        return (dict(zip(names, row)) for row in zip(*values))
+    return (
+        {name: value for name, value in zip(names, row) if value is not None}
+        for row in zip(*values)
+    )
+
+
+def snapshot_digest(graphml_path: Path) -> str:
+    """Return a SHA-256 over the files a snapshot is loaded from.
+
+    The Parquet tables are preferred when present; otherwise the GraphML file.
+    """
+
+    tables = graph_table_paths(graphml_path)
+    paths = tables if all(path.exists() for path in tables) else (graphml_path,)
+    digest = hashlib.sha256()
+    for path in paths:
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(_DIGEST_CHUNK), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_graph_analytics(
+    graphml_path: Path, analytics: GraphAnalytics, *, digest: str | None = None
+) -> Path:
+    """Persist ``analytics`` keyed to the snapshot's current file contents."""
+
+    return _write_sidecar(
+        graph_analytics_path(graphml_path),
+        version=_ANALYTICS_VERSION,
+        digest=digest or snapshot_digest(graphml_path),
+        body={
+            "betweenness_samples": analytics.betweenness_samples,
+            "centrality": analytics.centrality,
+            "betweenness": analytics.betweenness,
+            "community_assignments": analytics.community_assignments,
+        },
+    )
+
+
+def read_graph_analytics(
+    graphml_path: Path, *, digest: str | None = None
+) -> GraphAnalytics | None:
+    """Return persisted analytics, or ``None`` when missing or stale."""
+
+    payload = _read_sidecar(
+        graph_analytics_path(graphml_path),
+        version=_ANALYTICS_VERSION,
+        digest=lambda: digest or snapshot_digest(graphml_path),
+    )
+    if payload is None:
+        return None
+    return GraphAnalytics(
+        centrality={str(k): float(v) for k, v in payload["centrality"].items()},
+        betweenness={str(k): float(v) for k, v in payload["betweenness"].items()},
+        community_assignments={
+            str(k): int(v) for k, v in payload["community_assignments"].items()
+        },
+        betweenness_samples=payload.get("betweenness_samples"),
+    )
+
+
+@dataclass(frozen=True)
+class GraphIndexes:
+    """Inverted indexes over node attributes for point lookups.
+
+    Keys are normalised the way queries are: phones are stripped, emails,
+    publishers and connectors are casefolded. Values list node identifiers
+    in graph order.
+    """
+
+    phones: dict[str, list[str]] = field(default_factory=dict)
+    emails: dict[str, list[str]] = field(default_factory=dict)
+    publishers: dict[str, list[str]] = field(default_factory=dict)
+    connectors: dict[str, list[str]] = field(default_factory=dict)
+    organisation_people: dict[str, list[str]] = field(default_factory=dict)
+
+    def people_with_phone(self, phone: str) -> list[str]:
+        return list(self.phones.get(phone.strip(), ()))
+
+    def people_with_email(self, email: str) -> list[str]:
+        return list(self.emails.get(email.strip().casefold(), ()))
+
+    def sources_matching(self, term: str) -> list[str]:
+        """Return sources whose publisher or connector contains ``term``.
+
+        Only the distinct publisher/connector values are scanned, never the
+        graph itself.
+        """
+
+        key = term.casefold()
+        matches: dict[str, None] = {}
+        for index in (self.publishers, self.connectors):
+            for value, nodes in index.items():
+                if key in value:
+                    matches.update(dict.fromkeys(nodes))
+        return list(matches)
+
+    def people_for_organisation(self, organisation: str) -> list[str]:
+        return list(self.organisation_people.get(organisation, ()))
+
+    def to_dict(self) -> dict[str, dict[str, list[str]]]:
+        return {
+            "phones": self.phones,
+            "emails": self.emails,
+            "publishers": self.publishers,
+            "connectors": self.connectors,
+            "organisation_people": self.organisation_people,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> GraphIndexes:
+        return cls(
+            **{
+                name: {
+                    str(key): [str(node) for node in nodes]
+                    for key, nodes in payload.get(name, {}).items()
+                }
+                for name in (
+                    "phones",
+                    "emails",
+                    "publishers",
+                    "connectors",
+                    "organisation_people",
+                )
+            }
+        )
+
+
+def build_graph_indexes(graph: "nx.MultiDiGraph") -> GraphIndexes:
+    """Index person contact details, source publishers and organisation staff."""
+
+    indexes = GraphIndexes()
+    for node, data in graph.nodes(data=True):
+        node_type = data.get("type")
+        if node_type == "person":
+            for phone in _split_values(data.get("phones")):
+                _index(indexes.phones, phone, node)
+            for email in _split_values(data.get("emails")):
+                _index(indexes.emails, email.casefold(), node)
+        elif node_type == "source":
+            for name, index in (
+                ("publisher", indexes.publishers),
+                ("connector", indexes.connectors),
+            ):
+                value = str(data.get(name) or "").strip().casefold()
+                if value:
+                    _index(index, value, node)
+        elif node_type == "organisation":
+            for _, neighbour in graph.out_edges(node):
+                if graph.nodes[neighbour].get("type") == "person":
+                    _index(indexes.organisation_people, str(node), neighbour)
+    return indexes
+
+
+def graph_indexes_path(graphml_path: Path) -> Path:
+    """Return the lookup-index sidecar stored next to a GraphML snapshot."""
+
+    return graphml_path.with_name(f"{graphml_path.stem}_indexes.json")
+
+
+def write_graph_indexes(
+    graphml_path: Path, indexes: GraphIndexes, *, digest: str | None = None
+) -> Path:
+    """Persist ``indexes`` keyed to the snapshot's current file contents."""
+
+    return _write_sidecar(
+        graph_indexes_path(graphml_path),
+        version=_INDEXES_VERSION,
+        digest=digest or snapshot_digest(graphml_path),
+        body=indexes.to_dict(),
+    )
+
+
+def read_graph_indexes(
+    graphml_path: Path, *, digest: str | None = None
+) -> GraphIndexes | None:
+    """Return persisted indexes, or ``None`` when missing or stale."""
+
+    payload = _read_sidecar(
+        graph_indexes_path(graphml_path),
+        version=_INDEXES_VERSION,
+        digest=lambda: digest or snapshot_digest(graphml_path),
+    )
+    return GraphIndexes.from_dict(payload) if payload is not None else None
+
+
+def _split_values(raw: Any) -> list[str]:
+    return [item.strip() for item in str(raw or "").split(";") if item.strip()]
+
+
+def _index(index: dict[str, list[str]], key: str, node: Any) -> None:
+    nodes = index.setdefault(key, [])
+    if not nodes or nodes[-1] != str(node):
+        nodes.append(str(node))
+
+
+def _write_sidecar(
+    path: Path, *, version: int, digest: str, body: Mapping[str, Any]
+) -> Path:
+    payload = {"version": version, "snapshot_sha256": digest, **body}
+    path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+    return path
+
+
+def _read_sidecar(
+    path: Path, *, version: int, digest: Callable[[], str]
+) -> dict[str, Any] | None:
+    if not path.exists():
+        return None
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if payload.get("version") != version or payload.get("snapshot_sha256") != digest():
+        return None
+    return payload
 
 
 def canonical_id(kind: str, value: str) -> str:
@@ -201,12 +722,19 @@ def merge_sources(primary: SourceDocument, incoming: SourceDocument) -> SourceDo
 
 
 def merge_evidence_links(primary: EvidenceLink, incoming: EvidenceLink) -> EvidenceLink:
-    """Merge evidence edges, summing weights and provenance."""
+    """Merge evidence edges, summing weights and provenance.
+
+    Evidence whose provenance is already recorded on ``primary`` is a replay
+    and leaves the weight unchanged, so merging the same link twice is
+    idempotent.
+    """
 
     combined = replace(primary)
-    base_weight = primary.weight or 0.0
-    incoming_weight = incoming.weight or 0.0
-    combined.weight = (base_weight + incoming_weight) or None
+    replayed = bool(incoming.provenance) and incoming.provenance <= primary.provenance
+    if not replayed:
+        base_weight = primary.weight or 0.0
+        incoming_weight = incoming.weight or 0.0
+        combined.weight = (base_weight + incoming_weight) or None
     combined.attributes = _merge_attributes(primary.attributes, incoming.attributes)
     combined.provenance = merge_provenance(primary.provenance, incoming.provenance)
     return combined
@@ -217,31 +745,31 @@ def load_graph_snapshot(
     graphml_path: Path,
     node_csv_path: Path | None = None,
     edge_csv_path: Path | None = None,
+    betweenness_samples: int | None = None,
 ) -> RelationshipGraphSnapshot:
-    """Load a previously exported relationship graph snapshot."""
+    """Load a previously exported relationship graph snapshot.
+
+    The graph is built from the Parquet node/edge tables when they exist and
+    falls back to parsing GraphML for older snapshots. Centrality and
+    communities come from the analytics sidecar written by the build; they are
+    only recomputed (with ``betweenness_samples``) when the sidecar is missing
+    or no longer matches the snapshot files.
+    """
 
     if nx is None:  # pragma: no cover - optional dependency guard
         raise RuntimeError("networkx is required to load the relationship graph")
 
     graphml_path = graphml_path.expanduser().resolve()
-    if not graphml_path.exists():
+    tables: tuple[Path, Path] | None = graph_table_paths(graphml_path)
+    if _ARROW_AVAILABLE and all(path.exists() for path in tables or ()):
+        graph = read_graph_tables(graphml_path)
+    elif graphml_path.exists():
+        graph = _read_graphml(graphml_path)
+        tables = None
+    else:
         raise FileNotFoundError(
             f"Relationship graph snapshot not found at {graphml_path}"
         )
-
-    raw_graph = nx.read_graphml(graphml_path)
-    if isinstance(raw_graph, nx.MultiDiGraph):
-        graph = raw_graph
-    else:
-        graph = nx.MultiDiGraph()
-        graph.add_nodes_from(raw_graph.nodes(data=True))
-        for source, target, data in raw_graph.edges(data=True):
-            attributes = dict(data)
-            edge_key = attributes.pop("key", None)
-            if edge_key is not None:
-                graph.add_edge(source, target, key=edge_key, **attributes)
-            else:
-                graph.add_edge(source, target, **attributes)
     nodes_csv = (
         node_csv_path.expanduser().resolve()
         if node_csv_path is not None
@@ -253,25 +781,42 @@ def load_graph_snapshot(
         else graphml_path.with_stem(f"{graphml_path.stem}_edges")
     )
 
-    simple_graph = nx.Graph(graph)
-    if simple_graph.number_of_nodes():
-        centrality = nx.degree_centrality(simple_graph)
-        betweenness = nx.betweenness_centrality(simple_graph)
-        try:
-            communities = list(
-                nx.algorithms.community.greedy_modularity_communities(simple_graph)
-            )
-        except Exception:  # pragma: no cover - community detection optional
-            communities = []
-    else:
-        centrality = {}
-        betweenness = {}
-        communities = []
+    # Snapshots written before these sidecars existed (or edited since) are
+    # analysed and indexed once, and the results cached next to the GraphML.
+    digest = snapshot_digest(graphml_path)
+    analytics = read_graph_analytics(graphml_path, digest=digest)
+    if analytics is None:
+        analytics = compute_graph_analytics(
+            graph, betweenness_samples=betweenness_samples
+        )
+        _persist(write_graph_analytics, graphml_path, analytics, digest)
+    indexes = read_graph_indexes(graphml_path, digest=digest)
+    if indexes is None:
+        indexes = build_graph_indexes(graph)
+        _persist(write_graph_indexes, graphml_path, indexes, digest)
 
-    community_assignments: dict[str, int] = {}
-    for index, community in enumerate(communities):
-        for node in community:
-            community_assignments[str(node)] = index
+    anomalies = detect_graph_anomalies(graph)
+
+    return RelationshipGraphSnapshot(
+        graphml_path=graphml_path,
+        node_summary_path=nodes_csv,
+        edge_summary_path=edges_csv,
+        node_count=graph.number_of_nodes(),
+        edge_count=graph.number_of_edges(),
+        centrality=analytics.centrality,
+        betweenness=analytics.betweenness,
+        community_assignments=analytics.community_assignments,
+        anomalies=anomalies,
+        graph=graph,
+        betweenness_samples=analytics.betweenness_samples,
+        indexes=indexes,
+        node_table_path=tables[0] if tables else None,
+        edge_table_path=tables[1] if tables else None,
+    )
+
+
+def detect_graph_anomalies(graph: "nx.MultiDiGraph") -> list[RelationshipAnomaly]:
+    """Flag organisations whose node lists more than one province."""
 
     anomalies: list[RelationshipAnomaly] = []
     for node, data in graph.nodes(data=True):
@@ -294,34 +839,63 @@ def load_graph_snapshot(
                     },
                 )
             )
+    return anomalies
 
-    return RelationshipGraphSnapshot(
-        graphml_path=graphml_path,
-        node_summary_path=nodes_csv,
-        edge_summary_path=edges_csv,
-        node_count=graph.number_of_nodes(),
-        edge_count=graph.number_of_edges(),
-        centrality={str(key): value for key, value in centrality.items()},
-        betweenness={str(key): value for key, value in betweenness.items()},
-        community_assignments=community_assignments,
-        anomalies=anomalies,
-        graph=graph,
-    )
+
+def _persist(
+    writer: Callable[..., Path], graphml_path: Path, value: Any, digest: str
+) -> None:
+    try:
+        writer(graphml_path, value, digest=digest)
+    except OSError:  # pragma: no cover - read-only snapshot directory
+        pass
+
+
+def _read_graphml(graphml_path: Path) -> "nx.MultiDiGraph":
+    raw_graph = nx.read_graphml(graphml_path)
+    if isinstance(raw_graph, nx.MultiDiGraph):
+        return raw_graph
+    graph = nx.MultiDiGraph()
+    graph.add_nodes_from(raw_graph.nodes(data=True))
+    for source, target, data in raw_graph.edges(data=True):
+        attributes = dict(data)
+        edge_key = attributes.pop("key", None)
+        if edge_key is not None:
+            graph.add_edge(source, target, key=edge_key, **attributes)
+        else:
+            graph.add_edge(source, target, **attributes)
+    return graph
 
 
 __all__ = [
     "EvidenceLink",
+    "GraphAnalytics",
+    "GraphIndexes",
     "Organisation",
     "Person",
     "ProvenanceTag",
     "RelationshipAnomaly",
     "RelationshipGraphSnapshot",
     "SourceDocument",
+    "build_graph_indexes",
     "canonical_id",
+    "detect_graph_anomalies",
+    "compute_graph_analytics",
+    "graph_analytics_path",
+    "graph_indexes_path",
+    "graph_table_paths",
     "load_graph_snapshot",
     "merge_evidence_links",
     "merge_organisations",
     "merge_people",
     "merge_provenance",
     "merge_sources",
+    "read_graph_analytics",
+    "read_graph_indexes",
+    "read_graph_tables",
+    "snapshot_digest",
+    "update_graph_analytics",
+    "write_graph_analytics",
+    "write_graph_indexes",
+    "write_graph_tables",
 ]
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import re
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import lru_cache
+from pathlib import Path
 from typing import Any, Callable, Iterable
 
 try:
+    import numpy as np
     import pandas as pd
 
+    from watercrawl.core.fingerprints import FrameFingerprint, fingerprint_frame
+
     _PANDAS_AVAILABLE = True
 except ImportError:
+    np = None  # type: ignore
     pd = None  # type: ignore
+    FrameFingerprint = Any  # type: ignore
+    fingerprint_frame = None  # type: ignore
     _PANDAS_AVAILABLE = False
 
 from watercrawl.core import config
@@ -30,6 +39,11 @@ def _compiled_regex(pattern: str) -> re.Pattern[str]:
     return re.compile(pattern)
 
 
+_PHONE_PUNCTUATION = re.compile(r"[\s().-]")
+# Mirrors the slug rule in :func:`relationships.canonical_id`.
+_CANONICAL_SLUG_PATTERN = r"[^a-z0-9]+"
+
+
 def _clean_value(value: Any) -> str | None:
     if value is None:
         return None
@@ -61,11 +75,308 @@ ContactIndex = dict[str, list[ContactRow]]
 Validator = Callable[[Any, ContactIndex], Iterable[ValidationIssue]]
 
 
+def _flagged_positions(mask: Any) -> list[int]:
+    return [int(position) for position in mask.to_numpy().nonzero()[0]]
+
+
+def _clean_column(frame: Any, column: str | None) -> Any:
+    """Vectorised :func:`_clean_value` over ``frame[column]`` (``None`` for blanks)."""
+
+    if column is None or column not in frame.columns:
+        return pd.Series(None, index=frame.index, dtype=object)
+    values = frame[column]
+    text = values.astype(str).str.strip()
+    blank = values.isna() | text.eq("") | text.str.lower().eq("nan")
+    return text.astype(object).mask(blank, None)
+
+
+def _canonical_id_column(kind: str, values: Any) -> Any:
+    """Vectorised :func:`relationships.canonical_id` for non-null ``values``."""
+
+    slugs = (
+        values.str.strip()
+        .str.casefold()
+        .str.replace(_CANONICAL_SLUG_PATTERN, "-", regex=True)
+        .str.strip("-")
+    )
+    slugs = slugs.mask(slugs.eq(""), "unknown")
+    return (kind + ":" + slugs).astype(object).mask(values.isna(), None)
+
+
+def _canonical_domain_column(websites: Any) -> Any:
+    # URL parsing is not expressible as a string op; parse each distinct value once.
+    present = websites.dropna()
+    domains = {value: canonical_domain(value) for value in present.unique()}
+    return websites.map(domains).astype(object).where(websites.notna(), None)
+
+
+def _build_columnar_contact_index(frame: Any, role_column: str | None) -> ContactIndex:
+    """Build the contact index with column-wise normalisation and one grouping pass."""
+
+    row_numbers = range(2, len(frame) + 2)
+    organisation = _clean_column(frame, "Name of Organisation")
+    org_identifier = organisation.where(
+        organisation.notna(), [f"row-{offset}" for offset in row_numbers]
+    )
+    org_ids = _canonical_id_column("organisation", org_identifier)
+    person = _clean_column(frame, "Contact Person")
+    role = _clean_column(frame, role_column)
+    email = _clean_column(frame, "Contact Email Address")
+    phone = _clean_column(frame, "Contact Number")
+    normalized_email = email.str.lower()
+
+    columns = zip(
+        row_numbers,
+        organisation.fillna("").tolist(),
+        org_ids.tolist(),
+        *(
+            _column_values(column)
+            for column in (
+                _canonical_domain_column(_clean_column(frame, "Website URL")),
+                person,
+                person.str.casefold(),
+                _canonical_id_column("person", person),
+                role,
+                role.str.casefold(),
+                email,
+                normalized_email,
+                _canonical_id_column("email", normalized_email),
+                phone,
+                phone.str.replace(_PHONE_PUNCTUATION.pattern, "", regex=True),
+            )
+        ),
+    )
+    return _group_contact_rows([ContactRow(*values) for values in columns])
+
+
+def _group_contact_rows(rows: list[ContactRow]) -> ContactIndex:
+    """Group rows by organisation in first-seen order, keeping rows ascending."""
+
+    org_ids = np.array([row.canonical_org_id for row in rows], dtype=object)
+    codes, uniques = pd.factorize(org_ids, sort=False)
+    order = np.argsort(codes, kind="stable")
+    grouped_rows = [rows[position] for position in order.tolist()]
+    bounds = [0, *(np.flatnonzero(np.diff(codes[order])) + 1).tolist(), len(rows)]
+    return {
+        org_id: grouped_rows[start:stop]
+        for org_id, start, stop in zip(uniques, bounds, bounds[1:])
+    }
+
+
+_ROW_VALIDATORS = frozenset(
+    {"_validate_provinces", "_validate_statuses", "_validate_contact_hygiene"}
+)
+_ORGANISATION_VALIDATORS = frozenset(
+    {"_validate_duplicates", "_validate_multi_contact_conflicts"}
+)
+# Row-local validators that report in contact-index order rather than sheet order.
+_CONTACT_ORDERED_VALIDATORS = frozenset({"_validate_contact_hygiene"})
+_VALIDATION_CACHE_FORMAT = 1
+_FINGERPRINT_COLUMNS = (
+    "Name of Organisation",
+    "Province",
+    "Status",
+    "Website URL",
+    "Contact Person",
+    "Contact Email Address",
+    "Contact Number",
+)
+
+
+def _validator_name(validator: Validator) -> str:
+    return getattr(validator, "__name__", type(validator).__name__)
+
+
+def validation_profile_version(state: config.ProfileRuntimeState | None = None) -> str:
+    """Return a digest of the profile settings that influence validation results."""
+
+    state = state or _profile_state()
+    payload = {
+        "format": _VALIDATION_CACHE_FORMAT,
+        "profile": state.PROFILE.identifier,
+        "provinces": sorted(state.PROVINCES),
+        "statuses": sorted(state.CANONICAL_STATUSES),
+        "phone_regex": state.PHONE_E164_REGEX,
+        "email_regex": state.EMAIL_REGEX,
+        "email_domain_match": state.EMAIL_REQUIRE_DOMAIN_MATCH,
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def _validated_columns(frame: Any, role_column: str | None) -> list[str]:
+    return [
+        column
+        for column in (*_FINGERPRINT_COLUMNS, role_column)
+        if column is not None and column in frame.columns
+    ]
+
+
+def _organisation_signature(
+    contacts: list[ContactRow],
+    row_keys: list[str],
+    email_owners: dict[str, ContactRow],
+) -> str:
+    """Describe the inputs of the per-organisation checks, independent of row numbers."""
+
+    parts: list[str] = []
+    for contact in contacts:
+        owner = email_owners.get(contact.canonical_email_id or "")
+        if owner is None or owner is contact:
+            marker = ";"
+        elif owner.canonical_org_id == contact.canonical_org_id:
+            marker = "=;"
+        else:
+            marker = ">;"
+        parts.append(row_keys[contact.row_number - 2] + marker)
+    return "".join(parts)
+
+
+@dataclass
+class _CachedRow:
+    contact: tuple[Any, ...]
+    issues: dict[str, tuple[tuple[str, str, str | None], ...]]
+    # Most recently materialised row, reused while the row keeps its position.
+    last_row: ContactRow | None = field(default=None, compare=False, repr=False)
+
+    def contact_row(self, row_number: int) -> ContactRow:
+        if self.last_row is not None and self.last_row.row_number == row_number:
+            return self.last_row
+        organisation, org_id, *details = self.contact
+        if not organisation:
+            # Unnamed organisations are keyed by their sheet row.
+            org_id = relationships.canonical_id("organisation", f"row-{row_number}")
+        self.last_row = ContactRow(row_number, organisation, org_id, *details)
+        return self.last_row
+
+
+@dataclass(frozen=True)
+class _CachedOrganisation:
+    signature: str
+    issues: dict[str, tuple[tuple[Any, ...], ...]]
+
+
+@dataclass
+class ValidationCache:
+    """Validation results reused across runs of :class:`DatasetValidator`.
+
+    Row-local issues and normalised contact details are stored per row content
+    hash; duplicate and multi-contact checks are stored per organisation and
+    re-run only for organisations whose rows, or the first owner of one of
+    their email addresses, changed. Entries are dropped when the active
+    profile's validation settings change.
+    """
+
+    path: Path | None = None
+    profile_version: str | None = None
+    rows: dict[str, _CachedRow] = field(default_factory=dict)
+    organisations: dict[str, _CachedOrganisation] = field(default_factory=dict)
+    row_hits: int = 0
+    row_misses: int = 0
+    organisations_reevaluated: int = 0
+
+    @classmethod
+    def load(cls, path: Path) -> ValidationCache:
+        """Load a cache from ``path``, starting empty when it is missing or stale."""
+
+        cache = cls(path=path)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cache
+        if not isinstance(payload, dict):
+            return cache
+        if payload.get("format") != _VALIDATION_CACHE_FORMAT:
+            return cache
+        try:
+            rows = {
+                key: _CachedRow(
+                    contact=tuple(entry["contact"]),
+                    issues={
+                        name: tuple(tuple(issue) for issue in issues)
+                        for name, issues in entry["issues"].items()
+                    },
+                )
+                for key, entry in payload.get("rows", {}).items()
+            }
+            organisations = {
+                org_id: _CachedOrganisation(
+                    signature=entry["signature"],
+                    issues={
+                        name: tuple(tuple(issue) for issue in issues)
+                        for name, issues in entry["issues"].items()
+                    },
+                )
+                for org_id, entry in payload.get("organisations", {}).items()
+            }
+        except (AttributeError, KeyError, TypeError):
+            return cache
+        cache.profile_version = payload.get("profile_version")
+        cache.rows = rows
+        cache.organisations = organisations
+        return cache
+
+    def save(self, path: Path | None = None) -> Path:
+        """Persist the cache as JSON to ``path`` (or the path it was loaded from)."""
+
+        target = path or self.path
+        if target is None:
+            raise ValueError("ValidationCache.save requires a path")
+        payload = {
+            "format": _VALIDATION_CACHE_FORMAT,
+            "profile_version": self.profile_version,
+            "rows": {
+                key: {"contact": list(entry.contact), "issues": entry.issues}
+                for key, entry in self.rows.items()
+            },
+            "organisations": {
+                org_id: {"signature": entry.signature, "issues": entry.issues}
+                for org_id, entry in self.organisations.items()
+            },
+        }
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(json.dumps(payload), encoding="utf-8")
+        return target
+
+    def clear(self) -> None:
+        self.rows.clear()
+        self.organisations.clear()
+
+    def prepare(self, profile_version: str) -> None:
+        if self.profile_version != profile_version:
+            self.clear()
+            self.profile_version = profile_version
+        self.row_hits = self.row_misses = self.organisations_reevaluated = 0
+
+    def retain(self, row_keys: Iterable[str], contact_index: ContactIndex) -> None:
+        """Drop entries for rows and organisations absent from the latest frame."""
+
+        live_rows = set(row_keys)
+        self.rows = {key: row for key, row in self.rows.items() if key in live_rows}
+        self.organisations = {
+            org_id: entry
+            for org_id, entry in self.organisations.items()
+            if org_id in contact_index
+        }
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "row_hits": self.row_hits,
+            "row_misses": self.row_misses,
+            "organisations_reevaluated": self.organisations_reevaluated,
+        }
+
+
+def _column_values(values: Any) -> list[Any]:
+    return values.astype(object).where(values.notna(), None).tolist()
+
+
 @dataclass(frozen=True)
 class DatasetValidator:
     """Validates input datasets for mandatory columns and value constraints."""
 
     validators: tuple[Validator, ...] | None = None
+    cache: ValidationCache | None = field(default=None, compare=False)
 
     def __post_init__(self) -> None:
         if self.validators is None:
@@ -81,7 +392,11 @@ class DatasetValidator:
                 ),
             )
 
-    def validate_dataframe(self, frame: Any) -> ValidationReport:
+    def validate_dataframe(
+        self, frame: Any, *, fingerprint: FrameFingerprint | None = None
+    ) -> ValidationReport:
+        """Validate ``frame``; ``fingerprint`` lets the cache reuse precomputed row hashes."""
+
         issues: list[ValidationIssue] = []
         frame_columns = getattr(frame, "columns", [])
         frame_attrs = getattr(frame, "attrs", {})
@@ -106,68 +421,275 @@ class DatasetValidator:
         if missing_columns:
             return ValidationReport(issues=issues, rows=len(frame))
 
+        if self.cache is not None and _PANDAS_AVAILABLE:
+            if isinstance(frame, pd.DataFrame):
+                issues.extend(
+                    self._validate_incremental(
+                        frame, self.cache, fingerprint or fingerprint_frame(frame)
+                    )
+                )
+                return ValidationReport(issues=issues, rows=len(frame))
+
         contact_index = self._build_contact_index(frame)
         for validator in self.validators or ():
             issues.extend(validator(frame, contact_index))
         return ValidationReport(issues=list(issues), rows=len(frame))
 
+    def _validate_incremental(
+        self, frame: Any, cache: ValidationCache, fingerprint: FrameFingerprint
+    ) -> list[ValidationIssue]:
+        role_column = self._contact_role_column(frame)
+        cache.prepare(f"{validation_profile_version()}:{role_column or ''}")
+        row_keys = fingerprint.row_digests(_validated_columns(frame, role_column))
+        row_validators, organisation_validators = self._partition_validators()
+
+        stale_keys: dict[str, int] = {}
+        for position, key in enumerate(row_keys):
+            if key not in cache.rows:
+                stale_keys.setdefault(key, position)
+        if stale_keys:
+            cache.rows.update(
+                self._evaluate_rows(
+                    frame.iloc[list(stale_keys.values())],
+                    list(stale_keys),
+                    role_column,
+                    row_validators,
+                )
+            )
+        cache.row_hits = len(row_keys) - len(stale_keys)
+        cache.row_misses = len(stale_keys)
+
+        contact_index = _group_contact_rows(
+            [
+                cache.rows[key].contact_row(position + 2)
+                for position, key in enumerate(row_keys)
+            ]
+        )
+        if organisation_validators:
+            self._evaluate_organisations(
+                contact_index, row_keys, organisation_validators, cache
+            )
+        flagged_rows = [
+            (position, cache.rows[key].issues)
+            for position, key in enumerate(row_keys)
+            if cache.rows[key].issues
+        ]
+        flagged_organisations = [
+            (contacts, cache.organisations[org_id].issues)
+            for org_id, contacts in contact_index.items()
+            if cache.organisations[org_id].issues
+        ]
+        contact_rank: dict[int, int] = {}
+        if flagged_rows:
+            contact_rank = {
+                contact.row_number - 2: rank
+                for rank, contact in enumerate(
+                    contact
+                    for contacts in contact_index.values()
+                    for contact in contacts
+                )
+            }
+
+        issues: list[ValidationIssue] = []
+        for validator in self.validators or ():
+            name = _validator_name(validator)
+            if validator in row_validators:
+                ordered_rows = (
+                    sorted(flagged_rows, key=lambda item: contact_rank[item[0]])
+                    if name in _CONTACT_ORDERED_VALIDATORS
+                    else flagged_rows
+                )
+                for position, row_issues in ordered_rows:
+                    issues.extend(
+                        ValidationIssue(code, message, position + 2, column)
+                        for code, message, column in row_issues.get(name, ())
+                    )
+            elif validator in organisation_validators:
+                for contacts, organisation_issues in flagged_organisations:
+                    issues.extend(
+                        ValidationIssue(
+                            code, message, contacts[ordinal].row_number, column
+                        )
+                        for code, message, ordinal, column in organisation_issues.get(
+                            name, ()
+                        )
+                    )
+            else:
+                issues.extend(validator(frame, contact_index))
+        cache.retain(row_keys, contact_index)
+        return issues
+
+    def _partition_validators(self) -> tuple[list[Validator], list[Validator]]:
+        """Split built-in validators into row-local and per-organisation checks.
+
+        Custom validators fall in neither group and always run on the full frame.
+        """
+
+        row_validators: list[Validator] = []
+        organisation_validators: list[Validator] = []
+        for validator in self.validators or ():
+            if getattr(validator, "__self__", None) is not self:
+                continue
+            if _validator_name(validator) in _ROW_VALIDATORS:
+                row_validators.append(validator)
+            elif _validator_name(validator) in _ORGANISATION_VALIDATORS:
+                organisation_validators.append(validator)
+        return row_validators, organisation_validators
+
+    def _evaluate_rows(
+        self,
+        subset: Any,
+        keys: list[str],
+        role_column: str | None,
+        row_validators: list[Validator],
+    ) -> dict[str, _CachedRow]:
+        subset_index = _build_columnar_contact_index(subset, role_column)
+        issues_by_row: dict[int, dict[str, list[tuple[str, str, str | None]]]] = (
+            defaultdict(lambda: defaultdict(list))
+        )
+        for validator in row_validators:
+            name = _validator_name(validator)
+            for issue in validator(subset, subset_index):
+                issues_by_row[issue.row or 0][name].append(
+                    (issue.code, issue.message, issue.column)
+                )
+        entries: dict[str, _CachedRow] = {}
+        for contacts in subset_index.values():
+            for contact in contacts:
+                offset = contact.row_number
+                entries[keys[offset - 2]] = _CachedRow(
+                    contact=tuple(vars(contact).values())[1:],
+                    last_row=contact,
+                    issues={
+                        name: tuple(found)
+                        for name, found in issues_by_row.get(offset, {}).items()
+                    },
+                )
+        return entries
+
+    def _evaluate_organisations(
+        self,
+        contact_index: ContactIndex,
+        row_keys: list[str],
+        organisation_validators: list[Validator],
+        cache: ValidationCache,
+    ) -> None:
+        email_owners: dict[str, ContactRow] = {}
+        for contacts in contact_index.values():
+            for contact in contacts:
+                if contact.canonical_email_id:
+                    email_owners.setdefault(contact.canonical_email_id, contact)
+        signatures = {
+            org_id: _organisation_signature(contacts, row_keys, email_owners)
+            for org_id, contacts in contact_index.items()
+        }
+        touched = {
+            org_id
+            for org_id, signature in signatures.items()
+            if getattr(cache.organisations.get(org_id), "signature", None) != signature
+        }
+        # Email checks compare each entry with the first row using that email,
+        # so untouched organisations only contribute the owners of emails that
+        # touched organisations use.
+        owner_rows = {
+            email_owners[contact.canonical_email_id].row_number
+            for org_id in touched
+            for contact in contact_index[org_id]
+            if contact.canonical_email_id
+        }
+        subset_index: ContactIndex = {}
+        for org_id, contacts in contact_index.items():
+            if org_id in touched:
+                subset_index[org_id] = contacts
+            elif owner_rows:
+                owned = [
+                    contact for contact in contacts if contact.row_number in owner_rows
+                ]
+                if owned:
+                    subset_index[org_id] = owned
+        found: dict[str, dict[str, list[tuple[Any, ...]]]] = {}
+        # Issues are cached against the contact's ordinal within its
+        # organisation so inserted or deleted rows elsewhere do not stale them.
+        row_owners = {
+            contact.row_number: (org_id, ordinal)
+            for org_id in touched
+            for ordinal, contact in enumerate(contact_index[org_id])
+        }
+        for validator in organisation_validators:
+            name = _validator_name(validator)
+            for issue in validator(None, subset_index):
+                owner = row_owners.get(issue.row or 0)
+                if owner is not None:
+                    org_id, ordinal = owner
+                    found.setdefault(org_id, {}).setdefault(name, []).append(
+                        (issue.code, issue.message, ordinal, issue.column)
+                    )
+        for org_id in touched:
+            cache.organisations[org_id] = _CachedOrganisation(
+                signature=signatures[org_id],
+                issues={
+                    name: tuple(entries)
+                    for name, entries in found.get(org_id, {}).items()
+                },
+            )
+        cache.organisations_reevaluated = len(touched)
+
     def _validate_provinces(
         self, frame: Any, _: ContactIndex
     ) -> Iterable[ValidationIssue]:
-        allowed = {
-            province.lower(): province for province in _profile_state().PROVINCES
-        }
+        allowed = {province.lower() for province in _profile_state().PROVINCES}
         province_series = frame["Province"].fillna("")
-        issues: list[ValidationIssue] = []
-        for offset, (_, raw_value) in enumerate(province_series.items(), start=2):
-            cleaned = str(raw_value).strip().lower()
-            if cleaned and cleaned in allowed:
-                continue
-            if cleaned == "unknown" or not cleaned:
-                continue
-            issues.append(
-                ValidationIssue(
-                    code="invalid_province",
-                    message=f"Province '{raw_value}' is not recognised",
-                    row=offset,
-                    column="Province",
-                )
+        cleaned = province_series.astype(str).str.strip().str.lower()
+        invalid = ~(cleaned.isin(allowed) | cleaned.isin(("", "unknown")))
+        raw_values = province_series.tolist()
+        return [
+            ValidationIssue(
+                code="invalid_province",
+                message=f"Province '{raw_values[position]}' is not recognised",
+                row=position + 2,
+                column="Province",
             )
-        return issues
+            for position in _flagged_positions(invalid)
+        ]
 
     def _validate_statuses(
         self, frame: Any, _: ContactIndex
     ) -> Iterable[ValidationIssue]:
         allowed = {status.lower() for status in _profile_state().CANONICAL_STATUSES}
+        status_series = frame["Status"].fillna("")
+        cleaned = status_series.astype(str).str.strip().str.lower()
+        missing = cleaned.eq("")
+        invalid = ~(missing | cleaned.isin(allowed))
+        raw_values = status_series.tolist()
+        missing_flags = missing.tolist()
         issues: list[ValidationIssue] = []
-        for offset, (_, raw_value) in enumerate(
-            frame["Status"].fillna("").items(), start=2
-        ):
-            cleaned = str(raw_value).strip().lower()
-            if not cleaned:
+        for position in _flagged_positions(missing | invalid):
+            if missing_flags[position]:
                 issues.append(
                     ValidationIssue(
                         code="missing_status",
                         message="Status is empty",
-                        row=offset,
+                        row=position + 2,
                         column="Status",
                     )
                 )
                 continue
-            if cleaned not in allowed:
-                issues.append(
-                    ValidationIssue(
-                        code="invalid_status",
-                        message=f"Status '{raw_value}' is not permitted",
-                        row=offset,
-                        column="Status",
-                    )
+            issues.append(
+                ValidationIssue(
+                    code="invalid_status",
+                    message=f"Status '{raw_values[position]}' is not permitted",
+                    row=position + 2,
+                    column="Status",
                 )
+            )
         return issues
 
     def _validate_contact_hygiene(
         self, _: Any, contact_index: ContactIndex
     ) -> Iterable[ValidationIssue]:
+        state = _profile_state()
+        phone_re = _compiled_regex(state.PHONE_E164_REGEX)
+        email_re = _compiled_regex(state.EMAIL_REGEX)
         issues: list[ValidationIssue] = []
         for contacts in contact_index.values():
             for contact in contacts:
@@ -181,7 +703,6 @@ class DatasetValidator:
                         )
                     )
                 else:
-                    phone_re = _compiled_regex(_profile_state().PHONE_E164_REGEX)
                     if not contact.normalized_phone or not phone_re.fullmatch(
                         contact.normalized_phone
                     ):
@@ -205,7 +726,6 @@ class DatasetValidator:
                     )
                     continue
 
-                email_re = _compiled_regex(_profile_state().EMAIL_REGEX)
                 if not email_re.fullmatch(contact.email):
                     issues.append(
                         ValidationIssue(
@@ -217,7 +737,6 @@ class DatasetValidator:
                     )
                     continue
 
-                state = _profile_state()
                 if (
                     state.EMAIL_REQUIRE_DOMAIN_MATCH
                     and contact.website_domain
@@ -389,21 +908,12 @@ class DatasetValidator:
         return issues
 
     def _build_contact_index(self, frame: Any) -> ContactIndex:
-        contact_index: ContactIndex = defaultdict(list)
         role_column = self._contact_role_column(frame)
+        if _PANDAS_AVAILABLE and isinstance(frame, pd.DataFrame):
+            return _build_columnar_contact_index(frame, role_column)
 
-        if _PANDAS_AVAILABLE and hasattr(frame, "iterrows"):
-            row_iterable = (
-                (offset, data)
-                for offset, (_, data) in enumerate(frame.iterrows(), start=2)
-            )
-        else:
-            row_iterable = (
-                (offset, data) for offset, data in enumerate(frame, start=2)
-            )
-
-        for offset, data in row_iterable:
-
+        contact_index: ContactIndex = defaultdict(list)
+        for offset, data in enumerate(frame, start=2):
             organisation = _clean_value(data.get("Name of Organisation")) or ""
             org_identifier = organisation or f"row-{offset}"
             canonical_org_id = relationships.canonical_id(
@@ -418,7 +928,7 @@ class DatasetValidator:
             phone = _clean_value(data.get("Contact Number"))
 
             normalized_email = email.lower() if email else None
-            normalized_phone = re.sub(r"[\s().-]", "", phone) if phone else None
+            normalized_phone = _PHONE_PUNCTUATION.sub("", phone) if phone else None
             canonical_person_id = (
                 relationships.canonical_id("person", person)
                 if person is not None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import json
 import sys
 import uuid
 from datetime import UTC, datetime
@@ -18,8 +19,18 @@ from watercrawl.integrations.storage.lakehouse import (
     LakehouseConfig,
     LocalLakehouseWriter,
     build_lakehouse_writer,
+    compact_snapshot,
+    diff_snapshots,
     restore_snapshot,
     restore_snapshot_to_path,
+    vacuum_snapshots,
+)
+from watercrawl.integrations.storage.query import (
+    VERSION_COLUMN,
+    count_by,
+    parse_filter,
+    query_sql,
+    scan_snapshots,
 )
 
 
@@ -70,6 +81,11 @@ def command_snapshot(args: argparse.Namespace) -> None:
 
 def command_restore(args: argparse.Namespace) -> None:
     output_path = Path(args.output).resolve() if args.output else None
+    pushdown = {
+        "columns": _split_columns(args.columns),
+        "filters": [parse_filter(expression) for expression in args.where or []]
+        or None,
+    }
     if output_path is not None:
         restored_path = restore_snapshot_to_path(
             output_path=output_path,
@@ -77,6 +93,7 @@ def command_restore(args: argparse.Namespace) -> None:
             version=args.version,
             root_path=args.root,
             backend=args.backend,
+            **pushdown,
         )
         print(restored_path)
         return
@@ -85,10 +102,111 @@ def command_restore(args: argparse.Namespace) -> None:
         version=args.version,
         root_path=args.root,
         backend=args.backend,
+        **pushdown,
     )
     dataframe.to_csv(sys.stdout, index=False)
 
 
+def command_diff(args: argparse.Namespace) -> None:
+    diff = diff_snapshots(
+        base_version=args.base,
+        target_version=args.target,
+        table_name=args.table,
+        root_path=args.root,
+        backend=args.backend,
+    )
+    payload = diff.to_dict(include_rows=not args.summary)
+    print(json.dumps(payload, indent=2, sort_keys=True))
+
+
+def command_compact(args: argparse.Namespace) -> None:
+    report = compact_snapshot(
+        version=args.version,
+        table_name=args.table,
+        root_path=args.root,
+        backend=args.backend,
+    )
+    print(json.dumps(report.to_dict(), indent=2, sort_keys=True))
+
+
+def command_vacuum(args: argparse.Namespace) -> None:
+    report = vacuum_snapshots(
+        retain_versions=args.retain,
+        table_name=args.table,
+        root_path=args.root,
+        backend=args.backend,
+        dry_run=args.dry_run,
+    )
+    print(json.dumps(report.to_dict(), indent=2, sort_keys=True))
+
+
+def _split_columns(value: str | None) -> list[str] | None:
+    if not value:
+        return None
+    return [column.strip() for column in value.split(",") if column.strip()]
+
+
+def command_query(args: argparse.Namespace) -> None:
+    versions: int | list[str] | None = args.version or args.last
+    location = {
+        "table_name": args.table,
+        "root_path": args.root,
+        "backend": args.backend,
+    }
+    if args.sql:
+        table = query_sql(args.sql, versions=versions, **location)
+    else:
+        count_columns = _split_columns(args.count_by)
+        # Counting only needs the grouping keys; filters are pushed down separately.
+        columns = count_columns or _split_columns(args.columns)
+        filters = [parse_filter(expression) for expression in args.where or []]
+        table = scan_snapshots(
+            columns=columns,
+            filters=filters or None,
+            versions=versions,
+            with_version=bool(count_columns and VERSION_COLUMN in count_columns)
+            or None,
+            **location,
+        )
+        if count_columns:
+            table = count_by(table, count_columns)
+    if args.limit is not None:
+        table = table.slice(0, args.limit)
+
+    frame = table.to_pandas()
+    if not args.output:
+        frame.to_csv(sys.stdout, index=False)
+        return
+    output_path = Path(args.output).resolve()
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    suffix = output_path.suffix.lower()
+    if suffix == ".parquet":
+        frame.to_parquet(output_path, index=False)
+    elif suffix in {".json", ".jsonl"}:
+        frame.to_json(output_path, orient="records", lines=suffix == ".jsonl")
+    else:
+        frame.to_csv(output_path, index=False)
+    print(output_path)
+
+
+def _add_table_arguments(parser: argparse.ArgumentParser, action: str) -> None:
+    parser.add_argument(
+        "--table",
+        type=str,
+        help=f"Table name to {action} (defaults to configuration).",
+    )
+    parser.add_argument(
+        "--root",
+        type=Path,
+        help=f"Override lakehouse root path for {action} operations.",
+    )
+    parser.add_argument(
+        "--backend",
+        type=str,
+        help=f"Override backend for {action} (e.g., delta).",
+    )
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Lakehouse utilities for snapshotting and restoring curated datasets."
@@ -131,7 +249,8 @@ def build_parser() -> argparse.ArgumentParser:
     restore_parser.add_argument(
         "--output",
         type=str,
-        help="Destination file for the restored dataset. Prints to stdout when omitted.",
+        help="Destination file (CSV, Parquet, or Arrow IPC via .arrow/.feather). "
+        "Prints to stdout when omitted.",
     )
     restore_parser.add_argument(
         "--table",
@@ -148,8 +267,129 @@ def build_parser() -> argparse.ArgumentParser:
         type=str,
         help="Override backend for restore (e.g., delta).",
     )
+    restore_parser.add_argument(
+        "--columns",
+        type=str,
+        help="Comma-separated columns to restore (others are never read).",
+    )
+    restore_parser.add_argument(
+        "--where",
+        action="append",
+        help="Row filter such as 'Province == Gauteng' (repeatable; combined with AND).",
+    )
     restore_parser.set_defaults(func=command_restore)
 
+    diff_parser = subparsers.add_parser(
+        "diff",
+        help="Report rows added, removed or changed between two snapshots.",
+    )
+    diff_parser.add_argument(
+        "--base", type=str, required=True, help="Snapshot version to compare from."
+    )
+    diff_parser.add_argument(
+        "--target",
+        type=str,
+        help="Snapshot version to compare to. Latest when omitted.",
+    )
+    diff_parser.add_argument(
+        "--table",
+        type=str,
+        help="Table name to diff (defaults to configuration).",
+    )
+    diff_parser.add_argument(
+        "--root",
+        type=Path,
+        help="Override lakehouse root path for diff operations.",
+    )
+    diff_parser.add_argument(
+        "--backend",
+        type=str,
+        help="Override backend for diff (e.g., delta).",
+    )
+    diff_parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="Print counts only, omitting the differing rows.",
+    )
+    diff_parser.set_defaults(func=command_diff)
+
+    compact_parser = subparsers.add_parser(
+        "compact",
+        help="Merge appended partition files of a snapshot into one file each.",
+    )
+    compact_parser.add_argument(
+        "--version",
+        type=str,
+        help="Snapshot version to compact. Latest when omitted.",
+    )
+    _add_table_arguments(compact_parser, "compact")
+    compact_parser.set_defaults(func=command_compact)
+
+    vacuum_parser = subparsers.add_parser(
+        "vacuum",
+        help="Expire old snapshots and delete data files no snapshot references.",
+    )
+    vacuum_parser.add_argument(
+        "--retain",
+        type=int,
+        help="Number of most recent snapshots to keep (defaults to configuration).",
+    )
+    vacuum_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would be removed without deleting anything.",
+    )
+    _add_table_arguments(vacuum_parser, "vacuum")
+    vacuum_parser.set_defaults(func=command_vacuum)
+
+    query_parser = subparsers.add_parser(
+        "query",
+        help="Query snapshots in place with column/filter pushdown or SQL.",
+    )
+    versions_group = query_parser.add_mutually_exclusive_group()
+    versions_group.add_argument(
+        "--version",
+        action="append",
+        help="Snapshot version to query (repeatable). Latest when omitted.",
+    )
+    versions_group.add_argument(
+        "--last",
+        type=int,
+        help="Query the most recent N snapshot versions.",
+    )
+    query_parser.add_argument(
+        "--columns",
+        type=str,
+        help="Comma-separated columns to read.",
+    )
+    query_parser.add_argument(
+        "--where",
+        action="append",
+        help="Filter such as 'Province == Gauteng' or 'Status in Verified,Candidate' "
+        "(repeatable; combined with AND).",
+    )
+    query_parser.add_argument(
+        "--count-by",
+        type=str,
+        help="Comma-separated columns to group row counts by "
+        "(include snapshot_version to count per version).",
+    )
+    query_parser.add_argument(
+        "--sql",
+        type=str,
+        help="SQL over the 'snapshots' view (requires duckdb).",
+    )
+    query_parser.add_argument(
+        "--limit", type=int, help="Maximum number of result rows."
+    )
+    query_parser.add_argument(
+        "--output",
+        type=str,
+        help="Write results to CSV, Parquet or JSON. Prints CSV when omitted.",
+    )
+    _add_table_arguments(query_parser, "query")
+    query_parser.set_defaults(func=command_query)
+
     return parser
 
 
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Any, Protocol, TypeVar, cast, runtime_checkabl
 from urllib.parse import urlparse
 
 from crawlkit.adapter.firecrawl_compat import fetch_markdown
+from crawlkit.fetch.http_cache import ensure_http_cache
 from crawlkit.types import Entities, FetchPolicy
 from watercrawl.core import config
 from watercrawl.core.external_sources import triangulate_organisation
@@ -155,6 +156,15 @@ class TriangulatingResearchAdapter:
         return merge_findings(baseline, triangulated)
 
 
+def _enable_http_cache() -> None:
+    """Point Crawlkit's page cache at ``CRAWLER_HTTP_CACHE_DIR`` when configured."""
+
+    settings = getattr(config, "CRAWLER_INFRASTRUCTURE", None)
+    directory = getattr(settings, "http_cache_dir", None)
+    if directory is not None:
+        ensure_http_cache(directory)
+
+
 class CrawlkitResearchAdapter:
     """Adapter that uses Crawlkit fetch/distill/extract pipelines for enrichment."""
 
@@ -194,6 +204,7 @@ class CrawlkitResearchAdapter:
             note = baseline.notes or "Crawlkit found no candidate URLs"
             return merge_findings(baseline, ResearchFinding(notes=note))
 
+        _enable_http_cache()
         findings: list[ResearchFinding] = []
         policy = self._policy_factory(organisation, province)
         seen: set[str] = set()
@@ -16,8 +16,10 @@ WC-03 acceptance criteria:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import threading
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field
@@ -26,6 +28,8 @@ from typing import Dict, List, Optional, Set
 from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
 
+from crawlkit.fetch.robots_cache import RobotsCache, shared_robots_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -79,10 +83,17 @@ class CrawlPolicyManager:
         ...     manager.record_success("example.com")
     """
 
-    def __init__(self, config: Optional[CrawlConfig] = None):
+    def __init__(
+        self,
+        config: Optional[CrawlConfig] = None,
+        robots_cache: Optional[RobotsCache] = None,
+    ):
         self.config = config or CrawlConfig()
+        # Shared with crawlkit's fetch so each host's robots.txt is downloaded once.
+        self.robots_cache = robots_cache or shared_robots_cache()
         self.host_states: Dict[str, HostState] = defaultdict(HostState)
         self._seen_urls: Set[str] = set()
+        self._rate_lock = threading.Lock()
         self._trap_patterns = self._compile_trap_patterns()
 
     def _compile_trap_patterns(self) -> List[re.Pattern]:
@@ -201,32 +212,20 @@ class CrawlPolicyManager:
             host: Hostname to get robots.txt for
 
         Returns:
-            RobotFileParser instance or None if fetch fails
+            RobotFileParser instance, or None if the host has no robots.txt
         """
         state = self.host_states[host]
-
-        # Check cache validity
-        if state.robots_parser and state.robots_fetched_at:
-            age = datetime.now() - state.robots_fetched_at
-            if age < self.config.robots_cache_ttl:
-                return state.robots_parser
-
-        # Fetch robots.txt
-        try:
-            parser = RobotFileParser()
-            parser.set_url(f"https://{host}/robots.txt")
-            parser.read()
-
-            state.robots_parser = parser
-            state.robots_fetched_at = datetime.now()
-
-            logger.info(f"Fetched robots.txt for {host}")
-            return parser
-
-        except Exception as e:
-            logger.warning(f"Failed to fetch robots.txt for {host}: {e}")
-            # Per RFC 9309, treat as no restrictions if fetch fails
-            return None
+        # Per RFC 9309, a missing robots.txt (4xx) means no restrictions and
+        # the shared cache returns None; 5xx or network failures come back as
+        # a short-lived disallow-all parser.
+        parser = self.robots_cache.parser_sync(
+            f"https://{host}/",
+            user_agent=self.config.user_agent,
+            max_age=self.config.robots_cache_ttl.total_seconds(),
+        )
+        state.robots_parser = parser
+        state.robots_fetched_at = datetime.now()
+        return parser
 
     def can_fetch(self, url: str) -> bool:
         """
@@ -258,24 +257,61 @@ class CrawlPolicyManager:
 
         return True
 
+    def _reserve_request_slot(self, host: str) -> float:
+        """
+        Claim the host's next request slot and return how long to wait for it.
+
+        The slot is recorded before anyone sleeps, so concurrent callers queue
+        one delay apart instead of all waking at once.
+
+        Args:
+            host: Hostname to rate-limit
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        with self._rate_lock:
+            state = self.host_states[host]
+            delay = state.current_delay
+            if state.robots_parser is not None:
+                crawl_delay = state.robots_parser.crawl_delay(self.config.user_agent)
+                delay = max(delay, float(crawl_delay or 0.0))
+
+            now = datetime.now()
+            wait_time = 0.0
+            if state.last_request_time:
+                elapsed = (now - state.last_request_time).total_seconds()
+                wait_time = max(0.0, delay - elapsed)
+
+            state.last_request_time = now + timedelta(seconds=wait_time)
+        if wait_time > 0:
+            logger.debug(f"Rate limiting {host}: waiting {wait_time:.2f}s")
+        return wait_time
+
     def wait_for_rate_limit(self, host: str) -> None:
         """
         Block until rate limit allows request to host.
 
+        Async callers should use :meth:`wait_for_rate_limit_async`, which
+        waits without tying up a thread.
+
         Args:
             host: Hostname to rate-limit
         """
-        state = self.host_states[host]
+        wait_time = self._reserve_request_slot(host)
+        if wait_time > 0:
+            time.sleep(wait_time)
 
-        if state.last_request_time:
-            elapsed = (datetime.now() - state.last_request_time).total_seconds()
-            wait_time = state.current_delay - elapsed
-
-            if wait_time > 0:
-                logger.debug(f"Rate limiting {host}: waiting {wait_time:.2f}s")
-                time.sleep(wait_time)
+    async def wait_for_rate_limit_async(self, host: str) -> None:
+        """
+        Wait until rate limit allows request to host, yielding to the event loop.
 
-        state.last_request_time = datetime.now()
+        Args:
+            host: Hostname to rate-limit
+        """
+        wait_time = self._reserve_request_slot(host)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
 
     def record_success(self, host: str) -> None:
         """
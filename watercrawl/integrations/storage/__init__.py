@@ -1,5 +1,5 @@
 """Storage integrations covering lakehouse writers and versioning."""
 
-from . import lakehouse, versioning
+from . import lakehouse, query, versioning
 
-__all__ = ["lakehouse", "versioning"]
+__all__ = ["lakehouse", "query", "versioning"]
@@ -6,22 +6,50 @@ for curated datasets, supporting modular plugin registration and evidence-backed
 
 from __future__ import annotations
 
+import bisect
 import hashlib
 import json
+import shutil
 import warnings
-from dataclasses import dataclass, field
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
+from urllib.parse import quote
 
 try:  # pragma: no cover - optional dependency for tests
+    import numpy as np
     import pandas as pd
 
+    from watercrawl.core.fingerprints import FrameFingerprint, fingerprint_frame
+    from watercrawl.integrations.storage.merkle import (
+        RowMerkleTree,
+        build_row_index,
+        diff_row_indexes,
+        load_row_index,
+        save_row_index,
+    )
+
     _PANDAS_AVAILABLE = True
 except ImportError:  # pragma: no cover - fallback when pandas absent
+    np = None  # type: ignore
     pd = None  # type: ignore
+    FrameFingerprint = Any  # type: ignore
+    fingerprint_frame = None  # type: ignore
+    RowMerkleTree = Any  # type: ignore
     _PANDAS_AVAILABLE = False
 
+try:  # pragma: no cover - optional dependency for row-group reads
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    _PYARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover - pandas may use fastparquet instead
+    feather = None  # type: ignore
+    pq = None  # type: ignore
+    _PYARROW_AVAILABLE = False
+
 try:  # pragma: no cover - optional dependency for Delta Lake support
     from deltalake import DeltaTable, write_deltalake  # type: ignore
 
@@ -42,6 +70,17 @@ from watercrawl.integrations.integration_plugins import (
 
 DELTA_BACKEND = {"delta", "deltalake"}
 ICEBERG_BACKEND = {"iceberg"}
+# Rows are keyed by organisation for snapshot diffs; frames without the column
+# fall back to keying on every column (changes then show as remove + add).
+MERKLE_KEY_COLUMNS = ("Name of Organisation",)
+ROW_INDEX_FILENAME = "row_index.npy"
+ROW_ORDER_FILENAME = "row_order.npy"
+# Partition files live beside the version directories and are shared by them.
+PARTITIONS_DIRNAME = "_partitions"
+_NULL_PARTITION = "__null__"
+# Small row groups let diffs read only the parts of a snapshot that changed.
+PARQUET_ROW_GROUP_SIZE = 4096
+ARROW_SUFFIXES = {".arrow", ".feather", ".ipc"}
 
 
 def _ensure_pandas() -> None:
@@ -60,13 +99,60 @@ def _normalize_dataframe(dataframe: Any) -> Any:
     )  # type: ignore[attr-defined]
 
 
-def _fingerprint_dataframe(dataframe: Any) -> str:
-    normalized = _normalize_dataframe(dataframe)
-    if _PANDAS_AVAILABLE and hasattr(normalized, "to_csv"):
-        payload = normalized.to_csv(index=False)  # type: ignore[call-arg]
-    else:  # pragma: no cover - defensive guard
-        payload = json.dumps(normalized, default=str)
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+def _build_row_merkle(
+    frame_fingerprint: FrameFingerprint, storage_order: Any = None
+) -> tuple[Any, RowMerkleTree]:
+    """Build the row index, with positions following *storage_order* when given."""
+
+    key_columns = [
+        column for column in MERKLE_KEY_COLUMNS if column in frame_fingerprint.columns
+    ] or sorted(frame_fingerprint.columns)
+    key_hashes = frame_fingerprint.row_hashes(key_columns)
+    row_hashes = frame_fingerprint.row_hashes()
+    if storage_order is not None:
+        key_hashes, row_hashes = key_hashes[storage_order], row_hashes[storage_order]
+    return build_row_index(key_hashes, row_hashes, key_columns=key_columns)
+
+
+def _rows_digest(row_hashes: Any) -> str:
+    return hashlib.blake2b(
+        np.ascontiguousarray(row_hashes, dtype=np.uint64).tobytes(), digest_size=16
+    ).hexdigest()
+
+
+def _partition_path(columns: list[str], key: Any) -> tuple[str, dict[str, Any]]:
+    values = key if isinstance(key, tuple) else (key,)
+    parts: list[str] = []
+    recorded: dict[str, Any] = {}
+    for column, value in zip(columns, values):
+        if value is None or (isinstance(value, float) and value != value):
+            label, value = _NULL_PARTITION, None
+        else:
+            label = quote(str(value), safe=" ")
+        parts.append(f"{quote(column, safe=' ')}={label}")
+        recorded[column] = value if value is None else str(value)
+    return "/".join(parts), recorded
+
+
+def _previous_partition_files(
+    table_root: Path, partition_columns: list[str], *, exclude_version: str
+) -> dict[str, list[dict[str, Any]]]:
+    """Return partition files of the latest earlier version with the same layout."""
+
+    for manifest_path in sorted(table_root.glob("*/manifest.json"), reverse=True):
+        if manifest_path.parent.name == exclude_version:
+            continue
+        try:
+            artifacts = json.loads(manifest_path.read_text()).get("artifacts", {})
+        except (OSError, json.JSONDecodeError):
+            continue
+        if artifacts.get("partition_columns") != partition_columns:
+            return {}
+        return {
+            partition["path"]: list(partition["files"])
+            for partition in artifacts.get("partitions", [])
+        }
+    return {}
 
 
 @dataclass(slots=True)
@@ -77,6 +163,12 @@ class LakehouseConfig:
     root_path: Path = field(default_factory=lambda: config.LAKEHOUSE.root_path)
     table_name: str = field(default_factory=lambda: config.LAKEHOUSE.table_name)
     enabled: bool = field(default_factory=lambda: config.LAKEHOUSE.enabled)
+    partition_columns: tuple[str, ...] = field(
+        default_factory=lambda: config.LAKEHOUSE.partition_columns
+    )
+    retain_versions: int = field(
+        default_factory=lambda: config.LAKEHOUSE.retain_versions
+    )
 
 
 @dataclass(frozen=True)
@@ -93,6 +185,7 @@ class LakehouseManifest:
     degraded: bool = False
     remediation: str | None = None
     extras: dict[str, Any] = field(default_factory=dict)
+    merkle: RowMerkleTree | None = field(default=None, repr=False)
 
 
 class LocalLakehouseWriter:
@@ -168,7 +261,8 @@ class LocalLakehouseWriter:
         table_root.mkdir(parents=True, exist_ok=True)
 
         normalized = _normalize_dataframe(dataframe)
-        fingerprint = _fingerprint_dataframe(normalized)
+        frame_fingerprint = fingerprint_frame(normalized)
+        fingerprint = frame_fingerprint.root
         row_count = int(len(normalized)) if _PANDAS_AVAILABLE else 0
 
         write_deltalake(  # type: ignore[misc]
@@ -180,6 +274,9 @@ class LocalLakehouseWriter:
         table = DeltaTable(table_root.as_posix())  # type: ignore[misc]
         version_number = table.version()
         version_str = str(version_number)
+        row_index, merkle_tree = _build_row_merkle(frame_fingerprint)
+        row_index_name = f"row_index_v{version_str}.npy"
+        save_row_index(table_root / row_index_name, row_index)
         history_entries = table.history(1)
         history_entry = history_entries[0] if history_entries else {}
         history_payload = json.loads(json.dumps(history_entry, default=str))
@@ -192,9 +289,12 @@ class LocalLakehouseWriter:
             "artifacts": {
                 "data": "_delta_log",
                 "format": "delta",
+                "row_index": row_index_name,
             },
             "created_at": datetime.now(UTC).isoformat(),
             "fingerprint": fingerprint,
+            "column_fingerprints": dict(frame_fingerprint.columns),
+            "merkle": merkle_tree.to_dict(),
             "row_count": row_count,
             "delta": {
                 "table_path": table_root.as_posix(),
@@ -233,6 +333,7 @@ class LocalLakehouseWriter:
             degraded=False,
             remediation=None,
             extras=extras,
+            merkle=merkle_tree,
         )
 
     def _write_filesystem_snapshot(
@@ -251,16 +352,37 @@ class LocalLakehouseWriter:
         table_dir.mkdir(parents=True, exist_ok=True)
 
         normalized = _normalize_dataframe(dataframe)
-        fingerprint = _fingerprint_dataframe(normalized)
+        frame_fingerprint = fingerprint_frame(normalized)
+        fingerprint = frame_fingerprint.root
         row_count = int(len(normalized)) if _PANDAS_AVAILABLE else 0
+        partition_columns = [
+            column
+            for column in self._config.partition_columns
+            if column in normalized.columns
+        ]
 
         storage_format = "parquet"
         data_path = table_dir / "data.parquet"
         degraded = False
         parquet_error: Exception | None = None
+        partition_layout: dict[str, Any] | None = None
+        storage_order: Any = None
         try:
-            normalized.to_parquet(data_path, index=False)  # type: ignore[call-arg]
+            if partition_columns:
+                partition_layout, storage_order = self._write_partitions(
+                    normalized,
+                    frame_fingerprint,
+                    partition_columns,
+                    exclude_version=version,
+                )
+                data_path = self._table_directory() / PARTITIONS_DIRNAME
+                np.save(table_dir / ROW_ORDER_FILENAME, storage_order)
+            else:
+                normalized.to_parquet(  # type: ignore[call-arg]
+                    data_path, index=False, row_group_size=PARQUET_ROW_GROUP_SIZE
+                )
         except (ImportError, ValueError) as error:
+            partition_layout, storage_order = None, None
             degraded = True
             storage_format = "csv"
             parquet_error = error
@@ -275,6 +397,9 @@ class LocalLakehouseWriter:
             if remediation is None:
                 remediation = csv_message
 
+        row_index, merkle_tree = _build_row_merkle(frame_fingerprint, storage_order)
+        save_row_index(table_dir / ROW_INDEX_FILENAME, row_index)
+
         manifest_payload: dict[str, Any] = {
             "backend": self._config.backend,
             "table": self._config.table_name,
@@ -283,9 +408,13 @@ class LocalLakehouseWriter:
             "artifacts": {
                 "data": data_path.name,
                 "format": storage_format,
+                "layout": "partitioned" if partition_layout else "single",
+                "row_index": ROW_INDEX_FILENAME,
             },
             "created_at": datetime.now(UTC).isoformat(),
             "fingerprint": fingerprint,
+            "column_fingerprints": dict(frame_fingerprint.columns),
+            "merkle": merkle_tree.to_dict(),
             "row_count": row_count,
             "schema": (
                 {column: str(dtype) for column, dtype in normalized.dtypes.items()}
@@ -304,6 +433,10 @@ class LocalLakehouseWriter:
             },
         }
 
+        if partition_layout:
+            manifest_payload["artifacts"].update(partition_layout)
+            manifest_payload["artifacts"]["row_order"] = ROW_ORDER_FILENAME
+
         if degraded or degrade_reason:
             reason = degrade_reason or "parquet_engine_missing"
             remediation_msg = remediation or (
@@ -339,7 +472,97 @@ class LocalLakehouseWriter:
             degraded=bool(degrade_reason or degraded),
             remediation=remediation,
             extras=extras,
+            merkle=merkle_tree,
+        )
+
+    def _write_partitions(
+        self,
+        normalized: Any,
+        frame_fingerprint: FrameFingerprint,
+        partition_columns: list[str],
+        *,
+        exclude_version: str,
+    ) -> tuple[dict[str, Any], Any]:
+        """Write changed partitions and reference unchanged files from earlier versions.
+
+        Partition files are content-addressed by the row hashes they hold. A
+        partition whose leading rows match the files recorded for it in the
+        previous version reuses those files and only writes the appended tail.
+        Returns the manifest layout and the storage order of the rows.
+        """
+
+        table_root = self._table_directory()
+        previous = _previous_partition_files(
+            table_root, partition_columns, exclude_version=exclude_version
+        )
+        row_hashes = frame_fingerprint.row_hashes()
+        groups = normalized.groupby(partition_columns, dropna=False, sort=False).indices
+        partitions: list[dict[str, Any]] = []
+        order: list[Any] = []
+        files_written = files_reused = 0
+        for key, positions in sorted(
+            (
+                (_partition_path(partition_columns, key), positions)
+                for key, positions in groups.items()
+            ),
+            key=lambda item: item[0],
+        ):
+            relative_dir, values = key
+            hashes = row_hashes[positions]
+            files: list[dict[str, Any]] = []
+            offset = 0
+            for entry in previous.get(relative_dir, []):
+                stop = offset + int(entry["rows"])
+                if (
+                    stop > len(hashes)
+                    or _rows_digest(hashes[offset:stop]) != entry["digest"]
+                ):
+                    break
+                files.append(entry)
+                offset = stop
+            files_reused += len(files)
+            if offset < len(hashes):
+                digest = _rows_digest(hashes[offset:])
+                relative_path = (
+                    f"{PARTITIONS_DIRNAME}/{relative_dir}/part-{digest}.parquet"
+                )
+                target = table_root / relative_path
+                if not target.exists():
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    normalized.iloc[positions[offset:]].to_parquet(
+                        target, index=False, row_group_size=PARQUET_ROW_GROUP_SIZE
+                    )
+                    files_written += 1
+                else:
+                    files_reused += 1
+                files.append(
+                    {
+                        "path": relative_path,
+                        "rows": int(len(hashes) - offset),
+                        "digest": digest,
+                    }
+                )
+            partitions.append(
+                {
+                    "path": relative_dir,
+                    "values": values,
+                    "rows": int(len(positions)),
+                    "files": files,
+                }
+            )
+            order.append(positions)
+        storage_order = (
+            np.concatenate(order).astype(np.int64)
+            if order
+            else np.empty(0, dtype=np.int64)
         )
+        layout = {
+            "partition_columns": list(partition_columns),
+            "partitions": partitions,
+            "files_written": files_written,
+            "files_reused": files_reused,
+        }
+        return layout, storage_order
 
 
 def build_lakehouse_writer() -> LocalLakehouseWriter | None:
@@ -403,20 +626,82 @@ def _resolve_table_path(
     return resolved_backend, table_root, f"{resolved_backend}://{table_root.as_posix()}"
 
 
+def _version_directories(table_root: Path) -> list[Path]:
+    """Return snapshot directories oldest first, skipping shared data folders."""
+
+    return sorted(
+        (
+            path
+            for path in table_root.iterdir()
+            if path.is_dir() and not path.name.startswith(("_", "."))
+        ),
+        key=lambda item: item.name,
+    )
+
+
+def _snapshot_directory(
+    table: str, table_root: Path, version: str | int | None
+) -> Path:
+    if version is None:
+        if not table_root.exists():
+            raise FileNotFoundError(
+                f"No snapshots found for table '{table}'. Expected directory {table_root}."
+            )
+        candidates = _version_directories(table_root)
+        if not candidates:
+            raise FileNotFoundError(
+                f"No snapshots found for table '{table}'. Expected directory {table_root}."
+            )
+        return candidates[-1]
+    snapshot_dir = table_root / str(version)
+    if not snapshot_dir.exists():
+        raise FileNotFoundError(
+            f"Snapshot '{version}' not found for table '{table}'. "
+            f"Checked {snapshot_dir}."
+        )
+    return snapshot_dir
+
+
 def restore_snapshot(
     *,
     table_name: str | None = None,
     version: str | int | None = None,
     root_path: Path | None = None,
     backend: str | None = None,
+    columns: Sequence[str] | None = None,
+    filters: Any = None,
+    as_arrow: bool = False,
 ) -> Any:
-    """Return a dataframe for the requested snapshot (latest when version is None)."""
+    """Return a dataframe for the requested snapshot (latest when version is None).
+
+    ``columns`` and ``filters`` (pyarrow-style DNF tuples such as
+    ``[("Province", "==", "Gauteng")]``) are applied at the reader: partitions
+    and row groups whose statistics cannot match are skipped and only the
+    selected columns are decoded. ``as_arrow=True`` returns a
+    :class:`pyarrow.Table` read through memory-mapped files instead of a
+    DataFrame.
+    """
 
     table = table_name or LakehouseConfig().table_name
     resolved_backend, table_root, _ = _resolve_table_path(
         table_name=table, root_path=root_path, backend=backend
     )
 
+    if columns is not None or filters or as_arrow:
+        from watercrawl.integrations.storage.query import (
+            read_snapshot_table,
+            resolve_snapshot_sources,
+        )
+
+        (source,) = resolve_snapshot_sources(
+            versions=None if version is None else [version],
+            table_name=table,
+            root_path=root_path,
+            backend=backend,
+        )
+        arrow_table = read_snapshot_table(source, columns=columns, filters=filters)
+        return arrow_table if as_arrow else arrow_table.to_pandas()
+
     if resolved_backend in DELTA_BACKEND:
         if not _DELTA_AVAILABLE:
             raise RuntimeError(
@@ -430,30 +715,11 @@ def restore_snapshot(
         table_instance = DeltaTable(table_root.as_posix(), **kwargs)  # type: ignore[misc]
         return table_instance.to_pandas()  # type: ignore[no-any-return]
 
-    snapshot_dir: Path
-    if version is None:
-        if not table_root.exists():
-            raise FileNotFoundError(
-                f"No snapshots found for table '{table}'. Expected directory {table_root}."
-            )
-        candidates = sorted(
-            (path for path in table_root.iterdir() if path.is_dir()),
-            key=lambda item: item.name,
-        )
-        if not candidates:
-            raise FileNotFoundError(
-                f"No snapshots found for table '{table}'. Expected directory {table_root}."
-            )
-        snapshot_dir = candidates[-1]
-    else:
-        snapshot_dir = table_root / str(version)
-        if not snapshot_dir.exists():
-            raise FileNotFoundError(
-                f"Snapshot '{version}' not found for table '{table}'. "
-                f"Checked {snapshot_dir}."
-            )
-
+    snapshot_dir = _snapshot_directory(table, table_root, version)
     _ensure_pandas()
+    artifacts = _manifest_payload(snapshot_dir / "manifest.json").get("artifacts", {})
+    if artifacts.get("layout") == "partitioned":
+        return _read_partitioned_snapshot(table_root, snapshot_dir, artifacts)
     parquet_path = snapshot_dir / "data.parquet"
     if parquet_path.exists():
         return pd.read_parquet(parquet_path)  # type: ignore[no-any-return]
@@ -466,6 +732,34 @@ def restore_snapshot(
     )
 
 
+def _manifest_payload(manifest_path: Path) -> dict[str, Any]:
+    if not manifest_path.exists():
+        return {}
+    return json.loads(manifest_path.read_text())  # type: ignore[no-any-return]
+
+
+def _partition_files(table_root: Path, artifacts: dict[str, Any]) -> list[Path]:
+    return [
+        table_root / entry["path"]
+        for partition in artifacts.get("partitions", [])
+        for entry in partition["files"]
+    ]
+
+
+def _read_partitioned_snapshot(
+    table_root: Path, snapshot_dir: Path, artifacts: dict[str, Any]
+) -> Any:
+    """Concatenate partition files and restore the original row order."""
+
+    frames = [pd.read_parquet(path) for path in _partition_files(table_root, artifacts)]
+    if not frames:
+        schema = _manifest_payload(snapshot_dir / "manifest.json").get("schema", {})
+        return pd.DataFrame(columns=list(schema))
+    frame = pd.concat(frames, ignore_index=True)
+    frame.index = np.load(snapshot_dir / artifacts["row_order"])
+    return frame.sort_index().reset_index(drop=True)
+
+
 def restore_snapshot_to_path(
     *,
     output_path: Path,
@@ -473,14 +767,39 @@ def restore_snapshot_to_path(
     version: str | int | None = None,
     root_path: Path | None = None,
     backend: str | None = None,
+    columns: Sequence[str] | None = None,
+    filters: Any = None,
 ) -> Path:
-    """Restore a snapshot and persist it to *output_path*."""
+    """Restore a snapshot and persist it to *output_path*.
+
+    ``.arrow``/``.feather`` outputs are written as uncompressed Arrow IPC so they
+    can be memory-mapped without copying (``pyarrow.feather.read_table(path,
+    memory_map=True)``).
+    """
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if output_path.suffix.lower() in ARROW_SUFFIXES:
+        arrow_table = restore_snapshot(
+            table_name=table_name,
+            version=version,
+            root_path=root_path,
+            backend=backend,
+            columns=columns,
+            filters=filters,
+            as_arrow=True,
+        )
+        feather.write_feather(arrow_table, output_path, compression="uncompressed")
+        return output_path
 
     dataframe = restore_snapshot(
-        table_name=table_name, version=version, root_path=root_path, backend=backend
+        table_name=table_name,
+        version=version,
+        root_path=root_path,
+        backend=backend,
+        columns=columns,
+        filters=filters,
     )
     _ensure_pandas()
-    output_path.parent.mkdir(parents=True, exist_ok=True)
     if output_path.suffix.lower() == ".parquet":
         dataframe.to_parquet(output_path, index=False)  # type: ignore[call-arg]
     else:
@@ -488,6 +807,427 @@ def restore_snapshot_to_path(
     return output_path
 
 
+@dataclass(frozen=True)
+class CompactionReport:
+    """Outcome of merging a snapshot's partition files."""
+
+    version: str
+    partitions_compacted: int = 0
+    files_merged: int = 0
+    files_written: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class VacuumReport:
+    """Snapshot versions and data files removed (or due for removal) by vacuum."""
+
+    retained_versions: list[str] = field(default_factory=list)
+    removed_versions: list[str] = field(default_factory=list)
+    removed_files: list[str] = field(default_factory=list)
+    bytes_freed: int = 0
+    dry_run: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def compact_snapshot(
+    *,
+    version: str | int | None = None,
+    table_name: str | None = None,
+    root_path: Path | None = None,
+    backend: str | None = None,
+) -> CompactionReport:
+    """Merge the appended files of each partition into one file per partition.
+
+    Only the snapshot's manifest is rewritten; earlier versions keep referencing
+    the small files until :func:`vacuum_snapshots` expires them.
+    """
+
+    _ensure_pandas()
+    table = table_name or LakehouseConfig().table_name
+    resolved_backend, table_root, _ = _resolve_table_path(
+        table_name=table, root_path=root_path, backend=backend
+    )
+    if resolved_backend in DELTA_BACKEND:
+        delta_table = _open_delta_table(table_root)
+        metrics = delta_table.optimize.compact()
+        return CompactionReport(
+            version=str(delta_table.version()),
+            files_merged=int(metrics.get("numFilesRemoved", 0)),
+            files_written=int(metrics.get("numFilesAdded", 0)),
+        )
+
+    snapshot_dir = _snapshot_directory(table, table_root, version)
+    manifest_path = snapshot_dir / "manifest.json"
+    payload = _manifest_payload(manifest_path)
+    artifacts = payload.get("artifacts", {})
+    if artifacts.get("layout") != "partitioned":
+        return CompactionReport(version=snapshot_dir.name)
+
+    # Recover row hashes in storage order so merged files keep digests that
+    # later appends can match against.
+    row_index = load_row_index(snapshot_dir / artifacts["row_index"])
+    row_hashes = np.empty(row_index.shape[1], dtype=np.uint64)
+    row_hashes[row_index[2].astype(np.int64)] = row_index[1]
+
+    partitions_compacted = files_merged = files_written = 0
+    offset = 0
+    for partition in artifacts["partitions"]:
+        rows = int(partition["rows"])
+        files = partition["files"]
+        if len(files) > 1:
+            digest = _rows_digest(row_hashes[offset : offset + rows])
+            relative_path = (
+                f"{PARTITIONS_DIRNAME}/{partition['path']}/part-{digest}.parquet"
+            )
+            target = table_root / relative_path
+            if not target.exists():
+                merged = pd.concat(
+                    [pd.read_parquet(table_root / entry["path"]) for entry in files],
+                    ignore_index=True,
+                )
+                merged.to_parquet(
+                    target, index=False, row_group_size=PARQUET_ROW_GROUP_SIZE
+                )
+                files_written += 1
+            partition["files"] = [
+                {"path": relative_path, "rows": rows, "digest": digest}
+            ]
+            partitions_compacted += 1
+            files_merged += len(files)
+        offset += rows
+
+    if partitions_compacted:
+        payload["compacted_at"] = datetime.now(UTC).isoformat()
+        manifest_path.write_text(json.dumps(payload, indent=2, sort_keys=True))
+    return CompactionReport(
+        version=snapshot_dir.name,
+        partitions_compacted=partitions_compacted,
+        files_merged=files_merged,
+        files_written=files_written,
+    )
+
+
+def vacuum_snapshots(
+    *,
+    retain_versions: int | None = None,
+    table_name: str | None = None,
+    root_path: Path | None = None,
+    backend: str | None = None,
+    dry_run: bool = False,
+) -> VacuumReport:
+    """Expire snapshots beyond the retention window and delete unreferenced files."""
+
+    cfg = LakehouseConfig()
+    table = table_name or cfg.table_name
+    keep = max(1, retain_versions or cfg.retain_versions)
+    resolved_backend, table_root, _ = _resolve_table_path(
+        table_name=table, root_path=root_path, backend=backend
+    )
+    if resolved_backend in DELTA_BACKEND:
+        removed = _open_delta_table(table_root).vacuum(dry_run=dry_run)
+        return VacuumReport(removed_files=list(removed), dry_run=dry_run)
+    if not table_root.exists():
+        return VacuumReport(dry_run=dry_run)
+
+    versions = _version_directories(table_root)
+    retained, expired = versions[-keep:], versions[:-keep]
+    referenced: set[Path] = set()
+    for snapshot_dir in retained:
+        artifacts = _manifest_payload(snapshot_dir / "manifest.json").get(
+            "artifacts", {}
+        )
+        referenced.update(_partition_files(table_root, artifacts))
+    partitions_root = table_root / PARTITIONS_DIRNAME
+    unreferenced = sorted(
+        path
+        for path in (
+            partitions_root.rglob("*.parquet") if partitions_root.exists() else []
+        )
+        if path not in referenced
+    )
+    bytes_freed = sum(path.stat().st_size for path in unreferenced) + sum(
+        path.stat().st_size
+        for snapshot_dir in expired
+        for path in snapshot_dir.rglob("*")
+        if path.is_file()
+    )
+
+    if not dry_run:
+        for snapshot_dir in expired:
+            shutil.rmtree(snapshot_dir)
+        for path in unreferenced:
+            path.unlink()
+        if partitions_root.exists():
+            for directory in sorted(
+                (path for path in partitions_root.rglob("*") if path.is_dir()),
+                key=lambda item: len(item.parts),
+                reverse=True,
+            ):
+                if not any(directory.iterdir()):
+                    directory.rmdir()
+
+    return VacuumReport(
+        retained_versions=[path.name for path in retained],
+        removed_versions=[path.name for path in expired],
+        removed_files=[
+            path.relative_to(table_root).as_posix() for path in unreferenced
+        ],
+        bytes_freed=bytes_freed,
+        dry_run=dry_run,
+    )
+
+
+def _open_delta_table(table_root: Path, version: int | None = None) -> Any:
+    if not _DELTA_AVAILABLE:
+        raise RuntimeError(
+            "Delta Lake support requires the 'deltalake' package. "
+            "Install it with `poetry install --with lakehouse`."
+        )
+    if version is None:
+        return DeltaTable(table_root.as_posix())  # type: ignore[misc]
+    return DeltaTable(table_root.as_posix(), version=version)  # type: ignore[misc]
+
+
+@dataclass(frozen=True)
+class SnapshotDiff:
+    """Rows that differ between two snapshots of a table.
+
+    ``changed_before`` and ``changed_after`` are aligned row-for-row; each pair
+    shares the Merkle key columns but differs elsewhere.
+    """
+
+    base_version: str
+    target_version: str
+    key_columns: tuple[str, ...]
+    added: Any
+    removed: Any
+    changed_before: Any
+    changed_after: Any
+    leaves_changed: int = 0
+    rows_read: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        return not (len(self.added) or len(self.removed) or len(self.changed_after))
+
+    def to_dict(self, *, include_rows: bool = True) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "base_version": self.base_version,
+            "target_version": self.target_version,
+            "key_columns": list(self.key_columns),
+            "added": len(self.added),
+            "removed": len(self.removed),
+            "changed": len(self.changed_after),
+            "leaves_changed": self.leaves_changed,
+            "rows_read": self.rows_read,
+        }
+        if include_rows:
+            before = _json_records(self.changed_before)
+            after = _json_records(self.changed_after)
+            payload["rows"] = {
+                "added": _json_records(self.added),
+                "removed": _json_records(self.removed),
+                "changed": [
+                    {
+                        "before": old,
+                        "after": new,
+                        "columns": sorted(
+                            column
+                            for column in set(old) | set(new)
+                            if old.get(column) != new.get(column)
+                        ),
+                    }
+                    for old, new in zip(before, after)
+                ],
+            }
+        return payload
+
+
+@dataclass(frozen=True)
+class _SnapshotHandle:
+    table: str
+    table_root: Path
+    backend: str
+    version: str
+    location: Path
+    payload: dict[str, Any]
+
+
+def diff_snapshots(
+    *,
+    base_version: str | int,
+    target_version: str | int | None = None,
+    table_name: str | None = None,
+    root_path: Path | None = None,
+    backend: str | None = None,
+) -> SnapshotDiff:
+    """Compare two snapshots via their row-hash Merkle trees.
+
+    Only the row-index slices of differing Merkle leaves are read, followed by
+    the data row groups holding the rows that actually changed. Snapshots
+    written before Merkle manifests existed are hashed on the fly.
+    """
+
+    _ensure_pandas()
+    table = table_name or LakehouseConfig().table_name
+    resolved_backend, table_root, _ = _resolve_table_path(
+        table_name=table, root_path=root_path, backend=backend
+    )
+    base = _snapshot_handle(table, table_root, resolved_backend, base_version)
+    target = _snapshot_handle(table, table_root, resolved_backend, target_version)
+    base_index, base_tree = _snapshot_row_index(base)
+    target_index, target_tree = _snapshot_row_index(target)
+    if not base_tree.is_comparable(target_tree):
+        raise ValueError(
+            f"Snapshots '{base.version}' and '{target.version}' key their Merkle trees "
+            f"differently ({list(base_tree.key_columns)} vs "
+            f"{list(target_tree.key_columns)}); restore both to compare them."
+        )
+    row_diff = diff_row_indexes(base_index, base_tree, target_index, target_tree)
+
+    base_positions = sorted(
+        set(row_diff.removed) | {old for old, _ in row_diff.changed}
+    )
+    target_positions = sorted(
+        set(row_diff.added) | {new for _, new in row_diff.changed}
+    )
+    base_rows, base_read = _read_snapshot_rows(base, base_positions)
+    target_rows, target_read = _read_snapshot_rows(target, target_positions)
+    return SnapshotDiff(
+        base_version=base.version,
+        target_version=target.version,
+        key_columns=base_tree.key_columns,
+        added=_take_rows(target_rows, row_diff.added),
+        removed=_take_rows(base_rows, row_diff.removed),
+        changed_before=_take_rows(base_rows, [old for old, _ in row_diff.changed]),
+        changed_after=_take_rows(target_rows, [new for _, new in row_diff.changed]),
+        leaves_changed=row_diff.leaves_changed,
+        rows_read=base_read + target_read,
+    )
+
+
+def _snapshot_handle(
+    table: str, table_root: Path, backend: str, version: str | int | None
+) -> _SnapshotHandle:
+    if backend in DELTA_BACKEND:
+        if version is None:
+            version = _open_delta_table(table_root).version()
+        manifest_path = table_root / f"manifest_v{version}.json"
+        location = table_root
+    else:
+        location = _snapshot_directory(table, table_root, version)
+        manifest_path = location / "manifest.json"
+    payload = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    resolved = str(version) if backend in DELTA_BACKEND else location.name
+    return _SnapshotHandle(
+        table=table,
+        table_root=table_root,
+        backend=backend,
+        version=resolved,
+        location=location,
+        payload=payload,
+    )
+
+
+def _snapshot_row_index(handle: _SnapshotHandle) -> tuple[Any, RowMerkleTree]:
+    merkle = handle.payload.get("merkle")
+    index_name = handle.payload.get("artifacts", {}).get("row_index")
+    if merkle and index_name and (handle.location / index_name).exists():
+        return load_row_index(handle.location / index_name), RowMerkleTree.from_dict(
+            merkle
+        )
+    frame = _normalize_dataframe(_restore_handle(handle))
+    artifacts = handle.payload.get("artifacts", {})
+    storage_order = None
+    if artifacts.get("layout") == "partitioned":
+        storage_order = np.load(handle.location / artifacts["row_order"])
+    return _build_row_merkle(fingerprint_frame(frame), storage_order)
+
+
+def _restore_handle(handle: _SnapshotHandle) -> Any:
+    return restore_snapshot(
+        table_name=handle.table,
+        version=handle.version,
+        root_path=handle.table_root.parent,
+        backend=handle.backend,
+    )
+
+
+def _read_snapshot_rows(
+    handle: _SnapshotHandle, positions: list[int]
+) -> tuple[dict[int, Any], int]:
+    """Return ``{position: row}`` for *positions* and the number of rows read."""
+
+    if not positions:
+        return {}, 0
+    artifacts = handle.payload.get("artifacts", {})
+    partitioned = artifacts.get("layout") == "partitioned"
+    if handle.backend not in DELTA_BACKEND and _PYARROW_AVAILABLE:
+        if partitioned:
+            paths = _partition_files(handle.table_root, artifacts)
+        else:
+            paths = [handle.location / "data.parquet"]
+        if all(path.exists() for path in paths):
+            return _read_parquet_positions(paths, positions)
+
+    frame = _normalize_dataframe(_restore_handle(handle))
+    if partitioned:
+        # Row-index positions follow partition storage order.
+        frame = frame.iloc[np.load(handle.location / artifacts["row_order"])]
+    return {position: frame.iloc[position] for position in positions}, len(frame)
+
+
+def _read_parquet_positions(
+    paths: list[Path], positions: list[int]
+) -> tuple[dict[int, Any], int]:
+    """Read only the row groups covering *positions* across concatenated files."""
+
+    groups: list[tuple[Any, int, int, int]] = []
+    offset = 0
+    for path in paths:
+        parquet_file = pq.ParquetFile(path)
+        for group in range(parquet_file.metadata.num_row_groups):
+            rows = parquet_file.metadata.row_group(group).num_rows
+            groups.append((parquet_file, group, offset, rows))
+            offset += rows
+    starts = [start for _, _, start, _ in groups]
+    wanted = sorted(
+        {bisect.bisect_right(starts, position) - 1 for position in positions}
+    )
+    rows_by_position: dict[int, Any] = {}
+    rows_read = 0
+    for slot in wanted:
+        parquet_file, group, start, rows = groups[slot]
+        frame = parquet_file.read_row_group(group).to_pandas()
+        frame.index = range(start, start + rows)
+        rows_read += rows
+        for position in positions:
+            if start <= position < start + rows:
+                rows_by_position[position] = frame.loc[position]
+    return rows_by_position, rows_read
+
+
+def _take_rows(rows: dict[int, Any], positions: list[int]) -> Any:
+    if not positions:
+        columns = next(iter(rows.values())).index if rows else []
+        return pd.DataFrame(columns=columns)
+    return pd.DataFrame([rows[position] for position in positions]).reset_index(
+        drop=True
+    )
+
+
+def _json_records(frame: Any) -> list[dict[str, Any]]:
+    if not len(frame):
+        return []
+    cleaned = frame.astype(object).where(frame.notna(), None)
+    return json.loads(json.dumps(cleaned.to_dict(orient="records"), default=str))
+
+
 register_plugin(
     IntegrationPlugin(
         name="lakehouse",
@@ -516,7 +1256,14 @@ __all__ = [
     "LakehouseConfig",
     "LakehouseManifest",
     "LocalLakehouseWriter",
+    "MERKLE_KEY_COLUMNS",
+    "SnapshotDiff",
+    "CompactionReport",
+    "VacuumReport",
     "build_lakehouse_writer",
+    "compact_snapshot",
+    "diff_snapshots",
     "restore_snapshot",
     "restore_snapshot_to_path",
+    "vacuum_snapshots",
 ]
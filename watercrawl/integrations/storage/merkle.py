@@ -0,0 +1,230 @@
+"""Row-hash Merkle trees for diffing lakehouse snapshots.
+
+Rows are bucketed into ``2 ** depth`` leaves by the top bits of a key hash (the
+organisation name by default), so a row lands in the same leaf in every
+snapshot. Each leaf digests the sorted ``(key hash, row hash)`` pairs it holds
+and parent nodes digest their two children. Comparing two trees top-down yields
+the leaves that differ, and only the row-index entries for those leaves need to
+be read to classify rows as added, removed or changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+__all__ = [
+    "DEFAULT_MERKLE_DEPTH",
+    "RowIndexDiff",
+    "RowMerkleTree",
+    "build_row_index",
+    "diff_row_indexes",
+    "load_row_index",
+    "save_row_index",
+]
+
+DEFAULT_MERKLE_DEPTH = 8
+_DIGEST_SIZE = 8
+# Row index layout: three rows (key hashes, row hashes, positions) sorted by
+# key hash, so each leaf is a contiguous slice of every row.
+_KEY, _ROW, _POSITION = 0, 1, 2
+
+
+@dataclass(frozen=True)
+class RowMerkleTree:
+    """Merkle tree over row hashes bucketed by key hash.
+
+    ``levels[0]`` holds the leaf digests and ``levels[-1]`` the root.
+    """
+
+    key_columns: tuple[str, ...]
+    depth: int
+    levels: tuple[tuple[str, ...], ...]
+
+    @property
+    def root(self) -> str:
+        return self.levels[-1][0]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "key_columns": list(self.key_columns),
+            "depth": self.depth,
+            "root": self.root,
+            "levels": [list(level) for level in self.levels],
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> RowMerkleTree:
+        return cls(
+            key_columns=tuple(payload["key_columns"]),
+            depth=int(payload["depth"]),
+            levels=tuple(tuple(level) for level in payload["levels"]),
+        )
+
+    def is_comparable(self, other: RowMerkleTree) -> bool:
+        """Return ``True`` when both trees bucket rows the same way."""
+
+        return self.key_columns == other.key_columns and self.depth == other.depth
+
+    def changed_leaves(self, other: RowMerkleTree) -> list[int]:
+        """Return leaf numbers whose digests differ, descending only into changed nodes."""
+
+        if not self.is_comparable(other):
+            raise ValueError("Merkle trees use different key columns or depths")
+        frontier = [0] if self.root != other.root else []
+        for height in range(self.depth - 1, -1, -1):
+            left_level, right_level = self.levels[height], other.levels[height]
+            frontier = [
+                child
+                for node in frontier
+                for child in (2 * node, 2 * node + 1)
+                if left_level[child] != right_level[child]
+            ]
+        return frontier
+
+
+@dataclass(frozen=True)
+class RowIndexDiff:
+    """Row positions that differ between two snapshots.
+
+    ``changed`` pairs a base position with the target position sharing its key.
+    """
+
+    added: list[int] = field(default_factory=list)
+    removed: list[int] = field(default_factory=list)
+    changed: list[tuple[int, int]] = field(default_factory=list)
+    leaves_changed: int = 0
+    rows_compared: int = 0
+
+
+def build_row_index(
+    key_hashes: np.ndarray,
+    row_hashes: np.ndarray,
+    *,
+    key_columns: Sequence[str],
+    depth: int = DEFAULT_MERKLE_DEPTH,
+) -> tuple[np.ndarray, RowMerkleTree]:
+    """Return the key-sorted row index and its Merkle tree."""
+
+    keys = np.asarray(key_hashes, dtype=np.uint64)
+    rows = np.asarray(row_hashes, dtype=np.uint64)
+    order = np.lexsort((rows, keys))
+    index = np.stack([keys[order], rows[order], order.astype(np.uint64)])
+
+    bounds = _leaf_bounds(index[_KEY], depth)
+    leaves = tuple(
+        _digest(index[_KEY, start:stop].tobytes() + index[_ROW, start:stop].tobytes())
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    )
+    levels = [leaves]
+    while len(levels[-1]) > 1:
+        below = levels[-1]
+        levels.append(
+            tuple(
+                _digest((below[offset] + below[offset + 1]).encode("ascii"))
+                for offset in range(0, len(below), 2)
+            )
+        )
+    tree = RowMerkleTree(
+        key_columns=tuple(key_columns), depth=depth, levels=tuple(levels)
+    )
+    return index, tree
+
+
+def save_row_index(path: Path, index: np.ndarray) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as handle:
+        np.save(handle, index, allow_pickle=False)
+
+
+def load_row_index(path: Path) -> np.ndarray:
+    """Memory-map a row index so only the slices that are read touch the disk."""
+
+    return np.load(path, mmap_mode="r", allow_pickle=False)
+
+
+def diff_row_indexes(
+    base_index: np.ndarray,
+    base_tree: RowMerkleTree,
+    target_index: np.ndarray,
+    target_tree: RowMerkleTree,
+) -> RowIndexDiff:
+    """Classify differing rows, reading only the index slices of changed leaves."""
+
+    leaves = base_tree.changed_leaves(target_tree)
+    if not leaves:
+        return RowIndexDiff()
+    base_rows = _leaf_rows(base_index, leaves, base_tree.depth)
+    target_rows = _leaf_rows(target_index, leaves, target_tree.depth)
+
+    # Rows present in both snapshots with identical content cancel out; the
+    # remainder pair up by key (in position order) as changes.
+    unmatched: dict[tuple[int, int], list[int]] = defaultdict(list)
+    for key, row, position in base_rows:
+        unmatched[(key, row)].append(position)
+    target_only: list[tuple[int, int]] = []
+    for key, row, position in target_rows:
+        positions = unmatched.get((key, row))
+        if positions:
+            positions.pop(0)
+        else:
+            target_only.append((key, position))
+
+    removed_by_key: dict[int, list[int]] = defaultdict(list)
+    for (key, _), positions in unmatched.items():
+        removed_by_key[key].extend(positions)
+    for positions in removed_by_key.values():
+        positions.sort()
+
+    added: list[int] = []
+    changed: list[tuple[int, int]] = []
+    for key, position in sorted(target_only, key=lambda item: item[1]):
+        candidates = removed_by_key.get(key)
+        if candidates:
+            changed.append((candidates.pop(0), position))
+        else:
+            added.append(position)
+    removed = sorted(
+        position for positions in removed_by_key.values() for position in positions
+    )
+    return RowIndexDiff(
+        added=added,
+        removed=removed,
+        changed=sorted(changed),
+        leaves_changed=len(leaves),
+        rows_compared=len(base_rows) + len(target_rows),
+    )
+
+
+def _leaf_bounds(sorted_keys: np.ndarray, depth: int) -> np.ndarray:
+    shift = np.uint64(64 - depth)
+    edges = np.arange(1, 2**depth, dtype=np.uint64) << shift
+    inner = np.searchsorted(sorted_keys, edges, side="left")
+    return np.concatenate(([0], inner, [len(sorted_keys)])).astype(np.int64)
+
+
+def _leaf_rows(
+    index: np.ndarray, leaves: Iterable[int], depth: int
+) -> list[tuple[int, int, int]]:
+    shift = 64 - depth
+    keys = index[_KEY]
+    rows: list[tuple[int, int, int]] = []
+    for leaf in leaves:
+        low = np.uint64(leaf << shift)
+        start = int(np.searchsorted(keys, low, side="left"))
+        if leaf + 1 < 2**depth:
+            stop = int(np.searchsorted(keys, np.uint64((leaf + 1) << shift)))
+        else:
+            stop = len(keys)
+        rows.extend(zip(*np.asarray(index[:, start:stop]).tolist()))
+    return rows
+
+
+def _digest(payload: bytes) -> str:
+    return hashlib.blake2b(payload, digest_size=_DIGEST_SIZE).hexdigest()
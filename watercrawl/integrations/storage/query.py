@@ -0,0 +1,523 @@
+"""Query lakehouse snapshots in place with projection and predicate pushdown.
+
+Snapshots are scanned as Arrow datasets built from manifest metadata: partition
+files whose recorded partition values cannot satisfy the filters are skipped,
+remaining filters and column selections are pushed into the Parquet reader
+(using row-group statistics), and results from several versions are stacked
+with a ``snapshot_version`` column for time-travel questions. SQL queries run
+through DuckDB when it is installed. Everything reads the local lakehouse tree.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+try:  # pragma: no cover - optional dependency for dataset scans
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    _ARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover - pyarrow ships with the ui group
+    np = None  # type: ignore
+    pa = None  # type: ignore
+    ds = None  # type: ignore
+    pq = None  # type: ignore
+    _ARROW_AVAILABLE = False
+
+try:  # pragma: no cover - optional dependency for SQL queries
+    import duckdb  # type: ignore
+
+    _DUCKDB_AVAILABLE = True
+except ImportError:  # pragma: no cover - duckdb ships with the dbt group
+    duckdb = None  # type: ignore
+    _DUCKDB_AVAILABLE = False
+
+from watercrawl.integrations.storage.lakehouse import (
+    DELTA_BACKEND,
+    LakehouseConfig,
+    _manifest_payload,
+    _open_delta_table,
+    _resolve_table_path,
+    _snapshot_directory,
+    _version_directories,
+)
+
+__all__ = [
+    "SQL_VIEW_NAME",
+    "VERSION_COLUMN",
+    "SnapshotSource",
+    "count_by",
+    "list_snapshot_versions",
+    "parse_filter",
+    "query_sql",
+    "read_snapshot_table",
+    "resolve_snapshot_sources",
+    "scan_snapshots",
+    "snapshot_dataset",
+]
+
+VERSION_COLUMN = "snapshot_version"
+_POSITION_COLUMN = "__snapshot_position"
+SQL_VIEW_NAME = "snapshots"
+# Filters follow the pyarrow/pandas DNF convention: a list of
+# ``(column, op, value)`` tuples is a conjunction, and a list of such lists is
+# a disjunction of conjunctions.
+Filter = tuple[str, str, Any]
+Filters = Sequence[Filter] | Sequence[Sequence[Filter]]
+
+_FILTER_PATTERN = re.compile(
+    r"^\s*(?P<column>.+?)\s*(?P<op>==|!=|<=|>=|<|>|=|\bnot in\b|\bin\b)\s*(?P<value>.*?)\s*$",
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class SnapshotSource:
+    """Data files (or Delta version) backing one snapshot version."""
+
+    version: str
+    format: str
+    files: tuple[Path, ...] = ()
+    partition_values: tuple[dict[str, Any] | None, ...] = ()
+    delta_root: Path | None = None
+    row_order: Path | None = None
+
+
+def _ensure_arrow() -> None:
+    if not _ARROW_AVAILABLE:
+        raise RuntimeError(
+            "pyarrow is required to query lakehouse snapshots. "
+            "Install it via `poetry install --with ui`."
+        )
+
+
+def list_snapshot_versions(
+    *,
+    table_name: str | None = None,
+    root_path: Path | None = None,
+    backend: str | None = None,
+) -> list[str]:
+    """Return available snapshot versions, oldest first."""
+
+    table = table_name or LakehouseConfig().table_name
+    resolved_backend, table_root, _ = _resolve_table_path(
+        table_name=table, root_path=root_path, backend=backend
+    )
+    if resolved_backend in DELTA_BACKEND:
+        latest = _open_delta_table(table_root).version()
+        return [str(version) for version in range(latest + 1)]
+    if not table_root.exists():
+        return []
+    return [path.name for path in _version_directories(table_root)]
+
+
+def resolve_snapshot_sources(
+    *,
+    versions: int | Sequence[str | int] | None = None,
+    table_name: str | None = None,
+    root_path: Path | None = None,
+    backend: str | None = None,
+) -> list[SnapshotSource]:
+    """Resolve versions to their data files.
+
+    ``versions`` may be ``None`` (latest), an ``int`` (the last *n* versions) or
+    an explicit sequence of versions.
+    """
+
+    table = table_name or LakehouseConfig().table_name
+    resolved_backend, table_root, _ = _resolve_table_path(
+        table_name=table, root_path=root_path, backend=backend
+    )
+    if isinstance(versions, int):
+        available = list_snapshot_versions(
+            table_name=table, root_path=root_path, backend=backend
+        )
+        selected: list[str | int | None] = list(available[-max(versions, 1) :])
+    elif versions is None:
+        selected = [None]
+    else:
+        selected = list(versions)
+
+    if resolved_backend in DELTA_BACKEND:
+        if selected == [None]:
+            selected = [_open_delta_table(table_root).version()]
+        return [
+            SnapshotSource(version=str(version), format="delta", delta_root=table_root)
+            for version in selected
+        ]
+    return [
+        _filesystem_source(_snapshot_directory(table, table_root, version))
+        for version in selected
+    ]
+
+
+def _filesystem_source(snapshot_dir: Path) -> SnapshotSource:
+    artifacts = _manifest_payload(snapshot_dir / "manifest.json").get("artifacts", {})
+    if artifacts.get("layout") == "partitioned":
+        table_root = snapshot_dir.parent
+        files: list[Path] = []
+        values: list[dict[str, Any] | None] = []
+        for partition in artifacts.get("partitions", []):
+            for entry in partition["files"]:
+                files.append(table_root / entry["path"])
+                values.append(dict(partition.get("values", {})))
+        return SnapshotSource(
+            version=snapshot_dir.name,
+            format="parquet",
+            files=tuple(files),
+            partition_values=tuple(values),
+            row_order=snapshot_dir / artifacts["row_order"],
+        )
+    for name, storage_format in (("data.parquet", "parquet"), ("data.csv", "csv")):
+        if (snapshot_dir / name).exists():
+            return SnapshotSource(
+                version=snapshot_dir.name,
+                format=storage_format,
+                files=(snapshot_dir / name,),
+                partition_values=(None,),
+            )
+    raise FileNotFoundError(
+        f"No data artifact found for snapshot '{snapshot_dir}'. "
+        "Expected partitions, 'data.parquet' or 'data.csv'."
+    )
+
+
+def snapshot_dataset(source: SnapshotSource, filters: Filters | None = None) -> Any:
+    """Return an Arrow dataset for *source*, pruning partitions that cannot match."""
+
+    _ensure_arrow()
+    if source.format == "delta":
+        delta_table = _open_delta_table(source.delta_root, int(source.version))
+        return delta_table.to_pyarrow_dataset()
+    conjunctions = _normalise_filters(filters)
+    files = [
+        path
+        for path, values in zip(source.files, source.partition_values)
+        if values is None or _partition_may_match(values, conjunctions)
+    ]
+    if source.format == "csv":
+        return ds.dataset(files, format="csv")
+    if not files:
+        return None
+    schema = pa.unify_schemas([pq.read_schema(path) for path in files])
+    return ds.dataset(files, schema=schema, format="parquet")
+
+
+def scan_snapshots(
+    *,
+    columns: Sequence[str] | None = None,
+    filters: Filters | None = None,
+    versions: int | Sequence[str | int] | None = None,
+    table_name: str | None = None,
+    root_path: Path | None = None,
+    backend: str | None = None,
+    with_version: bool | None = None,
+) -> Any:
+    """Scan one or more snapshot versions into an Arrow table.
+
+    ``with_version`` adds a ``snapshot_version`` column; it defaults to ``True``
+    whenever more than one version is requested.
+    """
+
+    _ensure_arrow()
+    sources = resolve_snapshot_sources(
+        versions=versions, table_name=table_name, root_path=root_path, backend=backend
+    )
+    if with_version is None:
+        with_version = len(sources) > 1
+    tables = []
+    for source in sources:
+        dataset = snapshot_dataset(source, filters)
+        if dataset is None:
+            continue
+        selected = (
+            None
+            if columns is None
+            else [column for column in columns if column in dataset.schema.names]
+        )
+        table = dataset.to_table(
+            columns=selected, filter=_filter_expression(filters, dataset.schema)
+        )
+        if with_version:
+            table = table.append_column(
+                VERSION_COLUMN, pa.array([source.version] * table.num_rows, pa.string())
+            )
+        tables.append(table)
+    if not tables:
+        names = list(columns or []) + ([VERSION_COLUMN] if with_version else [])
+        return pa.table({name: pa.array([], pa.null()) for name in names})
+    return pa.concat_tables(tables, promote_options="default")
+
+
+def read_snapshot_table(
+    source: SnapshotSource,
+    *,
+    columns: Sequence[str] | None = None,
+    filters: Filters | None = None,
+) -> Any:
+    """Read one snapshot into an Arrow table, preserving the written row order.
+
+    Parquet files are memory-mapped and read one row group at a time. Row
+    groups whose min/max statistics rule out every filter conjunction are
+    skipped, as are partitions whose values cannot match. Only the requested
+    columns (plus the columns referenced by filters) are decoded.
+    """
+
+    _ensure_arrow()
+    if source.format != "parquet":
+        dataset = snapshot_dataset(source)
+        _check_columns(columns, dataset.schema)
+        return dataset.to_table(
+            columns=None if columns is None else list(columns),
+            filter=_filter_expression(filters, dataset.schema),
+        )
+
+    conjunctions = _normalise_filters(filters)
+    files = list(zip(source.files, source.partition_values))
+    if not files:
+        return pa.table({name: pa.array([], pa.null()) for name in columns or []})
+    schema = pa.unify_schemas([pq.read_schema(path) for path, _ in files])
+    _check_columns(columns, schema)
+    conjunctions = _coerce_filters(conjunctions, schema)
+    expression = pq.filters_to_expression(conjunctions) if conjunctions else None
+    selected = list(schema.names) if columns is None else list(columns)
+    needed = list(
+        dict.fromkeys(
+            [
+                *selected,
+                *(item[0] for conjunction in conjunctions for item in conjunction),
+            ]
+        )
+    )
+
+    tables = []
+    offset = 0
+    for path, values in files:
+        parquet_file = pq.ParquetFile(path, memory_map=True)
+        skip_file = values is not None and not _partition_may_match(
+            values, conjunctions
+        )
+        for group in range(parquet_file.metadata.num_row_groups):
+            row_group = parquet_file.metadata.row_group(group)
+            start, offset = offset, offset + row_group.num_rows
+            if skip_file or not _row_group_may_match(row_group, conjunctions):
+                continue
+            table = parquet_file.read_row_group(group, columns=needed)
+            table = table.append_column(
+                _POSITION_COLUMN, pa.array(range(start, offset), pa.int64())
+            )
+            if expression is not None:
+                table = table.filter(expression)
+            tables.append(table.select([*selected, _POSITION_COLUMN]))
+
+    if not tables:
+        return schema.empty_table().select(selected)
+    combined = pa.concat_tables(tables, promote_options="default")
+    positions = combined.column(_POSITION_COLUMN).to_numpy()
+    if source.row_order is not None:
+        # Partitioned snapshots store rows grouped by partition; map storage
+        # positions back to the original row order.
+        positions = np.load(source.row_order)[positions]
+    order = np.argsort(positions, kind="stable")
+    return combined.drop_columns([_POSITION_COLUMN]).take(pa.array(order))
+
+
+def count_by(table: Any, columns: Sequence[str]) -> Any:
+    """Return row counts grouped by *columns*, sorted by the grouping keys."""
+
+    _ensure_arrow()
+    grouped = table.group_by(list(columns)).aggregate([([], "count_all")])
+    grouped = grouped.rename_columns([*columns, "count"])
+    return grouped.sort_by([(column, "ascending") for column in columns])
+
+
+def query_sql(
+    sql: str,
+    *,
+    versions: int | Sequence[str | int] | None = None,
+    table_name: str | None = None,
+    root_path: Path | None = None,
+    backend: str | None = None,
+) -> Any:
+    """Run *sql* with DuckDB against a ``snapshots`` view of the selected versions.
+
+    The view stacks every selected version with a ``snapshot_version`` column;
+    DuckDB pushes projections and predicates down into the Arrow datasets.
+    """
+
+    if not _DUCKDB_AVAILABLE:
+        raise RuntimeError(
+            "SQL queries require the 'duckdb' package. Install it with "
+            "`poetry install --with dbt`, or use --where/--count-by instead."
+        )
+    _ensure_arrow()
+    sources = resolve_snapshot_sources(
+        versions=versions, table_name=table_name, root_path=root_path, backend=backend
+    )
+    connection = duckdb.connect()
+    try:
+        selects = []
+        for position, source in enumerate(sources):
+            dataset = snapshot_dataset(source)
+            if dataset is None:
+                continue
+            name = f"snapshot_{position}"
+            connection.register(name, dataset)
+            version = source.version.replace("'", "''")
+            selects.append(f"SELECT *, '{version}' AS {VERSION_COLUMN} FROM {name}")
+        if not selects:
+            raise FileNotFoundError("No snapshot data available to query.")
+        connection.execute(
+            f"CREATE VIEW {SQL_VIEW_NAME} AS " + " UNION ALL BY NAME ".join(selects)
+        )
+        return connection.execute(sql).fetch_arrow_table()
+    finally:
+        connection.close()
+
+
+def parse_filter(text: str) -> Filter:
+    """Parse ``"Province == Gauteng"`` or ``"Status in Verified,Candidate"``."""
+
+    match = _FILTER_PATTERN.match(text)
+    if not match:
+        raise ValueError(
+            f"Could not parse filter '{text}'. Use 'COLUMN OP VALUE' with one of "
+            "==, !=, <, <=, >, >=, in, not in."
+        )
+    column = match.group("column").strip()
+    op = match.group("op").lower()
+    value = match.group("value").strip().strip("'\"")
+    if op == "=":
+        op = "=="
+    if op in {"in", "not in"}:
+        return column, op, [item.strip() for item in value.split(",") if item.strip()]
+    return column, op, value
+
+
+def _check_columns(columns: Sequence[str] | None, schema: Any) -> None:
+    missing = [column for column in columns or [] if column not in schema.names]
+    if missing:
+        raise KeyError(f"Unknown snapshot columns: {', '.join(missing)}")
+
+
+def _filter_expression(filters: Filters | None, schema: Any) -> Any:
+    conjunctions = _coerce_filters(_normalise_filters(filters), schema)
+    return pq.filters_to_expression(conjunctions) if conjunctions else None
+
+
+def _coerce_filters(
+    conjunctions: list[list[Filter]], schema: Any
+) -> list[list[Filter]]:
+    """Cast filter values to column types so CLI strings compare with numbers."""
+
+    def _cast(column: str, value: Any) -> Any:
+        if column not in schema.names:
+            return value
+        try:
+            return pa.scalar(value).cast(schema.field(column).type).as_py()
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+            return value
+
+    coerced: list[list[Filter]] = []
+    for conjunction in conjunctions:
+        items: list[Filter] = []
+        for column, op, value in conjunction:
+            if op in {"in", "not in"}:
+                value = [_cast(column, item) for item in value]
+            else:
+                value = _cast(column, value)
+            items.append((column, op, value))
+        coerced.append(items)
+    return coerced
+
+
+def _row_group_may_match(row_group: Any, conjunctions: list[list[Filter]]) -> bool:
+    """Return ``False`` when min/max statistics rule out every conjunction."""
+
+    if not conjunctions:
+        return True
+    bounds: dict[str, tuple[Any, Any]] = {}
+    for index in range(row_group.num_columns):
+        column = row_group.column(index)
+        statistics = column.statistics
+        if column.is_stats_set and statistics is not None and statistics.has_min_max:
+            bounds[column.path_in_schema] = (statistics.min, statistics.max)
+    return any(
+        all(
+            _bounds_may_satisfy(bounds.get(column), op, value)
+            for column, op, value in conjunction
+        )
+        for conjunction in conjunctions
+    )
+
+
+def _bounds_may_satisfy(bounds: tuple[Any, Any] | None, op: str, value: Any) -> bool:
+    if bounds is None:
+        return True
+    low, high = bounds
+    try:
+        if op in {"==", "="}:
+            return bool(low <= value <= high)
+        if op == "in":
+            return any(low <= item <= high for item in value)
+        if op == "<":
+            return bool(low < value)
+        if op == "<=":
+            return bool(low <= value)
+        if op == ">":
+            return bool(high > value)
+        if op == ">=":
+            return bool(high >= value)
+        if op == "!=":
+            return not (low == high == value)
+        if op == "not in":
+            return not (low == high and low in value)
+    except TypeError:
+        return True
+    return True
+
+
+def _normalise_filters(filters: Filters | None) -> list[list[Filter]]:
+    if not filters:
+        return []
+    if isinstance(filters[0], tuple):
+        return [list(filters)]  # type: ignore[arg-type]
+    return [list(conjunction) for conjunction in filters]  # type: ignore[arg-type]
+
+
+def _partition_may_match(
+    values: dict[str, Any], conjunctions: list[list[Filter]]
+) -> bool:
+    """Return ``False`` only when partition values rule out every conjunction."""
+
+    if not conjunctions:
+        return True
+    return any(
+        all(
+            column not in values or _compare(values[column], op, expected)
+            for column, op, expected in conjunction
+        )
+        for conjunction in conjunctions
+    )
+
+
+def _compare(actual: Any, op: str, expected: Any) -> bool:
+    if actual is None:
+        # Null partitions only satisfy explicit null checks, which DNF filters
+        # cannot express; keep them for the reader to decide.
+        return True
+    if op in {"in", "not in"}:
+        members = {str(item) for item in expected}
+        return (str(actual) in members) == (op == "in")
+    if op in {"==", "="}:
+        return str(actual) == str(expected)
+    if op == "!=":
+        return str(actual) != str(expected)
+    # Ordering comparisons depend on column types; let the reader evaluate them.
+    return True
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import hashlib
 import json
 import os
 
@@ -16,9 +15,12 @@ from typing import Any
 try:
     import pandas as pd
 
+    from watercrawl.core.fingerprints import fingerprint_frame
+
     _PANDAS_AVAILABLE = True
 except ImportError:
     pd = None  # type: ignore
+    fingerprint_frame = None  # type: ignore
     _PANDAS_AVAILABLE = False
 
 from watercrawl.core import config
@@ -34,12 +36,13 @@ from .lakehouse import LakehouseManifest
 
 
 def fingerprint_dataframe(dataframe: Any) -> str:
-    """Generate a deterministic fingerprint for the provided dataframe."""
+    """Generate a deterministic fingerprint for the provided dataframe.
 
-    normalized = dataframe.reset_index(drop=True).reindex(
-        sorted(dataframe.columns), axis=1
-    )
-    return hashlib.sha256(normalized.to_csv(index=False).encode("utf-8")).hexdigest()
+    Shorthand for ``fingerprint_frame(dataframe).root``; callers that also need
+    row or column digests should compute the :class:`FrameFingerprint` once.
+    """
+
+    return fingerprint_frame(dataframe).root
 
 
 @dataclass(frozen=True)
@@ -1,5 +1,5 @@
 """Telemetry integrations for drift monitoring, lineage, and semantics."""
 
-from . import drift, graph_semantics, lineage
+from . import drift, graph_semantics, lineage, metrics_store, sketches
 
-__all__ = ["drift", "graph_semantics", "lineage"]
+__all__ = ["drift", "graph_semantics", "lineage", "metrics_store", "sketches"]
@@ -30,6 +30,14 @@ from watercrawl.integrations.integration_plugins import (
     PluginHealthStatus,
     register_plugin,
 )
+from watercrawl.integrations.telemetry.sketches import (
+    SketchDriftReport,
+    SketchProfile,
+    compare_profiles,
+    load_profile,
+    profile_frame,
+    save_profile,
+)
 
 
 @dataclass(frozen=True)
@@ -76,6 +84,7 @@ class DriftReport:
     threshold: float
     whylogs_profile: WhylogsProfileInfo | None = None
     whylogs_alerts: list[WhylogsAlert] = field(default_factory=list)
+    sketch_drift: SketchDriftReport | None = None
 
 
 def _calculate_ratios(counts: Mapping[str, int], total: int) -> dict[str, float]:
@@ -314,6 +323,12 @@ __all__ = [
     "compare_whylogs_metadata",
     "save_baseline",
     "load_baseline",
+    "SketchDriftReport",
+    "SketchProfile",
+    "compare_profiles",
+    "load_profile",
+    "profile_frame",
+    "save_profile",
 ]
 
 
@@ -340,6 +355,10 @@ register_plugin(
             "load_baseline": load_baseline,
             "save_baseline": save_baseline,
             "load_whylogs_metadata": load_whylogs_metadata,
+            "profile_frame": profile_frame,
+            "compare_profiles": compare_profiles,
+            "load_profile": load_profile,
+            "save_profile": save_profile,
         },
         config_schema=PluginConfigSchema(
             optional_dependencies=("pandas", "whylogs"),
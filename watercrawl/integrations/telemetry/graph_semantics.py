@@ -5,6 +5,7 @@ import json
 import re
 from collections.abc import Iterable
 from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
@@ -14,21 +15,37 @@ except ImportError:  # pragma: no cover - optional dependency
     nx = None  # type: ignore
 
 try:
+    import numpy as np
     import pandas as pd
 
     _PANDAS_AVAILABLE = True
 except ImportError:
+    np = None  # type: ignore
     pd = None  # type: ignore
     _PANDAS_AVAILABLE = False
 
 from watercrawl.core import config
 from watercrawl.domain.relationships import (
     EvidenceLink,
+    GraphAnalytics,
     Organisation,
     Person,
-    RelationshipAnomaly,
+    ProvenanceTag,
     RelationshipGraphSnapshot,
     SourceDocument,
+    build_graph_indexes,
+    compute_graph_analytics,
+    detect_graph_anomalies,
+    load_graph_snapshot,
+    merge_evidence_links,
+    merge_organisations,
+    merge_people,
+    merge_sources,
+    snapshot_digest,
+    update_graph_analytics,
+    write_graph_analytics,
+    write_graph_indexes,
+    write_graph_tables,
 )
 from watercrawl.integrations.integration_plugins import (
     IntegrationPlugin,
@@ -205,49 +222,21 @@ def _build_graph_metrics(frame: Any) -> tuple[GraphMetrics, list[GraphValidation
     province_nodes = len(provinces.unique())
     status_nodes = len(statuses.unique())
 
-    degree_map: dict[str, int] = {}
-    edge_count = 0
-    for _, row in frame.iterrows():
-        org = str(row.get("Name of Organisation", "")).strip()
-        province = str(row.get("Province", "")).strip()
-        status = str(row.get("Status", "")).strip()
-
-        if not org:
-            issues.append(
-                GraphValidationIssue(
-                    code="MISSING_ORGANISATION",
-                    message="Row missing organisation name for graph construction.",
-                )
-            )
-            continue
-
-        degree_map.setdefault(org, 0)
-
-        if province:
-            degree_map[org] += 1
-            edge_count += 1
-        else:
-            issues.append(
-                GraphValidationIssue(
-                    code="MISSING_PROVINCE",
-                    message=f"Organisation '{org}' missing province edge.",
-                    details={"organisation": org},
-                )
-            )
-
-        if status:
-            degree_map[org] += 1
-            edge_count += 1
-        else:
-            issues.append(
-                GraphValidationIssue(
-                    code="MISSING_STATUS",
-                    message=f"Organisation '{org}' missing status edge.",
-                    details={"organisation": org},
-                )
-            )
-
-    degrees = list(degree_map.values()) or [0]
+    # Cells are compared as ``str(value).strip()`` so NaN/None render as
+    # non-empty text, exactly as the original row-by-row loop treated them.
+    org = _stripped_text(frame, "Name of Organisation")
+    has_org = (org != "").to_numpy()
+    has_province = (_stripped_text(frame, "Province") != "").to_numpy()
+    has_status = (_stripped_text(frame, "Status") != "").to_numpy()
+
+    row_degree = has_province.astype(int) + has_status.astype(int)
+    degree_by_org = (
+        pd.Series(row_degree[has_org], index=org[has_org].to_numpy())
+        .groupby(level=0, sort=False)
+        .sum()
+    )
+    edge_count = int(row_degree[has_org].sum())
+    degrees = [int(value) for value in degree_by_org.tolist()] or [0]
     metrics = GraphMetrics(
         organisation_nodes=org_nodes,
         province_nodes=province_nodes,
@@ -258,18 +247,60 @@ def _build_graph_metrics(frame: Any) -> tuple[GraphMetrics, list[GraphValidation
         average_degree=sum(degrees) / len(degrees),
     )
 
-    for organisation, degree in degree_map.items():
-        if degree == 0:
+    # Per-row issues keep row order, with province before status in a row.
+    positions = np.concatenate(
+        [
+            np.flatnonzero(~has_org),
+            np.flatnonzero(has_org & ~has_province),
+            np.flatnonzero(has_org & ~has_status),
+        ]
+    )
+    kinds = np.repeat(
+        [0, 1, 2],
+        [
+            int((~has_org).sum()),
+            int((has_org & ~has_province).sum()),
+            int((has_org & ~has_status).sum()),
+        ],
+    )
+    order = np.lexsort((kinds, positions))
+    names = org.to_numpy()
+    for position, kind in zip(positions[order].tolist(), kinds[order].tolist()):
+        if kind == 0:
             issues.append(
                 GraphValidationIssue(
-                    code="ISOLATED_ORGANISATION",
-                    message=f"Organisation '{organisation}' has zero degree.",
-                    details={"organisation": organisation},
+                    code="MISSING_ORGANISATION",
+                    message="Row missing organisation name for graph construction.",
                 )
             )
+            continue
+        organisation = names[position]
+        edge = "province" if kind == 1 else "status"
+        issues.append(
+            GraphValidationIssue(
+                code=f"MISSING_{edge.upper()}",
+                message=f"Organisation '{organisation}' missing {edge} edge.",
+                details={"organisation": organisation},
+            )
+        )
+
+    for organisation in degree_by_org.index[degree_by_org.to_numpy() == 0]:
+        issues.append(
+            GraphValidationIssue(
+                code="ISOLATED_ORGANISATION",
+                message=f"Organisation '{organisation}' has zero degree.",
+                details={"organisation": organisation},
+            )
+        )
     return metrics, issues
 
 
+def _stripped_text(frame: Any, column: str) -> Any:
+    if column not in frame.columns:
+        return pd.Series([""] * len(frame), dtype=object)
+    return frame[column].astype(str).str.strip().reset_index(drop=True)
+
+
 def _validate_metric_ranges(metrics: GraphMetrics) -> Iterable[GraphValidationIssue]:
     settings = getattr(config, "GRAPH_SEMANTICS", None)
     if settings is None or not getattr(settings, "enabled", True):
@@ -411,6 +442,132 @@ def _stringify_collection(values: Iterable[Any]) -> str:
     return ";".join(sorted(str(value) for value in values if value))
 
 
+def _provenance_dump(tags: Iterable[ProvenanceTag]) -> str:
+    return _json_dump([tag.as_dict() for tag in tags])
+
+
+def _provenance_load(raw: Any) -> set[ProvenanceTag]:
+    tags: set[ProvenanceTag] = set()
+    for payload in json.loads(raw or "[]"):
+        retrieved_at = payload.get("retrieved_at")
+        tags.add(
+            ProvenanceTag(
+                source=payload["source"],
+                connector=payload.get("connector"),
+                retrieved_at=(
+                    datetime.fromisoformat(retrieved_at) if retrieved_at else None
+                ),
+                notes=payload.get("notes"),
+            )
+        )
+    return tags
+
+
+def _split_collection(raw: Any) -> set[str]:
+    return {item for item in str(raw or "").split(";") if item}
+
+
+def _organisation_node(organisation: Organisation) -> dict[str, Any]:
+    return {
+        "type": "organisation",
+        "name": organisation.name,
+        "provinces": _stringify_collection(organisation.provinces),
+        "statuses": _stringify_collection(organisation.statuses),
+        "website": organisation.website_url or "",
+        "aliases": _stringify_collection(organisation.aliases),
+        "contacts": _stringify_collection(organisation.contacts),
+        "provenance": _provenance_dump(organisation.provenance),
+    }
+
+
+def _person_node(person: Person) -> dict[str, Any]:
+    return {
+        "type": "person",
+        "name": person.name,
+        "role": person.role or "",
+        "emails": _stringify_collection(person.emails),
+        "phones": _stringify_collection(person.phones),
+        "organisations": _stringify_collection(person.organisations),
+        "provenance": _provenance_dump(person.provenance),
+    }
+
+
+def _source_node(source: SourceDocument) -> dict[str, Any]:
+    return {
+        "type": "source",
+        "uri": source.uri,
+        "title": source.title or "",
+        "publisher": source.publisher or "",
+        "connector": source.connector or "",
+        "tags": _stringify_collection(source.tags),
+        "summary": source.summary or "",
+        "provenance": _provenance_dump(source.provenance),
+    }
+
+
+def _evidence_edge(link: EvidenceLink) -> dict[str, Any]:
+    attributes = {
+        key: value for key, value in link.attributes.items() if value is not None
+    }
+    return {
+        "kind": link.kind,
+        "weight": link.weight or 0.0,
+        "provenance": _provenance_dump(link.provenance),
+        "attributes": _json_dump(attributes),
+    }
+
+
+def _organisation_from_node(identifier: str, data: dict[str, Any]) -> Organisation:
+    return Organisation(
+        identifier=identifier,
+        name=str(data.get("name", "")),
+        provinces=_split_collection(data.get("provinces")),
+        statuses=_split_collection(data.get("statuses")),
+        website_url=data.get("website") or None,
+        aliases=_split_collection(data.get("aliases")),
+        contacts=_split_collection(data.get("contacts")),
+        provenance=_provenance_load(data.get("provenance")),
+    )
+
+
+def _person_from_node(identifier: str, data: dict[str, Any]) -> Person:
+    return Person(
+        identifier=identifier,
+        name=str(data.get("name", "")),
+        role=data.get("role") or None,
+        emails=_split_collection(data.get("emails")),
+        phones=_split_collection(data.get("phones")),
+        organisations=_split_collection(data.get("organisations")),
+        provenance=_provenance_load(data.get("provenance")),
+    )
+
+
+def _source_from_node(identifier: str, data: dict[str, Any]) -> SourceDocument:
+    return SourceDocument(
+        identifier=identifier,
+        uri=str(data.get("uri", "")),
+        title=data.get("title") or None,
+        publisher=data.get("publisher") or None,
+        connector=data.get("connector") or None,
+        tags=_split_collection(data.get("tags")),
+        summary=data.get("summary") or None,
+        provenance=_provenance_load(data.get("provenance")),
+    )
+
+
+def _evidence_from_edge(
+    source: str, target: str, kind: str, data: dict[str, Any]
+) -> EvidenceLink:
+    return EvidenceLink(
+        source=source,
+        target=target,
+        kind=kind,
+        weight=float(data.get("weight") or 0.0) or None,
+        provenance=_provenance_load(data.get("provenance")),
+        attributes=json.loads(data.get("attributes") or "{}"),
+    )
+
+
 def build_relationship_graph(
     *,
     organisations: Iterable[Organisation],
@@ -426,160 +583,165 @@ def build_relationship_graph(
     if nx is None:  # pragma: no cover - optional dependency guard
         raise RuntimeError("networkx is required to build the relationship graph")
 
-    graphml_path.parent.mkdir(parents=True, exist_ok=True)
-    nodes_csv_path.parent.mkdir(parents=True, exist_ok=True)
-    edges_csv_path.parent.mkdir(parents=True, exist_ok=True)
-
     graph: nx.MultiDiGraph = nx.MultiDiGraph()
-    node_rows: list[dict[str, Any]] = []
     for organisation in organisations:
-        provenance = [tag.as_dict() for tag in organisation.provenance]
-        graph.add_node(
-            organisation.identifier,
-            type="organisation",
-            name=organisation.name,
-            provinces=_stringify_collection(organisation.provinces),
-            statuses=_stringify_collection(organisation.statuses),
-            website=organisation.website_url or "",
-            aliases=_stringify_collection(organisation.aliases),
-            contacts=_stringify_collection(organisation.contacts),
-            provenance=_json_dump(provenance),
-        )
-        node_rows.append(
-            {
-                "id": organisation.identifier,
-                "type": "organisation",
-                "name": organisation.name,
-                "provinces": _stringify_collection(organisation.provinces),
-                "statuses": _stringify_collection(organisation.statuses),
-                "website": organisation.website_url or "",
-                "aliases": _stringify_collection(organisation.aliases),
-                "contacts": _stringify_collection(organisation.contacts),
-                "provenance": _json_dump(provenance),
-            }
-        )
-
+        graph.add_node(organisation.identifier, **_organisation_node(organisation))
     for person in people:
-        provenance = [tag.as_dict() for tag in person.provenance]
-        graph.add_node(
-            person.identifier,
-            type="person",
-            name=person.name,
-            role=person.role or "",
-            emails=_stringify_collection(person.emails),
-            phones=_stringify_collection(person.phones),
-            organisations=_stringify_collection(person.organisations),
-            provenance=_json_dump(provenance),
-        )
-        node_rows.append(
-            {
-                "id": person.identifier,
-                "type": "person",
-                "name": person.name,
-                "role": person.role or "",
-                "emails": _stringify_collection(person.emails),
-                "phones": _stringify_collection(person.phones),
-                "organisations": _stringify_collection(person.organisations),
-                "provenance": _json_dump(provenance),
-            }
-        )
-
+        graph.add_node(person.identifier, **_person_node(person))
     for source in sources:
-        provenance = [tag.as_dict() for tag in source.provenance]
-        graph.add_node(
-            source.identifier,
-            type="source",
-            uri=source.uri,
-            title=source.title or "",
-            publisher=source.publisher or "",
-            connector=source.connector or "",
-            tags=_stringify_collection(source.tags),
-            summary=source.summary or "",
-            provenance=_json_dump(provenance),
+        graph.add_node(source.identifier, **_source_node(source))
+    for link in evidence:
+        if not graph.has_node(link.source) or not graph.has_node(link.target):
+            continue
+        graph.add_edge(link.source, link.target, key=link.kind, **_evidence_edge(link))
+
+    analytics = compute_graph_analytics(graph, betweenness_samples=_samples())
+    return _write_relationship_snapshot(
+        graph,
+        analytics,
+        graphml_path=graphml_path,
+        nodes_csv_path=nodes_csv_path,
+        edges_csv_path=edges_csv_path,
+    )
+
+
+def update_relationship_graph(
+    *,
+    organisations: Iterable[Organisation],
+    people: Iterable[Person],
+    sources: Iterable[SourceDocument],
+    evidence: Iterable[EvidenceLink],
+    graphml_path: Path,
+    nodes_csv_path: Path,
+    edges_csv_path: Path,
+) -> RelationshipGraphSnapshot:
+    """Merge a run's entities and evidence into the existing snapshot.
+
+    Nodes and edges already in the snapshot are combined with
+    ``merge_organisations``/``merge_people``/``merge_sources``/
+    ``merge_evidence_links``. Betweenness and communities are only
+    recomputed for connected components that gained nodes or edges, so the
+    cost follows the size of the delta rather than the accumulated graph.
+    Falls back to :func:`build_relationship_graph` when no snapshot exists.
+    """
+
+    if nx is None:  # pragma: no cover - optional dependency guard
+        raise RuntimeError("networkx is required to build the relationship graph")
+
+    try:
+        previous = load_graph_snapshot(
+            graphml_path=graphml_path, betweenness_samples=_samples()
         )
-        node_rows.append(
-            {
-                "id": source.identifier,
-                "type": "source",
-                "uri": source.uri,
-                "title": source.title or "",
-                "publisher": source.publisher or "",
-                "connector": source.connector or "",
-                "tags": _stringify_collection(source.tags),
-                "summary": source.summary or "",
-                "provenance": _json_dump(provenance),
-            }
+    except FileNotFoundError:
+        previous = None
+    if previous is None or previous.graph is None:
+        return build_relationship_graph(
+            organisations=organisations,
+            people=people,
+            sources=sources,
+            evidence=evidence,
+            graphml_path=graphml_path,
+            nodes_csv_path=nodes_csv_path,
+            edges_csv_path=edges_csv_path,
         )
 
-    edge_rows: list[dict[str, Any]] = []
+    graph = previous.graph
+    # Attribute-only merges leave the topology (and so the analytics) as is.
+    affected: set[str] = set()
+    for items, to_node, from_node, merge in (
+        (
+            organisations,
+            _organisation_node,
+            _organisation_from_node,
+            merge_organisations,
+        ),
+        (people, _person_node, _person_from_node, merge_people),
+        (sources, _source_node, _source_from_node, merge_sources),
+    ):
+        for item in items:
+            identifier = item.identifier
+            if graph.has_node(identifier):
+                existing = from_node(identifier, graph.nodes[identifier])
+                graph.nodes[identifier].update(to_node(merge(existing, item)))
+            else:
+                graph.add_node(identifier, **to_node(item))
+                affected.add(identifier)
     for link in evidence:
         if not graph.has_node(link.source) or not graph.has_node(link.target):
             continue
-        provenance = [tag.as_dict() for tag in link.provenance]
-        attributes = {
-            key: value for key, value in link.attributes.items() if value is not None
-        }
-        graph.add_edge(
-            link.source,
-            link.target,
-            key=link.kind,
-            kind=link.kind,
-            weight=link.weight or 0.0,
-            provenance=_json_dump(provenance),
-            attributes=_json_dump(attributes),
-        )
-        edge_rows.append(
-            {
-                "source": link.source,
-                "target": link.target,
-                "kind": link.kind,
-                "weight": link.weight or 0.0,
-                "provenance": _json_dump(provenance),
-                "attributes": _json_dump(attributes),
-            }
+        existing_edge = graph.get_edge_data(link.source, link.target, key=link.kind)
+        if existing_edge is not None:
+            merged = merge_evidence_links(
+                _evidence_from_edge(link.source, link.target, link.kind, existing_edge),
+                link,
+            )
+            existing_edge.update(_evidence_edge(merged))
+            continue
+        graph.add_edge(link.source, link.target, key=link.kind, **_evidence_edge(link))
+        affected.update((link.source, link.target))
+
+    analytics = GraphAnalytics(
+        centrality=previous.centrality,
+        betweenness=previous.betweenness,
+        community_assignments=previous.community_assignments,
+        betweenness_samples=previous.betweenness_samples,
+    )
+    if affected:
+        analytics = update_graph_analytics(
+            graph,
+            analytics,
+            affected,
+            previous_node_count=previous.node_count,
+            betweenness_samples=_samples(),
         )
+    return _write_relationship_snapshot(
+        graph,
+        analytics,
+        graphml_path=graphml_path,
+        nodes_csv_path=nodes_csv_path,
+        edges_csv_path=edges_csv_path,
+    )
+
 
+def _samples() -> int | None:
+    settings = getattr(config, "GRAPH_SEMANTICS", None)
+    return getattr(settings, "betweenness_samples", None)
+
+
+def _write_relationship_snapshot(
+    graph: Any,
+    analytics: GraphAnalytics,
+    *,
+    graphml_path: Path,
+    nodes_csv_path: Path,
+    edges_csv_path: Path,
+) -> RelationshipGraphSnapshot:
+    graphml_path.parent.mkdir(parents=True, exist_ok=True)
+    nodes_csv_path.parent.mkdir(parents=True, exist_ok=True)
+    edges_csv_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # GraphML stays the interoperability export; loaders prefer the Parquet
+    # node/edge tables, which are much cheaper to read back.
     nx.write_graphml(graph, graphml_path)
-    _write_csv(node_rows, nodes_csv_path)
-    _write_csv(edge_rows, edges_csv_path)
-
-    simple_graph = nx.Graph(graph)
-    if simple_graph.number_of_nodes():
-        centrality = nx.degree_centrality(simple_graph)
-        betweenness = nx.betweenness_centrality(simple_graph)
-        try:
-            communities = list(
-                nx.algorithms.community.greedy_modularity_communities(simple_graph)
-            )
-        except Exception:  # pragma: no cover - community detection optional
-            communities = []
-    else:
-        centrality = {}
-        betweenness = {}
-        communities = []
-
-    community_assignments: dict[str, int] = {}
-    for index, community in enumerate(communities):
-        for node in community:
-            community_assignments[str(node)] = index
-
-    anomalies: list[RelationshipAnomaly] = []
-    for organisation in organisations:
-        if len(organisation.provinces) > 1:
-            anomalies.append(
-                RelationshipAnomaly(
-                    code="CONFLICTING_PROVINCE",
-                    message=(
-                        f"Organisation '{organisation.name}' has conflicting provinces"
-                        f" {sorted(organisation.provinces)}"
-                    ),
-                    details={
-                        "organisation": organisation.name,
-                        "provinces": sorted(organisation.provinces),
-                        "identifier": organisation.identifier,
-                    },
-                )
-            )
+    tables = write_graph_tables(graph, graphml_path)
+    _write_csv(
+        [{"id": node, **data} for node, data in graph.nodes(data=True)],
+        nodes_csv_path,
+    )
+    _write_csv(
+        [
+            {"source": source, "target": target, **data}
+            for source, target, data in graph.edges(data=True)
+        ],
+        edges_csv_path,
+    )
+
+    # Analytics and lookup indexes are persisted with the snapshot so loaders
+    # (e.g. the analyst graph CLI) never recompute them.
+    indexes = build_graph_indexes(graph)
+    digest = snapshot_digest(graphml_path)
+    write_graph_analytics(graphml_path, analytics, digest=digest)
+    write_graph_indexes(graphml_path, indexes, digest=digest)
 
     return RelationshipGraphSnapshot(
         graphml_path=graphml_path,
@@ -587,16 +749,21 @@ def build_relationship_graph(
         edge_summary_path=edges_csv_path,
         node_count=graph.number_of_nodes(),
         edge_count=graph.number_of_edges(),
-        centrality=centrality,
-        betweenness=betweenness,
-        community_assignments=community_assignments,
-        anomalies=anomalies,
+        centrality=analytics.centrality,
+        betweenness=analytics.betweenness,
+        community_assignments=analytics.community_assignments,
+        anomalies=detect_graph_anomalies(graph),
         graph=graph,
+        betweenness_samples=analytics.betweenness_samples,
+        indexes=indexes,
+        node_table_path=tables[0] if tables else None,
+        edge_table_path=tables[1] if tables else None,
     )
 
 
 __all__ = [
     "build_relationship_graph",
+    "update_relationship_graph",
     "GraphMetrics",
     "GraphSemanticsReport",
     "GraphValidationIssue",
@@ -627,6 +794,7 @@ register_plugin(
             "build_r2rml_mapping": build_r2rml_mapping,
             "generate_graph_semantics_report": generate_graph_semantics_report,
             "build_relationship_graph": build_relationship_graph,
+            "update_relationship_graph": update_relationship_graph,
         },
         config_schema=PluginConfigSchema(
             optional_dependencies=("pandas", "networkx"),
@@ -3,7 +3,7 @@ from __future__ import annotations
 import importlib.util
 import json
 import logging
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from pathlib import Path
@@ -21,10 +21,18 @@ from watercrawl.integrations.integration_plugins import (
     register_plugin,
 )
 
+from .background import BackgroundLineageEmitter, EmitterStats, LineageSpool
+from .jsonld import write_jsonld, write_jsonld_graph
+
 ACES_LINEAGE_NS = "https://acesaero.co.za/ns/lineage#"
 ACES_CONTEXT_PREFIX = "aces"
 CATALOG_CONTACT_EMAIL = "info@acesaero.co.za"
 CATALOG_CONTACT_TYPE = "platform-support"
+PROV_CONTEXT: Mapping[str, str] = {
+    "prov": "http://www.w3.org/ns/prov#",
+    "dct": "http://purl.org/dc/terms/",
+    ACES_CONTEXT_PREFIX: ACES_LINEAGE_NS,
+}
 
 
 class LineageEmitter(Protocol):
@@ -44,13 +52,17 @@ class HttpLineageEmitter:
     api_key: str | None = None
     timeout: float = 10.0
     logger: logging.Logger = field(default_factory=lambda: logging.getLogger(__name__))
+    _session: requests.Session = field(
+        default_factory=requests.Session, init=False, repr=False
+    )
 
     def emit(self, events: Sequence[dict[str, Any]]) -> None:
         headers = {"Content-Type": "application/json"}
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
         for event in events:
-            response = requests.post(
+            # A shared session keeps the connection alive across a batch.
+            response = self._session.post(
                 self.url, json=event, headers=headers, timeout=self.timeout
             )
             try:
@@ -212,12 +224,48 @@ class LineageManager:
     kafka_bootstrap_servers: str | None = field(
         default_factory=lambda: config.LINEAGE.kafka_bootstrap_servers
     )
+    async_emit: bool = field(default_factory=lambda: config.LINEAGE.async_emit)
+    spool_dir: Path | None = field(default_factory=lambda: config.LINEAGE.spool_dir)
+    queue_size: int = field(default_factory=lambda: config.LINEAGE.queue_size)
+    batch_size: int = field(default_factory=lambda: config.LINEAGE.batch_size)
+    max_retries: int = field(default_factory=lambda: config.LINEAGE.max_retries)
+    compact_output: bool = field(default_factory=lambda: config.LINEAGE.compact_output)
+    gzip_output: bool = field(default_factory=lambda: config.LINEAGE.gzip_output)
+    record_threshold: int = field(
+        default_factory=lambda: config.LINEAGE.record_threshold
+    )
     emitter: LineageEmitter | None = None
     logger: logging.Logger = field(default_factory=lambda: logging.getLogger(__name__))
 
     def __post_init__(self) -> None:
         if self.emitter is None:
-            self.emitter = self._build_emitter()
+            transport_emitter = self._build_emitter()
+            if transport_emitter is not None and self.async_emit:
+                # Transport I/O moves off the pipeline's critical path; events
+                # that cannot be delivered are spooled for later replay.
+                spool_dir = self.spool_dir or (
+                    self.artifact_root / "lineage" / "_spool"
+                )
+                transport_emitter = BackgroundLineageEmitter(
+                    transport_emitter,
+                    spool=LineageSpool(spool_dir),
+                    max_queue=self.queue_size,
+                    batch_size=self.batch_size,
+                    max_retries=self.max_retries,
+                    logger=self.logger,
+                )
+            self.emitter = transport_emitter
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until queued lineage events are delivered or spooled."""
+
+        if isinstance(self.emitter, BackgroundLineageEmitter):
+            return self.emitter.flush(timeout)
+        return True
+
+    def close(self) -> None:
+        if isinstance(self.emitter, BackgroundLineageEmitter):
+            self.emitter.close()
 
     def capture(
         self, report: models.PipelineReport, context: LineageContext
@@ -241,26 +289,30 @@ class LineageManager:
 
         completed_at = datetime.now(UTC)
         events = build_openlineage_events(report, context, completed_at=completed_at)
-        openlineage_path = artifact_dir / "openlineage.json"
-        openlineage_path.write_text(json.dumps(events, indent=2, sort_keys=True))
-
-        prov_document = build_prov_document(
+        # OpenLineage events stay uncompressed so transports and tooling can
+        # replay them directly.
+        openlineage_path = write_jsonld(
+            artifact_dir / "openlineage.json", events, compact=self.compact_output
+        )
+        prov_path = write_prov_document(
+            artifact_dir / "prov.jsonld",
             report,
             context,
             artifact_dir=artifact_dir,
             completed_at=completed_at,
+            record_threshold=self.record_threshold,
+            compact=self.compact_output,
+            compress=self.gzip_output,
         )
-        prov_path = artifact_dir / "prov.jsonld"
-        prov_path.write_text(json.dumps(prov_document, indent=2, sort_keys=True))
-
-        catalog_entry = build_catalog_entry(
+        catalog_path = write_catalog_entry(
+            artifact_dir / "catalog.jsonld",
             report,
             context,
             artifact_dir=artifact_dir,
             completed_at=completed_at,
+            compact=self.compact_output,
+            compress=self.gzip_output,
         )
-        catalog_path = artifact_dir / "catalog.jsonld"
-        catalog_path.write_text(json.dumps(catalog_entry, indent=2, sort_keys=True))
 
         if self.emitter:
             try:
@@ -414,9 +466,41 @@ def build_prov_document(
     *,
     artifact_dir: Path | None = None,
     completed_at: datetime | None = None,
+    record_threshold: int | None = None,
 ) -> dict[str, Any]:
     """Generate a PROV-O JSON-LD document capturing the run."""
 
+    return {
+        "@context": dict(PROV_CONTEXT),
+        "@graph": list(
+            iter_prov_nodes(
+                report,
+                context,
+                artifact_dir=artifact_dir,
+                completed_at=completed_at,
+                record_threshold=record_threshold,
+            )
+        ),
+    }
+
+
+def iter_prov_nodes(
+    report: models.PipelineReport,
+    context: LineageContext,
+    *,
+    artifact_dir: Path | None = None,
+    completed_at: datetime | None = None,
+    record_threshold: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield the PROV-O graph nodes for the run, one at a time.
+
+    The activity, agent and dataset entities come first. When
+    ``record_threshold`` (``config.LINEAGE.record_threshold`` by default) is
+    positive they are followed by one ``prov:Entity`` per evidence record up
+    to the threshold, with the rest folded into a single summary collection.
+    The default of ``0`` keeps per-record entities out of the graph.
+    """
+
     completed = (completed_at or datetime.utcnow()).isoformat()
     activity_id = f"urn:uuid:{context.run_id}"
     agent_id = f"urn:aces:agent:{context.job_name}"
@@ -520,17 +604,96 @@ def build_prov_document(
             report.rollback_plan.as_dict()
         )
 
-    graph: list[dict[str, Any]] = [activity, agent, *used_entities, *generated_entities]
-    return {
-        "@context": {
-            "prov": "http://www.w3.org/ns/prov#",
-            "dct": "http://purl.org/dc/terms/",
-            ACES_CONTEXT_PREFIX: ACES_LINEAGE_NS,
-        },
-        "@graph": graph,
+    yield activity
+    yield agent
+    yield from used_entities
+    yield from generated_entities
+
+    threshold = (
+        config.LINEAGE.record_threshold
+        if record_threshold is None
+        else record_threshold
+    )
+    yield from _evidence_nodes(
+        report.evidence_log, activity_id, run_id=context.run_id, limit=threshold
+    )
+
+
+def _evidence_nodes(
+    evidence: Sequence[models.EvidenceRecord],
+    activity_id: str,
+    *,
+    run_id: str,
+    limit: int,
+) -> Iterator[dict[str, Any]]:
+    if limit <= 0:
+        return
+    for position, record in enumerate(evidence[:limit]):
+        yield {
+            "@id": f"urn:aces:evidence:{run_id}:{position}",
+            "@type": "prov:Entity",
+            "dct:subject": record.organisation,
+            "dct:description": record.changes,
+            "prov:wasGeneratedBy": activity_id,
+            "prov:wasDerivedFrom": list(record.sources),
+            "prov:generatedAtTime": record.timestamp.isoformat(),
+            f"{ACES_CONTEXT_PREFIX}:rowId": record.row_id,
+            f"{ACES_CONTEXT_PREFIX}:confidence": record.confidence,
+        }
+    remainder = evidence[limit:]
+    if not remainder:
+        return
+    organisations: set[str] = set()
+    sources: set[str] = set()
+    confidence_total = 0
+    for record in remainder:
+        organisations.add(record.organisation)
+        sources.update(record.sources)
+        confidence_total += record.confidence
+    yield {
+        "@id": f"urn:aces:evidence:{run_id}:summary",
+        "@type": "prov:Collection",
+        "dct:title": "Summarised evidence records",
+        "prov:wasGeneratedBy": activity_id,
+        f"{ACES_CONTEXT_PREFIX}:recordCount": len(remainder),
+        f"{ACES_CONTEXT_PREFIX}:firstRecord": limit,
+        f"{ACES_CONTEXT_PREFIX}:organisationCount": len(organisations),
+        f"{ACES_CONTEXT_PREFIX}:sourceCount": len(sources),
+        f"{ACES_CONTEXT_PREFIX}:meanConfidence": round(
+            confidence_total / len(remainder), 2
+        ),
     }
 
 
+def write_prov_document(
+    path: Path,
+    report: models.PipelineReport,
+    context: LineageContext,
+    *,
+    artifact_dir: Path | None = None,
+    completed_at: datetime | None = None,
+    record_threshold: int | None = None,
+    compact: bool = False,
+    compress: bool = False,
+) -> Path:
+    """Stream the PROV-O document to ``path`` node by node; return the file written."""
+
+    written, _ = write_jsonld_graph(
+        path,
+        PROV_CONTEXT,
+        iter_prov_nodes(
+            report,
+            context,
+            artifact_dir=artifact_dir,
+            completed_at=completed_at,
+            record_threshold=record_threshold,
+        ),
+        compact=compact,
+        compress=compress,
+    )
+    return written
+
+
 def build_catalog_entry(
     report: models.PipelineReport,
     context: LineageContext,
@@ -684,6 +847,24 @@ def build_catalog_entry(
     return dataset
 
 
+def write_catalog_entry(
+    path: Path,
+    report: models.PipelineReport,
+    context: LineageContext,
+    *,
+    artifact_dir: Path | None = None,
+    completed_at: datetime | None = None,
+    compact: bool = False,
+    compress: bool = False,
+) -> Path:
+    """Write the DCAT entry to ``path``; return the file written."""
+
+    entry = build_catalog_entry(
+        report, context, artifact_dir=artifact_dir, completed_at=completed_at
+    )
+    return write_jsonld(path, entry, compact=compact, compress=compress)
+
+
 __all__ = [
     "LineageContext",
     "LineageArtifacts",
@@ -692,9 +873,15 @@ __all__ = [
     "HttpLineageEmitter",
     "KafkaLineageEmitter",
     "LoggingLineageEmitter",
+    "BackgroundLineageEmitter",
+    "EmitterStats",
+    "LineageSpool",
     "build_openlineage_events",
     "build_prov_document",
     "build_catalog_entry",
+    "iter_prov_nodes",
+    "write_prov_document",
+    "write_catalog_entry",
 ]
 
 
@@ -749,6 +936,8 @@ register_plugin(
                 "LINEAGE_ENDPOINT",
                 "LINEAGE_KAFKA_TOPIC",
                 "LINEAGE_KAFKA_BOOTSTRAP_SERVERS",
+                "LINEAGE_ASYNC_EMIT",
+                "LINEAGE_SPOOL_DIR",
             ),
             optional_dependencies=("requests", "kafka"),
             description=(
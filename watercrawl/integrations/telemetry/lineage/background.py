@@ -0,0 +1,350 @@
+"""Background lineage emission with batching, retries and an on-disk spool.
+
+:class:`BackgroundLineageEmitter` wraps a synchronous emitter so
+``LineageManager.capture`` only enqueues events. A daemon worker drains the
+bounded queue in batches, retries failed sends with exponential backoff and,
+once retries are exhausted (or the queue is full), appends the batch to a
+:class:`LineageSpool`. Spooled batches are replayed oldest-first after the next
+successful send and when the emitter starts, so events survive transport
+outages and process restarts.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from . import LineageEmitter
+
+__all__ = ["BackgroundLineageEmitter", "EmitterStats", "LineageSpool"]
+
+_SPOOL_SUFFIX = ".jsonl"
+# Upper bound on how long the worker blocks before re-checking stop/flush.
+_POLL_INTERVAL = 0.05
+
+
+class LineageSpool:
+    """Durable directory of pending event batches, one JSON Lines file per batch.
+
+    Files are written to a temporary name and renamed into place, so readers
+    never see a partial batch. Names start with a nanosecond timestamp, which
+    keeps replay in arrival order.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+
+    def append(self, events: Sequence[dict[str, Any]]) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        name = f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}{_SPOOL_SUFFIX}"
+        return self._write(self.directory / name, events)
+
+    def rewrite(self, path: Path, events: Sequence[dict[str, Any]]) -> Path:
+        """Replace ``path`` with ``events``, keeping its place in replay order."""
+
+        return self._write(path, events)
+
+    def pending(self) -> list[Path]:
+        if not self.directory.exists():
+            return []
+        return sorted(self.directory.glob(f"*{_SPOOL_SUFFIX}"))
+
+    def read(self, path: Path) -> list[dict[str, Any]]:
+        with path.open(encoding="utf-8") as handle:
+            return [json.loads(line) for line in handle if line.strip()]
+
+    def discard(self, path: Path) -> None:
+        path.unlink(missing_ok=True)
+
+    def _write(self, target: Path, events: Sequence[dict[str, Any]]) -> Path:
+        staging = target.with_suffix(".tmp")
+        payload = "".join(
+            json.dumps(event, sort_keys=True, separators=(",", ":")) + "\n"
+            for event in events
+        )
+        with self._lock:
+            with staging.open("w", encoding="utf-8") as handle:
+                handle.write(payload)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(staging, target)
+        return target
+
+
+@dataclass(frozen=True)
+class EmitterStats:
+    """Counters describing background emitter activity."""
+
+    queued: int
+    sent: int
+    batches: int
+    retries: int
+    spooled: int
+    replayed: int
+    pending_spool_files: int
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "queued": self.queued,
+            "sent": self.sent,
+            "batches": self.batches,
+            "retries": self.retries,
+            "spooled": self.spooled,
+            "replayed": self.replayed,
+            "pending_spool_files": self.pending_spool_files,
+        }
+
+
+class BackgroundLineageEmitter:
+    """Queue lineage events and deliver them from a daemon worker thread.
+
+    ``emit`` never blocks on the transport: events go onto a bounded queue, or
+    straight to the spool when the queue is full. The worker groups up to
+    ``batch_size`` events per delegate call, waiting at most
+    ``flush_interval`` seconds for a batch to fill.
+    """
+
+    def __init__(
+        self,
+        delegate: LineageEmitter,
+        *,
+        spool: LineageSpool | None = None,
+        max_queue: int = 1000,
+        batch_size: int = 50,
+        flush_interval: float = 1.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        logger: logging.Logger | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self.delegate = delegate
+        self.spool = spool
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.logger = logger or logging.getLogger(__name__)
+        self._sleep = sleep
+        self._queue: queue.Queue[dict[str, Any]] = queue.Queue(maxsize=max_queue)
+        self._stop = threading.Event()
+        self._draining = threading.Event()
+        self._idle = threading.Condition()
+        self._in_flight = 0
+        self._counters = {
+            "queued": 0,
+            "sent": 0,
+            "batches": 0,
+            "retries": 0,
+            "spooled": 0,
+            "replayed": 0,
+        }
+        self._worker = threading.Thread(
+            target=self._run, name="lineage-emitter", daemon=True
+        )
+        self._worker.start()
+        atexit.register(self.close)
+
+    def emit(self, events: Sequence[dict[str, Any]]) -> None:
+        overflow: list[dict[str, Any]] = []
+        with self._idle:
+            for event in events:
+                if self._stop.is_set():
+                    overflow.append(event)
+                    continue
+                try:
+                    self._queue.put_nowait(event)
+                except queue.Full:
+                    overflow.append(event)
+                else:
+                    self._in_flight += 1
+                    self._counters["queued"] += 1
+        if overflow:
+            self.logger.warning(
+                "openlineage.queue_full spooling=%d events", len(overflow)
+            )
+            self._spool(overflow)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued event has been sent or spooled."""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # Ask the worker to send partial batches instead of waiting for them
+        # to fill.
+        self._draining.set()
+        try:
+            with self._idle:
+                while self._in_flight:
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._idle.wait(remaining)
+            return True
+        finally:
+            self._draining.clear()
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Stop the worker, spooling anything it could not deliver in time."""
+
+        if self._stop.is_set():
+            return
+        self.flush(timeout)
+        self._stop.set()
+        self._worker.join(timeout)
+        leftover: list[dict[str, Any]] = []
+        while True:
+            try:
+                leftover.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if leftover:
+            self._spool(leftover)
+            self._settle(len(leftover))
+        atexit.unregister(self.close)
+
+    def stats(self) -> EmitterStats:
+        with self._idle:
+            counters = dict(self._counters)
+        pending = len(self.spool.pending()) if self.spool is not None else 0
+        return EmitterStats(pending_spool_files=pending, **counters)
+
+    def _run(self) -> None:
+        # Deliver anything a previous process left behind before new events.
+        self._replay_spool()
+        while not self._stop.is_set():
+            batch = self._next_batch()
+            if not batch:
+                continue
+            if self._send(batch):
+                # Replay before settling so flush() also covers spooled batches.
+                self._replay_spool()
+            else:
+                self._spool(batch)
+            self._settle(len(batch))
+
+    def _next_batch(self) -> list[dict[str, Any]]:
+        try:
+            first = self._queue.get(timeout=min(self.flush_interval, _POLL_INTERVAL))
+        except queue.Empty:
+            return []
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if self._queue.qsize():
+                    batch.append(self._queue.get_nowait())
+                elif remaining > 0 and not (
+                    self._stop.is_set() or self._draining.is_set()
+                ):
+                    batch.append(
+                        self._queue.get(timeout=min(remaining, _POLL_INTERVAL))
+                    )
+                else:
+                    break
+            except queue.Empty:
+                if remaining <= 0:
+                    break
+        return batch
+
+    def _send(self, batch: Sequence[dict[str, Any]]) -> bool:
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.delegate.emit(batch)
+            except Exception as exc:
+                if attempt == self.max_retries:
+                    self.logger.warning(
+                        "openlineage.emit_failed events=%d attempts=%d",
+                        len(batch),
+                        attempt + 1,
+                        exc_info=exc,
+                    )
+                    return False
+                with self._idle:
+                    self._counters["retries"] += 1
+                self._sleep(self.backoff_base * (2**attempt))
+            else:
+                with self._idle:
+                    self._counters["sent"] += len(batch)
+                    self._counters["batches"] += 1
+                return True
+        return False  # pragma: no cover - loop always returns
+
+    def _replay_spool(self) -> None:
+        if self.spool is None:
+            return
+        for path in self.spool.pending():
+            if self._stop.is_set():
+                return
+            try:
+                events = self.spool.read(path)
+            except (OSError, ValueError) as exc:
+                self.logger.warning(
+                    "openlineage.spool_unreadable path=%s", path, exc_info=exc
+                )
+                continue
+            for start in range(0, len(events), self.batch_size):
+                chunk = events[start : start + self.batch_size]
+                try:
+                    self.delegate.emit(chunk)
+                except Exception:
+                    # Transport still down; keep only the unsent events so the
+                    # next attempt does not deliver the sent chunks twice.
+                    if start:
+                        self._keep_unsent(self.spool, path, events[start:])
+                        self._count_replayed(start)
+                    return
+            self.spool.discard(path)
+            self._count_replayed(len(events))
+
+    def _keep_unsent(
+        self, spool: LineageSpool, path: Path, events: Sequence[dict[str, Any]]
+    ) -> None:
+        try:
+            spool.rewrite(path, events)
+        except OSError as exc:
+            self.logger.warning(
+                "openlineage.spool_rewrite_failed path=%s", path, exc_info=exc
+            )
+
+    def _count_replayed(self, count: int) -> None:
+        with self._idle:
+            self._counters["sent"] += count
+            self._counters["replayed"] += count
+
+    def _spool(self, events: Sequence[dict[str, Any]]) -> None:
+        if self.spool is None:
+            self.logger.warning(
+                "openlineage.events_dropped count=%d (no spool configured)",
+                len(events),
+            )
+            return
+        try:
+            self.spool.append(events)
+        except OSError as exc:
+            self.logger.warning("openlineage.spool_failed", exc_info=exc)
+            return
+        with self._idle:
+            self._counters["spooled"] += len(events)
+
+    def _settle(self, count: int) -> None:
+        with self._idle:
+            self._in_flight -= count
+            if self._in_flight <= 0:
+                self._in_flight = 0
+                self._idle.notify_all()
@@ -0,0 +1,98 @@
+"""Streaming JSON-LD writers for lineage artefacts.
+
+:func:`write_jsonld_graph` writes ``{"@context": ..., "@graph": [...]}`` one
+node at a time, so a graph never has to be materialised as a single string.
+Pretty output is byte-for-byte what ``json.dumps(document, indent=2,
+sort_keys=True)`` would produce; ``compact=True`` drops the whitespace and
+``compress=True`` gzips the file (appending ``.gz`` to its name).
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import IO, Any
+
+__all__ = ["artifact_path", "write_jsonld", "write_jsonld_graph"]
+
+GZIP_SUFFIX = ".gz"
+# Level 6 is gzip's default trade-off; lineage files are written once per run.
+_GZIP_LEVEL = 6
+_COMPACT_SEPARATORS = (",", ":")
+
+
+def artifact_path(path: Path, *, compress: bool = False) -> Path:
+    """Return the on-disk name for ``path`` given the compression setting."""
+
+    if compress and path.suffix != GZIP_SUFFIX:
+        return path.with_name(path.name + GZIP_SUFFIX)
+    return path
+
+
+def write_jsonld(
+    path: Path, document: Any, *, compact: bool = False, compress: bool = False
+) -> Path:
+    """Serialise ``document`` to ``path`` without building the full string."""
+
+    target = artifact_path(path, compress=compress)
+    with _open_text(target, compress=compress) as handle:
+        if compact:
+            json.dump(document, handle, sort_keys=True, separators=_COMPACT_SEPARATORS)
+        else:
+            json.dump(document, handle, indent=2, sort_keys=True)
+    return target
+
+
+def write_jsonld_graph(
+    path: Path,
+    context: Mapping[str, Any],
+    nodes: Iterable[Mapping[str, Any]],
+    *,
+    compact: bool = False,
+    compress: bool = False,
+) -> tuple[Path, int]:
+    """Stream a JSON-LD graph to ``path``; return the path and node count."""
+
+    target = artifact_path(path, compress=compress)
+    count = 0
+    with _open_text(target, compress=compress) as handle:
+        if compact:
+            handle.write('{"@context":')
+            handle.write(_dumps(context, compact=True))
+            handle.write(',"@graph":[')
+            for node in nodes:
+                if count:
+                    handle.write(",")
+                handle.write(_dumps(node, compact=True))
+                count += 1
+            handle.write("]}")
+        else:
+            handle.write('{\n  "@context": ')
+            handle.write(_indent(_dumps(context, compact=False), 2))
+            handle.write(',\n  "@graph": [')
+            for node in nodes:
+                handle.write(",\n    " if count else "\n    ")
+                handle.write(_indent(_dumps(node, compact=False), 4))
+                count += 1
+            handle.write("\n  ]\n}" if count else "]\n}")
+    return target, count
+
+
+def _dumps(value: Any, *, compact: bool) -> str:
+    if compact:
+        return json.dumps(value, sort_keys=True, separators=_COMPACT_SEPARATORS)
+    return json.dumps(value, indent=2, sort_keys=True)
+
+
+def _indent(text: str, width: int) -> str:
+    # JSON strings never contain raw newlines, so every newline is structural.
+    return text.replace("\n", "\n" + " " * width)
+
+
+def _open_text(path: Path, *, compress: bool) -> IO[str]:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8", compresslevel=_GZIP_LEVEL)
+    return path.open("w", encoding="utf-8")
@@ -0,0 +1,314 @@
+"""Local time-series store for per-run drift summaries.
+
+Every pipeline run becomes one Parquet partition,
+``<root>/dataset=<name>/run=<timestamp>-<run_id>/summary.parquet``, in a long
+format with one row per ``(column, metric, key)``:
+
+* ``rows``/``nulls``/``distinct`` per column, plus ``rows`` for ``__run__``;
+* ``quantile`` rows keyed by fraction for numeric columns and ``count`` rows
+  keyed by category for categoricals;
+* a ``sketch`` row per column holding the serialised mergeable sketch;
+* ``psi``/``js`` and ``ratio_difference`` rows for the run's drift results.
+
+Partition names sort chronologically, so "the last N runs" is a directory
+listing and history reads only open the partitions and row groups they need.
+Rolling baselines merge the stored sketches (or sum the stored counts) of the
+last N runs.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+try:  # pragma: no cover - optional dependency for Parquet partitions
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    _ARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover - pyarrow ships with the ui group
+    pa = None  # type: ignore
+    ds = None  # type: ignore
+    pq = None  # type: ignore
+    _ARROW_AVAILABLE = False
+
+from watercrawl.integrations.telemetry.sketches import (
+    ColumnSketch,
+    SketchProfile,
+)
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import pandas as pd
+
+    from watercrawl.integrations.telemetry.drift import DriftBaseline, DriftReport
+
+__all__ = ["MetricsStore", "RunPartition", "RUN_COLUMN"]
+
+RUN_COLUMN = "__run__"
+SUMMARY_FILENAME = "summary.parquet"
+_QUANTILE_FRACTIONS = (0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99)
+_RUN_PATTERN = re.compile(r"^run=(?P<stamp>\d{8}T\d{12})-(?P<run_id>.+)$")
+_STAMP_FORMAT = "%Y%m%dT%H%M%S%f"
+_UNSAFE = re.compile(r"[^A-Za-z0-9._-]+")
+_SCHEMA = (
+    pa.schema(
+        [
+            ("run_id", pa.string()),
+            ("recorded_at", pa.timestamp("us", tz="UTC")),
+            ("column", pa.string()),
+            ("metric", pa.string()),
+            ("key", pa.string()),
+            ("value", pa.float64()),
+            ("sketch", pa.string()),
+        ]
+    )
+    if _ARROW_AVAILABLE
+    else None
+)
+
+
+@dataclass(frozen=True)
+class RunPartition:
+    run_id: str
+    recorded_at: datetime
+    path: Path
+
+
+class MetricsStore:
+    """Append-only store of per-run distribution summaries for one dataset."""
+
+    def __init__(self, root: Path, dataset: str) -> None:
+        self.root = Path(root)
+        self.dataset = dataset
+        self.dataset_root = self.root / f"dataset={_safe(dataset)}"
+
+    def record_run(
+        self,
+        run_id: str,
+        *,
+        profile: SketchProfile | None = None,
+        drift_report: DriftReport | None = None,
+        recorded_at: datetime | None = None,
+    ) -> Path:
+        """Write the run's summary as a new partition and return its file."""
+
+        _ensure_arrow()
+        timestamp = (recorded_at or datetime.now(UTC)).astimezone(UTC)
+        rows: list[tuple[str, str, str, float | None, str | None]] = []
+        if profile is not None:
+            rows.append((RUN_COLUMN, "rows", "", float(profile.rows), None))
+            for column, sketch in sorted(profile.columns.items()):
+                rows.extend(_sketch_rows(column, sketch))
+        if drift_report is not None:
+            rows.extend(_drift_rows(drift_report))
+
+        directory = self.dataset_root / (
+            f"run={timestamp.strftime(_STAMP_FORMAT)}-{_safe(run_id)}"
+        )
+        directory.mkdir(parents=True, exist_ok=True)
+        columns = list(zip(*rows)) if rows else [(), (), (), (), ()]
+        table = pa.table(
+            {
+                "run_id": pa.array([run_id] * len(rows), pa.string()),
+                "recorded_at": pa.array(
+                    [timestamp] * len(rows), pa.timestamp("us", tz="UTC")
+                ),
+                "column": pa.array(columns[0], pa.string()),
+                "metric": pa.array(columns[1], pa.string()),
+                "key": pa.array(columns[2], pa.string()),
+                "value": pa.array(columns[3], pa.float64()),
+                "sketch": pa.array(columns[4], pa.string()),
+            }
+        )
+        target = directory / SUMMARY_FILENAME
+        staging = directory / f".{SUMMARY_FILENAME}.tmp"
+        pq.write_table(table, staging, compression="zstd")
+        os.replace(staging, target)
+        return target
+
+    def runs(self, last: int | None = None) -> list[RunPartition]:
+        """Return recorded runs, oldest first (only the newest ``last`` when set)."""
+
+        if not self.dataset_root.exists():
+            return []
+        partitions: list[RunPartition] = []
+        for entry in sorted(self.dataset_root.iterdir()):
+            match = _RUN_PATTERN.match(entry.name)
+            summary = entry / SUMMARY_FILENAME
+            if match is None or not summary.exists():
+                continue
+            recorded_at = datetime.strptime(match["stamp"], _STAMP_FORMAT).replace(
+                tzinfo=UTC
+            )
+            partitions.append(RunPartition(match["run_id"], recorded_at, summary))
+        if last is not None:
+            partitions = partitions[-last:] if last > 0 else []
+        return partitions
+
+    def read_history(
+        self,
+        *,
+        last: int | None = None,
+        columns: Sequence[str] | None = None,
+        metrics: Sequence[str] | None = None,
+        include_sketches: bool = False,
+    ) -> pd.DataFrame:
+        """Return summary rows for the selected runs as a dataframe."""
+
+        table = self._scan(
+            last=last,
+            columns=columns,
+            metrics=metrics,
+            include_sketches=include_sketches,
+        )
+        return table.to_pandas()
+
+    def rolling_profile(self, last: int) -> SketchProfile | None:
+        """Merge the sketches of the newest ``last`` runs into one baseline profile."""
+
+        table = self._scan(last=last, metrics=("sketch", "rows"), include_sketches=True)
+        if not table.num_rows:
+            return None
+        profile = SketchProfile()
+        for record in table.to_pylist():
+            if record["column"] == RUN_COLUMN and record["metric"] == "rows":
+                profile.rows += int(record["value"] or 0)
+            elif record["metric"] == "sketch" and record["sketch"]:
+                sketch = ColumnSketch.from_dict(json.loads(record["sketch"]))
+                existing = profile.columns.get(record["column"])
+                if existing is None:
+                    profile.columns[record["column"]] = sketch
+                elif existing.kind == sketch.kind:
+                    existing.merge(sketch)
+        return profile if profile.columns else None
+
+    def rolling_baseline(self, last: int) -> DriftBaseline | None:
+        """Sum Status/Province counts over the newest ``last`` runs."""
+
+        from watercrawl.integrations.telemetry.drift import DriftBaseline
+
+        table = self._scan(
+            last=last,
+            columns=("Status", "Province", RUN_COLUMN),
+            metrics=("count", "rows"),
+        )
+        if not table.num_rows:
+            return None
+        counts: dict[str, dict[str, int]] = {"Status": {}, "Province": {}}
+        total = 0
+        for record in table.to_pylist():
+            if record["column"] == RUN_COLUMN:
+                total += int(record["value"] or 0)
+            elif record["metric"] == "count":
+                bucket = counts[record["column"]]
+                bucket[record["key"]] = bucket.get(record["key"], 0) + int(
+                    record["value"] or 0
+                )
+        if not total:
+            return None
+        return DriftBaseline(
+            status_counts=counts["Status"],
+            province_counts=counts["Province"],
+            total_rows=total,
+        )
+
+    def _scan(
+        self,
+        *,
+        last: int | None,
+        columns: Sequence[str] | None = None,
+        metrics: Sequence[str] | None = None,
+        include_sketches: bool = False,
+    ) -> Any:
+        _ensure_arrow()
+        files = [str(partition.path) for partition in self.runs(last)]
+        projection = ["run_id", "recorded_at", "column", "metric", "key", "value"]
+        if include_sketches:
+            projection.append("sketch")
+        if not files:
+            return pa.table(
+                {name: pa.array([], _SCHEMA.field(name).type) for name in projection}
+            )
+        expression = None
+        if columns is not None:
+            expression = ds.field("column").isin(list(columns))
+        if metrics is not None:
+            metric_filter = ds.field("metric").isin(list(metrics))
+            expression = (
+                metric_filter if expression is None else expression & metric_filter
+            )
+        dataset = ds.dataset(files, format="parquet", schema=_SCHEMA)
+        return dataset.to_table(columns=projection, filter=expression)
+
+
+def _sketch_rows(
+    column: str, sketch: ColumnSketch
+) -> list[tuple[str, str, str, float | None, str | None]]:
+    rows: list[tuple[str, str, str, float | None, str | None]] = [
+        (column, "rows", "", float(sketch.rows), None),
+        (column, "nulls", "", float(sketch.nulls), None),
+        (column, "distinct", "", round(sketch.distinct.estimate(), 1), None),
+    ]
+    if sketch.quantiles is not None and sketch.quantiles.count:
+        values = sketch.quantiles.quantiles(_QUANTILE_FRACTIONS)
+        rows.extend(
+            (column, "quantile", str(fraction), float(value), None)
+            for fraction, value in zip(_QUANTILE_FRACTIONS, values)
+        )
+    if sketch.frequent is not None:
+        rows.extend(
+            (column, "count", category, float(count), None)
+            for category, count in sorted(sketch.frequent.counters.items())
+        )
+    rows.append(
+        (column, "sketch", "", None, json.dumps(sketch.to_dict(), sort_keys=True))
+    )
+    return rows
+
+
+def _drift_rows(
+    report: DriftReport,
+) -> list[tuple[str, str, str, float | None, str | None]]:
+    rows: list[tuple[str, str, str, float | None, str | None]] = [
+        (RUN_COLUMN, "exceeded_threshold", "", float(report.exceeded_threshold), None)
+    ]
+    for column, metrics in (
+        ("Status", report.status_drift),
+        ("Province", report.province_drift),
+    ):
+        rows.extend(
+            (column, "ratio_difference", str(category), metric.difference, None)
+            for category, metric in sorted(metrics.items())
+        )
+    if report.sketch_drift is not None:
+        for column, drift in sorted(report.sketch_drift.columns.items()):
+            if drift.high_cardinality:
+                rows.append(
+                    (column, "null_rate_delta", "", drift.null_rate_delta, None)
+                )
+                rows.append(
+                    (column, "uniqueness_delta", "", drift.uniqueness_delta, None)
+                )
+                continue
+            rows.append((column, "psi", "", drift.psi, None))
+            rows.append((column, "js", "", drift.js_divergence, None))
+    return rows
+
+
+def _safe(value: str) -> str:
+    return _UNSAFE.sub("_", value) or "_"
+
+
+def _ensure_arrow() -> None:
+    if not _ARROW_AVAILABLE:
+        raise RuntimeError(
+            "pyarrow is required for the drift metrics store. "
+            "Install it via `poetry install --with ui`."
+        )
@@ -0,0 +1,660 @@
+"""Mergeable sketch profiles for drift detection.
+
+Each profiled column keeps fixed-size sketches: a HyperLogLog for distinct
+counts, a KLL sketch for numeric quantiles and a Misra-Gries frequent-items
+summary for categoricals. Profiles are updated chunk by chunk, merge across
+shards with :meth:`SketchProfile.merge`, and serialise to small JSON documents,
+so profiling any number of rows and comparing every column against a baseline
+costs memory proportional to the column count only.
+
+Comparisons bucket both sides on the baseline's distribution (deciles for
+numeric columns, heavy hitters plus an "other" bucket for categoricals) and
+report the population stability index and Jensen-Shannon divergence.
+Categorical columns that are near-unique in the baseline (names, URLs, phone
+numbers) have no stable distribution to compare, so for them only the null
+rate and the share of distinct values are checked.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import math
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from watercrawl.core.fingerprints import hash_cells
+
+__all__ = [
+    "ColumnDrift",
+    "ColumnSketch",
+    "FrequentItemsSketch",
+    "HyperLogLog",
+    "KllSketch",
+    "SketchDriftReport",
+    "SketchProfile",
+    "compare_profiles",
+    "load_profile",
+    "profile_frame",
+    "save_profile",
+]
+
+DEFAULT_CHUNK_SIZE = 10_000
+DEFAULT_PSI_THRESHOLD = 0.2
+DEFAULT_JS_THRESHOLD = 0.1
+DEFAULT_CARDINALITY_RATIO = 0.5
+DEFAULT_NULL_RATE_THRESHOLD = 0.1
+DEFAULT_UNIQUENESS_THRESHOLD = 0.2
+# Probability floor so empty buckets do not make PSI infinite.
+_EPSILON = 1e-6
+_NUMERIC_BINS = 10
+_KLL_CAPACITY_RATIO = 2.0 / 3.0
+
+
+class HyperLogLog:
+    """HyperLogLog distinct-count sketch over 64-bit hashes (``2 ** precision`` registers)."""
+
+    def __init__(self, precision: int = 12, registers: np.ndarray | None = None):
+        if not 4 <= precision <= 16:
+            raise ValueError("precision must be between 4 and 16")
+        self.precision = precision
+        self.registers = (
+            np.zeros(1 << precision, dtype=np.uint8)
+            if registers is None
+            else np.asarray(registers, dtype=np.uint8).copy()
+        )
+
+    def update(self, hashes: np.ndarray) -> None:
+        values = np.asarray(hashes, dtype=np.uint64)
+        if not values.size:
+            return
+        width = 64 - self.precision
+        buckets = (values >> np.uint64(width)).astype(np.int64)
+        remainder = values & np.uint64((1 << width) - 1)
+        rank = (width - _bit_length(remainder) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, buckets, rank)
+
+    def merge(self, other: HyperLogLog) -> None:
+        if other.precision != self.precision:
+            raise ValueError("cannot merge HyperLogLog sketches of different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> float:
+        size = self.registers.size
+        alpha = 0.7213 / (1 + 1.079 / size)
+        raw = (
+            alpha
+            * size
+            * size
+            / float(np.sum(np.ldexp(1.0, -self.registers.astype(int))))
+        )
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * size and zeros:
+            # Linear counting is more accurate for small cardinalities.
+            return size * math.log(size / zeros)
+        return raw
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "precision": self.precision,
+            "registers": base64.b64encode(self.registers.tobytes()).decode("ascii"),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> HyperLogLog:
+        registers = np.frombuffer(
+            base64.b64decode(payload["registers"]), dtype=np.uint8
+        )
+        return cls(int(payload["precision"]), registers)
+
+
+class KllSketch:
+    """KLL quantile sketch with deterministic alternating compaction.
+
+    Items at level ``h`` carry weight ``2 ** h``. When the sketch exceeds its
+    capacity the lowest over-full level is sorted and every other item is
+    promoted, giving rank error of roughly ``1.7 / k``.
+    """
+
+    def __init__(self, k: int = 200) -> None:
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.count = 0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.levels: list[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._offsets: list[int] = [0]
+
+    def update(self, values: np.ndarray) -> None:
+        data = np.asarray(values, dtype=np.float64)
+        data = data[np.isfinite(data)]
+        if not data.size:
+            return
+        self.count += int(data.size)
+        self.minimum = min(self.minimum, float(data.min()))
+        self.maximum = max(self.maximum, float(data.max()))
+        self.levels[0] = np.concatenate([self.levels[0], data])
+        self._compress()
+
+    def merge(self, other: KllSketch) -> None:
+        if not other.count:
+            return
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype=np.float64))
+            self._offsets.append(0)
+        for height, items in enumerate(other.levels):
+            self.levels[height] = np.concatenate([self.levels[height], items])
+        self.count += other.count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self._compress()
+
+    def cdf(self, points: Sequence[float] | np.ndarray) -> np.ndarray:
+        """Return the estimated fraction of values ``<=`` each point."""
+
+        targets = np.asarray(points, dtype=np.float64)
+        if not self.count:
+            return np.zeros_like(targets)
+        items, weights = self._weighted_items()
+        cumulative = np.concatenate([[0.0], np.cumsum(weights)])
+        positions = np.searchsorted(items, targets, side="right")
+        return cumulative[positions] / cumulative[-1]
+
+    def quantiles(self, fractions: Sequence[float] | np.ndarray) -> np.ndarray:
+        ranks = np.asarray(fractions, dtype=np.float64)
+        if not self.count:
+            return np.full_like(ranks, np.nan)
+        items, weights = self._weighted_items()
+        cumulative = np.cumsum(weights) / weights.sum()
+        positions = np.searchsorted(cumulative, ranks, side="left")
+        values = items[np.clip(positions, 0, items.size - 1)]
+        values[ranks <= 0] = self.minimum
+        values[ranks >= 1] = self.maximum
+        return values
+
+    def retained(self) -> int:
+        return sum(level.size for level in self.levels)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "k": self.k,
+            "count": self.count,
+            "min": self.minimum if self.count else None,
+            "max": self.maximum if self.count else None,
+            "levels": [level.tolist() for level in self.levels],
+            "offsets": list(self._offsets),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> KllSketch:
+        sketch = cls(int(payload["k"]))
+        sketch.count = int(payload["count"])
+        if sketch.count:
+            sketch.minimum = float(payload["min"])
+            sketch.maximum = float(payload["max"])
+        sketch.levels = [
+            np.asarray(level, dtype=np.float64) for level in payload["levels"]
+        ] or [np.empty(0, dtype=np.float64)]
+        sketch._offsets = list(payload.get("offsets", [0] * len(sketch.levels)))
+        return sketch
+
+    def _capacity(self, height: int) -> int:
+        depth = len(self.levels) - 1 - height
+        return max(2, int(math.ceil(self.k * _KLL_CAPACITY_RATIO**depth)))
+
+    def _compress(self) -> None:
+        while self.retained() > sum(
+            self._capacity(height) for height in range(len(self.levels))
+        ):
+            for height, items in enumerate(self.levels):
+                if items.size >= self._capacity(height):
+                    break
+            if height + 1 == len(self.levels):
+                self.levels.append(np.empty(0, dtype=np.float64))
+                self._offsets.append(0)
+            items = np.sort(self.levels[height])
+            # An odd item stays behind so total weight is preserved exactly.
+            keep = items[-1:] if items.size % 2 else items[:0]
+            pairs = items[: items.size - keep.size]
+            offset = self._offsets[height]
+            self._offsets[height] = 1 - offset
+            self.levels[height + 1] = np.concatenate(
+                [self.levels[height + 1], pairs[offset::2]]
+            )
+            self.levels[height] = keep
+
+    def _weighted_items(self) -> tuple[np.ndarray, np.ndarray]:
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [
+                np.full(level.size, 2.0**height)
+                for height, level in enumerate(self.levels)
+            ]
+        )
+        order = np.argsort(items, kind="stable")
+        return items[order], weights[order]
+
+
+class FrequentItemsSketch:
+    """Misra-Gries heavy-hitter summary keeping at most ``capacity`` counters.
+
+    Counts are underestimates by at most ``offset``; categories whose true
+    frequency exceeds ``count / (capacity + 1)`` are always retained.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.count = 0
+        self.offset = 0
+        self.counters: dict[str, int] = {}
+
+    def update(self, counts: Mapping[str, int]) -> None:
+        for value, amount in counts.items():
+            self.counters[value] = self.counters.get(value, 0) + int(amount)
+            self.count += int(amount)
+        self._purge()
+
+    def merge(self, other: FrequentItemsSketch) -> None:
+        for value, amount in other.counters.items():
+            self.counters[value] = self.counters.get(value, 0) + amount
+        self.count += other.count
+        self.offset += other.offset
+        self._purge()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "count": self.count,
+            "offset": self.offset,
+            "counters": dict(self.counters),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> FrequentItemsSketch:
+        sketch = cls(int(payload["capacity"]))
+        sketch.count = int(payload["count"])
+        sketch.offset = int(payload["offset"])
+        sketch.counters = {
+            str(key): int(value) for key, value in payload["counters"].items()
+        }
+        return sketch
+
+    def _purge(self) -> None:
+        if len(self.counters) <= self.capacity:
+            return
+        ordered = sorted(self.counters.values(), reverse=True)
+        cut = ordered[self.capacity]
+        self.offset += cut
+        self.counters = {
+            value: amount - cut
+            for value, amount in self.counters.items()
+            if amount > cut
+        }
+
+
+@dataclass
+class ColumnSketch:
+    """Sketches for one column; ``kind`` is ``numeric`` or ``categorical``."""
+
+    kind: str
+    rows: int = 0
+    nulls: int = 0
+    distinct: HyperLogLog = field(default_factory=HyperLogLog)
+    quantiles: KllSketch | None = None
+    frequent: FrequentItemsSketch | None = None
+
+    @classmethod
+    def for_kind(cls, kind: str) -> ColumnSketch:
+        if kind == "numeric":
+            return cls(kind=kind, quantiles=KllSketch())
+        return cls(kind=kind, frequent=FrequentItemsSketch())
+
+    def update(self, series: pd.Series) -> None:
+        mask = series.isna().to_numpy()
+        values = series[~mask]
+        self.rows += int(series.size)
+        self.nulls += int(mask.sum())
+        if values.empty:
+            return
+        self.distinct.update(hash_cells(values))
+        if self.quantiles is not None:
+            self.quantiles.update(pd.to_numeric(values, errors="coerce").to_numpy())
+        if self.frequent is not None:
+            counts = values.astype(str).value_counts(sort=False)
+            self.frequent.update(dict(zip(counts.index, counts.tolist())))
+
+    def merge(self, other: ColumnSketch) -> None:
+        if other.kind != self.kind:
+            raise ValueError("cannot merge sketches of different column kinds")
+        self.rows += other.rows
+        self.nulls += other.nulls
+        self.distinct.merge(other.distinct)
+        if self.quantiles is not None and other.quantiles is not None:
+            self.quantiles.merge(other.quantiles)
+        if self.frequent is not None and other.frequent is not None:
+            self.frequent.merge(other.frequent)
+
+    def to_dict(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "kind": self.kind,
+            "rows": self.rows,
+            "nulls": self.nulls,
+            "distinct": self.distinct.to_dict(),
+        }
+        if self.quantiles is not None:
+            payload["quantiles"] = self.quantiles.to_dict()
+        if self.frequent is not None:
+            payload["frequent"] = self.frequent.to_dict()
+        return payload
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> ColumnSketch:
+        return cls(
+            kind=str(payload["kind"]),
+            rows=int(payload["rows"]),
+            nulls=int(payload["nulls"]),
+            distinct=HyperLogLog.from_dict(payload["distinct"]),
+            quantiles=(
+                KllSketch.from_dict(payload["quantiles"])
+                if "quantiles" in payload
+                else None
+            ),
+            frequent=(
+                FrequentItemsSketch.from_dict(payload["frequent"])
+                if "frequent" in payload
+                else None
+            ),
+        )
+
+
+@dataclass
+class SketchProfile:
+    """Per-column sketches for a dataset; update per chunk, merge per shard."""
+
+    columns: dict[str, ColumnSketch] = field(default_factory=dict)
+    rows: int = 0
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        for name in chunk.columns:
+            series = chunk[name]
+            label = str(name)
+            sketch = self.columns.get(label)
+            if sketch is None:
+                sketch = ColumnSketch.for_kind(_column_kind(series))
+                self.columns[label] = sketch
+            sketch.update(series)
+        self.rows += len(chunk)
+
+    def merge(self, other: SketchProfile) -> SketchProfile:
+        for label, sketch in other.columns.items():
+            mine = self.columns.get(label)
+            if mine is None:
+                self.columns[label] = ColumnSketch.from_dict(sketch.to_dict())
+            else:
+                mine.merge(sketch)
+        self.rows += other.rows
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "columns": {
+                label: sketch.to_dict() for label, sketch in self.columns.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> SketchProfile:
+        return cls(
+            columns={
+                str(label): ColumnSketch.from_dict(sketch)
+                for label, sketch in payload.get("columns", {}).items()
+            },
+            rows=int(payload.get("rows", 0)),
+        )
+
+
+@dataclass(frozen=True)
+class ColumnDrift:
+    column: str
+    kind: str
+    psi: float
+    js_divergence: float
+    baseline_rows: int
+    observed_rows: int
+    baseline_distinct: float
+    observed_distinct: float
+    exceeded: bool
+    high_cardinality: bool = False
+    null_rate_delta: float = 0.0
+    uniqueness_delta: float = 0.0
+
+
+@dataclass(frozen=True)
+class SketchDriftReport:
+    columns: dict[str, ColumnDrift]
+    psi_threshold: float
+    js_threshold: float
+
+    @property
+    def exceeded_threshold(self) -> bool:
+        return any(drift.exceeded for drift in self.columns.values())
+
+    @property
+    def drifted_columns(self) -> list[str]:
+        return sorted(
+            column for column, drift in self.columns.items() if drift.exceeded
+        )
+
+
+def profile_frame(
+    frame: pd.DataFrame,
+    *,
+    columns: Iterable[str] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    profile: SketchProfile | None = None,
+) -> SketchProfile:
+    """Update ``profile`` (or a new one) from ``frame`` in ``chunk_size`` row slices."""
+
+    target = profile if profile is not None else SketchProfile()
+    selected = frame if columns is None else frame[list(columns)]
+    step = max(1, chunk_size)
+    for start in range(0, len(selected), step):
+        target.update(selected.iloc[start : start + step])
+    return target
+
+
+def compare_profiles(
+    baseline: SketchProfile,
+    observed: SketchProfile,
+    *,
+    psi_threshold: float = DEFAULT_PSI_THRESHOLD,
+    js_threshold: float = DEFAULT_JS_THRESHOLD,
+    cardinality_ratio: float = DEFAULT_CARDINALITY_RATIO,
+    null_rate_threshold: float = DEFAULT_NULL_RATE_THRESHOLD,
+    uniqueness_threshold: float = DEFAULT_UNIQUENESS_THRESHOLD,
+) -> SketchDriftReport:
+    """Compare every column present in both profiles using PSI and JS divergence.
+
+    Categorical columns whose baseline distinct count is at least
+    ``cardinality_ratio`` of their non-null rows are treated as identifiers:
+    they drift only when the null rate or the distinct share moves by more
+    than ``null_rate_threshold`` or ``uniqueness_threshold``.
+    """
+
+    results: dict[str, ColumnDrift] = {}
+    for label in sorted(set(baseline.columns) & set(observed.columns)):
+        expected, actual = baseline.columns[label], observed.columns[label]
+        if expected.kind != actual.kind:
+            continue
+        if expected.kind == "categorical" and (
+            _uniqueness(expected) >= cardinality_ratio
+        ):
+            results[label] = _identifier_drift(
+                label,
+                expected,
+                actual,
+                null_rate_threshold=null_rate_threshold,
+                uniqueness_threshold=uniqueness_threshold,
+            )
+            continue
+        if expected.kind == "numeric":
+            distributions = _numeric_distributions(expected, actual)
+        else:
+            distributions = _categorical_distributions(expected, actual)
+        if distributions is None:
+            continue
+        base, obs = distributions
+        psi = _psi(base, obs)
+        js = _js_divergence(base, obs)
+        results[label] = ColumnDrift(
+            column=label,
+            kind=expected.kind,
+            psi=psi,
+            js_divergence=js,
+            baseline_rows=expected.rows,
+            observed_rows=actual.rows,
+            baseline_distinct=round(expected.distinct.estimate(), 1),
+            observed_distinct=round(actual.distinct.estimate(), 1),
+            exceeded=psi > psi_threshold or js > js_threshold,
+        )
+    return SketchDriftReport(
+        columns=results, psi_threshold=psi_threshold, js_threshold=js_threshold
+    )
+
+
+def save_profile(profile: SketchProfile, path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(profile.to_dict(), sort_keys=True), encoding="utf-8")
+    return path
+
+
+def load_profile(path: Path) -> SketchProfile:
+    return SketchProfile.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+def _column_kind(series: pd.Series) -> str:
+    if pd.api.types.is_bool_dtype(series) or not pd.api.types.is_numeric_dtype(series):
+        return "categorical"
+    return "numeric"
+
+
+def _numeric_distributions(
+    baseline: ColumnSketch, observed: ColumnSketch
+) -> tuple[np.ndarray, np.ndarray] | None:
+    assert baseline.quantiles is not None and observed.quantiles is not None
+    if not baseline.quantiles.count or not observed.quantiles.count:
+        return None
+    fractions = np.linspace(0, 1, _NUMERIC_BINS + 1)[1:-1]
+    edges = np.unique(baseline.quantiles.quantiles(fractions))
+    return (
+        _bucket_probabilities(baseline.quantiles.cdf(edges)),
+        _bucket_probabilities(observed.quantiles.cdf(edges)),
+    )
+
+
+def _bucket_probabilities(cdf: np.ndarray) -> np.ndarray:
+    return np.diff(np.concatenate([[0.0], cdf, [1.0]]))
+
+
+def _categorical_distributions(
+    baseline: ColumnSketch, observed: ColumnSketch
+) -> tuple[np.ndarray, np.ndarray] | None:
+    assert baseline.frequent is not None and observed.frequent is not None
+    if not baseline.rows or not observed.rows:
+        return None
+    categories = sorted(
+        set(baseline.frequent.counters) | set(observed.frequent.counters)
+    )
+    return (
+        _category_probabilities(baseline, categories),
+        _category_probabilities(observed, categories),
+    )
+
+
+def _category_probabilities(sketch: ColumnSketch, categories: list[str]) -> np.ndarray:
+    assert sketch.frequent is not None
+    counts = np.array(
+        [sketch.frequent.counters.get(category, 0) for category in categories]
+        + [
+            sketch.frequent.count - sum(sketch.frequent.counters.values()),
+            sketch.nulls,
+        ],
+        dtype=np.float64,
+    )
+    return counts / max(sketch.rows, 1)
+
+
+def _identifier_drift(
+    label: str,
+    baseline: ColumnSketch,
+    observed: ColumnSketch,
+    *,
+    null_rate_threshold: float,
+    uniqueness_threshold: float,
+) -> ColumnDrift:
+    null_delta = abs(_null_rate(observed) - _null_rate(baseline))
+    unique_delta = abs(_uniqueness(observed) - _uniqueness(baseline))
+    return ColumnDrift(
+        column=label,
+        kind=baseline.kind,
+        psi=0.0,
+        js_divergence=0.0,
+        baseline_rows=baseline.rows,
+        observed_rows=observed.rows,
+        baseline_distinct=round(baseline.distinct.estimate(), 1),
+        observed_distinct=round(observed.distinct.estimate(), 1),
+        exceeded=null_delta > null_rate_threshold
+        or unique_delta > uniqueness_threshold,
+        high_cardinality=True,
+        null_rate_delta=round(null_delta, 6),
+        uniqueness_delta=round(unique_delta, 6),
+    )
+
+
+def _null_rate(sketch: ColumnSketch) -> float:
+    return sketch.nulls / sketch.rows if sketch.rows else 0.0
+
+
+def _uniqueness(sketch: ColumnSketch) -> float:
+    """Distinct values per non-null row (capped at 1; HLL can overestimate)."""
+
+    present = sketch.rows - sketch.nulls
+    if present <= 0:
+        return 0.0
+    return min(1.0, sketch.distinct.estimate() / present)
+
+
+def _smooth(probabilities: np.ndarray) -> np.ndarray:
+    clipped = np.clip(probabilities, _EPSILON, None)
+    return clipped / clipped.sum()
+
+
+def _psi(baseline: np.ndarray, observed: np.ndarray) -> float:
+    expected, actual = _smooth(baseline), _smooth(observed)
+    return round(float(np.sum((actual - expected) * np.log(actual / expected))), 6)
+
+
+def _js_divergence(baseline: np.ndarray, observed: np.ndarray) -> float:
+    expected, actual = _smooth(baseline), _smooth(observed)
+    midpoint = (expected + actual) / 2
+    divergence = 0.5 * np.sum(expected * np.log2(expected / midpoint)) + 0.5 * np.sum(
+        actual * np.log2(actual / midpoint)
+    )
+    return round(float(max(divergence, 0.0)), 6)
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Exact bit length of ``uint64`` values (``frexp`` is exact below 2**53)."""
+
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
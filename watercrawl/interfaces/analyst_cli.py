@@ -19,9 +19,15 @@ from rich.progress import BarColumn, Progress, TaskID, TextColumn, TimeRemaining
 from watercrawl.application.pipeline import MultiSourcePipeline, Pipeline
 from watercrawl.application.progress import PipelineProgressListener
 from watercrawl.core import config
-from watercrawl.core.excel import read_dataset
+from watercrawl.core.excel import (
+    DATASET_FORMATS,
+    dataset_format,
+    dataset_suffix,
+    read_dataset,
+)
 from watercrawl.core.profiles import ProfileError, load_profile
 from watercrawl.domain.models import SchoolRecord
+from watercrawl.domain.validation import DatasetValidator, ValidationCache
 from watercrawl.infrastructure.evidence import build_evidence_sink
 from watercrawl.integrations.contracts import (
     CuratedDatasetContractResult,
@@ -330,6 +336,16 @@ def cli() -> None:
     type=click.Path(path_type=Path),
     help="Path to a refinement profile YAML file.",
 )
+@click.option(
+    "--validation-cache",
+    "validation_cache_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help=(
+        "JSON file caching per-row validation results between runs; only "
+        "changed rows are re-validated."
+    ),
+)
 def validate(
     input_path: Path,
     additional_inputs: Sequence[Path],
@@ -338,6 +354,7 @@ def validate(
     progress: bool | None,
     profile_id: str | None,
     profile_path: Path | None,
+    validation_cache_path: Path | None,
 ) -> None:
     """Validate a CSV/XLSX dataset and report any quality issues."""
 
@@ -354,7 +371,17 @@ def validate(
     metadata = {str(key): value for key, value in frame.attrs.items()}
     if output_format == "text":
         _emit_column_inference_preview(metadata)
-    report = pipeline.validator.validate_dataframe(frame)
+    validation_cache = (
+        ValidationCache.load(validation_cache_path) if validation_cache_path else None
+    )
+    validator = (
+        DatasetValidator(cache=validation_cache)
+        if validation_cache is not None
+        else pipeline.validator
+    )
+    report = validator.validate_dataframe(frame)
+    if validation_cache is not None:
+        validation_cache.save()
     validation_contract = report.to_contract()
     issues_payload = [issue.model_dump() for issue in validation_contract.issues]
     registry = contract_registry()
@@ -370,6 +397,8 @@ def validate(
         },
     }
     payload["profile"] = config.describe_active_profile()
+    if validation_cache is not None:
+        payload["validation_cache"] = validation_cache.stats()
     progress_listener_factory = _get_cli_override(
         "RichPipelineProgress", RichPipelineProgress
     )
@@ -392,6 +421,11 @@ def validate(
         click.echo(json.dumps(payload, indent=2))
     else:
         click.echo(f"Rows: {payload['rows']}")
+        if validation_cache is not None:
+            click.echo(
+                f"Validation cache: {validation_cache.row_hits} rows reused, "
+                f"{validation_cache.row_misses} re-validated."
+            )
         if issues_payload:
             click.echo("Issues:")
             for issue in issues_payload:
@@ -404,6 +438,38 @@ def validate(
         raise click.exceptions.Exit(1)
 
 
+_DATASET_FORMAT_SUFFIXES = {
+    "xlsx": ".xlsx",
+    "csv": ".csv",
+    "parquet": ".parquet",
+    "feather": ".feather",
+    "jsonl": ".jsonl.gz",
+}
+
+
+def _resolve_enrich_target(
+    input_path: Path, output_path: Path | None, dataset_output_format: str | None
+) -> Path:
+    if output_path is not None:
+        if dataset_output_format and (
+            dataset_format(output_path) != dataset_output_format
+        ):
+            raise click.BadParameter(
+                f"Suffix does not match --dataset-format {dataset_output_format}.",
+                param_hint="--output",
+            )
+        return output_path
+    # Strip compound suffixes whole so ``x.jsonl.gz`` becomes ``x_enriched.jsonl.gz``.
+    input_suffix = dataset_suffix(input_path)
+    stem = input_path.name[: len(input_path.name) - len(input_suffix)]
+    suffix = (
+        _DATASET_FORMAT_SUFFIXES[dataset_output_format]
+        if dataset_output_format
+        else input_suffix
+    )
+    return input_path.with_name(f"{stem}_enriched{suffix}")
+
+
 @cli.command()
 @click.argument("input_path", type=click.Path(exists=True, path_type=Path))
 @click.option(
@@ -428,6 +494,26 @@ def validate(
     type=click.Path(path_type=Path),
     help="Optional path for the enriched dataset (defaults to *_enriched).",
 )
+@click.option(
+    "--dataset-format",
+    "dataset_output_format",
+    type=click.Choice(list(DATASET_FORMATS)),
+    default=None,
+    help=(
+        "Enriched dataset format (xlsx, csv, parquet, feather, jsonl). "
+        "Defaults to the --output suffix or the input format."
+    ),
+)
+@click.option(
+    "--validation-cache",
+    "validation_cache_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help=(
+        "JSON file caching per-row validation results between runs; only "
+        "changed rows are re-validated."
+    ),
+)
 @click.option(
     "--format", "output_format", type=click.Choice(["text", "json"]), default="text"
 )
@@ -472,6 +558,8 @@ def enrich(
     additional_inputs: Sequence[Path],
     sheet_map_entries: Sequence[str],
     output_path: Path | None,
+    dataset_output_format: str | None,
+    validation_cache_path: Path | None,
     output_format: str,
     progress: bool | None,
     profile_id: str | None,
@@ -518,14 +606,18 @@ def enrich(
     evidence_sink = evidence_sink_factory()
     lineage_manager = lineage_manager_factory()
     lakehouse_writer = lakehouse_writer_factory()
-    pipeline = pipeline_factory(
-        evidence_sink=evidence_sink,
-        lineage_manager=lineage_manager,
-        lakehouse_writer=lakehouse_writer,
-    )
-    target = output_path or input_path.with_name(
-        f"{input_path.stem}_enriched{input_path.suffix}"
+    pipeline_options: dict[str, Any] = {
+        "evidence_sink": evidence_sink,
+        "lineage_manager": lineage_manager,
+        "lakehouse_writer": lakehouse_writer,
+    }
+    validation_cache = (
+        ValidationCache.load(validation_cache_path) if validation_cache_path else None
     )
+    if validation_cache is not None:
+        pipeline_options["validator"] = DatasetValidator(cache=validation_cache)
+    pipeline = pipeline_factory(**pipeline_options)
+    target = _resolve_enrich_target(input_path, output_path, dataset_output_format)
     show_progress = _resolve_progress_flag(output_format, progress)
     progress_listener_factory = _get_cli_override(
         "RichPipelineProgress", RichPipelineProgress
@@ -553,6 +645,8 @@ def enrich(
         lineage_context=lineage_context,
         sheet_map=sheet_map or None,
     )
+    if validation_cache is not None:
+        validation_cache.save()
     report_contract = report.to_contract()
     issues_payload = [issue.model_dump() for issue in report_contract.issues]
     registry = contract_registry()
@@ -574,6 +668,8 @@ def enrich(
         },
     }
     payload["profile"] = dict(validation.profile)
+    if validation_cache is not None:
+        payload["validation_cache"] = validation_cache.stats()
     if report.lineage_artifacts:
         payload["lineage_artifacts"] = {
             "openlineage": str(report.lineage_artifacts.openlineage_path),